@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+Benchmark for the (date, time) join performed by hourly process_records.
+
+Compares the linear rescan of the MAWN and RTMA record lists that process_records
+used to perform for every hour against the hash index built by index_records_by_hour.
+
+python bench_hourly_join.py --days 365
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from typing import List, Dict, Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("EWX_LOG_FILE", os.path.join(tempfile.gettempdir(), "ewx_benchmark_logs"))
+from ewx_utils.hourly_validation_checks.hourly_validation_utils import index_records_by_hour
+
+
+def make_records(begin: datetime, hours: int, missing_rate: float, seed: int) -> List[Dict[str, Any]]:
+    """
+    Generate shuffled hourly records keyed by date and time, with a fraction of hours missing.
+    """
+    rng = random.Random(seed)
+    records = []
+    for i in range(hours):
+        if rng.random() < missing_rate:
+            continue
+        dt = begin + timedelta(hours=i)
+        records.append({"date": dt.date(), "time": dt.time(), "atmp": rng.uniform(-20, 30)})
+    rng.shuffle(records)
+    return records
+
+
+def linear_join(hours: List[datetime], mawn_records: List[Dict[str, Any]], rtma_records: List[Dict[str, Any]]) -> int:
+    """
+    Match every hour by rescanning both record lists, as process_records did before indexing.
+    """
+    matches = 0
+    for dt in hours:
+        for record in mawn_records:
+            if record["date"] == dt.date() and record["time"] == dt.time():
+                matches += 1
+                break
+        for record in rtma_records:
+            if record["date"] == dt.date() and record["time"] == dt.time():
+                matches += 1
+                break
+    return matches
+
+
+def indexed_join(hours: List[datetime], mawn_records: List[Dict[str, Any]], rtma_records: List[Dict[str, Any]]) -> int:
+    """
+    Match every hour through the (date, time) indexes used by process_records.
+    """
+    mawn_records_by_hour = index_records_by_hour(mawn_records)
+    rtma_records_by_hour = index_records_by_hour(rtma_records)
+    matches = 0
+    for dt in hours:
+        hour_key = (dt.date(), dt.time())
+        matches += hour_key in mawn_records_by_hour
+        matches += hour_key in rtma_records_by_hour
+    return matches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the hourly (date, time) join")
+    parser.add_argument("--days", type=int, default=30, help="Number of days of hourly data per source")
+    parser.add_argument("--missing-rate", type=float, default=0.05, help="Fraction of hours missing from each source")
+    args = parser.parse_args()
+
+    begin = datetime(2023, 1, 1, 1)
+    n_hours = args.days * 24
+    hours = [begin + timedelta(hours=i) for i in range(n_hours)]
+    mawn_records = make_records(begin, n_hours, args.missing_rate, seed=1)
+    rtma_records = make_records(begin, n_hours, args.missing_rate, seed=2)
+
+    start = time.perf_counter()
+    linear_matches = linear_join(hours, mawn_records, rtma_records)
+    linear_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed_matches = indexed_join(hours, mawn_records, rtma_records)
+    indexed_seconds = time.perf_counter() - start
+
+    assert linear_matches == indexed_matches
+    print(f"hours={n_hours} matches={indexed_matches}")
+    print(f"linear scan : {linear_seconds:.4f} s")
+    print(f"hash index  : {indexed_seconds:.4f} s")
+    print(f"speedup     : {linear_seconds / indexed_seconds:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
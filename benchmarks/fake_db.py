@@ -0,0 +1,79 @@
+"""
+In-memory stand-ins for a psycopg2 connection and cursor, so the write path can be benchmarked offline.
+
+Statements are not executed, but their parameters are quoted with the psycopg2 adapters and COPY buffers are
+read to the end, so the client-side cost of building each statement is still measured.
+"""
+from typing import Any, List, Optional, Sequence
+
+from psycopg2.extensions import adapt
+
+
+class FakeCursor:
+    """
+    Cursor that counts statements, parameter bytes and COPY bytes instead of sending them to a server.
+    """
+
+    def __init__(self, connection: "FakeConnection"):
+        self.connection = connection
+        self.rowcount = -1
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def mogrify(self, query: Any, params: Optional[Sequence[Any]] = None) -> bytes:
+        if isinstance(query, str):
+            query = query.encode("utf-8")
+        if params is None:
+            return query
+        return query % tuple(adapt(value).getquoted() for value in params)
+
+    def execute(self, query: Any, params: Optional[Sequence[Any]] = None) -> None:
+        statement = self.mogrify(query, params)
+        self.connection.statements += 1
+        self.connection.bytes_sent += len(statement)
+
+    def copy_expert(self, sql: str, file: Any, size: int = 8192) -> None:
+        self.connection.statements += 1
+        while True:
+            chunk = file.read(size)
+            if not chunk:
+                break
+            self.connection.bytes_sent += len(chunk)
+
+    def fetchone(self) -> Optional[tuple]:
+        return None
+
+    def fetchall(self) -> List[tuple]:
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+class FakeConnection:
+    """
+    Connection handing out FakeCursors and counting commits and rollbacks.
+    """
+    encoding = "UTF8"
+
+    def __init__(self):
+        self.statements = 0
+        self.bytes_sent = 0
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self, *args, **kwargs) -> FakeCursor:
+        return FakeCursor(self)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+    def close(self) -> None:
+        pass
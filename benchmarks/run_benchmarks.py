@@ -0,0 +1,393 @@
+#!/usr/bin/env python
+"""
+Benchmark suite for the QC pipeline on synthetic station data.
+
+Generates MAWN/RTMA hourly and MAWN daily rows for a number of stations and years, then times hourly and
+daily process_records, check_value, compare_records and the write path (batched upsert and COPY) against an
+in-memory connection. Each benchmark reports its rows, best and median seconds over the repeats, throughput
+and peak memory (measured in a separate run under tracemalloc). Results are written as JSON, and can be
+compared with the results of an earlier release to catch regressions. Runs offline; no database is needed.
+
+python benchmarks/run_benchmarks.py --stations 3 --years 1 --output results.json
+python benchmarks/run_benchmarks.py --baseline results-1.4.json --max-slowdown 0.25
+"""
+import os
+import sys
+import gc
+import io
+import copy
+import json
+import time
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+REPO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, REPO_PATH)
+os.environ.setdefault("EWX_LOG_FILE", os.path.join(tempfile.gettempdir(), "ewx_benchmark_logs"))
+from ewx_utils.ewx_config import ewx_log_file
+from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
+from ewx_utils.hourly_validation_checks import hourly_validation_utils
+from ewx_utils.hourly_validation_checks.hourly_columnar_engine import process_records_columnar, numpy_available
+from ewx_utils.daily_validation_checks import daily_validation_utils
+from ewx_utils.main_hourly_scripts import hourly_main
+from ewx_utils.main_hourly_scripts.hourly_utility import compare_records
+from ewx_utils.main_hourly_scripts.hourly_compare_engine import compare_records_columnar
+from ewx_utils.main_daily_scripts import daily_main
+from benchmarks.fake_db import FakeConnection
+from benchmarks.synthetic_data import (
+    DAILY_QC_COLUMNS,
+    HOURLY_QC_COLUMNS,
+    HOURLY_VARIABLES,
+    perturb_records,
+    station_dataset,
+    station_names,
+    stored_records,
+)
+
+RESULTS_FORMAT = 1
+
+# name -> function(data) returning (prepare, run); prepare builds fresh inputs outside the timing,
+# run processes them and returns the number of rows handled
+BENCHMARKS: Dict[str, Callable[[Dict[str, Any]], Tuple[Callable[[], Any], Callable[[Any], int]]]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    def register(function: Callable) -> Callable:
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+@benchmark("hourly_process_records")
+def bench_hourly_process_records(data: Dict[str, Any]):
+    def prepare():
+        return [(copy.deepcopy(s["mawn"]), copy.deepcopy(s["rtma"]), s["begin"], s["end"]) for s in data["stations"].values()]
+
+    def run(inputs):
+        return sum(len(hourly_validation_utils.process_records(HOURLY_QC_COLUMNS, *station_inputs)) for station_inputs in inputs)
+    return prepare, run
+
+
+@benchmark("hourly_process_records_columnar")
+def bench_hourly_process_records_columnar(data: Dict[str, Any]):
+    prepare, _ = bench_hourly_process_records(data)
+
+    def run(inputs):
+        return sum(len(process_records_columnar(HOURLY_QC_COLUMNS, *station_inputs)) for station_inputs in inputs)
+    return prepare, run
+
+
+@benchmark("daily_process_records")
+def bench_daily_process_records(data: Dict[str, Any]):
+    def prepare():
+        return [(copy.deepcopy(s["daily"]), copy.deepcopy(s["mawnqc"]), s["begin"], s["end"]) for s in data["stations"].values()]
+
+    def run(inputs):
+        # process_records prints every date; the output is discarded but still formatted
+        with redirect_stdout(io.StringIO()):
+            return sum(len(daily_validation_utils.process_records(DAILY_QC_COLUMNS, *station_inputs)) for station_inputs in inputs)
+    return prepare, run
+
+
+@benchmark("check_value")
+def bench_check_value(data: Dict[str, Any]):
+    def prepare():
+        return [
+            (variable, record[variable], datetime.combine(record["date"], record["time"]))
+            for s in data["stations"].values() for record in s["mawn"] for variable in HOURLY_VARIABLES
+            if record[variable] is not None
+        ]
+
+    def run(values):
+        check_value = hourly_validation_utils.check_value
+        for variable, value, dt in values:
+            check_value(variable, value, dt)
+        return len(values)
+    return prepare, run
+
+
+@benchmark("compare_records")
+def bench_compare_records(data: Dict[str, Any]):
+    def prepare():
+        return [(s["cleaned"], perturb_records(s["cleaned"], data["seed"])) for s in data["stations"].values()]
+
+    def run(inputs):
+        for test_records, supercell_records in inputs:
+            compare_records(test_records, supercell_records)
+        return sum(len(test_records) for test_records, _ in inputs)
+    return prepare, run
+
+
+@benchmark("compare_records_columnar")
+def bench_compare_records_columnar(data: Dict[str, Any]):
+    prepare, _ = bench_compare_records(data)
+
+    def run(inputs):
+        for test_records, supercell_records in inputs:
+            compare_records_columnar(test_records, supercell_records)
+        return sum(len(test_records) for test_records, _ in inputs)
+    return prepare, run
+
+
+@benchmark("hourly_write_upsert")
+def bench_hourly_write_upsert(data: Dict[str, Any]):
+    def prepare():
+        return [(station, s["cleaned"]) for station, s in data["stations"].items()]
+
+    def run(inputs):
+        connection = FakeConnection()
+        for station, records in inputs:
+            hourly_main.commit_and_rollback(connection, station, records)
+        return sum(len(records) for _, records in inputs)
+    return prepare, run
+
+
+@benchmark("hourly_write_bulk_copy")
+def bench_hourly_write_bulk_copy(data: Dict[str, Any]):
+    prepare, _ = bench_hourly_write_upsert(data)
+
+    def run(inputs):
+        connection = FakeConnection()
+        for station, records in inputs:
+            hourly_main.commit_and_rollback(connection, station, records, bulk_copy=True)
+        return sum(len(records) for _, records in inputs)
+    return prepare, run
+
+
+@benchmark("daily_write_upsert")
+def bench_daily_write_upsert(data: Dict[str, Any]):
+    def prepare():
+        return [(station, s["daily_cleaned"]) for station, s in data["stations"].items()]
+
+    def run(inputs):
+        connection = FakeConnection()
+        with redirect_stdout(io.StringIO()):
+            for station, records in inputs:
+                daily_main.commit_and_rollback(connection, station, records, DAILY_QC_COLUMNS, ["date", "time"])
+        return sum(len(records) for _, records in inputs)
+    return prepare, run
+
+
+def add_cleaned_records(dataset: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add the cleaned hourly and daily records of a station, which the compare and write benchmarks work on.
+
+    Parameters:
+        dataset (Dict[str, Any]): begin/end dates and the mawn, rtma and daily rows of a station
+
+    Returns:
+        Dict[str, Any]: The dataset with cleaned, mawnqc (cleaned as read back) and daily_cleaned records
+    """
+    dataset["cleaned"] = hourly_validation_utils.process_records(
+        HOURLY_QC_COLUMNS, copy.deepcopy(dataset["mawn"]), copy.deepcopy(dataset["rtma"]), dataset["begin"], dataset["end"]
+    )
+    # Daily records are built from the hourly QC rows as stored in the QC database
+    dataset["mawnqc"] = stored_records(dataset["cleaned"])
+    with redirect_stdout(io.StringIO()):
+        dataset["daily_cleaned"] = daily_validation_utils.process_records(
+            DAILY_QC_COLUMNS, copy.deepcopy(dataset["daily"]), copy.deepcopy(dataset["mawnqc"]), dataset["begin"], dataset["end"]
+        )
+    return dataset
+
+
+def build_data(stations: int, first_year: int, years: int, seed: int, missing_rate: float,
+               out_of_range_rate: float) -> Dict[str, Any]:
+    """
+    Generate the rows of every station and their cleaned records.
+
+    Returns:
+        Dict[str, Any]: Seed and the dataset of each station, see add_cleaned_records
+    """
+    data = {"seed": seed, "stations": {}}
+    for station in station_names(stations):
+        dataset = station_dataset(station, first_year, years, seed, missing_rate, out_of_range_rate)
+        data["stations"][station] = add_cleaned_records(dataset)
+    return data
+
+
+def measure(prepare: Callable[[], Any], run: Callable[[Any], int], repeat: int, memory: bool = True) -> Dict[str, Any]:
+    """
+    Time run over repeat fresh inputs, then measure its peak memory in one more run under tracemalloc.
+
+    Parameters:
+        prepare (Callable[[], Any]): Builds the inputs of one run
+        run (Callable[[Any], int]): Processes the inputs and returns the number of rows handled
+        repeat (int): Timed runs
+        memory (bool): Measure the peak memory; tracemalloc slows the run down several times
+
+    Returns:
+        Dict[str, Any]: rows, seconds_best, seconds_median, rows_per_sec (from the best time) and
+        peak_memory_bytes (None without memory)
+    """
+    timings = []
+    rows = 0
+    for _ in range(repeat):
+        inputs = prepare()
+        gc.collect()
+        start = time.perf_counter()
+        rows = run(inputs)
+        timings.append(time.perf_counter() - start)
+        del inputs
+
+    peak_memory = None
+    if memory:
+        inputs = prepare()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run(inputs)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        "rows": rows,
+        "repeat": repeat,
+        "seconds_best": round(best, 6),
+        "seconds_median": round(statistics.median(timings), 6),
+        "rows_per_sec": round(rows / best, 1) if best > 0 else None,
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_PATH, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(names: List[str], parameters: Dict[str, Any], repeat: int, memory: bool = True) -> Dict[str, Any]:
+    """
+    Generate the data and run the named benchmarks.
+
+    Parameters:
+        names (List[str]): Benchmarks to run, keys of BENCHMARKS
+        parameters (Dict[str, Any]): stations, first_year, years, seed, missing_rate and out_of_range_rate
+        repeat (int): Timed runs per benchmark
+        memory (bool): Measure the peak memory of each benchmark
+
+    Returns:
+        Dict[str, Any]: Machine-readable results with the environment, parameters and one entry per benchmark
+    """
+    data = build_data(**parameters)
+    results = {}
+    # compare_records writes its mismatch CSV files to the working directory
+    working_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch_directory:
+        os.chdir(scratch_directory)
+        try:
+            for name in names:
+                prepare, run = BENCHMARKS[name](data)
+                results[name] = measure(prepare, run, repeat, memory)
+        finally:
+            os.chdir(working_directory)
+
+    return {
+        "format": RESULTS_FORMAT,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "log_level": EWXStructuredLogger(log_path=ewx_log_file).level,
+        "parameters": parameters,
+        "results": results,
+    }
+
+
+def compare_with_baseline(results: Dict[str, Any], baseline: Dict[str, Any], max_slowdown: float) -> List[str]:
+    """
+    Compare the best times with a baseline run.
+
+    Parameters:
+        results (Dict[str, Any]): Results of this run
+        baseline (Dict[str, Any]): Results of an earlier run
+        max_slowdown (float): Allowed relative slowdown, e.g. 0.25 for 25%
+
+    Returns:
+        List[str]: Benchmarks slower than the baseline by more than max_slowdown
+    """
+    if baseline.get("parameters") != results["parameters"]:
+        print("warning: the baseline was run with different parameters", file=sys.stderr)
+    regressions = []
+    for name, result in results["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base["seconds_best"]:
+            continue
+        ratio = result["seconds_best"] / base["seconds_best"]
+        print(f"{name:34} {ratio:6.2f}x baseline")
+        if ratio > 1 + max_slowdown:
+            regressions.append(name)
+    return regressions
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    print(f"{'benchmark':34} {'rows':>10} {'best s':>10} {'median s':>10} {'rows/s':>12} {'peak MiB':>9}")
+    for name, result in results["results"].items():
+        rows_per_sec = result["rows_per_sec"] if result["rows_per_sec"] is not None else float("nan")
+        peak_memory = result["peak_memory_bytes"] / 2**20 if result["peak_memory_bytes"] is not None else float("nan")
+        print(
+            f"{name:34} {result['rows']:>10} {result['seconds_best']:>10.4f} {result['seconds_median']:>10.4f} "
+            f"{rows_per_sec:>12.0f} {peak_memory:>9.1f}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the QC pipeline on synthetic station data")
+    parser.add_argument("--stations", type=int, default=3, help="Number of synthetic stations")
+    parser.add_argument("--years", type=int, default=1, help="Number of whole years of data per station")
+    parser.add_argument("--first-year", type=int, default=2023, help="First year of data")
+    parser.add_argument("--missing-rate", type=float, default=0.05, help="Fraction of missing rows and of missing values")
+    parser.add_argument("--out-of-range-rate", type=float, default=0.02, help="Fraction of out-of-range values")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic data")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark")
+    parser.add_argument("--skip-memory", action="store_true", default=False,
+                        help="Do not measure peak memory (saves one tracemalloc run per benchmark)")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Run only these benchmarks")
+    parser.add_argument("--log-level", type=str.upper, default="INFO",
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], help="Log level during the run")
+    parser.add_argument("--output", type=str, help="Write the results to this JSON file")
+    parser.add_argument("--baseline", type=str, help="Results JSON of an earlier run to compare against")
+    parser.add_argument("--max-slowdown", type=float, default=0.25,
+                        help="Relative slowdown against --baseline that counts as a regression (exit status 1)")
+    args = parser.parse_args(argv)
+
+    EWXStructuredLogger(log_path=ewx_log_file).set_level(args.log_level)
+    names = args.only or [name for name in BENCHMARKS
+                          if name not in ("hourly_process_records_columnar", "compare_records_columnar") or numpy_available()]
+    parameters = {
+        "stations": args.stations,
+        "first_year": args.first_year,
+        "years": args.years,
+        "seed": args.seed,
+        "missing_rate": args.missing_rate,
+        "out_of_range_rate": args.out_of_range_rate,
+    }
+
+    results = run_suite(names, parameters, args.repeat, not args.skip_memory)
+    print_results(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            regressions = compare_with_baseline(results, json.load(baseline_file), args.max_slowdown)
+        if regressions:
+            print(f"regressions: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+"""
+Synthetic MAWN, RTMA and MAWNQC rows for the benchmarks.
+
+Rows have the columns and types returned by the station tables (date, time, year, day, hour, rpt_time and
+Decimal or float values). Values are drawn inside the valid ranges used by the validation checks, except for a
+configurable fraction of missing (None, or a missing row) and out-of-range (including -7999) values.
+Generation is seeded, so the same parameters always produce the same rows.
+"""
+import math
+import random
+from decimal import Decimal
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Tuple
+
+from ewx_utils.mawndb_classes.temperature import Temperature
+
+# Realistic (low, high) range of the hourly variables; temperatures follow the monthly valid ranges instead
+HOURLY_RANGES = {
+    "relh": (15, 100),
+    "pcpn": (0, 12),
+    "rpet": (0, 0.9),
+    "srad": (0, 950),
+    "wspd": (0, 14),
+    "wspd_max": (0, 24),
+    "wdir": (0, 359),
+    "wstdv": (0, 80),
+    "leaf0": (0, 1),
+    "leaf1": (0, 1),
+    "smst_05cm": (0.05, 0.45),
+    "smst_10cm": (0.05, 0.45),
+    "volt": (11.5, 14.2),
+    "nrad": (-150, 700),
+}
+HOURLY_TEMPERATURES = ["atmp", "atmp_max", "atmp_min", "stmp_05cm", "stmp_10cm"]
+HOURLY_VARIABLES = HOURLY_TEMPERATURES + ["dwpt"] + list(HOURLY_RANGES)
+HOURLY_ID_COLUMNS = ["date", "time", "year", "day", "hour", "rpt_time"]
+HOURLY_QC_COLUMNS = HOURLY_ID_COLUMNS + [column for variable in HOURLY_VARIABLES for column in (variable, f"{variable}_src")]
+
+DAILY_RANGES = {
+    "relh_max": (60, 100),
+    "relh_min": (15, 60),
+    "pcpn": (0, 60),
+    "rpet": (0, 9),
+    "srad": (0, 8000),
+    "wspd": (0, 10),
+    "wspd_max": (0, 24),
+    "volt_min": (11.5, 13),
+}
+DAILY_TEMPERATURES = ["atmp_max", "atmp_min"]
+DAILY_VARIABLES = DAILY_TEMPERATURES + list(DAILY_RANGES)
+DAILY_ID_COLUMNS = ["date", "year", "day", "time", "rpt_time"]
+DAILY_QC_COLUMNS = DAILY_ID_COLUMNS + [column for variable in DAILY_VARIABLES for column in (variable, f"{variable}_src")]
+
+MISSING_VALUE = -7999
+
+
+def station_names(count: int) -> List[str]:
+    return [f"station{index:03d}" for index in range(1, count + 1)]
+
+
+def station_seed(seed: int, station: str, source: str) -> int:
+    """
+    Seed of one station and source, independent of the order the stations are generated in.
+    """
+    return seed * 1_000_003 + sum(ord(char) * (i + 1) for i, char in enumerate(f"{station}:{source}"))
+
+
+def temperature_range(month: int) -> Tuple[float, float]:
+    """
+    Middle half of the valid hourly temperature range of a month, so diurnal swings stay valid.
+    """
+    low, high = Temperature.valid_hourly_atmp[Temperature.month_abbrvs[month - 1]]
+    quarter = (high - low) / 4
+    return low + quarter, high - quarter
+
+
+def out_of_range_value(low: float, high: float, rng: random.Random) -> Any:
+    if rng.random() < 0.3:
+        return MISSING_VALUE
+    return round(high + (high - low + 1) * rng.uniform(1, 10), 3)
+
+
+def draw_value(low: float, high: float, rng: random.Random, missing_rate: float, out_of_range_rate: float,
+               decimal: bool = True) -> Any:
+    """
+    Draw one value; psycopg2 returns numeric columns (MAWN) as Decimal and real columns (RTMA) as float.
+    """
+    draw = rng.random()
+    if draw < missing_rate:
+        return None
+    if draw < missing_rate + out_of_range_rate:
+        value = out_of_range_value(low, high, rng)
+    else:
+        value = round(rng.uniform(low, high), 3)
+    return Decimal(str(value)) if decimal else float(value)
+
+
+def hourly_ids(dt: datetime) -> Dict[str, Any]:
+    hour = dt.hour or 24
+    return {
+        "date": dt.date(), "time": dt.time(), "year": dt.year, "day": dt.timetuple().tm_yday,
+        "hour": hour, "rpt_time": f"{hour}00",
+    }
+
+
+def make_hourly_records(station: str, begin: date, end: date, seed: int = 0, missing_rate: float = 0.05,
+                        out_of_range_rate: float = 0.02, source: str = "mawn") -> List[Dict[str, Any]]:
+    """
+    Generate the hourly rows of a station from begin to end (inclusive), in the order of the station table.
+
+    Parameters:
+        station (str): Station name, part of the seed
+        begin (date): First day
+        end (date): Last day
+        seed (int): Base seed
+        missing_rate (float): Fraction of missing rows and, separately, of missing values
+        out_of_range_rate (float): Fraction of out-of-range values
+        source (str): "mawn" or "rtma"; RTMA rows have no out-of-range values
+
+    Returns:
+        List[Dict[str, Any]]: Hourly rows
+    """
+    rng = random.Random(station_seed(seed, station, source))
+    decimal = source != "rtma"
+    if not decimal:
+        out_of_range_rate = 0.0
+    records = []
+    dt = datetime.combine(begin, time(0))
+    stop = datetime.combine(end + timedelta(days=1), time(0))
+    record_id = 0
+    while dt < stop:
+        if rng.random() >= missing_rate:
+            record_id += 1
+            record = {"id": record_id, **hourly_ids(dt)}
+            low, high = temperature_range(dt.month)
+            # Daily cycle peaking mid-afternoon
+            mean = (low + high) / 2 + (high - low) / 4 * math.sin((dt.hour - 9) * math.pi / 12)
+            for variable in HOURLY_TEMPERATURES:
+                record[variable] = draw_value(mean - 2, mean + 2, rng, missing_rate, out_of_range_rate, decimal)
+            record["dwpt"] = draw_value(mean - 8, mean - 1, rng, missing_rate, out_of_range_rate, decimal)
+            for variable, (low, high) in HOURLY_RANGES.items():
+                record[variable] = draw_value(low, high, rng, missing_rate, out_of_range_rate, decimal)
+            records.append(record)
+        dt += timedelta(hours=1)
+    return records
+
+
+def make_daily_records(station: str, begin: date, end: date, seed: int = 0, missing_rate: float = 0.05,
+                       out_of_range_rate: float = 0.02) -> List[Dict[str, Any]]:
+    """
+    Generate the daily MAWN rows of a station from begin to end (inclusive).
+
+    Parameters:
+        station (str): Station name, part of the seed
+        begin (date): First day
+        end (date): Last day
+        seed (int): Base seed
+        missing_rate (float): Fraction of missing rows and, separately, of missing values
+        out_of_range_rate (float): Fraction of out-of-range values
+
+    Returns:
+        List[Dict[str, Any]]: Daily rows
+    """
+    rng = random.Random(station_seed(seed, station, "daily"))
+    records = []
+    day = begin
+    record_id = 0
+    while day <= end:
+        if rng.random() >= missing_rate:
+            record_id += 1
+            record = {
+                "id": record_id, "date": day, "year": day.year, "day": day.timetuple().tm_yday,
+                "time": time(0), "rpt_time": "2400",
+            }
+            low, high = temperature_range(day.month)
+            record["atmp_max"] = draw_value((low + high) / 2, high, rng, missing_rate, out_of_range_rate)
+            record["atmp_min"] = draw_value(low, (low + high) / 2, rng, missing_rate, out_of_range_rate)
+            for variable, (low, high) in DAILY_RANGES.items():
+                record[variable] = draw_value(low, high, rng, missing_rate, out_of_range_rate)
+            records.append(record)
+        day += timedelta(days=1)
+    return records
+
+
+def stored_records(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Copy cleaned records as they read back from the QC tables, whose value columns are real (float).
+
+    Parameters:
+        records (List[Dict[str, Any]]): Cleaned records
+
+    Returns:
+        List[Dict[str, Any]]: Copies with Decimal and integer values converted to float, ID columns unchanged
+    """
+    id_columns = ("id", "year", "day", "hour")
+    return [
+        {
+            key: float(value) if key not in id_columns and isinstance(value, (int, Decimal)) and not isinstance(value, bool) else value
+            for key, value in record.items()
+        }
+        for record in records
+    ]
+
+
+def perturb_records(records: List[Dict[str, Any]], seed: int = 0, change_rate: float = 0.01,
+                    drop_rate: float = 0.01) -> List[Dict[str, Any]]:
+    """
+    Copy QC records with a fraction of values changed and of records dropped, as a second database to compare against.
+
+    Parameters:
+        records (List[Dict[str, Any]]): QC records
+        seed (int): Seed
+        change_rate (float): Fraction of numeric values shifted by one unit
+        drop_rate (float): Fraction of records left out
+
+    Returns:
+        List[Dict[str, Any]]: Perturbed copies of the records
+    """
+    rng = random.Random(seed)
+    perturbed = []
+    for record in records:
+        if rng.random() < drop_rate:
+            continue
+        copy = dict(record)
+        for key, value in record.items():
+            if key in ("id", "year", "day", "hour") or isinstance(value, (str, bool)) or value is None:
+                continue
+            if isinstance(value, (int, float, Decimal)) and rng.random() < change_rate:
+                copy[key] = value + 1
+        perturbed.append(copy)
+    return perturbed
+
+
+def year_range(first_year: int, years: int) -> Tuple[date, date]:
+    return date(first_year, 1, 1), date(first_year + years - 1, 12, 31)
+
+
+def station_dataset(station: str, first_year: int, years: int, seed: int = 0, missing_rate: float = 0.05,
+                    out_of_range_rate: float = 0.02, daily: bool = True) -> Dict[str, Any]:
+    """
+    Generate the MAWN hourly, RTMA hourly and MAWN daily rows of a station for whole years.
+
+    Returns:
+        Dict[str, Any]: begin and end dates (YYYY-MM-DD) and the mawn, rtma and daily rows
+    """
+    begin, end = year_range(first_year, years)
+    dataset = {
+        "begin": begin.isoformat(),
+        "end": end.isoformat(),
+        "mawn": make_hourly_records(station, begin, end, seed, missing_rate, out_of_range_rate, "mawn"),
+        "rtma": make_hourly_records(station, begin, end, seed, missing_rate, out_of_range_rate, "rtma"),
+    }
+    if daily:
+        dataset["daily"] = make_daily_records(station, begin, end, seed, missing_rate, out_of_range_rate)
+    return dataset
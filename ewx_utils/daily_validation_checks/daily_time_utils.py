@@ -15,7 +15,7 @@ from typing import List, Dict, Tuple, Any
 from ewx_utils.logs.ewx_utils_logs_config import ewx_unstructured_logger
 from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
 
-my_validation_logger = EWXStructuredLogger(log_path=EWXStructuredLogger)
+my_validation_logger = EWXStructuredLogger(log_path=ewx_log_file)
 
 def generate_list_of_dates(begin_date: str, end_date: str) -> List:
     """
@@ -12,6 +12,7 @@ sys.path.append(ewx_base_path)
 from ewx_utils.ewx_config import ewx_log_file
 from typing import Dict, Optional, Tuple, Any, List
 from .daily_time_utils import generate_list_of_dates
+from .daily_validator_registry import DAILY_VALIDATORS, ColumnValidator, resolve_validators
 from .daily_variables_list import (
     relh_vars,
     pcpn_vars,
@@ -49,82 +50,24 @@ from ewx_utils.mawndb_classes.solar_flux import SolarFlux
 from ewx_utils.logs.ewx_utils_logs_config import ewx_unstructured_logger
 from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
 
-my_validation_logger = EWXStructuredLogger(log_path=EWXStructuredLogger)
+my_validation_logger = EWXStructuredLogger(log_path=ewx_log_file)
 
-def check_value(k: str, v: float, d: date) -> bool:
+def check_value(k: str, v: float, d: date, validators: Optional[Dict[str, ColumnValidator]] = None) -> bool:
     """
     Checks if a given value is valid based on its variable key and date.
     Parameters:
         k (str): The variable key.
         v (float): The value to check.
         d (datetime.date): The date of the value.
+        validators (Dict[str, ColumnValidator], optional): Validators resolved with resolve_validators.
+            Defaults to every daily validator.
     Returns:
         bool: True if the value is valid, False otherwise.
     """
-    if k in relh_vars:
-        rh = Humidity(v, "PCT", d)
-        #print(k, v, d, rh.is_valid())
-        return rh.is_in_range() and rh.is_valid()
-    if k in pcpn_vars:
-        pn = Precipitation(v, "daily", "MM", d)
-        #print(k, v, d, pn.is_valid())
-        return pn.is_valid()
-    if k in rpet_vars:
-        rp = Evapotranspiration(v, "daily", "MM", d)
-        #print(k, v, d, rp.is_valid())
-        return rp.is_valid()
-    if k in temp_vars:
-        tp = Temperature(v, "C", d)
-        #print(k, v, d, tp.is_valid())
-        return tp.is_valid()
-    if k in wspd_vars:
-        ws = WindSpeed(v, "MPS", d)
-        #print(k, v, d, ws.is_valid())
-        return ws.is_valid()
-    if k in wdir_vars:
-        wd = WindDirection(v, "DEGREES", d)
-        #print(k, v, d, wd.is_valid())
-        return wd.is_valid()
-    if k in leafwt_vars:
-        lw = LeafWetness(v, "daily", k, d)
-        #print(k, v, d, lw.is_valid())
-        return lw.is_valid()
-    if k in dwpt_vars:
-        dp = Temperature(v, "C", d)
-        #print(k, v, d, dp.is_valid())
-        return dp.is_valid()
-    if k in vapr_vars:
-        vp = VaporPressure(v, "daily", d)
-        #print(k, v, d, vp.is_valid())
-        return vp.is_valid()
-    if k in mstr_vars:
-        ms = SoilMoisture(v, d)
-        #print(k, v, d, ms.is_valid())
-        return ms.is_valid()
-    if k in nrad_vars:
-        nr = NetRadiation(v, d)
-        #print(k, v, d, nr.is_valid())
-        return nr.is_valid()
-    if k in srad_vars:
-        sr = SolarRadiation(v, "daily", d)
-        #print(k, v, d, sr.is_valid())
-        return sr.is_valid()
-    if k in sflux_vars:
-        sf = SoilHeatFlux(v, d)
-        #print(k, v, d, sf.is_valid())
-        return sf.is_valid()
-    if k in wstdv_vars:
-        wv = StdDevWindDirection(v, d)
-        #print(k, v, d, wv.is_valid())
-        return wv.is_valid()
-    if k in volt_vars:
-        vt = Voltage(v, d)
-        #print(k, v, d, vt.is_valid())
-        return vt.is_valid()
-    if k in sden_vars:
-        sd = SolarFlux(v, "WPMS", d)
-        return sd.is_valid
-    return False
+    validator = (DAILY_VALIDATORS if validators is None else validators).get(k)
+    if validator is None:
+        return False
+    return validator.check(v, d)
 
 # Initialize lists for records and columns
 record_keys = []
@@ -188,10 +131,12 @@ def creating_mawnsrc_record(
     id_col_list: List[str],
     date_of_record: Optional[date],
     default_source: str,
+    validators: Optional[Dict[str, ColumnValidator]] = None,
 ) -> Dict[str, Any]:
     """
     Create a MAWN source record with appropriate source indicators.
     Handles time-related fields (e.g., rpt_time, time) separately from QC validation.
+    Values are checked with validators, resolved once per run of process_records, or with every daily validator.
     """
     if not record or not id_col_list:
         my_validation_logger.error("Missing required record or id_col_list")
@@ -225,7 +170,7 @@ def creating_mawnsrc_record(
             mawnsrc_record[key] = None
             mawnsrc_record[key + "_src"] = "OOR"
         else:
-            is_valid = check_value(key, value, date_of_record)
+            is_valid = check_value(key, value, date_of_record, validators)
             if is_valid:
                 mawnsrc_record[key + "_src"] = default_source
             elif key in relh_vars:
@@ -260,32 +205,32 @@ def relh_cap(mawnsrc_record: Dict[str, Any], relh_vars: List[str]) -> Dict[str,
 
     for key in mawnsrc_record:
         if key in relh_vars:
-            my_validation_logger.debug(f"Processing RH key: {key}")
+            my_validation_logger.debug("Processing RH key: %s", key)
             current_value = mawnsrc_record[key]
 
             if current_value is None or mawnsrc_record.get(key + "_src") == "EMPTY":
                 mawnsrc_record[key] = None
-                my_validation_logger.debug(f"{key}: Set to None (empty/null value)")
+                my_validation_logger.debug("%s: Set to None (empty/null value)", key)
 
             elif current_value == -7999:
                 mawnsrc_record[key] = None
                 mawnsrc_record[key + "_src"] = "EMPTY"
-                my_validation_logger.debug(f"{key}: Invalid value (-7999), marked as EMPTY")
+                my_validation_logger.debug("%s: Invalid value (-7999), marked as EMPTY", key)
 
             elif 100 < current_value <= 105:
                 mawnsrc_record[key + "_src"] = "RELH_CAP"
                 mawnsrc_record[key] = 100
-                my_validation_logger.debug(f"{key}: Value {current_value} capped at 100")
+                my_validation_logger.debug("%s: Value %s capped at 100", key, current_value)
 
             elif current_value > 105:
                 mawnsrc_record[key + "_src"] = "OOR"
                 mawnsrc_record[key] = None
-                my_validation_logger.debug(f"{key}: Value {current_value} out of range (>105)")
+                my_validation_logger.debug("%s: Value %s out of range (>105)", key, current_value)
 
             elif current_value < 0:
                 mawnsrc_record[key + "_src"] = "EMPTY"
                 mawnsrc_record[key] = None
-                my_validation_logger.debug(f"{key}: Negative value {current_value} set to None")
+                my_validation_logger.debug("%s: Negative value %s set to None", key, current_value)
 
     my_validation_logger.info("Completed relative humidity processing")
     return mawnsrc_record
@@ -307,16 +252,7 @@ def replace_none_with_manwqc_record(
     Returns:
         Dict[str, Any]: Updated daily record with filled values and appropriate source tagging.
     """
-    my_validation_logger.info(f"Starting MAWNQC replacement")
-
-    clean_record = mawnsrc_record.copy()
-    my_validation_logger.debug("Created copy of MAWN record")
-
-    # Ensure all expected keys exist
-    for key in qc_columns:
-        if key not in clean_record:
-            clean_record[key] = "EMPTY" if key.endswith("_src") else None
-            my_validation_logger.debug(f"Initialized missing key {key} as {'EMPTY' if key.endswith('_src') else 'None'}")
+    my_validation_logger.info("Starting MAWNQC replacement")
 
     # check if any hourly source is RTMA
     has_rtma = any(
@@ -327,6 +263,36 @@ def replace_none_with_manwqc_record(
     # Estimate daily values from hourly data
     daily_estimates = estimate_daily_values(hourly_records, qc_columns)
 
+    return apply_mawnqc_estimates(mawnsrc_record, daily_estimates, has_rtma, qc_columns)
+
+
+def apply_mawnqc_estimates(
+        mawnsrc_record: Dict[str, Any],
+        daily_estimates: Dict[str, Any],
+        has_rtma: bool,
+        qc_columns: List[str]
+) -> Dict[str, Any]:
+    """
+    Replace None values in the MAWN source record with daily values estimated from MAWNQC hourly data.
+
+    Parameters:
+        mawnsrc_record (Dict[str, Any]): Existing daily record with potential missing data.
+        daily_estimates (Dict[str, Any]): Estimates as returned by estimate_daily_values.
+        has_rtma (bool): Whether any hourly source of the day is RTMA; the sources are then set to EMPTYQC.
+        qc_columns (List[str]): List of *_src fields indicating source attribution.
+
+    Returns:
+        Dict[str, Any]: Updated daily record with filled values and appropriate source tagging.
+    """
+    clean_record = mawnsrc_record.copy()
+    my_validation_logger.debug("Created copy of MAWN record")
+
+    # Ensure all expected keys exist
+    for key in qc_columns:
+        if key not in clean_record:
+            clean_record[key] = "EMPTY" if key.endswith("_src") else None
+            my_validation_logger.debug("Initialized missing key %s as %s", key, 'EMPTY' if key.endswith('_src') else 'None')
+
     for key in qc_columns:
         if key.endswith("_src"):
             data_key = key[:-4]
@@ -335,7 +301,7 @@ def replace_none_with_manwqc_record(
                 if daily_estimates.get(data_key) is not None:
                     clean_record[data_key] = daily_estimates[data_key]
                     clean_record[key] = "EMPTYQC" if has_rtma else "MAWNQC"
-                    my_validation_logger.debug(f"Set {data_key} from sum, source: {clean_record[key]}")
+                    my_validation_logger.debug("Set %s from sum, source: %s", data_key, clean_record[key])
             else:
                 min_key = f"{data_key}_min"
                 max_key = f"{data_key}_max"
@@ -343,14 +309,14 @@ def replace_none_with_manwqc_record(
                 if daily_estimates.get(min_key) is not None:
                     clean_record[min_key] = daily_estimates[min_key]
                     clean_record[key] = "EMPTYQC" if has_rtma else "MAWNQC"
-                    my_validation_logger.debug(f"Set {min_key} from hourly data, source: {clean_record[key]}")
+                    my_validation_logger.debug("Set %s from hourly data, source: %s", min_key, clean_record[key])
 
                 if daily_estimates.get(max_key) is not None:
                     clean_record[max_key] = daily_estimates[max_key]
                     # Avoid overwriting if already marked EMPTYQC
                     if clean_record.get(key) != "EMPTYQC":
                         clean_record[key] = "EMPTYQC" if has_rtma else "MAWNQC"
-                    my_validation_logger.debug(f"Set {max_key} from hourly data, source: {clean_record[key]}")
+                    my_validation_logger.debug("Set %s from hourly data, source: %s", max_key, clean_record[key])
 
     my_validation_logger.info("Completed MAWNQC value replacement")
     return clean_record
@@ -393,7 +359,7 @@ def inserting_empty_records(
         my_validation_logger.error("Failed to determine day_of_year for empty record")
         return {}
 
-    my_validation_logger.info(f"Creating empty record for day {day_of_year}")
+    my_validation_logger.info("Creating empty record for day %s", day_of_year)
     empty_record = {"day_of_year": day_of_year}
 
     for key in qc_columns:
@@ -405,6 +371,10 @@ def inserting_empty_records(
     return empty_record
 
 
+# Hourly variables whose daily value is their sum over the day
+SUM_VARIABLES = ["pcpn", "rpet", "srad"]
+
+
 def estimate_daily_values(
     hourly_records: List[Dict[str, Any]],
     qc_columns: List[str]
@@ -431,16 +401,16 @@ def estimate_daily_values(
             continue
 
         # Sum-based
-        if key in ["pcpn", "rpet", "srad"]:
+        if key in SUM_VARIABLES:
             values = [rec.get(key) for rec in hourly_records if rec.get(key) is not None]
             if len(values) == 24:
                 daily_estimates[key] = sum(values)
                 daily_estimates[key + "_src"] = "MAWNQC"
                 successful += 1
-                my_validation_logger.info(f"[ESTIMATED SUM] {key} = {daily_estimates[key]}")
+                my_validation_logger.info("[ESTIMATED SUM] %s = %s", key, daily_estimates[key])
             else:
                 skipped.append(key)
-                my_validation_logger.warning(f"[SKIPPED] Incomplete hourly values for {key}")
+                my_validation_logger.warning("[SKIPPED] Incomplete hourly values for %s", key)
 
         # Min/Max
         elif key.endswith("_min") or key.endswith("_max"):
@@ -450,14 +420,82 @@ def estimate_daily_values(
                 daily_estimates[key] = min(values) if key.endswith("_min") else max(values)
                 daily_estimates[key + "_src"] = "MAWNQC"
                 successful += 1
-                my_validation_logger.info(f"[ESTIMATED {key[-3:].upper()}] {key} = {daily_estimates[key]}")
+                my_validation_logger.info("[ESTIMATED %s] %s = %s", key[-3:].upper(), key, daily_estimates[key])
             else:
                 skipped.append(key)
-                my_validation_logger.warning(f"[SKIPPED] Incomplete hourly values for {key}")
+                my_validation_logger.warning("[SKIPPED] Incomplete hourly values for %s", key)
+
+    my_validation_logger.info("Total MAWNQC estimates created: %s", successful)
+    if skipped:
+        my_validation_logger.warning("Skipped estimates due to missing hourly values: %s", skipped)
+
+    return daily_estimates
+
+
+def hourly_aggregate_variables(qc_columns: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Hourly variables that daily estimates are built from.
+
+    Parameters:
+        qc_columns (List[str]): Columns of the daily QC table.
+
+    Returns:
+        Tuple[List[str], List[str]]: Variables summed over the day, and variables whose daily minimum or maximum is estimated.
+    """
+    target_keys = [key for key in qc_columns if not key.endswith("_src")]
+    sum_variables = [key for key in target_keys if key in SUM_VARIABLES]
+    min_max_variables = []
+    for key in target_keys:
+        if key.endswith("_min") or key.endswith("_max"):
+            base_var = key.rsplit("_", 1)[0]
+            if base_var not in min_max_variables:
+                min_max_variables.append(base_var)
+    return sum_variables, min_max_variables
+
+
+def estimate_daily_values_from_aggregate(
+    aggregate: Dict[str, Any],
+    qc_columns: List[str]
+) -> Dict[str, Any]:
+    """
+    Estimate daily values from the aggregates of a day's hourly records computed in the database.
+    Gives the estimates of estimate_daily_values for the day's 24 hourly records: a sum, minimum or
+    maximum is only estimated when its variable has a value in all 24 hours.
+
+    Parameters:
+        aggregate (Dict[str, Any]): Aggregates of one day, with the sum_<var>, min_<var>, max_<var> and
+            count_<var> (number of hours with a value) of each variable of hourly_aggregate_variables.
+        qc_columns (List[str]): Columns of the daily QC table.
+
+    Returns:
+        Dict[str, Any]: Estimated values and their source marked as MAWNQC.
+    """
+    my_validation_logger.info("Estimating daily values from MAWNQC hourly aggregates")
+
+    daily_estimates = {}
+    skipped = []
+
+    for key in qc_columns:
+        if key.endswith("_src") or key in ["year", "day", "date", "time", "id", "rpt_time"]:
+            continue
+
+        if key in SUM_VARIABLES:
+            value, count = aggregate.get(f"sum_{key}"), aggregate.get(f"count_{key}")
+        elif key.endswith("_min") or key.endswith("_max"):
+            base_var, bound = key.rsplit("_", 1)
+            value, count = aggregate.get(f"{bound}_{base_var}"), aggregate.get(f"count_{base_var}")
+        else:
+            continue
+
+        if count == 24:
+            daily_estimates[key] = value
+            daily_estimates[key + "_src"] = "MAWNQC"
+        else:
+            skipped.append(key)
 
-    my_validation_logger.info(f"Total MAWNQC estimates created: {successful}")
+    my_validation_logger.info("Total MAWNQC estimates created: %s", len(daily_estimates) // 2)
     if skipped:
-        my_validation_logger.warning(f"Skipped estimates due to missing hourly values: {skipped}")
+        my_validation_logger.warning("Skipped estimates due to missing hourly values: %s", skipped)
 
     return daily_estimates
 
@@ -473,46 +511,81 @@ def one_mawndb_record(mawndb_records: list) -> list:
     # Use dictionary comprehension to create new dictionaries
     return [{k: v for k, v in record.items()} for record in mawndb_records]
 
+def group_records_by_date(records: List[Dict[str, Any]]) -> Dict[date, List[Dict[str, Any]]]:
+    """
+    Bucket records by their date so that a day's records can be looked up directly.
+    Records keep the order in which they were fetched within each bucket.
+
+    Parameters:
+        records (List[Dict[str, Any]]): Daily MAWN records or hourly MAWNQC records.
+
+    Returns:
+        Dict[date, List[Dict[str, Any]]]: Records grouped by their 'date' value.
+    """
+    records_by_date = {}
+    for rec in records:
+        records_by_date.setdefault(rec.get("date"), []).append(rec)
+    return records_by_date
+
 def process_records(
     qc_columns: List[str],
     mawndb_records: List[Dict[str, Any]],
     mawnqc_records: List[Dict[str, Any]],
     begin_date: str,
     end_date: str,
+    mawnqc_aggregated: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Process and combine MAWN and MAWNQC records for a given date range.
+    With mawnqc_aggregated, mawnqc_records are one row of hourly aggregates per day (see
+    estimate_daily_values_from_aggregate, with the day's number of hours and has_rtma) instead of hourly records.
     """
-    my_validation_logger.info(f"Starting record processing for period: {begin_date} to {end_date}")
+    my_validation_logger.info("Starting record processing for period: %s to %s", begin_date, end_date)
 
     clean_records = []
     date_list = generate_list_of_dates(begin_date, end_date)
     id_col_list = ["year", "day", "date", "id"]
 
+    # Group both sources by date once so that each day is a direct lookup
+    mawn_records_by_date = group_records_by_date(mawndb_records)
+    mawnqc_records_by_date = group_records_by_date(mawnqc_records)
+
+    # Resolve the validators of the QC and MAWN columns once instead of looking them up for each value
+    validated_columns = dict.fromkeys(qc_columns)
+    validated_columns.update(dict.fromkeys(next(iter(mawn_records_by_date.values()), [{}])[0]))
+    validators = resolve_validators(tuple(validated_columns))
+
     for dt in date_list:
         print(f"\nProcessing date: {dt.date()}")
 
         # Get the MAWNDB daily record (expecting 1 record per day)
-        matching_mawn_record = next(
-            (rec for rec in mawndb_records if rec.get("date") == dt.date()),
-            None
-        )
+        matching_mawn_records = mawn_records_by_date.get(dt.date())
+        matching_mawn_record = matching_mawn_records[0] if matching_mawn_records else None
 
         # Collect all matching hourly MAWNQC records for that day
-        matching_mawnqc_records = [
-            rec for rec in mawnqc_records
-            if rec.get("date") == dt.date()
-        ]
+        matching_mawnqc_records = mawnqc_records_by_date.get(dt.date(), [])
+        if mawnqc_aggregated:
+            mawnqc_aggregate = matching_mawnqc_records[0] if matching_mawnqc_records else {}
+            complete_mawnqc_day = mawnqc_aggregate.get("hours") == 24
+        else:
+            complete_mawnqc_day = len(matching_mawnqc_records) == 24
 
         clean_record = None
 
         if matching_mawn_record:
             my_validation_logger.debug("Found matching MAWN daily record")
 
-            mawnsrc_record = creating_mawnsrc_record(matching_mawn_record, id_col_list, dt.date(), "MAWN")
+            mawnsrc_record = creating_mawnsrc_record(matching_mawn_record, id_col_list, dt.date(), "MAWN", validators)
             mawnsrc_record = relh_cap(mawnsrc_record, relh_vars)
 
-            if len(matching_mawnqc_records) == 24:
+            if complete_mawnqc_day and mawnqc_aggregated:
+                mawnsrc_record = apply_mawnqc_estimates(
+                    mawnsrc_record,
+                    estimate_daily_values_from_aggregate(mawnqc_aggregate, qc_columns),
+                    mawnqc_aggregate["has_rtma"],
+                    qc_columns
+                )
+            elif complete_mawnqc_day:
                 # Replaces missing values in the daily record using full hourly set
                 mawnsrc_record = replace_none_with_manwqc_record(
                     mawnsrc_record,
@@ -524,22 +597,27 @@ def process_records(
             clean_records.append(clean_record)
             my_validation_logger.debug("Processed MAWN + MAWNQC record")
 
-        elif len(matching_mawnqc_records) == 24:
+        elif complete_mawnqc_day:
             my_validation_logger.debug("No MAWN record, estimating from MAWNQC")
 
-            estimated_record = estimate_daily_values(matching_mawnqc_records, qc_columns)
-            mawnsrc_record = creating_mawnsrc_record(estimated_record, id_col_list, dt.date(), "MAWNQC")
-            mawnsrc_record = relh_cap(mawnsrc_record, relh_vars)
+            # Hours with gaps in every variable leave nothing to estimate; the day then gets an empty record
+            if mawnqc_aggregated:
+                estimated_record = estimate_daily_values_from_aggregate(mawnqc_aggregate, qc_columns)
+            else:
+                estimated_record = estimate_daily_values(matching_mawnqc_records, qc_columns)
+            if estimated_record:
+                mawnsrc_record = creating_mawnsrc_record(estimated_record, id_col_list, dt.date(), "MAWNQC", validators)
+                mawnsrc_record = relh_cap(mawnsrc_record, relh_vars)
 
-            clean_record = filter_clean_record(mawnsrc_record, qc_columns)
-            clean_records.append(clean_record)
-            my_validation_logger.debug("Processed estimated MAWNQC record")
+                clean_record = filter_clean_record(mawnsrc_record, qc_columns)
+                clean_records.append(clean_record)
+                my_validation_logger.debug("Processed estimated MAWNQC record")
 
-        else:
+        if not clean_record:
             # No data at all — insert empty record
             my_validation_logger.warning("No MAWN or complete MAWNQC data, inserting empty record")
             empty_record = inserting_empty_records({}, {}, dt.date(), qc_columns, id_col_list)
             clean_records.append(empty_record)
 
-    my_validation_logger.info(f"Completed processing {len(clean_records)} records")
+    my_validation_logger.info("Completed processing %s records", len(clean_records))
     return clean_records
@@ -0,0 +1,112 @@
+""" This script maps each mawndb daily column to a precompiled validator.
+It reuses the validator builders of the hourly registry with the daily ranges of the mawndb_classes.
+"""
+import os
+import sys
+from dotenv import load_dotenv
+load_dotenv()
+ewx_base_path = os.getenv("EWX_BASE_PATH")
+sys.path.append(ewx_base_path)
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+from .daily_variables_list import (
+    relh_vars,
+    pcpn_vars,
+    rpet_vars,
+    temp_vars,
+    wspd_vars,
+    wdir_vars,
+    leafwt_vars,
+    dwpt_vars,
+    vapr_vars,
+    mstr_vars,
+    srad_vars,
+    nrad_vars,
+    sflux_vars,
+    wstdv_vars,
+    volt_vars,
+    sden_vars
+)
+from ewx_utils.hourly_validation_checks.hourly_validator_registry import (
+    ColumnValidator,
+    build_registry,
+    range_check,
+    round_to_six,
+    temp_validator,
+)
+from ewx_utils.mawndb_classes.voltage import Voltage
+from ewx_utils.mawndb_classes.humidity import Humidity
+from ewx_utils.mawndb_classes.wind_speed import WindSpeed
+from ewx_utils.mawndb_classes.soil_moisture import SoilMoisture
+from ewx_utils.mawndb_classes.net_radiation import NetRadiation
+from ewx_utils.mawndb_classes.soil_heat_flux import SoilHeatFlux
+from ewx_utils.mawndb_classes.precipitation import Precipitation
+from ewx_utils.mawndb_classes.wind_direction import WindDirection
+from ewx_utils.mawndb_classes.vapor_pressure import VaporPressure
+from ewx_utils.mawndb_classes.solar_radiation import SolarRadiation
+from ewx_utils.mawndb_classes.evapotranspiration import Evapotranspiration
+from ewx_utils.mawndb_classes.std_dev_wind_direction import StdDevWindDirection
+from ewx_utils.mawndb_classes.solar_flux import SolarFlux
+
+
+def leafwt_daily_check(value: Any, record_date: Any = None) -> bool:
+    """
+    LeafWetness has no daily range: its is_valid raises for the DAILY table, and so does this check.
+    """
+    raise ValueError("Table must be either 'FIVEMIN' or 'HOURLY'")
+
+
+def sden_daily_check(value: Any, record_date: Any = None) -> bool:
+    """
+    Daily sden columns have always been accepted: check_value returned the SolarFlux.is_valid method
+    itself, which is truthy, instead of calling it.
+    """
+    return True
+
+
+# Same order as the original check_value if-chain
+DAILY_VALIDATORS = build_registry([
+    (relh_vars, ColumnValidator("relh_vars", Humidity.valid_relh_hourly_default, None,
+                                range_check(Humidity.valid_relh_hourly_default))),
+    (pcpn_vars, ColumnValidator("pcpn_vars", Precipitation.valid_pcpn_daily_default, None,
+                                range_check(Precipitation.valid_pcpn_daily_default))),
+    (rpet_vars, ColumnValidator("rpet_vars", Evapotranspiration.valid_rpet_daily_default, None,
+                                range_check(Evapotranspiration.valid_rpet_daily_default))),
+    (temp_vars, temp_validator),
+    (wspd_vars, ColumnValidator("wspd_vars", WindSpeed.valid_wspd_hourly_default, None,
+                                range_check(WindSpeed.valid_wspd_hourly_default))),
+    (wdir_vars, ColumnValidator("wdir_vars", WindDirection.valid_wdir_hourly_default, None,
+                                range_check(WindDirection.valid_wdir_hourly_default))),
+    (leafwt_vars, ColumnValidator("leafwt_vars", (None, None), None, leafwt_daily_check)),
+    (dwpt_vars, temp_validator._replace(kind="dwpt_vars")),
+    (vapr_vars, ColumnValidator("vapr_vars", VaporPressure.valid_vapr_hourly_default, None,
+                                range_check(VaporPressure.valid_vapr_hourly_default, convert=None))),
+    (mstr_vars, ColumnValidator("mstr_vars", SoilMoisture.valid_mstr_hourly_default, None,
+                                range_check(SoilMoisture.valid_mstr_hourly_default, convert=None))),
+    (nrad_vars, ColumnValidator("nrad_vars", NetRadiation.valid_nrad_hourly_default, None,
+                                range_check(NetRadiation.valid_nrad_hourly_default, convert=round_to_six))),
+    (srad_vars, ColumnValidator("srad_vars", SolarRadiation.valid_srad_daily_default, None,
+                                range_check(SolarRadiation.valid_srad_daily_default))),
+    (sflux_vars, ColumnValidator("sflux_vars", SoilHeatFlux.valid_sflux_hourly_default, None,
+                                 range_check(SoilHeatFlux.valid_sflux_hourly_default, convert=None))),
+    (wstdv_vars, ColumnValidator("wstdv_vars", StdDevWindDirection.valid_wstdv_hourly_default, None,
+                                 range_check(StdDevWindDirection.valid_wstdv_hourly_default, convert=None))),
+    (volt_vars, ColumnValidator("volt_vars", Voltage.valid_volt_hourly_default, None,
+                                range_check(Voltage.valid_volt_hourly_default, convert=None))),
+    (sden_vars, ColumnValidator("sden_vars", SolarFlux.valid_sden_max_default, None, sden_daily_check)),
+])
+
+
+@lru_cache(maxsize=None)
+def resolve_validators(columns: Tuple[str, ...]) -> Dict[str, ColumnValidator]:
+    """
+    Resolve the validators for a set of columns once, e.g. the qc_columns of a station table.
+    Columns without a validator are left out; check_value treats them as invalid.
+
+    Parameters:
+        columns (Tuple[str, ...]): Column names, as a tuple so that the result can be cached.
+
+    Returns:
+        Dict[str, ColumnValidator]: Validators keyed by column name.
+    """
+    return {column: DAILY_VALIDATORS[column] for column in columns if column in DAILY_VALIDATORS}
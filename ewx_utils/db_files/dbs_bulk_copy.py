@@ -0,0 +1,114 @@
+""" This script bulk loads cleaned records into a QC table with COPY.
+Records are streamed from an in-memory CSV buffer into a temporary table and merged into the
+target table with a single INSERT ... SELECT ... ON CONFLICT per group of columns.
+"""
+import os
+import sys
+import io
+import csv
+from dotenv import load_dotenv
+load_dotenv()
+ewx_base_path = os.getenv("EWX_BASE_PATH")
+sys.path.append(ewx_base_path)
+from ewx_utils.ewx_config import ewx_log_file
+from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+# Initialize custom logger
+my_dbfiles_logger = EWXStructuredLogger(log_path=ewx_log_file)
+
+COPY_NULL = "\\N"
+
+
+def records_to_csv_buffer(records: List[Dict[str, Any]], record_keys: Sequence[str]) -> io.StringIO:
+    """
+    Write records to an in-memory CSV buffer in the column order of record_keys.
+    Missing keys and None values are written as the COPY NULL marker.
+
+    Parameters:
+        records (List[Dict[str, Any]]): Records to write, where each record is a dictionary
+        record_keys (Sequence[str]): Columns to write, in order
+
+    Returns:
+        io.StringIO: Buffer positioned at its start
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for record in records:
+        writer.writerow([COPY_NULL if record.get(key) is None else record[key] for key in record_keys])
+    buffer.seek(0)
+    return buffer
+
+
+def copy_upsert_group(cursor: Any, table: str, records: List[Dict[str, Any]], record_keys: Sequence[str],
+                      unique_keys: Sequence[str] = ("date", "time")) -> None:
+    """
+    COPY one group of records with the same columns into a temporary table and merge it into the table.
+
+    Parameters:
+        cursor (Any): Database cursor
+        table (str): Target table, e.g. aetna_hourly
+        records (List[Dict[str, Any]]): Records to load
+        record_keys (Sequence[str]): Columns written for every record
+        unique_keys (Sequence[str]): Columns of the ON CONFLICT target
+    """
+    columns = ", ".join(record_keys)
+    temp_table = f"bulk_{table}"
+    update_cols = [f"{key} = EXCLUDED.{key}" for key in record_keys if key not in unique_keys]
+    if update_cols:
+        conflict_action = "DO UPDATE SET " + ", ".join(update_cols)
+    else:
+        conflict_action = "DO NOTHING"
+
+    # CREATE TABLE AS copies the column types but not the constraints, so columns left out of the
+    # COPY (such as an excluded id) do not need a value in the temporary table
+    cursor.execute(f"CREATE TEMP TABLE {temp_table} ON COMMIT DROP AS SELECT {columns} FROM {table} WITH NO DATA")
+    cursor.copy_expert(
+        f"COPY {temp_table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+        records_to_csv_buffer(records, record_keys),
+    )
+    cursor.execute(
+        f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {temp_table} "
+        f"ON CONFLICT ({', '.join(unique_keys)}) {conflict_action}"
+    )
+    cursor.execute(f"DROP TABLE {temp_table}")
+
+
+def copy_upsert_records(cursor: Any, table: str, records: List[Dict[str, Any]],
+                        record_keys: Optional[Sequence[str]] = None,
+                        unique_keys: Sequence[str] = ("date", "time"),
+                        exclude_keys: Sequence[str] = ()) -> None:
+    """
+    Bulk load records into a table with COPY FROM STDIN and merge them with INSERT ... SELECT ... ON CONFLICT.
+
+    When record_keys is None the records are grouped by their own columns, otherwise every record is
+    written with record_keys and missing columns are loaded as NULL. Columns in exclude_keys, such as an id
+    filled by the table's default, are not copied.
+
+    Parameters:
+        cursor (Any): Database cursor
+        table (str): Target table, e.g. aetna_hourly
+        records (List[Dict[str, Any]]): Records to load, where each record is a dictionary
+        record_keys (Optional[Sequence[str]]): Columns written for every record
+        unique_keys (Sequence[str]): Columns of the ON CONFLICT target
+        exclude_keys (Sequence[str]): Columns of the records that are not copied
+    """
+    if not records:
+        my_dbfiles_logger.error(f"No records to copy into {table}.")
+        return
+
+    if record_keys is None:
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for record in records:
+            groups.setdefault(tuple(record.keys()), []).append(record)
+    else:
+        groups = {tuple(record_keys): records}
+
+    try:
+        for keys, grouped_records in groups.items():
+            copy_upsert_group(cursor, table, grouped_records, [key for key in keys if key not in exclude_keys],
+                              unique_keys)
+        my_dbfiles_logger.info(f"Copied {len(records)} records into {table}.")
+    except Exception as e:
+        my_dbfiles_logger.error(f"Error copying records into {table}: {e}")
+        raise
@@ -0,0 +1,124 @@
+""" This script compares cleaned records with the rows already stored in a QC table before they are written.
+The stored rows of the records' date range are fetched in one query and each record is hashed against the
+stored row of its date and time, so that only new and changed rows are sent to the upsert; rewriting an
+identical row would only add WAL, index churn and dead tuples.
+"""
+import os
+import sys
+import hashlib
+from dotenv import load_dotenv
+load_dotenv()
+ewx_base_path = os.getenv("EWX_BASE_PATH")
+sys.path.append(ewx_base_path)
+from ewx_utils.ewx_config import ewx_log_file
+from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
+from datetime import date, time
+from decimal import Decimal
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Initialize custom logger
+my_dbfiles_logger = EWXStructuredLogger(log_path=ewx_log_file)
+
+# Numbers are compared to this many significant digits, so a value read back from a real column
+# matches the Decimal or float it was written from
+DIGEST_SIGNIFICANT_DIGITS = 6
+
+
+def comparable_value(value: Any) -> Any:
+    """
+    Normalize a column value for comparison: numbers are rounded to DIGEST_SIGNIFICANT_DIGITS
+    significant digits, other values are kept.
+
+    Parameters:
+        value (Any): Column value of a cleaned record or a stored row
+
+    Returns:
+        Any: The normalized value
+    """
+    if isinstance(value, (float, Decimal, int)) and not isinstance(value, bool):
+        return float(f"{float(value):.{DIGEST_SIGNIFICANT_DIGITS}g}")
+    return value
+
+
+def row_digest(row: Dict[str, Any], columns: Sequence[str]) -> bytes:
+    """
+    Hash the normalized values of the given columns of a row; missing columns hash as None.
+
+    Parameters:
+        row (Dict[str, Any]): Cleaned record or stored row
+        columns (Sequence[str]): Columns to hash, in order
+
+    Returns:
+        bytes: 16-byte digest of the row
+    """
+    values = tuple(comparable_value(row.get(column)) for column in columns)
+    return hashlib.blake2b(repr(values).encode(), digest_size=16).digest()
+
+
+def fetch_existing_rows(cursor: Any, table: str, begin_date: date, end_date: date) -> Dict[Tuple[date, time], Dict[str, Any]]:
+    """
+    Fetch the stored rows of a date range in one query.
+
+    Parameters:
+        cursor (Any): RealDictCursor on the QC database
+        table (str): QC table, e.g. aetna_hourly
+        begin_date (date): First date of the range
+        end_date (date): Last date of the range (inclusive)
+
+    Returns:
+        Dict[Tuple[date, time], Dict[str, Any]]: Stored rows keyed by their (date, time) pair
+    """
+    cursor.execute(f"SELECT * FROM {table} WHERE date BETWEEN %s AND %s", (begin_date, end_date))
+    return {(row["date"], row["time"]): row for row in cursor.fetchall()}
+
+
+def split_changed_records(records: List[Dict[str, Any]],
+                          existing_rows: Dict[Tuple[date, time], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Split records into new rows, changed rows and rows identical to the stored ones.
+    A record is compared on its own columns (without id), since records built from a MAWN record only
+    carry the columns of that record.
+
+    Parameters:
+        records (List[Dict[str, Any]]): Cleaned records
+        existing_rows (Dict[Tuple[date, time], Dict[str, Any]]): Stored rows as returned by fetch_existing_rows
+
+    Returns:
+        Dict[str, Any]: The "inserts" and "updates" records to write and the number of "unchanged" records
+    """
+    changes = {"inserts": [], "updates": [], "unchanged": 0}
+    for record in records:
+        existing_row = existing_rows.get((record["date"], record["time"]))
+        if existing_row is None:
+            changes["inserts"].append(record)
+            continue
+        columns = [column for column in record if column != "id"]
+        if row_digest(record, columns) == row_digest(existing_row, columns):
+            changes["unchanged"] += 1
+        else:
+            changes["updates"].append(record)
+    return changes
+
+
+def diff_existing_records(cursor: Any, table: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Compare records with the rows stored for their date range.
+
+    Parameters:
+        cursor (Any): RealDictCursor on the QC database
+        table (str): QC table, e.g. aetna_hourly
+        records (List[Dict[str, Any]]): Cleaned records
+
+    Returns:
+        Dict[str, Any]: The "inserts" and "updates" records to write and the number of "unchanged" records
+    """
+    if not records:
+        return {"inserts": [], "updates": [], "unchanged": 0}
+    dates = [record["date"] for record in records]
+    existing_rows = fetch_existing_rows(cursor, table, min(dates), max(dates))
+    changes = split_changed_records(records, existing_rows)
+    my_dbfiles_logger.info(
+        f"{table}: {len(changes['inserts'])} new, {len(changes['updates'])} changed, "
+        f"{changes['unchanged']} unchanged records"
+    )
+    return changes
@@ -2,6 +2,7 @@ import os
 import sys
 import argparse
 from argparse import Namespace
+import uuid
 import psycopg2
 from psycopg2 import OperationalError, extras
 from typing import Any
@@ -11,7 +12,8 @@ ewx_base_path = os.getenv("EWX_BASE_PATH")
 sys.path.append(ewx_base_path)
 from ewx_utils.ewx_config import ewx_log_file
 from ewx_utils.db_files.dbs_configfile import get_db_config
-from typing import List, Dict, Any, Tuple
+from ewx_utils.db_files.dbs_pool import get_pool_manager
+from typing import List, Dict, Any, Tuple, Iterator
 from ewx_utils.logs.ewx_utils_logs_config import ewx_unstructured_logger
 from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
 
@@ -217,11 +219,61 @@ def get_qcwrite_cursor(connection: psycopg2.extensions.connection,
     except Exception as error:
         my_dbfiles_logger.error(f"Unexpected error establishing {db_name} cursor connection: {str(error)}")
         raise
+
+def stream_records(connection: psycopg2.extensions.connection,
+                   query: str,
+                   params: Tuple = (),
+                   itersize: int = 2000,
+                   cursor_factory: Any = extras.RealDictCursor) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the rows of a query from a named server-side cursor, fetching itersize rows per round trip,
+    so that only one batch of rows is held in memory instead of the whole result.
+    The cursor is declared when the first row is requested and closed once the rows are exhausted or
+    the generator is closed. The connection must not be in autocommit mode.
+
+    Parameters:
+        connection (psycopg2.extensions.connection): Database connection object
+        query (str): Query to execute
+        params (Tuple, Optional): Query parameters
+        itersize (int, Optional): Number of rows fetched per round trip. Defaults to 2000
+        cursor_factory (Any, Optional): Cursor factory to use. Defaults to RealDictCursor
+
+    Returns:
+        Iterator[Dict[str, Any]]: Rows as dictionaries
+
+    Raises:
+        psycopg2.DatabaseError: If the query fails
+    """
+    cursor = connection.cursor(name=f"stream_{uuid.uuid4().hex}", cursor_factory=cursor_factory)
+    cursor.itersize = itersize
+    try:
+        cursor.execute(query, params)
+        for row in cursor:
+            yield dict(row)
+    except psycopg2.DatabaseError as error:
+        my_dbfiles_logger.error(f"Database error streaming records: {str(error)}")
+        raise
+    finally:
+        cursor.close()
     
 
+def release_connection(connection: psycopg2.extensions.connection) -> None:
+    """
+    Give a connection taken by create_db_connections back to its pool, rolling back any open transaction.
+    The connection stays open for the next station or run of the process; connections that do not
+    come from a pool are closed.
+
+    Parameters:
+        connection (psycopg2.extensions.connection): Database connection object
+    """
+    get_pool_manager().putconn(connection)
+
+
 def create_db_connections(args: Namespace) -> Dict[str, Any]:
     """
     Create and return necessary database connections based on user-specified arguments.
+    The connections are taken from the per-section connection pools, so a process reuses its open
+    connections; give them back with release_connection.
 
     Parameters:
     args : Namespace
@@ -274,7 +326,7 @@ def create_db_connections(args: Namespace) -> Dict[str, Any]:
                 # Only create the connection if it doesn't already exist
                 if connection_key not in connections:
                     my_dbfiles_logger.debug(f"Attempting connection for {connection_key}")
-                    connections[connection_key] = connect_to_db(db_config)
+                    connections[connection_key] = get_pool_manager().getconn(section)
                     
                     # Verifying connection
                     if connections[connection_key].closed:
@@ -303,7 +355,7 @@ def create_db_connections(args: Namespace) -> Dict[str, Any]:
         my_dbfiles_logger.debug(f"Write configuration: {safe_write_config}")
 
         # Creating write connection
-        connections["qcwrite_connection"] = connect_to_db(write_config)
+        connections["qcwrite_connection"] = get_pool_manager().getconn(args.write_to)
         
         # Verifying write connection
         if connections["qcwrite_connection"].closed:
@@ -0,0 +1,185 @@
+""" This script pools database connections per INI section.
+Connecting through the SSH tunnel takes seconds, so connections are opened on demand, health checked when
+they are handed out and kept open for the next station or run of the same process. Each section holds at
+most EWX_DB_POOL_MAXCONN connections; a caller waits up to EWX_DB_POOL_TIMEOUT seconds for a free one.
+"""
+import os
+import sys
+import threading
+from multiprocessing.util import Finalize
+import psycopg2
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+from dotenv import load_dotenv
+load_dotenv()
+ewx_base_path = os.getenv("EWX_BASE_PATH")
+sys.path.append(ewx_base_path)
+from ewx_utils.ewx_config import ewx_log_file
+from ewx_utils.db_files.dbs_configfile import get_db_config
+from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
+from typing import Any, Dict, List, Optional, Tuple
+
+# Initialize custom logger
+my_dbfiles_logger = EWXStructuredLogger(log_path=ewx_log_file)
+
+POOL_MAXCONN = int(os.getenv("EWX_DB_POOL_MAXCONN", "4"))
+POOL_TIMEOUT = float(os.getenv("EWX_DB_POOL_TIMEOUT", "60"))
+
+
+class SectionConnectionPool(ThreadedConnectionPool):
+    """
+    ThreadedConnectionPool that opens its connections on demand and keeps up to maxconn of them open.
+    """
+
+    def __init__(self, maxconn: int, **db_config: Any):
+        super().__init__(0, maxconn, **db_config)
+        # The base pool only keeps minconn idle connections and opens minconn connections up front
+        self.minconn = self.maxconn
+
+
+def connection_is_healthy(connection: psycopg2.extensions.connection) -> bool:
+    """
+    Check that a connection is open and answers a query; an open transaction is rolled back.
+
+    Parameters:
+        connection (psycopg2.extensions.connection): Database connection object
+
+    Returns:
+        bool: True if the connection can be used
+    """
+    if connection.closed:
+        return False
+    try:
+        connection.rollback()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        connection.rollback()
+        return True
+    except psycopg2.Error as error:
+        my_dbfiles_logger.warning(f"Connection health check failed: {str(error)}")
+        return False
+
+
+class ConnectionPoolManager:
+    """
+    Connection pools keyed by INI section.
+    """
+
+    def __init__(self, maxconn: int = POOL_MAXCONN, timeout: float = POOL_TIMEOUT):
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self.pid = os.getpid()
+        self._pools: Dict[str, Tuple[SectionConnectionPool, threading.BoundedSemaphore]] = {}
+        self._sections: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def pool(self, section: str) -> Tuple[SectionConnectionPool, threading.BoundedSemaphore]:
+        """
+        Return the pool of a section and the semaphore bounding its connections, creating them on first use.
+
+        Parameters:
+            section (str): Section name in the INI file
+
+        Returns:
+            Tuple[SectionConnectionPool, threading.BoundedSemaphore]: The pool and its semaphore
+
+        Raises:
+            Exception: If the section is not found in the INI file
+        """
+        with self._lock:
+            if section not in self._pools:
+                db_config = get_db_config(section)
+                self._pools[section] = (SectionConnectionPool(self.maxconn, **db_config),
+                                        threading.BoundedSemaphore(self.maxconn))
+                my_dbfiles_logger.info(f"Created connection pool for {section} "
+                                       f"({db_config.get('dbname', 'unknown')} on {db_config.get('host', 'unknown')})")
+            return self._pools[section]
+
+    def getconn(self, section: str) -> psycopg2.extensions.connection:
+        """
+        Take a connection of a section from its pool, waiting for a free one if all are in use.
+        A connection that fails its health check is closed and replaced.
+
+        Parameters:
+            section (str): Section name in the INI file
+
+        Returns:
+            psycopg2.extensions.connection: Connection object, not in autocommit mode
+
+        Raises:
+            PoolError: If no connection is free within the timeout
+            OperationalError: If a new connection cannot be opened
+        """
+        pool, slots = self.pool(section)
+        if not slots.acquire(timeout=self.timeout):
+            raise PoolError(f"No {section} connection free after {self.timeout} seconds")
+        try:
+            connection = pool.getconn()
+            if not connection_is_healthy(connection):
+                my_dbfiles_logger.warning(f"Replacing a broken {section} connection")
+                pool.putconn(connection, close=True)
+                connection = pool.getconn()
+        except Exception:
+            slots.release()
+            raise
+        with self._lock:
+            self._sections[id(connection)] = section
+        return connection
+
+    def putconn(self, connection: psycopg2.extensions.connection, close: bool = False) -> None:
+        """
+        Give a connection back to its pool; an open transaction is rolled back.
+        Connections that do not come from a pool are closed.
+
+        Parameters:
+            connection (psycopg2.extensions.connection): Connection taken with getconn
+            close (bool, optional): Close the connection instead of keeping it. Defaults to False
+        """
+        with self._lock:
+            section = self._sections.pop(id(connection), None)
+        if section is None:
+            connection.close()
+            return
+        pool, slots = self._pools[section]
+        try:
+            if not connection.closed and connection.autocommit:
+                connection.autocommit = False
+            pool.putconn(connection, close=close or bool(connection.closed))
+        finally:
+            slots.release()
+
+    def closeall(self) -> None:
+        """
+        Close every connection of every pool.
+        """
+        with self._lock:
+            pools, self._pools = self._pools, {}
+            self._sections = {}
+        for section, (pool, _) in pools.items():
+            if not pool.closed:
+                pool.closeall()
+                my_dbfiles_logger.info(f"Closed connection pool for {section}")
+
+
+_pool_manager: Optional[ConnectionPoolManager] = None
+# Managers inherited from a parent process: their connections share the parent's sockets, so they are
+# kept referenced and never closed in the child
+_inherited_managers: List[ConnectionPoolManager] = []
+
+
+def get_pool_manager() -> ConnectionPoolManager:
+    """
+    Return the connection pool manager of this process.
+    The pools are closed when the process exits; a worker process gets its own pools.
+
+    Returns:
+        ConnectionPoolManager: The process-wide manager
+    """
+    global _pool_manager
+    if _pool_manager is not None and _pool_manager.pid != os.getpid():
+        _inherited_managers.append(_pool_manager)
+        _pool_manager = None
+    if _pool_manager is None:
+        _pool_manager = ConnectionPoolManager()
+        # Finalizers also run when a multiprocessing worker exits, unlike atexit handlers
+        Finalize(_pool_manager, _pool_manager.closeall, exitpriority=10)
+    return _pool_manager
@@ -0,0 +1,86 @@
+""" This script keeps the per-station watermarks of the incremental hourly QC runs in the QC database.
+A watermark records the last hour written for a station and the largest MAWN and RTMA row ids seen,
+so that the next run only revalidates the hours after it and the hours whose upstream rows changed.
+"""
+import os
+import sys
+from dotenv import load_dotenv
+load_dotenv()
+ewx_base_path = os.getenv("EWX_BASE_PATH")
+sys.path.append(ewx_base_path)
+from ewx_utils.ewx_config import ewx_log_file
+from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+# Initialize custom logger
+my_dbfiles_logger = EWXStructuredLogger(log_path=ewx_log_file)
+
+WATERMARK_TABLE = "hourly_qc_watermarks"
+
+CREATE_WATERMARK_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS {WATERMARK_TABLE} (
+        station text PRIMARY KEY,
+        last_hour timestamp NOT NULL,
+        mawn_max_id bigint,
+        rtma_max_id bigint,
+        updated_at timestamptz NOT NULL DEFAULT now()
+    )
+"""
+
+
+def ensure_watermark_table(cursor: Any) -> None:
+    """
+    Create the watermark table if it does not exist yet.
+
+    Parameters:
+        cursor (Any): Cursor on the QC database
+    """
+    cursor.execute(CREATE_WATERMARK_TABLE)
+
+
+def read_watermark(cursor: Any, station: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the watermark of a station.
+
+    Parameters:
+        cursor (Any): RealDictCursor on the QC database
+        station (str): Station name
+
+    Returns:
+        Optional[Dict[str, Any]]: last_hour, mawn_max_id and rtma_max_id, or None if the station has no
+        watermark or the table does not exist yet
+    """
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL AS table_exists", (WATERMARK_TABLE,))
+    if not cursor.fetchone()["table_exists"]:
+        return None
+    cursor.execute(
+        f"SELECT last_hour, mawn_max_id, rtma_max_id FROM {WATERMARK_TABLE} WHERE station = %s", (station,)
+    )
+    row = cursor.fetchone()
+    return dict(row) if row else None
+
+
+def write_watermark(cursor: Any, station: str, last_hour: datetime, mawn_max_id: Optional[int],
+                    rtma_max_id: Optional[int]) -> None:
+    """
+    Insert or move the watermark of a station; the caller commits.
+    A watermark only moves forward, so an incremental run over an older date range does not rewind it.
+
+    Parameters:
+        cursor (Any): Cursor on the QC database
+        station (str): Station name
+        last_hour (datetime): Last local hour written for the station
+        mawn_max_id (Optional[int]): Largest MAWN row id seen
+        rtma_max_id (Optional[int]): Largest RTMA row id seen
+    """
+    cursor.execute(
+        f"INSERT INTO {WATERMARK_TABLE} (station, last_hour, mawn_max_id, rtma_max_id, updated_at) "
+        f"VALUES (%s, %s, %s, %s, now()) "
+        f"ON CONFLICT (station) DO UPDATE SET "
+        f"last_hour = GREATEST({WATERMARK_TABLE}.last_hour, EXCLUDED.last_hour), "
+        f"mawn_max_id = GREATEST({WATERMARK_TABLE}.mawn_max_id, EXCLUDED.mawn_max_id), "
+        f"rtma_max_id = GREATEST({WATERMARK_TABLE}.rtma_max_id, EXCLUDED.rtma_max_id), updated_at = now()",
+        (station, last_hour, mawn_max_id, rtma_max_id),
+    )
+    my_dbfiles_logger.info("Moved the watermark of %s to %s", station, last_hour)
@@ -0,0 +1,158 @@
+""" This script precomputes the hourly calendar of the station tables.
+For each year it builds, once, the local hours (naive America/Detroit wall-clock times, as stored in the
+date and time columns) with their year, day of year, hour and rpt_time identifiers; midnight is reported as
+hour 24 of the previous day. Date ranges are served as slices of these per-year grids.
+"""
+import os
+import sys
+from dotenv import load_dotenv
+load_dotenv()
+ewx_base_path = os.getenv("EWX_BASE_PATH")
+sys.path.append(ewx_base_path)
+from bisect import bisect_right
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+from datetime import date, datetime, time, timedelta
+from dateutil.parser import parse
+from typing import Any, Dict, List, Optional, Tuple
+
+LOCAL_TIMEZONE = ZoneInfo("America/Detroit")
+HOURS_PER_DAY = 24
+
+
+class HourGrid:
+    """
+    Parallel lists describing consecutive local hours: the hour as a datetime, its date and time columns,
+    and its year, day, hour and rpt_time identifiers.
+    """
+    __slots__ = ("datetimes", "dates", "times", "years", "days", "hours", "rpt_times")
+
+    def __init__(self, datetimes: List[datetime], dates: List[date], times: List[time], years: List[int],
+                 days: List[int], hours: List[int], rpt_times: List[str]):
+        self.datetimes = datetimes
+        self.dates = dates
+        self.times = times
+        self.years = years
+        self.days = days
+        self.hours = hours
+        self.rpt_times = rpt_times
+
+    def __len__(self) -> int:
+        return len(self.datetimes)
+
+    def slice(self, start: int, stop: int) -> "HourGrid":
+        return HourGrid(*(column[start:stop] for column in self.columns()))
+
+    def columns(self) -> Tuple[List[Any], ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def id_fields(self, index: int) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: year, day, hour and rpt_time of the hour at index, as a new dictionary
+        """
+        return {"year": self.years[index], "day": self.days[index], "hour": self.hours[index], "rpt_time": self.rpt_times[index]}
+
+
+@lru_cache(maxsize=32)
+def year_grid(year: int) -> HourGrid:
+    """
+    Build the hours of a year, from January 1 00:00 to December 31 23:00; cached per year.
+
+    Parameters:
+        year (int): Calendar year
+
+    Returns:
+        HourGrid: The 8760 (8784 in leap years) hours of the year; treat it as read-only
+    """
+    first_day = date(year, 1, 1)
+    n_days = (date(year + 1, 1, 1) - first_day).days
+    hour_times = [time(hour) for hour in range(HOURS_PER_DAY)]
+    columns = ([], [], [], [], [], [], [])
+    datetimes, dates, times, years, days, hours, rpt_times = columns
+    for day_index in range(n_days):
+        this_date = first_day + timedelta(days=day_index)
+        # Midnight belongs to hour 24 of the previous day
+        previous_date = this_date - timedelta(days=1)
+        for hour, hour_time in enumerate(hour_times):
+            represented_date, represented_hour = (previous_date, 24) if hour == 0 else (this_date, hour)
+            datetimes.append(datetime.combine(this_date, hour_time))
+            dates.append(this_date)
+            times.append(hour_time)
+            years.append(represented_date.year)
+            days.append(represented_date.timetuple().tm_yday)
+            hours.append(represented_hour)
+            rpt_times.append(f"{represented_hour}00")
+    return HourGrid(*columns)
+
+
+def parse_date(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD date, falling back to dateutil for other formats.
+    """
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return parse(value).date()
+
+
+def local_now() -> datetime:
+    """
+    Returns:
+        datetime: The current America/Detroit wall-clock time, naive like the hours of the grid
+    """
+    return datetime.now(LOCAL_TIMEZONE).replace(tzinfo=None)
+
+
+def hour_grid(begin_date: str, end_date: str, now: Optional[datetime] = None) -> HourGrid:
+    """
+    Return the hours from begin_date 00:00 through end_date 23:00, stopping at the current local time.
+
+    Parameters:
+        begin_date (str): First day of the range
+        end_date (str): Last day of the range (inclusive)
+        now (Optional[datetime]): Naive local time after which hours are left out; defaults to local_now()
+
+    Returns:
+        HourGrid: The hours of the range, sliced from the cached year grids
+
+    Raises:
+        ValueError: If a date cannot be parsed
+    """
+    begin = parse_date(begin_date)
+    end = parse_date(end_date)
+    if end < begin:
+        return HourGrid([], [], [], [], [], [], [])
+    now = local_now() if now is None else now
+
+    parts = []
+    for year in range(begin.year, end.year + 1):
+        grid = year_grid(year)
+        first_day = date(year, 1, 1)
+        start = (max(begin, first_day) - first_day).days * HOURS_PER_DAY
+        stop = ((min(end, date(year, 12, 31)) - first_day).days + 1) * HOURS_PER_DAY
+        # Hours after now are left out, as generate_list_of_hours always did
+        stop = min(stop, bisect_right(grid.datetimes, now, start, stop))
+        parts.append(grid.slice(start, stop))
+    if len(parts) == 1:
+        return parts[0]
+    columns = tuple([] for _ in HourGrid.__slots__)
+    for part in parts:
+        for column, values in zip(columns, part.columns()):
+            column.extend(values)
+    return HourGrid(*columns)
+
+
+def hour_id_fields(dt: datetime) -> Dict[str, Any]:
+    """
+    Look up the year, day, hour and rpt_time identifiers of a local hour.
+
+    Parameters:
+        dt (datetime): Local date and time; minutes and seconds are ignored
+
+    Returns:
+        Dict[str, Any]: year, day, hour and rpt_time, as a new dictionary
+    """
+    grid = year_grid(dt.year)
+    index = (dt.date() - date(dt.year, 1, 1)).days * HOURS_PER_DAY + dt.hour
+    return grid.id_fields(index)
@@ -0,0 +1,508 @@
+""" This script validates a station's hourly records column by column with NumPy.
+It is an optional alternative to process_records in hourly_validation_utils: the fetched rows are turned into
+per-column arrays with a null mask, the range rules of the validator registry are applied as vectorized comparisons,
+and the value and _src code arrays of every QC column are built in one pass.
+The records it returns are identical to the ones of the dict pipeline.
+"""
+import os
+import sys
+from dotenv import load_dotenv
+load_dotenv()
+ewx_base_path = os.getenv("EWX_BASE_PATH")
+sys.path.append(ewx_base_path)
+from ewx_utils.ewx_config import ewx_log_file
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, process_records_columnar then uses the dict pipeline
+    np = None
+from .hourly_variables_list import relh_vars
+from .hourly_time_utils import generate_list_of_hours
+from .hourly_calendar import hour_id_fields
+from .hourly_validator_registry import HOURLY_VALIDATORS
+from .hourly_validation_utils import (
+    ID_COLUMNS,
+    check_value,
+    index_records_by_hour,
+    process_records,
+)
+from ewx_utils.mawndb_classes.dew_point import DewPoint
+from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
+
+# Initialize the logger
+my_columnar_logger = EWXStructuredLogger(log_path=ewx_log_file)
+
+# Source codes stored in the _src code arrays
+SRC_CODES = ("MAWN", "OOR", "EMPTY", "RELH_CAP", "RTMA")
+MAWN, OOR, EMPTY, RELH_CAP, RTMA = range(len(SRC_CODES))
+
+# Thresholds on which relh_cap decides between keeping, capping and dropping a humidity value
+RELH_CAP_THRESHOLDS = (0, 100, 105)
+
+# Values this close to a threshold are validated with the scalar checks, so that Decimal and rounded values
+# give exactly the same result as in the dict pipeline
+EXACT_CHECK_TOLERANCE = 1e-6
+
+
+def numpy_available() -> bool:
+    """
+    Returns:
+        bool: True if NumPy can be imported and the columnar engine can be used.
+    """
+    return np is not None
+
+
+def uniform_record_keys(records: List[Dict[str, Any]]) -> Optional[Tuple[str, ...]]:
+    """
+    Returns the columns shared by all records of a source, as fetched from a single table.
+
+    Parameters:
+        records (List[Dict[str, Any]]): Records fetched from the MAWN or RTMA database.
+
+    Returns:
+        Optional[Tuple[str, ...]]: The record columns, or None if the records do not all have the same columns
+        or carry their own _src columns, in which case they are left to the dict pipeline.
+    """
+    if not records:
+        return ()
+    first_keys = records[0].keys()
+    if any(key.endswith("_src") for key in first_keys):
+        return None
+    if "dwpt" in first_keys and ("atmp" not in first_keys or "relh" not in first_keys):
+        return None
+    for record in records:
+        if record.keys() != first_keys:
+            return None
+    return tuple(first_keys)
+
+
+def gather_column(rows: List[Optional[Dict[str, Any]]], key: str) -> "np.ndarray":
+    """
+    Collect one column of the hourly rows into an object array, with None for missing hours.
+
+    Parameters:
+        rows (List[Optional[Dict[str, Any]]]): One record per hour, or None if there is no record for the hour.
+        key (str): The column name.
+
+    Returns:
+        np.ndarray: Object array holding the original values.
+    """
+    values = np.empty(len(rows), dtype=object)
+    values[:] = [row[key] if row is not None else None for row in rows]
+    return values
+
+
+def is_null(values: "np.ndarray") -> "np.ndarray":
+    """
+    Returns:
+        np.ndarray: Mask of the None values of an object array, tested by identity.
+    """
+    return np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+
+
+def null_and_floats(values: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Split an object column into its null mask and its float64 values.
+
+    Parameters:
+        values (np.ndarray): Object array of column values.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The null mask and the values as float64 (0 where null).
+    """
+    null = is_null(values)
+    filled = values.copy()
+    filled[null] = 0
+    return null, filled.astype(np.float64)
+
+
+def near_any(floats: "np.ndarray", thresholds) -> "np.ndarray":
+    """
+    Returns:
+        np.ndarray: Mask of the values within EXACT_CHECK_TOLERANCE of any of the thresholds.
+    """
+    near = np.zeros(len(floats), dtype=bool)
+    for threshold in thresholds:
+        near |= np.abs(floats - threshold) <= EXACT_CHECK_TOLERANCE
+    return near
+
+
+def range_mask(key: str, floats: "np.ndarray", months: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Apply the registry range of a column to its values, gathering the monthly bounds by month index.
+
+    Parameters:
+        key (str): The column name.
+        floats (np.ndarray): The column values as float64.
+        months (np.ndarray): Month (1-12) of every hour.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The valid mask and the mask of values too close to a bound to decide
+        in float64.
+    """
+    validator = HOURLY_VALIDATORS.get(key)
+    if validator is None:
+        return np.zeros(len(floats), dtype=bool), np.zeros(len(floats), dtype=bool)
+    if validator.monthly_bounds is not None:
+        monthly_bounds = np.array(validator.monthly_bounds, dtype=np.float64)
+        low = monthly_bounds[months - 1, 0]
+        high = monthly_bounds[months - 1, 1]
+    else:
+        low, high = validator.bounds
+    valid = (low <= floats) & (floats <= high)
+    return valid, near_any(floats, (low, high))
+
+
+def validate_value(key: str, value: Any, combined_date: datetime, default_source: str) -> Tuple[Any, str]:
+    """
+    Validate a single value the way creating_mawnsrc_record and relh_cap do.
+
+    Parameters:
+        key (str): The column name.
+        value (Any): The value to check.
+        combined_date (datetime): The hour of the value.
+        default_source (str): Source given to valid values.
+
+    Returns:
+        Tuple[Any, str]: The value to keep and its source.
+    """
+    if value is None:
+        return None, "EMPTY"
+    if value == -7999:
+        return None, "OOR"
+    src = default_source
+    if not check_value(key, value, combined_date):
+        src = "OOR"
+        if key not in relh_vars:
+            return None, src
+    if key in relh_vars:
+        if 100 < value <= 105:
+            return 100, "RELH_CAP"
+        if value > 105:
+            return None, "OOR"
+        if value < 0:
+            return None, "EMPTY"
+    return value, src
+
+
+def validate_column(
+    key: str,
+    values: "np.ndarray",
+    months: "np.ndarray",
+    hours: "np.ndarray",
+    default_code: int,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Validate one column for every hour: None values are EMPTY, -7999 and out of range values are OOR
+    and relative humidity values are capped as in relh_cap.
+
+    Parameters:
+        key (str): The column name.
+        values (np.ndarray): Object array of the column values.
+        months (np.ndarray): Month (1-12) of every hour.
+        hours (np.ndarray): Object array of the hours as datetimes.
+        default_code (int): Source code given to valid values (MAWN or RTMA).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The validated values and their source codes.
+    """
+    null, floats = null_and_floats(values)
+    live = ~null
+    valid, near = range_mask(key, floats, months)
+    missing = live & (floats == -7999)
+    near |= np.abs(floats + 7999) <= EXACT_CHECK_TOLERANCE
+    is_relh = key in relh_vars
+    if is_relh:
+        near |= near_any(floats, RELH_CAP_THRESHOLDS)
+
+    validated = values.copy()
+    codes = np.full(len(values), default_code, dtype=np.int8)
+    codes[null] = EMPTY
+    codes[missing] = OOR
+    validated[missing] = None
+    checked = live & ~missing
+    invalid = checked & ~valid
+    codes[invalid] = OOR
+    if is_relh:
+        capped = checked & (floats > 100) & (floats <= 105)
+        validated[capped] = 100
+        codes[capped] = RELH_CAP
+        above_cap = checked & (floats > 105)
+        validated[above_cap] = None
+        codes[above_cap] = OOR
+        negative = checked & (floats < 0)
+        validated[negative] = None
+        codes[negative] = EMPTY
+    else:
+        validated[invalid] = None
+
+    default_source = SRC_CODES[default_code]
+    for i in np.flatnonzero(near & live):
+        validated[i], src = validate_value(key, values[i], hours[i], default_source)
+        codes[i] = SRC_CODES.index(src)
+    return validated, codes
+
+
+def valid_replacements(key: str, values: "np.ndarray", months: "np.ndarray", hours: "np.ndarray") -> "np.ndarray":
+    """
+    Check RTMA values used to fill missing MAWN values, as replace_none_with_rtmarecord does with check_value.
+
+    Returns:
+        np.ndarray: Mask of the non-null values that pass check_value.
+    """
+    null, floats = null_and_floats(values)
+    valid, near = range_mask(key, floats, months)
+    valid &= ~null
+    for i in np.flatnonzero(near & ~null):
+        valid[i] = check_value(key, values[i], hours[i])
+    return valid
+
+
+def fill_mawn_dwpt(
+    validated: Dict[str, "np.ndarray"],
+    codes: Dict[str, "np.ndarray"],
+    present: "np.ndarray",
+    months: "np.ndarray",
+) -> None:
+    """
+    Calculate the missing MAWN dew points from the validated temperature and humidity, as create_mawn_dwpt does.
+    """
+    dwpt, dwpt_codes = validated["dwpt"], codes["dwpt"]
+    atmp, relh = validated["atmp"], validated["relh"]
+    for i in np.flatnonzero(present & is_null(dwpt)):
+        if atmp[i] is None or relh[i] is None:
+            dwpt_codes[i] = EMPTY
+            continue
+        try:
+            dwpt[i] = DewPoint.dwpt_value(atmp[i], relh[i], months[i])
+            dwpt_codes[i] = MAWN
+        except Exception as e:
+            my_columnar_logger.error(f"Error calculating dew point: {str(e)}")
+            dwpt_codes[i] = EMPTY
+
+
+def fill_rtma_dwpt(raw: Dict[str, "np.ndarray"], present: "np.ndarray", months: "np.ndarray") -> None:
+    """
+    Calculate the missing RTMA dew points from the RTMA temperature and humidity, as create_rtma_dwpt does.
+    """
+    dwpt, atmp, relh = raw["dwpt"], raw["atmp"], raw["relh"]
+    for i in np.flatnonzero(present & is_null(dwpt)):
+        if atmp[i] is None or relh[i] is None:
+            continue
+        try:
+            dwpt[i] = DewPoint.dwpt_value(atmp[i], relh[i], months[i])
+        except Exception as e:
+            my_columnar_logger.error(f"Error calculating dew point: {str(e)}")
+            dwpt[i] = None
+
+
+def replace_with_rtma(
+    qc_columns: List[str],
+    base_values: Dict[str, "np.ndarray"],
+    base_codes: Dict[str, "np.ndarray"],
+    rtma_raw: Dict[str, "np.ndarray"],
+    rtma_valid: Dict[str, "np.ndarray"],
+    n_hours: int,
+) -> Tuple[Dict[str, "np.ndarray"], Dict[str, "np.ndarray"]]:
+    """
+    Fill missing values with valid RTMA values for every QC column, as replace_none_with_rtmarecord does.
+
+    Parameters:
+        qc_columns (List[str]): The QC table columns.
+        base_values (Dict[str, np.ndarray]): Validated values of the record being completed.
+        base_codes (Dict[str, np.ndarray]): Source codes of the record being completed.
+        rtma_raw (Dict[str, np.ndarray]): RTMA values, including calculated dew points.
+        rtma_valid (Dict[str, np.ndarray]): Masks of the RTMA values passing check_value.
+        n_hours (int): Number of hours.
+
+    Returns:
+        Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]: Values of every QC data column and codes of every
+        QC _src column.
+    """
+    values = {}
+    codes = {}
+    for key in qc_columns:
+        if key.endswith("_src"):
+            continue
+        if key in base_values:
+            values[key] = base_values[key].copy()
+        else:
+            values[key] = np.full(n_hours, None, dtype=object)
+    for key in qc_columns:
+        if not key.endswith("_src"):
+            continue
+        data_key = key[:-4]
+        if data_key in base_codes:
+            src_codes = base_codes[data_key].copy()
+        else:
+            src_codes = np.full(n_hours, EMPTY, dtype=np.int8)
+        if data_key in values:
+            data_values = values[data_key]
+        elif data_key in base_values:
+            data_values = base_values[data_key].copy()
+        else:
+            data_values = np.full(n_hours, None, dtype=object)
+        missing = is_null(data_values)
+        if data_key in rtma_raw:
+            replace = missing & ~is_null(rtma_raw[data_key])
+            use_rtma = replace & rtma_valid[data_key]
+            data_values[use_rtma] = rtma_raw[data_key][use_rtma]
+            src_codes[use_rtma] = RTMA
+            src_codes[replace & ~use_rtma] = EMPTY
+        else:
+            src_codes[missing] = EMPTY
+        codes[key] = src_codes
+    return values, codes
+
+
+def build_records(
+    keys: List[str],
+    columns: List["np.ndarray"],
+    rows: "np.ndarray",
+    clean_records: List[Optional[Dict[str, Any]]],
+) -> None:
+    """
+    Turn the selected rows of the column arrays back into records.
+
+    Parameters:
+        keys (List[str]): The record keys.
+        columns (List[np.ndarray]): One array per key.
+        rows (np.ndarray): Indexes of the hours to build.
+        clean_records (List[Optional[Dict[str, Any]]]): Output list, filled in place by hour index.
+    """
+    if len(rows) == 0:
+        return
+    column_lists = [column[rows].tolist() for column in columns]
+    for i, record_values in zip(rows.tolist(), zip(*column_lists)):
+        clean_records[i] = dict(zip(keys, record_values))
+
+
+def empty_records(empty_hours: List[datetime], qc_columns: List[str]) -> List[Dict[str, Any]]:
+    """
+    Build the records of the hours missing from both sources, as inserting_empty_records does:
+    the hour identifiers, with midnight reported as hour 24 of the previous day, None values and EMPTY sources.
+
+    Parameters:
+        empty_hours (List[datetime]): The hours without a MAWN or RTMA record.
+        qc_columns (List[str]): The QC table columns.
+
+    Returns:
+        List[Dict[str, Any]]: One empty record per hour.
+    """
+    empty_values = {key: ("EMPTY" if "_src" in key else None) for key in qc_columns if key not in ID_COLUMNS}
+    records = []
+    for dt in empty_hours:
+        record = {"date": dt.date(), "time": dt.time()}
+        record.update(hour_id_fields(dt))
+        record.update(empty_values)
+        records.append(record)
+    return records
+
+
+def process_records_columnar(
+    qc_columns: List[str],
+    mawndb_records: List[Dict[str, Any]],
+    rtma_records: List[Dict[str, Any]],
+    begin_date: str,
+    end_date: str,
+) -> List[Dict[str, Any]]:
+    """
+    Process and combine MAWN and RTMA records for a given date range with NumPy column arrays.
+    Returns the same records as process_records, which is used instead when NumPy is not installed or
+    the records of a source do not share the same columns.
+
+    Parameters:
+        qc_columns (List[str]): List of quality control column names.
+        mawndb_records (List[Dict[str, Any]]): List of MAWN database records.
+        rtma_records (List[Dict[str, Any]]): List of RTMA records.
+        begin_date (str): Start date of the processing period.
+        end_date (str): End date of the processing period.
+
+    Returns:
+        List[Dict[str, Any]]: List of processed and cleaned records.
+
+    Raises:
+        ValueError: If required parameters are invalid or missing.
+    """
+    if begin_date == None or end_date == None:
+        my_columnar_logger.error(f"begin_date or end_date is None. Check station_info table")
+        raise ValueError
+
+    # Streamed records are iterators, and the engine passes over the records more than once
+    mawndb_records = list(mawndb_records)
+    rtma_records = list(rtma_records)
+    mawn_keys = uniform_record_keys(mawndb_records)
+    rtma_keys = uniform_record_keys(rtma_records)
+    qc_mawn_keys = [] if mawn_keys is None else [
+        key for key in qc_columns
+        if key in mawn_keys or (key.endswith("_src") and key[:-4] in mawn_keys and key[:-4] not in ID_COLUMNS)
+    ]
+    if np is None or mawn_keys is None or rtma_keys is None or not qc_columns or (mawndb_records and not qc_mawn_keys):
+        my_columnar_logger.warning("Columnar engine not applicable, using the dict pipeline")
+        return process_records(qc_columns, mawndb_records, rtma_records, begin_date, end_date)
+
+    datetime_list = generate_list_of_hours(begin_date, end_date)
+    n_hours = len(datetime_list)
+    my_columnar_logger.info(f"Processing {n_hours} time periods from {begin_date} to {end_date} with the columnar engine")
+
+    hours = np.empty(n_hours, dtype=object)
+    hours[:] = datetime_list
+    months = np.fromiter((dt.month for dt in datetime_list), dtype=np.int64, count=n_hours)
+    hour_keys = [(dt.date(), dt.time()) for dt in datetime_list]
+    mawn_records_by_hour = index_records_by_hour(mawndb_records)
+    rtma_records_by_hour = index_records_by_hour(rtma_records)
+    mawn_rows = [mawn_records_by_hour.get(hour_key) for hour_key in hour_keys]
+    rtma_rows = [rtma_records_by_hour.get(hour_key) for hour_key in hour_keys]
+    mawn_present = np.array([row is not None for row in mawn_rows], dtype=bool)
+    rtma_present = np.array([row is not None for row in rtma_rows], dtype=bool)
+
+    # MAWN records validated with MAWN as source, and their missing dew points calculated
+    mawn_raw = {key: gather_column(mawn_rows, key) for key in mawn_keys}
+    mawn_values, mawn_codes = dict(mawn_raw), {}
+    for key in mawn_keys:
+        if key not in ID_COLUMNS:
+            mawn_values[key], mawn_codes[key] = validate_column(key, mawn_raw[key], months, hours, MAWN)
+    if "dwpt" in mawn_codes:
+        fill_mawn_dwpt(mawn_values, mawn_codes, mawn_present, months)
+
+    # RTMA records with their missing dew points calculated, validated with RTMA as source
+    rtma_raw = {key: gather_column(rtma_rows, key) for key in rtma_keys}
+    if "dwpt" in rtma_raw and "dwpt" not in ID_COLUMNS:
+        fill_rtma_dwpt(rtma_raw, rtma_present, months)
+    rtma_values, rtma_codes, rtma_valid = dict(rtma_raw), {}, {}
+    for key in rtma_keys:
+        if key in ID_COLUMNS:
+            rtma_valid[key] = np.zeros(n_hours, dtype=bool)
+        else:
+            rtma_values[key], rtma_codes[key] = validate_column(key, rtma_raw[key], months, hours, RTMA)
+            rtma_valid[key] = valid_replacements(key, rtma_raw[key], months, hours)
+
+    src_names = np.array(SRC_CODES, dtype=object)
+    clean_records = [None] * n_hours
+
+    # MAWN only: the validated MAWN record restricted to the QC columns it has
+    mawn_columns = []
+    for key in qc_mawn_keys:
+        if key in mawn_values:
+            mawn_columns.append(mawn_values[key])
+        else:
+            mawn_columns.append(src_names[mawn_codes[key[:-4]]])
+    build_records(qc_mawn_keys, mawn_columns, np.flatnonzero(mawn_present & ~rtma_present), clean_records)
+
+    # MAWN and RTMA, or RTMA only: missing values are filled from RTMA
+    for base_values, base_codes, rows in (
+        (mawn_values, mawn_codes, mawn_present & rtma_present),
+        (rtma_values, rtma_codes, ~mawn_present & rtma_present),
+    ):
+        values, codes = replace_with_rtma(qc_columns, base_values, base_codes, rtma_raw, rtma_valid, n_hours)
+        columns = [src_names[codes[key]] if key.endswith("_src") else values[key] for key in qc_columns]
+        build_records(list(qc_columns), columns, np.flatnonzero(rows), clean_records)
+
+    # Neither source has the hour
+    empty_rows = np.flatnonzero(~mawn_present & ~rtma_present).tolist()
+    for i, empty_record in zip(empty_rows, empty_records([datetime_list[i] for i in empty_rows], qc_columns)):
+        clean_records[i] = empty_record
+
+    my_columnar_logger.info(f"Completed processing {n_hours} records")
+    return clean_records
@@ -9,24 +9,24 @@ load_dotenv()
 ewx_base_path = os.getenv("EWX_BASE_PATH")
 sys.path.append(ewx_base_path)
 from ewx_utils.ewx_config import ewx_log_file
-from datetime import datetime, timedelta
-from dateutil.parser import parse
-from dateutil import tz
+from .hourly_calendar import hour_grid
 
 from ewx_utils.logs.ewx_utils_logs_config import ewx_unstructured_logger
 from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
 
 # Initialize the logger
-my_validation_logger = EWXStructuredLogger(log_path=EWXStructuredLogger)
+my_validation_logger = EWXStructuredLogger(log_path=ewx_log_file)
 
 
 def generate_list_of_hours(begin_date: str, end_date: str) -> list:
     """
     Generate a list of datetime objects within a specified time range.
 
-    This function creates a list of hourly datetime objects between the given
-    start and end dates, considering the America/Detroit timezone and
-    accounting for daylight saving time changes.
+    This function returns the hours between the given start and end dates as naive
+    America/Detroit wall-clock times, the same values as the date and time columns of
+    the station tables, up to the current local time. The hours come from the cached
+    per-year grids of hourly_calendar, so no date parsing or timezone arithmetic is
+    repeated for every call.
 
     Parameters:
     begin_date (str): The start date in string format.
@@ -34,31 +34,11 @@ def generate_list_of_hours(begin_date: str, end_date: str) -> list:
 
     Returns:
     list: A list of datetime objects representing each hour in the specified range.
-        Parsing the input dates and set timezone
-        - `parse(begin_date/end_date)` uses the `dateutil.parser` module to convert the `date` string into a `datetime` object.
-        - `.replace(tzinfo=tz.gettz("America/Detroit"))` sets the timezone of the parsed `datetime` object to "America/Detroit".
-        This ensures that the `begin_date_time` is aware of the specific timezone, which is important for handling daylight saving time correctly
-
     """
     datetime_list = []
 
     try:
-        # Parsing the input dates and setting timezone
-        begin_date_time = parse(begin_date).replace(tzinfo=tz.gettz("America/Detroit"))
-        end_date_time = parse(end_date).replace(tzinfo=tz.gettz("America/Detroit"))
-
-        # Adjusting end_date_time to include the entire last day
-        end_date_time += timedelta(days=1)
-
-        # Considering the current datetime
-        now = datetime.now(tz=tz.gettz("America/Detroit"))
-
-        this_date = begin_date_time
-
-        # Generating hourly datetime objects until the end date or current time
-        while this_date < end_date_time and this_date <= now:
-            datetime_list.append(this_date)
-            this_date += timedelta(hours=1)
+        datetime_list = hour_grid(begin_date, end_date).datetimes
 
     except ValueError as e:
         my_validation_logger.error(f"Invalid date format: {e}")
@@ -66,6 +46,3 @@ def generate_list_of_hours(begin_date: str, end_date: str) -> list:
         my_validation_logger.error(f"An error occurred: {e}")
 
     return datetime_list
-
-
-
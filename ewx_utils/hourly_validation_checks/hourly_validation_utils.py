@@ -7,9 +7,7 @@ ewx_base_path = os.getenv("EWX_BASE_PATH")
 sys.path.append(ewx_base_path)
 from ewx_utils.ewx_config import ewx_log_file
 import datetime
-from zoneinfo import ZoneInfo
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from datetime import datetime, timedelta, date, time
 from .hourly_variables_list import (
     relh_vars,
     pcpn_vars,
@@ -44,71 +42,34 @@ from ewx_utils.mawndb_classes.evapotranspiration import Evapotranspiration
 from ewx_utils.mawndb_classes.std_dev_wind_direction import StdDevWindDirection
 from typing import List, Dict, Any, Optional, Tuple
 from .hourly_time_utils import generate_list_of_hours
+from .hourly_calendar import hour_id_fields
+from .hourly_validator_registry import HOURLY_VALIDATORS, ColumnValidator, resolve_validators
 from ewx_utils.logs.ewx_utils_logs_config import ewx_unstructured_logger
 from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
 
 # Initialize the logger
-my_validation_logger = EWXStructuredLogger(log_path=EWXStructuredLogger)
+my_validation_logger = EWXStructuredLogger(log_path=ewx_log_file)
 
+# Columns that identify a record and are never validated
+ID_COLUMNS = ["year", "day", "hour", "rpt_time", "date", "time", "id"]
 
-def check_value(k: str, v: float, d: datetime) -> bool:
+
+def check_value(k: str, v: float, d: datetime, validators: Optional[Dict[str, ColumnValidator]] = None) -> bool:
     """
     Checks if a given value is valid based on its variable key and date.
     Parameters:
         k (str): The variable key.
         v (float): The value to check.
         d (datetime.datetime): The date of the value.
+        validators (Dict[str, ColumnValidator], optional): Validators resolved with resolve_validators.
+            Defaults to every hourly validator.
     Returns:
         bool: True if the value is valid, False otherwise.
     """
-    if k in relh_vars:
-        rh = Humidity(v, "PCT", d)
-        return rh.is_in_range() and rh.is_valid()
-    if k in pcpn_vars:
-        pn = Precipitation(v, "hourly", "MM", d)
-        return pn.is_valid()
-    if k in rpet_vars:
-        rp = Evapotranspiration(v, "hourly", "MM", d)
-        return rp.is_valid()
-    if k in temp_vars:
-        tp = Temperature(v, "C", d)
-        return tp.is_valid()
-    if k in wspd_vars:
-        ws = WindSpeed(v, "MPS", d)
-        #print(k, v, d, ws.is_valid())
-        return ws.is_valid()
-    if k in wdir_vars:
-        wd = WindDirection(v, "DEGREES", d)
-        # print(k, v, d, tp.is_valid())
-        return wd.is_valid()
-    if k in leafwt_vars:
-        lw = LeafWetness(v, "hourly", k, d)
-        return lw.is_valid()
-    if k in dwpt_vars:
-        dp = Temperature(v, "C", d)
-        return dp.is_valid()
-    if k in vapr_vars:
-        vp = VaporPressure(v, "hourly", d)
-        return vp.is_valid()
-    if k in mstr_vars:
-        ms = SoilMoisture(v, d)
-        return ms.is_valid()
-    if k in nrad_vars:
-        nr = NetRadiation(v, d)
-        return nr.is_valid()
-    if k in srad_vars:
-        sr = SolarRadiation(v, "hourly", d)
-        return sr.is_valid()
-    if k in sflux_vars:
-        sf = SoilHeatFlux(v, d)
-        return sf.is_valid()
-    if k in wstdv_vars:
-        wv = StdDevWindDirection(v, d)
-        return wv.is_valid()
-    if k in volt_vars:
-        vt = Voltage(v, d)
-        return vt.is_valid()
-    return False
+    validator = (HOURLY_VALIDATORS if validators is None else validators).get(k)
+    if validator is None:
+        return False
+    return validator.check(v, d)
 
 
 def combined_datetime(record: dict) -> datetime:
@@ -166,39 +127,14 @@ def getYearDayHour(combined_date: datetime) -> Optional[Dict[str, int]]:
     Raises:
         ValueError: If combined_date is None or invalid datetime object.
     """
-    my_validation_logger.info(f"Processing datetime fields for: {combined_date}")
-
-    # Initialize fields dictionary
-    required_id_fields = {
-        'year': None,
-        'day': None,
-        'hour': None,
-        'rpt_time': None
-    }
+    my_validation_logger.info("Processing datetime fields for: %s", combined_date)
 
     try:
-        # Set the timezone: combined_date is a naive datetime
-        combined_date = combined_date.replace(tzinfo=ZoneInfo("America/Detroit"))
-        my_validation_logger.debug(f"Set timezone to America/Detroit: {combined_date}")
-
-        MIDNIGHT = datetime.strptime("00:00", '%H:%M').time()
-        if combined_date.time() == MIDNIGHT:
-            represented_date = combined_date.date() + timedelta(days=-1)
-            hour = 24
-            my_validation_logger.debug("Midnight case: adjusted date and set hour to 24")
-        else:
-            represented_date = combined_date.date()
-            hour = combined_date.hour
-            my_validation_logger.debug(f"Non-midnight case: using hour {hour}")
-
-        required_id_fields['year'] = represented_date.year
-        required_id_fields['day'] = represented_date.timetuple().tm_yday
-        required_id_fields['hour'] = hour
-        required_id_fields['rpt_time'] = str(hour) + '00'
-        
+        # combined_date is a naive local datetime; its fields come from the cached calendar of its year
+        required_id_fields = hour_id_fields(combined_date)
         my_validation_logger.debug(
-            f"Fields extracted - Year: {required_id_fields['year']}, "
-            f"Day: {required_id_fields['day']}, Hour: {required_id_fields['hour']}"
+            "Fields extracted - Year: %s, Day: %s, Hour: %s",
+            required_id_fields['year'], required_id_fields['day'], required_id_fields['hour']
         )
 
     except Exception as e:
@@ -214,6 +150,7 @@ def creating_mawnsrc_record(
     combined_datetime: datetime,
     id_col_list: List[str],
     default_source: str,
+    validators: Optional[Dict[str, ColumnValidator]] = None,
 ) -> Dict[str, Any]:
     """
     Create a MAWN source record with appropriate source indicators.
@@ -224,6 +161,7 @@ def creating_mawnsrc_record(
         combined_datetime (datetime): The combined datetime for validation.
         id_col_list (List[str]): List of ID columns to exclude from validation.
         default_source (str): Default source indicator to use.
+        validators (Dict[str, ColumnValidator], optional): Validators of the record columns. Defaults to every hourly validator.
 
     Returns:
         Dict[str, Any]: The MAWN source record with source indicators.
@@ -231,7 +169,7 @@ def creating_mawnsrc_record(
     Raises:
         ValueError: If required parameters are missing or invalid.
     """
-    my_validation_logger.info(f"Creating MAWN source record for {combined_datetime}")
+    my_validation_logger.info("Creating MAWN source record for %s", combined_datetime)
 
     if not record or not id_col_list:
         my_validation_logger.error("Missing required record or id_col_list")
@@ -242,28 +180,28 @@ def creating_mawnsrc_record(
 
     for key in record.keys():
         if key not in id_col_list and not key.endswith("_src"):
-            my_validation_logger.debug(f"Processing key: {key}")
+            my_validation_logger.debug("Processing key: %s", key)
 
             if mawnsrc_record[key] is None:
                 mawnsrc_record[key + "_src"] = "EMPTY"
-                my_validation_logger.debug(f"{key}: Marked as EMPTY (None value)")
+                my_validation_logger.debug("%s: Marked as EMPTY (None value)", key)
             else:
                 if mawnsrc_record[key] == -7999:
                     mawnsrc_record[key] = None
                     mawnsrc_record[key + "_src"] = "OOR"
-                    my_validation_logger.debug(f"{key}: Marked as OOR (-7999 value)")
+                    my_validation_logger.debug("%s: Marked as OOR (-7999 value)", key)
                 else:
-                    value_check = check_value(key, mawnsrc_record[key], combined_datetime)
+                    value_check = check_value(key, mawnsrc_record[key], combined_datetime, validators)
                     if value_check is True:
                         mawnsrc_record[key + "_src"] = default_source
-                        my_validation_logger.debug(f"{key}: Validation passed, using {default_source}")
+                        my_validation_logger.debug("%s: Validation passed, using %s", key, default_source)
                     elif key in relh_vars:
                         mawnsrc_record[key + "_src"] = "OOR"
-                        my_validation_logger.debug(f"{key}: Relative humidity OOR")
+                        my_validation_logger.debug("%s: Relative humidity OOR", key)
                     else:
                         mawnsrc_record[key] = None
                         mawnsrc_record[key + "_src"] = "OOR"
-                        my_validation_logger.debug(f"{key}: Failed validation, marked as OOR")
+                        my_validation_logger.debug("%s: Failed validation, marked as OOR", key)
 
     my_validation_logger.info("Completed MAWN source record creation")
     return mawnsrc_record
@@ -292,32 +230,32 @@ def relh_cap(mawnsrc_record: Dict[str, Any], relh_vars: List[str]) -> Dict[str,
 
     for key in mawnsrc_record:
         if key in relh_vars:
-            my_validation_logger.debug(f"Processing RH key: {key}")
+            my_validation_logger.debug("Processing RH key: %s", key)
             current_value = mawnsrc_record[key]
 
             if current_value is None or mawnsrc_record.get(key + "_src") == "EMPTY":
                 mawnsrc_record[key] = None
-                my_validation_logger.debug(f"{key}: Set to None (empty/null value)")
+                my_validation_logger.debug("%s: Set to None (empty/null value)", key)
 
             elif current_value == -7999:
                 mawnsrc_record[key] = None
                 mawnsrc_record[key + "_src"] = "EMPTY"
-                my_validation_logger.debug(f"{key}: Invalid value (-7999), marked as EMPTY")
+                my_validation_logger.debug("%s: Invalid value (-7999), marked as EMPTY", key)
 
             elif 100 < current_value <= 105:
                 mawnsrc_record[key + "_src"] = "RELH_CAP"
                 mawnsrc_record[key] = 100
-                my_validation_logger.debug(f"{key}: Value {current_value} capped at 100")
+                my_validation_logger.debug("%s: Value %s capped at 100", key, current_value)
 
             elif current_value > 105:
                 mawnsrc_record[key + "_src"] = "OOR"
                 mawnsrc_record[key] = None
-                my_validation_logger.debug(f"{key}: Value {current_value} out of range (>105)")
+                my_validation_logger.debug("%s: Value %s out of range (>105)", key, current_value)
 
             elif current_value < 0:
                 mawnsrc_record[key + "_src"] = "EMPTY"
                 mawnsrc_record[key] = None
-                my_validation_logger.debug(f"{key}: Negative value {current_value} set to None")
+                my_validation_logger.debug("%s: Negative value %s set to None", key, current_value)
 
     my_validation_logger.info("Completed relative humidity processing")
     return mawnsrc_record
@@ -328,6 +266,7 @@ def replace_none_with_rtmarecord(
     rtma_record: Dict[str, Any],
     combined_datetime: datetime,
     qc_columns: List[str],
+    validators: Optional[Dict[str, ColumnValidator]] = None,
 ) -> Dict[str, Any]:
     """
     Replace None values in the MAWN source record with values from the RTMA record.
@@ -337,6 +276,7 @@ def replace_none_with_rtmarecord(
         rtma_record (Dict[str, Any]): RTMA record for value replacement.
         combined_datetime (datetime): Timestamp for the data.
         qc_columns (List[str]): Keys for quality control checks.
+        validators (Dict[str, ColumnValidator], optional): Validators of the QC columns. Defaults to every hourly validator.
 
     Returns:
         Dict[str, Any]: Updated MAWN source record with RTMA values where applicable.
@@ -344,7 +284,7 @@ def replace_none_with_rtmarecord(
     Raises:
         ValueError: If required parameters are missing or invalid.
     """
-    my_validation_logger.info(f"Starting RTMA replacement for {combined_datetime}")
+    my_validation_logger.info("Starting RTMA replacement for %s", combined_datetime)
 
     # Starting with a copy of the MAWN source record
     clean_record = mawnsrc_record.copy()
@@ -355,10 +295,10 @@ def replace_none_with_rtmarecord(
         if key not in clean_record:
             if key.endswith("_src"):
                 clean_record[key] = "EMPTY"  # Setting source keys to EMPTY if missing
-                my_validation_logger.debug(f"Added missing source key {key} as EMPTY")
+                my_validation_logger.debug("Added missing source key %s as EMPTY", key)
             else:
                 clean_record[key] = None  # Setting data keys to None if missing
-                my_validation_logger.debug(f"Added missing data key {key} as None")
+                my_validation_logger.debug("Added missing data key %s as None", key)
 
     # Performing RTMA value replacement
     for key in qc_columns:
@@ -370,20 +310,20 @@ def replace_none_with_rtmarecord(
                     clean_record.get(data_key) is None
                     and rtma_record.get(data_key) is not None
                 ):
-                    my_validation_logger.debug(f"Found RTMA value for {data_key}")
+                    my_validation_logger.debug("Found RTMA value for %s", data_key)
                     # Validate the RTMA value before replacing
-                    if check_value(data_key, rtma_record[data_key], combined_datetime):
+                    if check_value(data_key, rtma_record[data_key], combined_datetime, validators):
                         clean_record[data_key] = rtma_record[data_key]  # Replace with RTMA value
                         clean_record[key] = "RTMA"  # Mark source as RTMA
-                        my_validation_logger.debug(f"Replaced {data_key} with RTMA value")
+                        my_validation_logger.debug("Replaced %s with RTMA value", data_key)
                     else:
                         clean_record[key] = "EMPTY"  # Mark as EMPTY if value fails check
-                        my_validation_logger.debug(f"RTMA value failed validation for {data_key}")
+                        my_validation_logger.debug("RTMA value failed validation for %s", data_key)
             else:
                 # If the data key is None and RTMA key is missing, mark as EMPTY
                 if clean_record.get(data_key) is None:
                     clean_record[key] = "EMPTY"
-                    my_validation_logger.debug(f"No RTMA value found for {data_key}")
+                    my_validation_logger.debug("No RTMA value found for %s", data_key)
 
     # Final pass to ensure all _src keys are marked correctly
     for key in qc_columns:
@@ -391,10 +331,10 @@ def replace_none_with_rtmarecord(
             data_key = key[:-4]
             if clean_record.get(key) is None:
                 clean_record[key] = "EMPTY"  # Explicitly mark missing _src keys as EMPTY
-                my_validation_logger.debug(f"Marked missing source {key} as EMPTY")
+                my_validation_logger.debug("Marked missing source %s as EMPTY", key)
             if data_key not in clean_record or clean_record[data_key] is None:
                 clean_record[data_key] = None  # Ensure missing data keys remain None
-                my_validation_logger.debug(f"Ensured {data_key} remains None")
+                my_validation_logger.debug("Ensured %s remains None", data_key)
 
     my_validation_logger.info("Completed RTMA replacement process")
     return clean_record
@@ -415,37 +355,29 @@ def create_mawn_dwpt(mawnsrc_record: Dict[str, Any], combined_datetime: datetime
     Raises:
         ValueError: If mawnsrc_record or combined_datetime is invalid.
     """
-    my_validation_logger.info(f"Processing MAWN dew point for {combined_datetime}")
+    my_validation_logger.info("Processing MAWN dew point for %s", combined_datetime)
 
     if "dwpt" in mawnsrc_record.keys() and mawnsrc_record["dwpt"] is None:
         my_validation_logger.debug("Dew point is None, checking temperature and humidity")
 
-        temp = (
-            Temperature(mawnsrc_record["atmp"], "C", combined_datetime)
-            if mawnsrc_record["atmp"] is not None
-            else None
-        )
+        temp = mawnsrc_record["atmp"]
         if temp is None:
             my_validation_logger.debug("Temperature value is None or invalid")
         else:
-            my_validation_logger.debug(f"Temperature value: {mawnsrc_record['atmp']}°C")
+            my_validation_logger.debug("Temperature value: %s°C", mawnsrc_record['atmp'])
 
-        relh = (
-            Humidity(mawnsrc_record["relh"], "PCT", combined_datetime)
-            if mawnsrc_record["relh"] is not None
-            else None
-        )
+        relh = mawnsrc_record["relh"]
         if relh is None:
             my_validation_logger.debug("Humidity value is None or invalid")
         else:
-            my_validation_logger.debug(f"Humidity value: {mawnsrc_record['relh']}%")
+            my_validation_logger.debug("Humidity value: %s%%", mawnsrc_record['relh'])
 
         if temp is not None and relh is not None:
             try:
-                dwpt_value = DewPoint(temp, relh, combined_datetime)
-                mawnsrc_record["dwpt"] = dwpt_value.dwptC
+                dwpt_value = DewPoint.dwpt_value(temp, relh, combined_datetime.month)
+                mawnsrc_record["dwpt"] = dwpt_value
                 mawnsrc_record["dwpt_src"] = "MAWN"
-                my_validation_logger.info(f"Calculated dew point: {dwpt_value.dwptC}°C")
+                my_validation_logger.info("Calculated dew point: %s°C", dwpt_value)
             except Exception as e:
                 my_validation_logger.error(f"Error calculating dew point: {str(e)}")
                 mawnsrc_record["dwpt_src"] = "EMPTY"
@@ -471,37 +403,29 @@ def create_rtma_dwpt(rtma_record: Dict[str, Any], combined_datetime: datetime) -
     Raises:
         ValueError: If rtma_record or combined_datetime is invalid.
     """
-    my_validation_logger.info(f"Processing RTMA dew point for {combined_datetime}")
+    my_validation_logger.info("Processing RTMA dew point for %s", combined_datetime)
 
     if "dwpt" in rtma_record.keys() and rtma_record["dwpt"] is None:
         my_validation_logger.debug("Dew point is None, checking temperature and humidity")
 
-        temp = (
-            Temperature(rtma_record["atmp"], "C", combined_datetime)
-            if rtma_record["atmp"] is not None
-            else None
-        )
+        temp = rtma_record["atmp"]
         if temp is None:
             my_validation_logger.debug("Temperature value is None or invalid")
         else:
-            my_validation_logger.debug(f"Temperature value: {rtma_record['atmp']}°C")
+            my_validation_logger.debug("Temperature value: %s°C", rtma_record['atmp'])
 
-        relh = (
-            Humidity(rtma_record["relh"], "PCT", combined_datetime)
-            if rtma_record["relh"] is not None
-            else None
-        )
+        relh = rtma_record["relh"]
         if relh is None:
             my_validation_logger.debug("Humidity value is None or invalid")
         else:
-            my_validation_logger.debug(f"Humidity value: {rtma_record['relh']}%")
+            my_validation_logger.debug("Humidity value: %s%%", rtma_record['relh'])
 
         if temp is not None and relh is not None:
             try:
-                dwpt_value = DewPoint(temp, relh, combined_datetime)
-                rtma_record["dwpt"] = dwpt_value.dwptC
+                dwpt_value = DewPoint.dwpt_value(temp, relh, combined_datetime.month)
+                rtma_record["dwpt"] = dwpt_value
                 rtma_record["dwpt_src"] = "RTMA"
-                my_validation_logger.info(f"Calculated dew point: {dwpt_value.dwptC}°C")
+                my_validation_logger.info("Calculated dew point: %s°C", dwpt_value)
             except Exception as e:
                 my_validation_logger.error(f"Error calculating dew point: {str(e)}")
                 rtma_record["dwpt"] = None
@@ -578,10 +502,10 @@ def inserting_empty_records(
     Raises:
         ValueError: If required parameters are invalid or missing.
     """
-    my_validation_logger.info(f"Creating empty record for {combined_date}")
+    my_validation_logger.info("Creating empty record for %s", combined_date)
 
     empty_record = {"date": combined_date.date(), "time": combined_date.time()}
-    my_validation_logger.debug(f"Initialized empty record with date/time: {combined_date}")
+    my_validation_logger.debug("Initialized empty record with date/time: %s", combined_date)
 
     # Get year, day, hour, and rpt_time
     datetime_fields = getYearDayHour(combined_date)
@@ -598,7 +522,7 @@ def inserting_empty_records(
                 empty_record[key] = None
                 if "_src" in key:
                     empty_record[key] = "EMPTY"
-                    my_validation_logger.debug(f"Set source indicator for QC column: {key}")
+                    my_validation_logger.debug("Set source indicator for QC column: %s", key)
 
     # Add source columns for keys in mawndbsrc_record with None values in both records
     for key in mawndbsrc_record.keys():
@@ -607,11 +531,27 @@ def inserting_empty_records(
                 empty_record[key] = None
                 if "_src" in key:
                     empty_record[key] = "EMPTY"
-                    my_validation_logger.debug(f"Set source indicator for additional key: {key}")
+                    my_validation_logger.debug("Set source indicator for additional key: %s", key)
 
     my_validation_logger.info("Completed empty record creation")
     return empty_record
 
+def index_records_by_hour(records: List[Dict[str, Any]]) -> Dict[Tuple[date, time], Dict[str, Any]]:
+    """
+    Build a (date, time) lookup table for a station's fetched records.
+    The first record seen for an hour is kept, matching the order in which the records were fetched.
+
+    Parameters:
+        records (List[Dict[str, Any]]): Records fetched from the MAWN or RTMA database.
+
+    Returns:
+        Dict[Tuple[date, time], Dict[str, Any]]: Records keyed by their (date, time) pair.
+    """
+    records_by_hour = {}
+    for record in records:
+        records_by_hour.setdefault((record["date"], record["time"]), record)
+    return records_by_hour
+
 def process_records(
     qc_columns: List[str],
     mawndb_records: List[Dict[str, Any]],
@@ -642,73 +582,71 @@ def process_records(
 
     clean_records = []
     datetime_list = generate_list_of_hours(begin_date, end_date)
-    id_col_list = ["year", "day", "hour", "rpt_time", "date", "time", "id"]  
+    id_col_list = ID_COLUMNS
+
+    my_validation_logger.debug("Processing %s time periods", len(datetime_list))
 
-    my_validation_logger.debug(f"Processing {len(datetime_list)} time periods")
+    # Index both sources once so that each hour is matched with a dictionary lookup
+    mawn_records_by_hour = index_records_by_hour(mawndb_records)
+    rtma_records_by_hour = index_records_by_hour(rtma_records)
+
+    # Resolve the validators once. Source columns outside qc_columns are validated too, since a computed
+    # dwpt depends on the checked atmp and relh
+    validated_columns = dict.fromkeys(qc_columns)
+    for records_by_hour in (mawn_records_by_hour, rtma_records_by_hour):
+        validated_columns.update(dict.fromkeys(next(iter(records_by_hour.values()), {})))
+    validators = resolve_validators(tuple(validated_columns))
 
     for dt in datetime_list:
-        my_validation_logger.debug(f"Processing datetime: {dt}")
-        matching_mawn_record = None
-        matching_rtma_record = None
+        my_validation_logger.debug("Processing datetime: %s", dt)
+        hour_key = (dt.date(), dt.time())
+        matching_mawn_record = mawn_records_by_hour.get(hour_key)
+        matching_rtma_record = rtma_records_by_hour.get(hour_key)
         clean_record = None
 
         # Process MAWN record if found
-        for record in mawndb_records:
-            if record["date"] == dt.date() and record["time"] == dt.time():
-                matching_mawn_record = record
-                my_validation_logger.debug(f"Found matching MAWN record for {dt}")
-                break
-
         if matching_mawn_record:
-            my_validation_logger.debug("Processing MAWN record")
+            my_validation_logger.debug("Found matching MAWN record for %s", dt)
             combined_date = combined_datetime(matching_mawn_record)
-            mawnsrc_record = creating_mawnsrc_record(matching_mawn_record, combined_date, id_col_list, "MAWN")
+            mawnsrc_record = creating_mawnsrc_record(matching_mawn_record, combined_date, id_col_list, "MAWN", validators)
             mawnsrc_record = relh_cap(mawnsrc_record, relh_vars)
             mawnsrc_record = create_mawn_dwpt(mawnsrc_record, combined_date)
 
             # Check for matching RTMA record
-            for rtma_record in rtma_records:
-                if rtma_record["date"] == dt.date() and rtma_record["time"] == dt.time():
-                    matching_rtma_record = rtma_record
-                    my_validation_logger.debug(f"Found matching RTMA record for {dt}")
-                    combined_rtma_date = combined_datetime(rtma_record)
-                    rtma_record = create_rtma_dwpt(rtma_record, combined_rtma_date)
-
-                    clean_record = replace_none_with_rtmarecord(mawnsrc_record, rtma_record, combined_date, qc_columns)
-                    clean_record = filter_clean_record(clean_record, qc_columns)
-                    clean_records.append(clean_record)
-                    my_validation_logger.debug("Processed MAWN+RTMA record combination")
-                    break
-
-            if not matching_rtma_record:
+            if matching_rtma_record:
+                my_validation_logger.debug("Found matching RTMA record for %s", dt)
+                combined_rtma_date = combined_datetime(matching_rtma_record)
+                rtma_record = create_rtma_dwpt(matching_rtma_record, combined_rtma_date)
+
+                clean_record = replace_none_with_rtmarecord(mawnsrc_record, rtma_record, combined_date, qc_columns, validators)
+                clean_record = filter_clean_record(clean_record, qc_columns)
+                clean_records.append(clean_record)
+                my_validation_logger.debug("Processed MAWN+RTMA record combination")
+            else:
                 my_validation_logger.debug("No matching RTMA record, using MAWN record only")
                 clean_record = filter_clean_record(mawnsrc_record, qc_columns)
                 clean_records.append(clean_record)
-        else:
-            # If no MAWN record, check for RTMA record
-            for rtma_record in rtma_records:
-                if rtma_record["date"] == dt.date() and rtma_record["time"] == dt.time():
-                    matching_rtma_record = rtma_record
-                    my_validation_logger.debug(f"Found RTMA record only for {dt}")
-                    combined_rtma_date = combined_datetime(rtma_record)
-                    rtma_record = create_rtma_dwpt(rtma_record, combined_rtma_date)
-
-                    mawnsrc_record = creating_mawnsrc_record(rtma_record, combined_rtma_date, id_col_list, "RTMA")
-                    mawnsrc_record = relh_cap(mawnsrc_record, relh_vars)
-                    clean_record = replace_none_with_rtmarecord(mawnsrc_record, rtma_record, combined_rtma_date, qc_columns)
-                    clean_record = filter_clean_record(clean_record, qc_columns)
-                    clean_records.append(clean_record)
-                    my_validation_logger.debug("Processed RTMA record")
-                    break
+        elif matching_rtma_record:
+            # If no MAWN record, use the RTMA record
+            my_validation_logger.debug("Found RTMA record only for %s", dt)
+            combined_rtma_date = combined_datetime(matching_rtma_record)
+            rtma_record = create_rtma_dwpt(matching_rtma_record, combined_rtma_date)
+
+            mawnsrc_record = creating_mawnsrc_record(rtma_record, combined_rtma_date, id_col_list, "RTMA", validators)
+            mawnsrc_record = relh_cap(mawnsrc_record, relh_vars)
+            clean_record = replace_none_with_rtmarecord(mawnsrc_record, rtma_record, combined_rtma_date, qc_columns, validators)
+            clean_record = filter_clean_record(clean_record, qc_columns)
+            clean_records.append(clean_record)
+            my_validation_logger.debug("Processed RTMA record")
 
         # If no matching records were found, create an empty record
         if not clean_record:
-            my_validation_logger.debug(f"No matching records found for {dt}, creating empty record")
+            my_validation_logger.debug("No matching records found for %s, creating empty record", dt)
             combined_date = dt  
             empty_record = inserting_empty_records({}, {}, combined_date, qc_columns, id_col_list)
             clean_records.append(empty_record)
 
-    my_validation_logger.info(f"Completed processing {len(clean_records)} records")
+    my_validation_logger.info("Completed processing %s records", len(clean_records))
     return clean_records
 
 
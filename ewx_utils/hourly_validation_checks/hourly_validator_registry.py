@@ -0,0 +1,187 @@
+""" This script maps each mawndb hourly column to a precompiled validator.
+The validators reproduce the range checks of the mawndb_classes without building an object per value,
+so that check_value is a single dictionary lookup followed by a comparison.
+"""
+import os
+import sys
+from dotenv import load_dotenv
+load_dotenv()
+ewx_base_path = os.getenv("EWX_BASE_PATH")
+sys.path.append(ewx_base_path)
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from .hourly_variables_list import (
+    relh_vars,
+    pcpn_vars,
+    rpet_vars,
+    temp_vars,
+    wspd_vars,
+    wdir_vars,
+    leafwt_vars,
+    dwpt_vars,
+    vapr_vars,
+    mstr_vars,
+    srad_vars,
+    nrad_vars,
+    sflux_vars,
+    wstdv_vars,
+    volt_vars,
+)
+from ewx_utils.mawndb_classes.voltage import Voltage
+from ewx_utils.mawndb_classes.humidity import Humidity
+from ewx_utils.mawndb_classes.wind_speed import WindSpeed
+from ewx_utils.mawndb_classes.leaf_wetness import LeafWetness
+from ewx_utils.mawndb_classes.temperature import Temperature
+from ewx_utils.mawndb_classes.soil_moisture import SoilMoisture
+from ewx_utils.mawndb_classes.net_radiation import NetRadiation
+from ewx_utils.mawndb_classes.soil_heat_flux import SoilHeatFlux
+from ewx_utils.mawndb_classes.precipitation import Precipitation
+from ewx_utils.mawndb_classes.wind_direction import WindDirection
+from ewx_utils.mawndb_classes.vapor_pressure import VaporPressure
+from ewx_utils.mawndb_classes.solar_radiation import SolarRadiation
+from ewx_utils.mawndb_classes.evapotranspiration import Evapotranspiration
+from ewx_utils.mawndb_classes.std_dev_wind_direction import StdDevWindDirection
+
+MONTHS = Temperature.month_abbrvs
+
+TEMP_DEFAULT_RANGE = Temperature.valid_atmp_hourly_default
+LEAFWT_HOURLY_RANGE = LeafWetness.valid_lw_hourly_default
+
+
+class ColumnValidator(NamedTuple):
+    """
+    A precompiled range check for one category of mawndb columns.
+
+    Attributes:
+        kind (str): The variable category, named after its list in the variables list module.
+        bounds (Tuple[float, float]): Inclusive valid range used when no monthly range applies.
+        monthly_bounds (Optional[Tuple[Tuple[float, float], ...]]): Inclusive valid ranges for January
+            to December, or None when the range does not depend on the month.
+        check (Callable[[Any, Any], bool]): Plain function validating a value for a record date.
+    """
+    kind: str
+    bounds: Tuple[float, float]
+    monthly_bounds: Optional[Tuple[Tuple[float, float], ...]]
+    check: Callable[[Any, Any], bool]
+
+
+def range_check(bounds: Tuple[float, float], convert: Optional[Callable[[Any], Any]] = float) -> Callable[[Any, Any], bool]:
+    """
+    Build a check that a value lies inside an inclusive range.
+
+    Parameters:
+        bounds (Tuple[float, float]): The inclusive (low, high) range.
+        convert (Callable, optional): Conversion applied to the value before comparing, mirroring
+            the conversion done by the matching mawndb class. None compares the raw value.
+
+    Returns:
+        Callable[[Any, Any], bool]: Function taking (value, record_date) and returning True if valid.
+    """
+    low, high = bounds
+    if convert is None:
+        def check(value: Any, record_date: Any = None) -> bool:
+            return low <= value <= high
+    else:
+        def check(value: Any, record_date: Any = None) -> bool:
+            return low <= convert(value) <= high
+    return check
+
+
+def monthly_range_check(monthly_bounds: Tuple[Tuple[float, float], ...], bounds: Tuple[float, float]) -> Callable[[Any, Any], bool]:
+    """
+    Build a check against a per-month range, falling back to a default range without a record date.
+
+    Parameters:
+        monthly_bounds (Tuple[Tuple[float, float], ...]): Inclusive ranges for January to December.
+        bounds (Tuple[float, float]): Inclusive range used when the record date is None.
+
+    Returns:
+        Callable[[Any, Any], bool]: Function taking (value, record_date) and returning True if valid.
+    """
+    default_low, default_high = bounds
+
+    def check(value: Any, record_date: Any = None) -> bool:
+        if record_date is None:
+            return default_low <= float(value) <= default_high
+        low, high = monthly_bounds[record_date.month - 1]
+        return low <= float(value) <= high
+    return check
+
+
+def round_to_six(value: Any) -> Any:
+    """
+    Round a value to six decimal places, as NetRadiation does before validating.
+    """
+    return round(value, 6)
+
+
+def build_registry(validators: List[Tuple[List[str], ColumnValidator]]) -> Dict[str, ColumnValidator]:
+    """
+    Map every column of each variable list to its validator.
+    Lists are applied in order and the first list containing a column wins, as in the check_value if-chain.
+
+    Parameters:
+        validators (List[Tuple[List[str], ColumnValidator]]): Variable lists paired with their validators.
+
+    Returns:
+        Dict[str, ColumnValidator]: Validators keyed by column name.
+    """
+    registry = {}
+    for columns, validator in validators:
+        for column in columns:
+            registry.setdefault(column, validator)
+    return registry
+
+
+temp_monthly_bounds = tuple(Temperature.valid_hourly_atmp[month] for month in MONTHS)
+temp_validator = ColumnValidator(
+    "temp_vars", TEMP_DEFAULT_RANGE, temp_monthly_bounds,
+    monthly_range_check(temp_monthly_bounds, TEMP_DEFAULT_RANGE),
+)
+
+# Same order as the original check_value if-chain
+HOURLY_VALIDATORS = build_registry([
+    (relh_vars, ColumnValidator("relh_vars", Humidity.valid_relh_hourly_default, None,
+                                range_check(Humidity.valid_relh_hourly_default))),
+    (pcpn_vars, ColumnValidator("pcpn_vars", Precipitation.valid_pcpn_hourly_default, None,
+                                range_check(Precipitation.valid_pcpn_hourly_default))),
+    (rpet_vars, ColumnValidator("rpet_vars", Evapotranspiration.valid_rpet_hourly_default, None,
+                                range_check(Evapotranspiration.valid_rpet_hourly_default))),
+    (temp_vars, temp_validator),
+    (wspd_vars, ColumnValidator("wspd_vars", WindSpeed.valid_wspd_hourly_default, None,
+                                range_check(WindSpeed.valid_wspd_hourly_default))),
+    (wdir_vars, ColumnValidator("wdir_vars", WindDirection.valid_wdir_hourly_default, None,
+                                range_check(WindDirection.valid_wdir_hourly_default))),
+    (leafwt_vars, ColumnValidator("leafwt_vars", LEAFWT_HOURLY_RANGE, None,
+                                  range_check(LEAFWT_HOURLY_RANGE, convert=None))),
+    (dwpt_vars, temp_validator._replace(kind="dwpt_vars")),
+    (vapr_vars, ColumnValidator("vapr_vars", VaporPressure.valid_vapr_hourly_default, None,
+                                range_check(VaporPressure.valid_vapr_hourly_default, convert=None))),
+    (mstr_vars, ColumnValidator("mstr_vars", SoilMoisture.valid_mstr_hourly_default, None,
+                                range_check(SoilMoisture.valid_mstr_hourly_default, convert=None))),
+    (nrad_vars, ColumnValidator("nrad_vars", NetRadiation.valid_nrad_hourly_default, None,
+                                range_check(NetRadiation.valid_nrad_hourly_default, convert=round_to_six))),
+    (srad_vars, ColumnValidator("srad_vars", SolarRadiation.valid_srad_hourly_default, None,
+                                range_check(SolarRadiation.valid_srad_hourly_default))),
+    (sflux_vars, ColumnValidator("sflux_vars", SoilHeatFlux.valid_sflux_hourly_default, None,
+                                 range_check(SoilHeatFlux.valid_sflux_hourly_default, convert=None))),
+    (wstdv_vars, ColumnValidator("wstdv_vars", StdDevWindDirection.valid_wstdv_hourly_default, None,
+                                 range_check(StdDevWindDirection.valid_wstdv_hourly_default, convert=None))),
+    (volt_vars, ColumnValidator("volt_vars", Voltage.valid_volt_hourly_default, None,
+                                range_check(Voltage.valid_volt_hourly_default, convert=None))),
+])
+
+
+@lru_cache(maxsize=None)
+def resolve_validators(columns: Tuple[str, ...]) -> Dict[str, ColumnValidator]:
+    """
+    Resolve the validators for a set of columns once, e.g. the qc_columns of a station table.
+    Columns without a validator are left out; check_value treats them as invalid.
+
+    Parameters:
+        columns (Tuple[str, ...]): Column names, as a tuple so that the result can be cached.
+
+    Returns:
+        Dict[str, ColumnValidator]: Validators keyed by column name.
+    """
+    return {column: HOURLY_VALIDATORS[column] for column in columns if column in HOURLY_VALIDATORS}
@@ -1,7 +1,11 @@
 import os
 import sys
+import queue
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import threading
+import warnings
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 import structlog
 
 """
@@ -41,6 +45,84 @@ def ewx_utils_logger(log_path = "../log"):
 
 logger_instance_unstructured = None
 
+# Level methods bound directly on the EWXStructuredLogger instance, so that calls skip __getattr__
+LEVEL_METHODS = ("debug", "info", "warning", "error", "critical", "exception", "log")
+
+# Bounds of the asynchronous sink: events buffered before logging blocks, and events written per flush
+DEFAULT_LOG_QUEUE_SIZE = 10000
+DEFAULT_LOG_BATCH_SIZE = 500
+
+class BatchFlushTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """
+    TimedRotatingFileHandler whose per-record flush can be deferred, so that the writer thread of the
+    asynchronous sink flushes a whole batch of records at once.
+    """
+    defer_flush = False
+
+    def flush(self):
+        if not self.defer_flush:
+            super().flush()
+
+    def flush_batch(self):
+        super().flush()
+
+class BlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue: when the queue is full, logging waits for the writer thread
+    instead of raising queue.Full, so events are never dropped and memory stays bounded.
+    before_enqueue, if given, is called before each event is queued, e.g. to start the writer thread.
+    """
+    def __init__(self, log_queue, before_enqueue=None):
+        super().__init__(log_queue)
+        self.before_enqueue = before_enqueue
+
+    def enqueue(self, record):
+        if self.before_enqueue is not None:
+            self.before_enqueue()
+        self.queue.put(record)
+
+class BatchingQueueListener(QueueListener):
+    """
+    QueueListener that takes up to batch_size queued records at a time, hands them to its handlers and
+    flushes each handler once per batch instead of once per record.
+    """
+    def __init__(self, log_queue, *handlers, batch_size=DEFAULT_LOG_BATCH_SIZE):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+
+    def _monitor(self):
+        log_queue = self.queue
+        has_task_done = hasattr(log_queue, "task_done")
+        stopped = False
+        while not stopped:
+            batch = [self.dequeue(True)]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+            for record in batch:
+                if record is self._sentinel:
+                    stopped = True
+                else:
+                    self.handle(record)
+                if has_task_done:
+                    log_queue.task_done()
+            for handler in self.handlers:
+                getattr(handler, "flush_batch", handler.flush)()
+
+def resolve_log_level(level):
+    """
+    Returns the numeric logging level for a level name such as "INFO" or a number such as logging.INFO.
+    Raises ValueError for unknown level names.
+    """
+    if isinstance(level, int):
+        return level
+    resolved_level = logging.getLevelName(str(level).strip().upper())
+    if not isinstance(resolved_level, int):
+        raise ValueError(f"Unknown log level: {level}")
+    return resolved_level
+
 def ewx_unstructured_logger(log_path="../log"):
     """
     Returns a standard unstructured logger (plain text).
@@ -79,9 +161,15 @@ def ewx_unstructured_logger(log_path="../log"):
 class EWXStructuredLogger:
     """
     Structured logger using structlog.
-    - Logs all levels to file in JSON format.
+    - Logs all levels from the minimum level to file in JSON format. The minimum level is taken from the
+      level argument, else the EWX_LOG_LEVEL environment variable, else DEBUG, and can be changed with set_level.
     - Logs only ERROR and CRITICAL to console.
+    - Calls below the minimum level return immediately: pass message arguments lazily,
+      e.g. logger.debug("value: %s", value), and they are never formatted.
     - Supports direct method access via __getattr__.
+    - Optionally writes through an asynchronous sink (start_async_sink, or EWX_LOG_ASYNC=1): events are
+      queued and written in batches by a writer thread, so logging does not wait on disk I/O. The writer
+      thread is started by the first event of the process that logs, so forked and spawned workers each get their own.
     """
 
     _instance = None
@@ -92,20 +180,42 @@ class EWXStructuredLogger:
             cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self, log_path="../log"):
+    def __init__(self, log_path="../log", level=None):
         if self._initialized:
             return
 
         self.log_path = log_path
         self.logger = None
+        self.level = logging.DEBUG
+        self.debug_enabled = True
+        self.handlers = []
+        self.queue_handler = None
+        self.listener = None
+        self.listener_pid = None
+        self._listener_lock = threading.Lock()
         self._setup_logger()
         self._initialized = True
+        atexit.register(self.stop_async_sink)
+        # Windows has no fork; spawned processes import this module again and set up their own logger
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._use_sync_sink_in_child)
+
+        if level is None:
+            level = os.getenv("EWX_LOG_LEVEL", "DEBUG")
+        try:
+            self.set_level(level)
+        except ValueError as e:
+            warnings.warn(f"{e}, logging at DEBUG level")
+            self.set_level(logging.DEBUG)
+
+        if os.getenv("EWX_LOG_ASYNC", "").strip().lower() in ("1", "true", "yes"):
+            self.start_async_sink()
 
     def _setup_logger(self):
         os.makedirs(self.log_path, exist_ok=True)
 
         # Create file handler (accepts all logs)
-        file_handler = TimedRotatingFileHandler(
+        file_handler = BatchFlushTimedRotatingFileHandler(
             filename=os.path.join(self.log_path, "ewx_logs.log"),
             when="midnight",
             interval=1,
@@ -121,9 +231,10 @@ class EWXStructuredLogger:
         console_handler.setFormatter(logging.Formatter('%(message)s'))
 
         # Configure base logging (handlers and root level)
+        self.handlers = [file_handler, console_handler]
         logging.basicConfig(
             level=logging.DEBUG,  # Capture all logs at the root
-            handlers=[file_handler, console_handler]
+            handlers=self.handlers
         )
 
         # Configure structlog
@@ -146,6 +257,101 @@ class EWXStructuredLogger:
     def get_logger(self):
         return self.logger
 
+    def set_level(self, level):
+        """
+        Sets the minimum level logged, as a level name such as "INFO" or a number such as logging.INFO.
+        Levels below it are compiled to no-ops by structlog, so their messages are neither formatted nor rendered.
+        """
+        self.level = resolve_log_level(level)
+        structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(self.level))
+        self.logger = structlog.get_logger()
+        bound_logger = self.logger.bind()
+        for name in LEVEL_METHODS:
+            setattr(self, name, getattr(bound_logger, name))
+        self.debug_enabled = self.level <= logging.DEBUG
+
+    def start_async_sink(self, queue_size=None, batch_size=None):
+        """
+        Routes log events through a bounded queue to a writer thread that writes them to the file and
+        console handlers in batches, flushing once per batch. When the queue is full, logging waits for
+        the writer thread. The sink is stopped, and the queue drained, at exit or by stop_async_sink.
+
+        Parameters:
+            queue_size (int, optional): Events buffered before logging waits. Defaults to EWX_LOG_QUEUE_SIZE or 10000
+            batch_size (int, optional): Events written per flush. Defaults to EWX_LOG_BATCH_SIZE or 500
+        """
+        if self.listener is not None:
+            return
+        queue_size = queue_size or int(os.getenv("EWX_LOG_QUEUE_SIZE", DEFAULT_LOG_QUEUE_SIZE))
+        batch_size = batch_size or int(os.getenv("EWX_LOG_BATCH_SIZE", DEFAULT_LOG_BATCH_SIZE))
+
+        log_queue = queue.Queue(maxsize=queue_size)
+        self.queue_handler = BlockingQueueHandler(log_queue, before_enqueue=self._start_listener)
+        self.listener = BatchingQueueListener(log_queue, *self.handlers, batch_size=batch_size)
+        self.listener_pid = None
+        for handler in self.handlers:
+            handler.defer_flush = True
+
+        root_logger = logging.getLogger()
+        for handler in self.handlers:
+            root_logger.removeHandler(handler)
+        root_logger.addHandler(self.queue_handler)
+
+    def _start_listener(self):
+        """
+        Starts the writer thread in the process that logs, on its first event. A sink inherited from
+        another process gets a new queue and writer thread, since the writer thread of that process is not running here.
+        """
+        pid = os.getpid()
+        if self.listener_pid == pid:
+            return
+        with self._listener_lock:
+            if self.listener_pid == pid or self.listener is None:
+                return
+            if self.listener_pid is not None:
+                log_queue = queue.Queue(maxsize=self.queue_handler.queue.maxsize)
+                self.queue_handler.queue = log_queue
+                self.listener = BatchingQueueListener(log_queue, *self.handlers, batch_size=self.listener.batch_size)
+            self.listener.start()
+            self.listener_pid = pid
+
+    def stop_async_sink(self):
+        """
+        Writes the queued events, stops the writer thread and writes events directly to the handlers again.
+        """
+        if self.listener is None:
+            return
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(self.queue_handler)
+        if self.listener_pid == os.getpid():
+            self.listener.stop()
+        self._restore_handlers()
+
+    def _use_sync_sink_in_child(self):
+        """
+        A forked child (e.g. a worker process) has no writer thread, so it writes events directly.
+        """
+        if self.listener is None:
+            return
+        logging.getLogger().removeHandler(self.queue_handler)
+        self._restore_handlers()
+
+    def _restore_handlers(self):
+        root_logger = logging.getLogger()
+        for handler in self.handlers:
+            handler.defer_flush = False
+            handler.flush()
+            root_logger.addHandler(handler)
+        self.queue_handler = None
+        self.listener = None
+        self.listener_pid = None
+
+    def is_enabled_for(self, level):
+        """
+        Returns True if messages of the given level are logged, to skip expensive work for disabled levels.
+        """
+        return resolve_log_level(level) >= self.level
+
     def __getattr__(self, name):
         """
         Delegate logging methods like .info(), .error(), etc., to the structlog logger.
@@ -0,0 +1,163 @@
+""" This script exports the metrics of a QC run as a node_exporter textfile-collector file.
+The file is written once at the end of a run, in the Prometheus text exposition format, and is
+replaced atomically so that the collector never reads a partly written file.
+"""
+import os
+import sys
+import time
+from collections import Counter
+from dotenv import load_dotenv
+load_dotenv()
+ewx_base_path = os.getenv("EWX_BASE_PATH")
+sys.path.append(ewx_base_path)
+from ewx_utils.logs.ewx_utils_timing import DURATION_BUCKETS, StageTimer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+METRIC_PREFIX = "ewx_qc"
+
+# Source of the rows counted by each fetch stage
+FETCH_STAGE_SOURCES = {"fetch_mawn": "MAWN", "fetch_rtma": "RTMA", "fetch_mawnqc": "MAWNQC"}
+WRITE_STAGE = "commit_and_rollback"
+
+
+def count_src_outcomes(records: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Count the values of the _src columns of cleaned records (MAWN, RTMA, OOR, EMPTY, RELH_CAP, ...).
+
+    Parameters:
+        records (Iterable[Dict[str, Any]]): Cleaned records
+
+    Returns:
+        Dict[str, int]: Number of _src cells per source value
+    """
+    outcomes = Counter()
+    for record in records:
+        outcomes.update(value for key, value in record.items() if key.endswith("_src") and value is not None)
+    return dict(outcomes)
+
+
+def escape_label_value(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels: Dict[str, Any]) -> str:
+    return "{" + ",".join(f'{name}="{escape_label_value(value)}"' for name, value in labels.items()) + "}"
+
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def format_metric(name: str, metric_type: str, help_text: str,
+                  samples: List[Tuple[str, Dict[str, Any], float]]) -> List[str]:
+    """
+    Format one metric family: its HELP and TYPE lines followed by its samples.
+
+    Parameters:
+        name (str): Metric family name
+        metric_type (str): counter, gauge or histogram
+        help_text (str): Description of the metric
+        samples (List[Tuple[str, Dict[str, Any], float]]): Sample name suffix, labels and value of each sample
+
+    Returns:
+        List[str]: Lines of the metric family
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    lines.extend(f"{name}{suffix}{format_labels(labels)} {format_value(value)}" for suffix, labels, value in samples)
+    return lines
+
+
+def format_textfile_metrics(script: str, results: List[Dict[str, Any]], run_timer: StageTimer,
+                            wall_seconds: float, timestamp: Optional[float] = None) -> str:
+    """
+    Format the metrics of a run in the Prometheus text exposition format.
+
+    Parameters:
+        script (str): Name of the script, used as the script label
+        results (List[Dict[str, Any]]): Station results with their stages, failures, src_counts and changes
+        run_timer (StageTimer): Timer of the stages outside the stations, such as connection setup
+        wall_seconds (float): Elapsed time of the run
+        timestamp (Optional[float]): Unix time of the end of the run, defaults to now
+
+    Returns:
+        str: Metrics text, ending with a newline
+    """
+    timestamp = time.time() if timestamp is None else timestamp
+    labels = {"script": script}
+
+    total_timer = StageTimer()
+    total_timer.merge(run_timer.stages)
+    src_counts = Counter()
+    changes = Counter()
+    for result in results:
+        total_timer.merge(result.get("stages", {}))
+        src_counts.update(result.get("src_counts", {}))
+        changes.update(result.get("changes", {}))
+    stages = total_timer.stages
+
+    failed_work_items = sum(len(result["failures"]) for result in results)
+    failed_stations = sum(1 for result in results if result["failures"])
+    rows_fetched = [
+        ("", {**labels, "source": source}, stages[stage]["rows"])
+        for stage, source in FETCH_STAGE_SOURCES.items() if stage in stages
+    ]
+    rows_written = stages[WRITE_STAGE]["rows"] if WRITE_STAGE in stages else 0
+
+    duration_samples = []
+    for stage, totals in sorted(stages.items()):
+        stage_labels = {**labels, "stage": stage}
+        for bound, count in zip(DURATION_BUCKETS, totals["buckets"]):
+            duration_samples.append(("_bucket", {**stage_labels, "le": format_value(bound)}, count))
+        duration_samples.append(("_bucket", {**stage_labels, "le": "+Inf"}, totals["calls"]))
+        duration_samples.append(("_sum", stage_labels, totals["seconds"]))
+        duration_samples.append(("_count", stage_labels, totals["calls"]))
+
+    lines = []
+    lines += format_metric(f"{METRIC_PREFIX}_stations_processed_total", "counter",
+                           "Stations processed in the run.", [("", labels, len(results))])
+    lines += format_metric(f"{METRIC_PREFIX}_work_items_processed_total", "counter",
+                           "Station/date range work items processed without errors in the run.",
+                           [("", labels, sum(result["work_items"] for result in results))])
+    lines += format_metric(f"{METRIC_PREFIX}_rows_fetched_total", "counter",
+                           "Rows fetched per source database in the run.", rows_fetched)
+    lines += format_metric(f"{METRIC_PREFIX}_rows_written_total", "counter",
+                           "Rows written to the QC database in the run.", [("", labels, rows_written)])
+    if changes:
+        lines += format_metric(f"{METRIC_PREFIX}_record_changes_total", "counter",
+                               "Cleaned records per write outcome (inserted, updated, unchanged) in the run.",
+                               [("", {**labels, "change": change}, count) for change, count in sorted(changes.items())])
+    lines += format_metric(f"{METRIC_PREFIX}_src_outcomes_total", "counter",
+                           "Cleaned cells per _src outcome in the run.",
+                           [("", {**labels, "outcome": outcome}, count) for outcome, count in sorted(src_counts.items())])
+    lines += format_metric(f"{METRIC_PREFIX}_failures_total", "counter",
+                           "Work items that failed in the run.", [("", labels, failed_work_items)])
+    lines += format_metric(f"{METRIC_PREFIX}_failed_stations", "gauge",
+                           "Stations with at least one failed work item in the run.", [("", labels, failed_stations)])
+    lines += format_metric(f"{METRIC_PREFIX}_stage_duration_seconds", "histogram",
+                           "Duration of each call of a run stage.", duration_samples)
+    lines += format_metric(f"{METRIC_PREFIX}_run_duration_seconds", "gauge",
+                           "Elapsed time of the run.", [("", labels, float(wall_seconds))])
+    lines += format_metric(f"{METRIC_PREFIX}_last_run_timestamp_seconds", "gauge",
+                           "Unix time at which the run finished.", [("", labels, float(timestamp))])
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile_metrics(path: Optional[str], text: str) -> None:
+    """
+    Write metrics text to a textfile-collector file by writing a temporary file in the same
+    directory and renaming it over the target; does nothing without a path.
+
+    Parameters:
+        path (Optional[str]): Output file path, normally ending in .prom
+        text (str): Metrics text as returned by format_textfile_metrics
+    """
+    if not path:
+        return
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(text)
+        os.replace(temporary_path, path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
@@ -0,0 +1,173 @@
+""" This script times the stages of a run (connection setup, fetching, processing, writing).
+Timings are accumulated per station with StageTimer and summarized per station and for the whole run,
+as structured log events and optionally as a JSON file.
+"""
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+from dotenv import load_dotenv
+load_dotenv()
+ewx_base_path = os.getenv("EWX_BASE_PATH")
+sys.path.append(ewx_base_path)
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Upper bounds, in seconds, of the cumulative duration buckets kept for each stage
+DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class StageCounter:
+    """
+    Row counter handed out by StageTimer.time; set rows to the number of rows the stage handled.
+    """
+    __slots__ = ("rows",)
+
+    def __init__(self):
+        self.rows = 0
+
+
+class StageTimer:
+    """
+    Accumulates the seconds, calls and rows of named stages.
+    The totals are plain dictionaries, so they can be returned from worker processes and merged.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, Any]] = {}
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[StageCounter]:
+        """
+        Time a block of code as one call of a stage.
+
+        Parameters:
+            stage (str): Stage name, e.g. "fetch_mawn"
+
+        Returns:
+            Iterator[StageCounter]: Counter whose rows are added to the stage when the block exits
+        """
+        counter = StageCounter()
+        start = time.perf_counter()
+        try:
+            yield counter
+        finally:
+            self.add(stage, time.perf_counter() - start, counter.rows)
+
+    def add(self, stage: str, seconds: float, rows: int = 0, calls: int = 1,
+            buckets: Optional[List[int]] = None) -> None:
+        """
+        Add seconds, rows and calls to a stage.
+
+        Parameters:
+            stage (str): Stage name
+            seconds (float): Seconds spent in the stage
+            rows (int): Rows handled by the stage
+            calls (int): Number of calls
+            buckets (Optional[List[int]]): Cumulative call counts per DURATION_BUCKETS bound of merged calls;
+                without them, the calls are counted as one call lasting seconds
+        """
+        totals = self.stages.setdefault(
+            stage, {"seconds": 0.0, "calls": 0, "rows": 0, "buckets": [0] * len(DURATION_BUCKETS)}
+        )
+        totals["seconds"] += seconds
+        totals["calls"] += calls
+        totals["rows"] += rows
+        if buckets is None:
+            buckets = [calls if seconds <= bound else 0 for bound in DURATION_BUCKETS]
+        totals["buckets"] = [count + added for count, added in zip(totals["buckets"], buckets)]
+
+    def count_rows(self, stage: str, records: Iterable[Any]) -> Iterator[Any]:
+        """
+        Yield records that are fetched while they are consumed, e.g. streamed records, and add their number
+        to the rows of a stage once they are consumed.
+
+        Parameters:
+            stage (str): Stage name, e.g. "fetch_mawn"
+            records (Iterable[Any]): Records to count
+
+        Returns:
+            Iterator[Any]: The records
+        """
+        rows = 0
+        try:
+            for record in records:
+                rows += 1
+                yield record
+        finally:
+            self.add(stage, 0.0, rows, calls=0)
+
+    def merge(self, stages: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Add the stage totals of another timer, e.g. one returned by a worker process.
+
+        Parameters:
+            stages (Dict[str, Dict[str, Any]]): Stage totals as in StageTimer.stages
+        """
+        for stage, totals in stages.items():
+            self.add(stage, totals["seconds"], totals["rows"], totals["calls"], totals.get("buckets"))
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns:
+            Dict[str, Dict[str, Any]]: Seconds, calls, rows and rows per second of each stage
+        """
+        return {stage: summarize_stage(totals) for stage, totals in self.stages.items()}
+
+
+def summarize_stage(totals: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Round the seconds of a stage and add its throughput.
+
+    Parameters:
+        totals (Dict[str, Any]): Seconds, calls and rows of a stage
+
+    Returns:
+        Dict[str, Any]: The totals with rows_per_sec, None when the stage took no measurable time or handled no rows
+    """
+    seconds = totals["seconds"]
+    rows_per_sec = round(totals["rows"] / seconds, 1) if seconds > 0 and totals["rows"] else None
+    return {"seconds": round(seconds, 6), "calls": totals["calls"], "rows": totals["rows"], "rows_per_sec": rows_per_sec}
+
+
+def run_summary(station_stages: Dict[str, Dict[str, Dict[str, Any]]], run_timer: StageTimer,
+                wall_seconds: float) -> Dict[str, Any]:
+    """
+    Summarize a run from the stage totals of each station and the run-level stages (such as connection setup).
+
+    Parameters:
+        station_stages (Dict[str, Dict[str, Dict[str, Any]]]): Stage totals keyed by station
+        run_timer (StageTimer): Timer of the stages outside the stations
+        wall_seconds (float): Elapsed time of the run
+
+    Returns:
+        Dict[str, Any]: Wall time, stage totals over all stations and the per-station summaries
+    """
+    total_timer = StageTimer()
+    total_timer.merge(run_timer.stages)
+    stations = {}
+    for station, stages in station_stages.items():
+        station_timer = StageTimer()
+        station_timer.merge(stages)
+        total_timer.merge(stages)
+        stations[station] = station_timer.summary()
+    return {
+        "wall_seconds": round(wall_seconds, 6),
+        "stations_processed": len(stations),
+        "stages": total_timer.summary(),
+        "stations": stations,
+    }
+
+
+def write_timing_json(path: Optional[str], summary: Dict[str, Any]) -> None:
+    """
+    Write a run summary to a JSON file; does nothing without a path.
+
+    Parameters:
+        path (Optional[str]): Output file path
+        summary (Dict[str, Any]): Run summary as returned by run_summary
+    """
+    if not path:
+        return
+    with open(path, "w", encoding="utf-8") as timing_file:
+        json.dump(summary, timing_file, indent=2)
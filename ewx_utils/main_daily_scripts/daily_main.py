@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 import os
 import sys
+import time
 import argparse
 import traceback
 from argparse import Namespace
@@ -13,23 +14,31 @@ ewx_base_path = os.getenv("EWX_BASE_PATH")
 sys.path.append(ewx_base_path)
 from ewx_utils.ewx_config import ewx_log_file
 from ewx_utils.db_files.dbs_configfile import get_ini_section_info
-from ewx_utils.daily_validation_checks.daily_validation_utils import process_records
+from ewx_utils.daily_validation_checks.daily_validation_utils import hourly_aggregate_variables, process_records
+from ewx_utils.db_files.dbs_bulk_copy import copy_upsert_records
 from ewx_utils.db_files.dbs_connection import(
     connect_to_db,
     get_mawn_cursor,
     get_mawnqc_cursor,
     get_qcwrite_cursor,
-    create_db_connections
+    create_db_connections,
+    release_connection,
+    stream_records
 )
 from ewx_utils.logs.ewx_utils_logs_config import ewx_unstructured_logger
 from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
-from typing import List, Dict, Any, Tuple, Optional
+from ewx_utils.logs.ewx_utils_timing import StageTimer, run_summary, write_timing_json
+from ewx_utils.logs.ewx_utils_metrics import count_src_outcomes, format_textfile_metrics, write_textfile_metrics
+from typing import List, Dict, Any, Tuple, Optional, Iterable
 
-my_logger = EWXStructuredLogger(log_path=EWXStructuredLogger)
+my_logger = EWXStructuredLogger(log_path=ewx_log_file)
+
+# Number of rows fetched per round trip from a server-side cursor in streaming mode
+STREAM_ITERSIZE = 2000
 
 def close_connections(connections: Dict[str, Any])->None:
     """
-    Close all provided database connections and cursors.
+    Close all provided cursors and give the database connections back to their pools.
 
     Parameters:
     Connections: Dict[str, Any]
@@ -43,29 +52,35 @@ def close_connections(connections: Dict[str, Any])->None:
                 conn.close()
                 my_logger.info(f"{name} cursor closed.")
             elif "connection" in name:
-                conn.close()
-                my_logger.info(f"{name} connection closed.")
+                release_connection(conn)
+                my_logger.info(f"{name} connection returned to its pool.")
         except Exception as e:
             my_logger.error(f"Error closing {name}: {e}")
 
 
-def fetch_records(cursor: Any, station: str, begin_date: str, end_date: str)-> List[Dict[str,Any]]:
+def fetch_records(cursor: Any, station: str, begin_date: str, end_date: str,
+                  itersize: Optional[int] = None)-> Iterable[Dict[str,Any]]:
     """
     Fetch records from specified station for a given date range.
+    With itersize, the records are streamed in date and time order from a named server-side cursor.
 
     Parameters:
         cursor: Database cursor object to excecute queries.
         station(str): Name of the table(station) to query.
         begin_date(str): Start date of the query in YYYY-MM-DD format.
         end_date(str): End date of the query in YYYY-MM-DD format.
+        itersize(Optional[int]): Rows fetched per round trip in streaming mode.
     
     Returns:
-        list: A list of dictionaries containing fectched records
+        list: A list of dictionaries containing fectched records, or an iterator over them in streaming mode
     
     Raises:
         Exception: If the query fails or if any other error occurs.
     """
     query = f"SELECT * FROM {station}_daily WHERE date BETWEEN %s and %s"
+    if itersize:
+        my_logger.info("Streaming query %s with parameters %s, %s", query, begin_date, end_date)
+        return stream_records(cursor.connection, query + " ORDER BY date, time", (begin_date, end_date), itersize)
     my_logger.error(
         f"Executing query {query} with parameters {begin_date}, {end_date}"
     )
@@ -81,6 +96,63 @@ def fetch_records(cursor: Any, station: str, begin_date: str, end_date: str)-> L
         my_logger.error(f"Error fetching records from {station}: {e}")
         raise
 
+def fetch_hourly_aggregates(cursor: Any, station: str, qc_columns: List[str], begin_date: str,
+                            end_date: str) -> List[Dict[str, Any]]:
+    """
+    Aggregate the hourly MAWNQC records of a station into one row per day in the database.
+
+    Parameters:
+        cursor: Database cursor object to excecute queries.
+        station(str): Name of the station, whose {station}_hourly table is aggregated.
+        qc_columns(List[str]): Columns of the daily QC table, which select the aggregated variables.
+        begin_date(str): Start date of the query in YYYY-MM-DD format.
+        end_date(str): End date of the query in YYYY-MM-DD format.
+
+    Returns:
+        list: One dictionary per day with the date, the number of hours, has_rtma (any _src of the day is RTMA)
+        and the sum_<var>, min_<var>, max_<var> and count_<var> (hours with a value) of the variables of
+        hourly_aggregate_variables.
+
+    Raises:
+        Exception: If the query fails or if any other error occurs.
+    """
+    try:
+        cursor.execute(f"SELECT * FROM {station}_hourly LIMIT 0")
+        hourly_columns = [desc[0] for desc in cursor.description]
+        sum_variables, min_max_variables = hourly_aggregate_variables(qc_columns)
+
+        aggregates = ["count(*) AS hours"]
+        src_columns = [column for column in hourly_columns if column.endswith("_src")]
+        rtma_sources = " OR ".join(f"upper({column}::text) = 'RTMA'" for column in src_columns) or "false"
+        aggregates.append(f"coalesce(bool_or({rtma_sources}), false) AS has_rtma")
+        for variable in sum_variables:
+            if variable in hourly_columns:
+                aggregates.append(f"sum({variable}) AS sum_{variable}")
+        for variable in min_max_variables:
+            if variable in hourly_columns:
+                aggregates.append(f"min({variable}) AS min_{variable}")
+                aggregates.append(f"max({variable}) AS max_{variable}")
+        for variable in dict.fromkeys(sum_variables + min_max_variables):
+            if variable in hourly_columns:
+                aggregates.append(f"count({variable}) AS count_{variable}")
+
+        query = f"""SELECT date, {", ".join(aggregates)}
+                    FROM {station}_hourly WHERE date BETWEEN %s and %s
+                    GROUP BY date ORDER BY date"""
+        my_logger.error(
+            f"Executing query {query} with parameters {begin_date}, {end_date}"
+        )
+        cursor.execute(query, (begin_date, end_date))
+        records = cursor.fetchall()
+        my_logger.error(
+            f"Fetched {len(records)} daily aggregates from {station}_hourly using {cursor}."
+        )
+        return [dict(record) for record in records]
+
+    except Exception as e:
+        my_logger.error(f"Error fetching hourly aggregates from {station}: {e}")
+        raise
+
 def get_insert_table_columns(cursor: Any, station: str) -> List[str]:
     """
     Retrieve and log column names from the specified station's table.
@@ -296,7 +368,8 @@ def insert_or_update_records(cursor, table: str, records: List[Dict[str, Any]],
             continue  # Skip to next record
 
 
-def commit_and_rollback(connection: Any, station: str, records: List[Dict[str, Any]], record_keys, unique_keys)->None:
+def commit_and_rollback(connection: Any, station: str, records: List[Dict[str, Any]], record_keys, unique_keys,
+                        bulk_copy: bool = False)->None:
     """
     Commit records for a station, rollback on error.
 
@@ -304,10 +377,14 @@ def commit_and_rollback(connection: Any, station: str, records: List[Dict[str, A
     connection(object): Database connection
     station(str): Specified weather station
     records(list): Records to insert/update where each record is a dictionary
+    bulk_copy(bool): Load the records with COPY into a temporary table and merge them in one statement
     """
     try:
         with connection.cursor() as cursor:
-            insert_or_update_records(cursor, station,records, record_keys, unique_keys)
+            if bulk_copy:
+                copy_upsert_records(cursor, f"{station}_daily", records, record_keys, unique_keys)
+            else:
+                insert_or_update_records(cursor, station,records, record_keys, unique_keys)
             my_logger.info("Inserted or updated records successfully.")
             connection.commit()
     except Exception as e:
@@ -608,9 +685,60 @@ def main() -> None:
         required=False,
         help="Section name in INI file for writing data",
     )
+    parser.add_argument(
+        "--bulk-copy",
+        action="store_true",
+        default=False,
+        help="Load records with COPY into a temporary table and merge them with INSERT ... SELECT ... ON CONFLICT (for backfills)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help="Stream records from named server-side cursors into the validation stage instead of fetching them all at once",
+    )
+    parser.add_argument(
+        "--aggregate-hourly",
+        action="store_true",
+        default=False,
+        help="Compute the daily MAWNQC estimates with GROUP BY date over {station}_hourly in the database, one row per day",
+    )
+    parser.add_argument(
+        "--itersize",
+        type=int,
+        default=STREAM_ITERSIZE,
+        help="Number of rows fetched per round trip in streaming mode",
+    )
+    parser.add_argument(
+        "--log-level",
+        type=str.upper,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        help="Minimum level written to the log file (default: EWX_LOG_LEVEL, else DEBUG)",
+    )
+    parser.add_argument(
+        "--async-log",
+        action="store_true",
+        default=False,
+        help="Write log events from a background thread in batches (same as EWX_LOG_ASYNC=1)",
+    )
+    parser.add_argument(
+        "--timing-json",
+        type=str,
+        help="Write the per-stage timing summary of the run (seconds, rows, rows/sec per station) to this JSON file",
+    )
+    parser.add_argument(
+        "--metrics-textfile",
+        type=str,
+        help="Write run metrics in Prometheus text format to this file (e.g. the node_exporter textfile-collector directory)",
+    )
 
     args = parser.parse_args()
 
+    if args.log_level:
+        my_logger.set_level(args.log_level)
+    if args.async_log:
+        my_logger.start_async_sink()
+
     # If show-sections flag is set, display section info and exit
     if args.show_sections:
         section_info = get_ini_section_info(ini_file_path)
@@ -625,9 +753,15 @@ def main() -> None:
     # Parse and set date ranges
     begin_date, end_date = time_defaults(args.begin, args.end)
 
+    run_start = time.perf_counter()
+    run_timer = StageTimer()
+    station_stages = {}
+    results = []
+
     try:
         # Establish database connections based on args
-        db_connections = create_db_connections(args)
+        with run_timer.time("connect"):
+            db_connections = create_db_connections(args)
         print(f"db_connections: {db_connections}")
         
         # Create cursors for connections
@@ -648,48 +782,101 @@ def main() -> None:
 
         for station in stations:
             my_logger.info(f"Processing station: {station}")
+            timer = StageTimer()
+            station_stages[station] = timer.stages
+            result = {"station": station, "work_items": 0, "records": 0, "failures": [], "stages": timer.stages}
+            results.append(result)
             
-            qc_columns = get_insert_table_columns(qcwrite_cursor, station)
+            with timer.time("get_insert_table_columns"):
+                qc_columns = get_insert_table_columns(qcwrite_cursor, station)
             #print(f"QC Columns: {qc_columns}")
             
-            mawndb_records = fetch_records(
-                mawn_cursor,
-                station,
-                runtime_begin_dates[station],
-                runtime_end_dates[station],
-            )
+            # Streamed records are only fetched while they are processed, so their fetch time counts as processing;
+            # their rows are added to the fetch stages as they are consumed
+            itersize = args.itersize if args.stream else None
+            with timer.time("fetch_mawn") as counter:
+                mawndb_records = fetch_records(
+                    mawn_cursor,
+                    station,
+                    runtime_begin_dates[station],
+                    runtime_end_dates[station],
+                    itersize,
+                )
+                if isinstance(mawndb_records, list):
+                    counter.rows = len(mawndb_records)
+                else:
+                    mawndb_records = timer.count_rows("fetch_mawn", mawndb_records)
             #print(f"Mawndb Record: {mawndb_records}")
             
-            mawnqc_records = fetch_records(
-                qcread_cursor,
-                station,
-                runtime_begin_dates[station],
-                runtime_end_dates[station],
-            )
+            with timer.time("fetch_mawnqc") as counter:
+                if args.aggregate_hourly:
+                    mawnqc_records = fetch_hourly_aggregates(
+                        qcread_cursor,
+                        station,
+                        qc_columns,
+                        runtime_begin_dates[station],
+                        runtime_end_dates[station],
+                    )
+                else:
+                    mawnqc_records = fetch_records(
+                        qcread_cursor,
+                        station,
+                        runtime_begin_dates[station],
+                        runtime_end_dates[station],
+                        itersize,
+                    )
+                if isinstance(mawnqc_records, list):
+                    counter.rows = len(mawnqc_records)
+                else:
+                    mawnqc_records = timer.count_rows("fetch_mawnqc", mawnqc_records)
             #print(f"Mawnqc record: {mawnqc_records}")
 
             # Process and clean the records
-            cleaned_records = process_records(
-                qc_columns, mawndb_records, mawnqc_records, 
-                runtime_begin_dates[station], runtime_end_dates[station]
-            )
+            with timer.time("process_records") as counter:
+                cleaned_records = process_records(
+                    qc_columns, mawndb_records, mawnqc_records, 
+                    runtime_begin_dates[station], runtime_end_dates[station],
+                    mawnqc_aggregated=args.aggregate_hourly
+                )
+                counter.rows = len(cleaned_records)
             #print(f"Cleaned Records: {cleaned_records}")
 
             # If execution is requested, insert or update records in the QC database
             if args.execute and qcwrite_cursor:
                 my_logger.info(f"Executing updates for station {station}")
-                commit_and_rollback(
-                    db_connections["qcwrite_connection"], station, cleaned_records, qc_columns, unique_keys=["date", "time"]
-                )
+                with timer.time("commit_and_rollback") as counter:
+                    commit_and_rollback(
+                        db_connections["qcwrite_connection"], station, cleaned_records, qc_columns, unique_keys=["date", "time"],
+                        bulk_copy=args.bulk_copy
+                    )
+                    counter.rows = len(cleaned_records)
+
+            result["work_items"] = 1
+            result["records"] = len(cleaned_records)
+            if args.metrics_textfile:
+                result["src_counts"] = count_src_outcomes(cleaned_records)
+            my_logger.info("station_timing", station=station, stages=timer.summary())
 
     except Exception as e:
         my_logger.error(traceback.format_exc())
         my_logger.error(f"An error occurred: {e}")
+        # The run stops at the first error, which belongs to the station being processed, if any
+        if results and not results[-1]["work_items"]:
+            results[-1]["failures"].append(str(e))
     finally:
         # Close all database connections
         if 'db_connections' in locals():
             close_connections(db_connections)
 
+        timing = run_summary(station_stages, run_timer, time.perf_counter() - run_start)
+        my_logger.info("run_timing", **timing)
+        write_timing_json(args.timing_json, timing)
+        if args.metrics_textfile:
+            write_textfile_metrics(
+                args.metrics_textfile,
+                format_textfile_metrics("daily_main", results, run_timer, timing["wall_seconds"]),
+            )
+
 
 if __name__ == "__main__":
     main()
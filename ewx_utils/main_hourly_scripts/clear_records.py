@@ -18,14 +18,15 @@ from ewx_utils.db_files.dbs_connection import(
     get_mawn_cursor,
     get_rtma_cursor,
     get_qcwrite_cursor,
-    create_db_connections
+    create_db_connections,
+    release_connection
 )
 from ewx_utils.hourly_validation_checks.hourly_validation_utils import process_records
 from ewx_utils.logs.ewx_utils_logs_config import ewx_unstructured_logger
 from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
 from typing import List, Dict, Any, Tuple, Optional
 
-my_logger = EWXStructuredLogger(log_path=EWXStructuredLogger)
+my_logger = EWXStructuredLogger(log_path=ewx_log_file)
 
 
 def get_all_stations_list(cursor: Any) -> List[str]:
@@ -95,7 +96,7 @@ def clear_records(cursor, station):
 
 def close_connections(connections):
     """
-    Close all database connections and cursors.
+    Close all cursors and give the database connections back to their pools.
 
     Parameters:
         connections (dict): A dictionary of connection and cursor objects,
@@ -111,8 +112,8 @@ def close_connections(connections):
                 conn.close()
                 my_logger.error(f"{name} cursor closed.")
             elif "connection" in name:
-                conn.close()
-                my_logger.error(f"{name} connection closed.")
+                release_connection(conn)
+                my_logger.error(f"{name} connection returned to its pool.")
         except Exception as e:
             my_logger.error(f"Error closing {name}: {e}")
 
@@ -1,4 +1,4 @@
-!/bin/bash
+#!/bin/bash
 # Defining stations array
 stations=(
     aetna albion allegan alpine arlene arlington bainbridge bath
@@ -15,19 +15,12 @@ stations=(
     shelbyeast sisterbay southerndoor southhaven sparta20 sparta spartanorth spooner 
     standale stephenson sturgeonbay swmrec verona westjacksonport westolive williamsburg20 wmich
 )
-# Main processing loops
-for station in "${stations[@]}"; do             # First loop: Station
-    echo "Processing station $station..."
-    for year in {1996..2005}; do               # Second loop: Years for current station
-        echo "Processing year $year for station $station..."
-        python3 hourly_main.py -x \
-            -b "${year}-01-01" \
-            -e "${year}-12-31" \
-            -s "$station" \
-            --read-from mawn rtma \
-            --write-to mawnqc
-    done
-done
+# Single run for all stations and years: connections, the INI file and the station data are set up once
+# and the records are processed one station and year at a time
+python3 hourly_main.py -x \
+    --years 1996 2005 \
+    -s "${stations[@]}" \
+    --read-from mawn rtma \
+    --write-to mawnqc
 
 echo "All processing completed!"
-
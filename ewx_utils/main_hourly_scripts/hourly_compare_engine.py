@@ -0,0 +1,368 @@
+""" This script compares the hourly records of two QC databases column by column with NumPy.
+It is an optional alternative to compare_records in hourly_utility: the test and supercell rows are aligned on
+(date, time), the equivalence rules of the comparison (RELH_CAP vs MAWN, EMPTY vs None, OOR/-7999, ...) are
+declared per column below and applied as array masks, and the 0.05% margin of the limited columns is checked
+in float64. Values too close to the margin to decide in float64 are checked with the Decimal arithmetic of
+compare_records, so the mismatches it returns are the same, with one exception: a polyatmp_src, polystmp1_src
+or polystmp2_src value of EMPTY in the test database. compare_records looks up the supercell value of these
+columns in the list of supercell records instead of the record and raises TypeError; here an EMPTY test value
+is equal to an OOR supercell value, as the rule intends, and a mismatch otherwise.
+"""
+import os
+import sys
+import decimal
+from dotenv import load_dotenv
+load_dotenv()
+ewx_base_path = os.getenv("EWX_BASE_PATH")
+sys.path.append(ewx_base_path)
+from ewx_utils.ewx_config import ewx_log_file
+from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
+from ewx_utils.main_hourly_scripts.hourly_reports import (
+    GENERAL_MISMATCHES_HEADER,
+    GENERAL_MISMATCHES_REPORT,
+    MARGIN_VALUES_HEADER,
+    MARGIN_VALUES_REPORT,
+    ReportWriter
+)
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, hourly_utility then uses compare_records
+    np = None
+
+my_compare_logger = EWXStructuredLogger(log_path=ewx_log_file)
+
+# Columns compared within MARGIN of the supercell value after limiting both values to MAX_DIGITS digits
+MARGIN_COLUMNS = ("srad", "relh", "soil0", "soil1", "atmp")
+MARGIN = decimal.Decimal("0.0005")
+MAX_DIGITS = 6
+
+# (columns, test value, supercell value) pairs that are treated as equal
+EQUIVALENT_VALUES = (
+    (("stmp_05cm_src", "stmp_10cm_src", "stmp_20cm_src", "stmp_50cm_src",
+      "smst_05cm_src", "smst_10cm_src", "smst_20cm_src", "smst_50cm_src"), "EMPTY", None),
+    (("polyatmp_src", "polystmp1_src", "polystmp2_src"), "EMPTY", "OOR"),
+    (("relh_src",), "RELH_CAP", "MAWN"),
+    (("relh_src",), "OOR", "EMPTY"),
+    (("dwpt_src",), "RTMA", None),
+    (("wstdv_src", "wstdv_20m_src"), "EMPTY", "OOR"),
+    (("volt_src",), "EMPTY", "OOR"),
+    (("vapr_src", "vapr_3m_src", "vapr_45cm_src"), "EMPTY", None),
+)
+
+# Columns that are not compared, and columns only compared for records from a date on
+NOT_COMPARED_COLUMNS = ("vapr_src", "vapr_3m_src", "vapr_45cm_src")
+COMPARED_FROM = {"vapr": date(2024, 9, 1)}
+
+# Before this year the _src columns and volt are not compared
+SRC_COMPARED_FROM_YEAR = 2017
+
+# Out of range values are stored as this value with an OOR source in the test database
+OOR_VALUE = -7999
+
+# Bound, relative to max(1, |value|), of the change of a value by limit_to_max_digits; margins closer than
+# this to the difference are checked with Decimal arithmetic
+LIMIT_ERROR = 5e-5
+
+
+def numpy_available() -> bool:
+    """
+    Returns:
+        bool: True if NumPy can be imported and the columnar comparison can be used.
+    """
+    return np is not None
+
+
+def limit_to_max_digits(num: Optional[float], max_digits: Optional[int] = None) -> Optional[decimal.Decimal]:
+    """
+    Limit the number of digits in a decimal number to a specified maximum.
+
+    Parameters:
+        num (float or None): The input number to be rounded.
+        max_digits (int, optional): Maximum number of digits. Defaults to 6.
+
+    Returns:
+        decimal.Decimal or None: The rounded decimal number, or None if an error occurs.
+
+    Logs:
+        Errors and unexpected conditions are logged.
+    """
+    try:
+        if num is None:
+            my_compare_logger.error("Input num is None.")
+            return None
+
+        if max_digits is None:
+            max_digits = MAX_DIGITS
+
+        if num == 0:
+            return decimal.Decimal("0.0")
+
+        num_decimal = decimal.Decimal(str(num))
+
+        integer_part = num_decimal.to_integral_value()
+        if integer_part == 0:
+            integer_digits = 0
+        else:
+            integer_digits = len(str(integer_part))
+        decimal_places = max_digits - integer_digits
+
+        if decimal_places < 0:
+            decimal_places = 0
+
+        quantize_str = decimal.Decimal("1." + "0" * decimal_places)
+
+        rounded_decimal = num_decimal.quantize(
+            quantize_str, rounding=decimal.ROUND_HALF_UP
+        )
+        return rounded_decimal
+
+    except decimal.ConversionSyntax as e:
+        my_compare_logger.error(
+            f"ConversionSyntax error for input num: {num}, max_digits: {max_digits}. Error: {e}"
+        )
+        return None
+    except Exception as e:
+        my_compare_logger.error(
+            f"An unexpected error occurred for input num: {num}, max_digits: {max_digits}. Error: {e}"
+        )
+        return None
+
+
+def limited_within_margin(test_value: Optional[decimal.Decimal], supercell_value: Optional[decimal.Decimal]) -> bool:
+    """
+    Check limited values the way is_within_margin does, without its comparison trace.
+
+    Parameters:
+        test_value (Optional[decimal.Decimal]): Test value as returned by limit_to_max_digits.
+        supercell_value (Optional[decimal.Decimal]): Supercell value as returned by limit_to_max_digits.
+
+    Returns:
+        bool: True if the difference is within MARGIN of the supercell value.
+    """
+    if test_value is None or supercell_value is None:
+        return False
+    return abs(test_value - supercell_value) <= abs(supercell_value) * MARGIN
+
+
+def object_column(records: List[Dict[str, Any]], key: str) -> "np.ndarray":
+    """
+    Collect one column of the records into an object array, with None for records without the column.
+    """
+    values = np.empty(len(records), dtype=object)
+    values[:] = [record.get(key) for record in records]
+    return values
+
+
+def equals(values: "np.ndarray", target: Any) -> "np.ndarray":
+    """
+    Returns:
+        np.ndarray: Mask of the values equal to target; None is matched by identity.
+    """
+    if target is None:
+        return np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+    return np.fromiter((value == target for value in values), dtype=bool, count=len(values))
+
+
+def numeric_floats(values: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Split an object column into its mask of numbers and their float64 values (NaN elsewhere).
+    """
+    numeric = np.fromiter(
+        (isinstance(value, (int, float, decimal.Decimal)) and not isinstance(value, bool) for value in values),
+        dtype=bool, count=len(values),
+    )
+    floats = np.full(len(values), np.nan)
+    if numeric.any():
+        floats[numeric] = [float(value) for value in values[numeric]]
+    return numeric, floats
+
+
+def equivalent_mask(column: str, test: "np.ndarray", supercell: "np.ndarray",
+                    test_src: "np.ndarray", supercell_src: "np.ndarray") -> "np.ndarray":
+    """
+    Mark the rows where the test and supercell values of a column are equivalent under the comparison rules.
+
+    Parameters:
+        column (str): Column name.
+        test (np.ndarray): Test values of the column.
+        supercell (np.ndarray): Supercell values of the column.
+        test_src (np.ndarray): Test values of the column's _src column (None where there is none).
+        supercell_src (np.ndarray): Supercell values of the column's _src column.
+
+    Returns:
+        np.ndarray: Mask of the rows that are not compared.
+    """
+    supercell_null = equals(supercell, None)
+    skip = (equals(test, OOR_VALUE) & equals(test_src, "OOR") & supercell_null & equals(supercell_src, "OOR"))
+    for columns, test_value, supercell_value in EQUIVALENT_VALUES:
+        if column in columns:
+            skip |= equals(test, test_value) & equals(supercell, supercell_value)
+
+    if column == "relh":
+        # Humidity capped to 100 in the test database may be stored up to 105 in the supercell database
+        test_numeric, test_floats = numeric_floats(test)
+        supercell_numeric, supercell_floats = numeric_floats(supercell)
+        with np.errstate(invalid="ignore"):
+            skip |= (test_numeric & (test_floats == 100) & supercell_numeric
+                     & (supercell_floats >= 100) & (supercell_floats <= 105))
+    elif column == "dwpt":
+        # Dew points replaced from RTMA are missing in the supercell database
+        skip |= supercell_null
+    elif column == "dwpt_src":
+        skip |= (~equals(test, None) & equals(supercell, "EMPTY")) | equals(supercell, "OOR")
+
+    if column in MARGIN_COLUMNS:
+        skip |= ((equals(test, None) & equals(test_src, "EMPTY"))
+                 | (equals(test_src, "OOR") & supercell_null & equals(supercell_src, "EMPTY"))
+                 | equals(supercell_src, "OOR"))
+    return skip
+
+
+def margin_mismatches(test: "np.ndarray", supercell: "np.ndarray") -> "np.ndarray":
+    """
+    Mark the rows whose limited test value is not within MARGIN of the limited supercell value.
+    Rows too close to the margin to decide in float64, and values that are not numbers, are checked
+    with limit_to_max_digits and Decimal arithmetic.
+
+    Parameters:
+        test (np.ndarray): Test values of the column.
+        supercell (np.ndarray): Supercell values of the column.
+
+    Returns:
+        np.ndarray: Mask of the mismatched rows.
+    """
+    test_numeric, test_floats = numeric_floats(test)
+    supercell_numeric, supercell_floats = numeric_floats(supercell)
+    both_numeric = test_numeric & supercell_numeric
+    with np.errstate(invalid="ignore"):
+        difference = np.abs(test_floats - supercell_floats)
+        margin = np.abs(supercell_floats) * float(MARGIN)
+        band = (2 * LIMIT_ERROR * (np.maximum(1, np.abs(test_floats)) + np.maximum(1, np.abs(supercell_floats)))
+                + 1e-12 * (difference + margin))
+        mismatched = both_numeric & (difference > margin)
+        exact = both_numeric & (np.abs(difference - margin) <= band)
+    # Missing values never match; other values are checked exactly
+    exact |= ~both_numeric & ~equals(test, None) & ~equals(supercell, None)
+    mismatched |= ~both_numeric
+    for index in np.flatnonzero(exact):
+        mismatched[index] = not limited_within_margin(
+            limit_to_max_digits(test[index]), limit_to_max_digits(supercell[index])
+        )
+    return mismatched
+
+
+def compare_group(test_rows: List[Dict[str, Any]], supercell_rows: List[Dict[str, Any]],
+                  columns: List[str]) -> "np.ndarray":
+    """
+    Compare matched rows that share their columns.
+
+    Parameters:
+        test_rows (List[Dict[str, Any]]): Test records.
+        supercell_rows (List[Dict[str, Any]]): Supercell records of the same dates and times.
+        columns (List[str]): Columns compared, in test record order.
+
+    Returns:
+        np.ndarray: Boolean matrix of mismatches, one row per record and one column per compared column.
+    """
+    mismatches = np.zeros((len(test_rows), len(columns)), dtype=bool)
+    years = np.array([record.get("year") or 0 for record in test_rows], dtype=np.int64)
+    before_src_years = years < SRC_COMPARED_FROM_YEAR
+    record_dates = object_column(test_rows, "date")
+
+    for index, column in enumerate(columns):
+        if column in NOT_COMPARED_COLUMNS:
+            continue
+        test = object_column(test_rows, column)
+        supercell = object_column(supercell_rows, column)
+        if column.endswith("_src") or column == "volt":
+            compared = ~before_src_years
+        else:
+            compared = np.ones(len(test_rows), dtype=bool)
+        if column in COMPARED_FROM:
+            compared &= np.fromiter((record_date >= COMPARED_FROM[column] for record_date in record_dates),
+                                    dtype=bool, count=len(record_dates))
+        compared &= ~equivalent_mask(
+            column, test, supercell,
+            object_column(test_rows, f"{column}_src"), object_column(supercell_rows, f"{column}_src"),
+        )
+        if column in MARGIN_COLUMNS:
+            mismatches[:, index] = compared & margin_mismatches(test, supercell)
+        else:
+            mismatches[:, index] = compared & np.asarray(test != supercell, dtype=bool)
+    return mismatches
+
+
+def compare_records_columnar(test_records: List[dict], supercell_records: List[dict]
+                             ) -> Tuple[List[dict], List[dict], List[Any], List[Tuple[Any, Any]]]:
+    """
+    Compare records between test and supercell databases with column arrays.
+
+    Parameters:
+        test_records (list): Records from the test database.
+        supercell_records (list): Records from the supercell database.
+
+    Returns:
+        tuple: Records only in test, records only in supercell, the mismatch details as in compare_records
+        ([test record, supercell record, column], in record and column order) and the limited
+        (test, supercell) values of the mismatches in MARGIN_COLUMNS, in the same order.
+    """
+    test_records_dict = {(rec["date"], rec["time"]): rec for rec in test_records}
+    supercell_records_dict = {(rec["date"], rec["time"]): rec for rec in supercell_records}
+    only_in_test = [record for key, record in test_records_dict.items() if key not in supercell_records_dict]
+    only_in_supercell = [record for key, record in supercell_records_dict.items() if key not in test_records_dict]
+
+    # Matched rows are grouped by their columns, which are the same for all rows of a table
+    groups: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], List[int]] = {}
+    matched = [(test_records_dict[key], supercell_records_dict[key]) for key in test_records_dict
+               if key in supercell_records_dict]
+    for position, (test_record, supercell_record) in enumerate(matched):
+        groups.setdefault((tuple(test_record), tuple(supercell_record)), []).append(position)
+
+    found = []
+    for (test_keys, supercell_keys), positions in groups.items():
+        supercell_key_set = set(supercell_keys)
+        columns = [key for key in test_keys if key != "id" and key in supercell_key_set]
+        mismatches = compare_group([matched[p][0] for p in positions], [matched[p][1] for p in positions], columns)
+        rows, column_indexes = np.nonzero(mismatches)
+        found.extend((positions[row], column_index, columns[column_index]) for row, column_index in zip(rows, column_indexes))
+    found.sort(key=lambda item: item[:2])
+
+    mismatches_details = []
+    margin_values = []
+    stripped: Dict[int, Tuple[dict, dict]] = {}
+    for position, _, column in found:
+        if position not in stripped:
+            test_record, supercell_record = matched[position]
+            stripped[position] = ({k: v for k, v in test_record.items() if k != "id"},
+                                  {k: v for k, v in supercell_record.items() if k != "id"})
+        test_record, supercell_record = stripped[position]
+        mismatches_details.append([test_record, supercell_record, column])
+        if column in MARGIN_COLUMNS:
+            margin_values.append((limit_to_max_digits(test_record[column]), limit_to_max_digits(supercell_record[column])))
+    my_compare_logger.info(
+        f"Compared {len(matched)} matched records: {len(mismatches_details)} mismatches, "
+        f"{len(only_in_test)} only in test, {len(only_in_supercell)} only in supercell"
+    )
+    return only_in_test, only_in_supercell, mismatches_details, margin_values
+
+
+def write_mismatch_reports(reports: ReportWriter, mismatches_details: List[Any], margin_values: List[Tuple[Any, Any]]) -> None:
+    """
+    Write the mismatches to the reports of compare_records: the limited values of MARGIN_COLUMNS mismatches
+    to srad_values and the other mismatches to general_mismatches.
+
+    Parameters:
+        reports (ReportWriter): Report writer of the run.
+        mismatches_details (List[Any]): Mismatch details as returned by compare_records_columnar.
+        margin_values (List[Tuple[Any, Any]]): Limited values as returned by compare_records_columnar.
+    """
+    reports.write_rows(MARGIN_VALUES_REPORT, MARGIN_VALUES_HEADER, margin_values)
+    for test_record, supercell_record, column in mismatches_details:
+        if column not in MARGIN_COLUMNS:
+            reports.write_row(
+                GENERAL_MISMATCHES_REPORT,
+                GENERAL_MISMATCHES_HEADER,
+                [test_record["date"], test_record["time"], column, test_record[column], supercell_record[column]],
+            )
@@ -0,0 +1,179 @@
+""" This script finds the rows that hourly_utility has to compare in detail.
+Most rows of a verification run are identical in the test and supercell databases. The pre-check hashes each
+row over the columns both tables share (md5(row(...)::text) in SQL, or the values of fetched rows in Python)
+and only the rows whose hashes differ, or that are in one database only, are sent to the column by column
+comparison. Identical rows with a missing value in a margin column are still compared in detail, since
+compare_records reports a missing margin value as a mismatch.
+"""
+import os
+import sys
+from dotenv import load_dotenv
+load_dotenv()
+ewx_base_path = os.getenv("EWX_BASE_PATH")
+sys.path.append(ewx_base_path)
+from ewx_utils.ewx_config import ewx_log_file
+from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
+from ewx_utils.main_hourly_scripts.hourly_compare_engine import MARGIN_COLUMNS
+from datetime import date, time
+from typing import Any, Dict, List, Set, Tuple
+
+my_hashes_logger = EWXStructuredLogger(log_path=ewx_log_file)
+
+PRECHECK_MODES = ("none", "sql", "python")
+# Keys per query when fetching the rows that differ
+KEY_BATCH_SIZE = 5000
+
+RowKey = Tuple[date, time]
+
+
+def get_table_columns(cursor: Any, table: str) -> List[str]:
+    """
+    Return the column names of a table, in table order.
+
+    Parameters:
+        cursor: Database cursor object to execute queries.
+        table (str): Table name.
+
+    Returns:
+        List[str]: Column names.
+    """
+    cursor.execute(f"SELECT * FROM {table} LIMIT 0")
+    return [desc[0] for desc in cursor.description]
+
+
+def shared_columns(test_columns: List[str], supercell_columns: List[str]) -> List[str]:
+    """
+    Return the columns compared by compare_records: the test columns, except id, that the supercell table has too.
+    """
+    supercell_column_set = set(supercell_columns)
+    return [column for column in test_columns if column != "id" and column in supercell_column_set]
+
+
+def fetch_row_hashes(cursor: Any, table: str, columns: List[str], start_date: str, end_date: str) -> Dict[RowKey, Tuple[str, bool]]:
+    """
+    Hash the rows of a table for a date range in the database.
+
+    Parameters:
+        cursor: Database cursor object to execute queries.
+        table (str): Table name.
+        columns (List[str]): Hashed columns, in the same order for both databases.
+        start_date (str): Start date of the query in YYYY-MM-DD format.
+        end_date (str): End date of the query in YYYY-MM-DD format.
+
+    Returns:
+        Dict[RowKey, Tuple[str, bool]]: md5 of each row and whether a margin column of the row is missing,
+        keyed by (date, time).
+    """
+    missing_margin = " OR ".join(f"{column} IS NULL" for column in columns if column in MARGIN_COLUMNS) or "false"
+    query = f"""
+    SELECT date, time, md5(row({", ".join(columns)})::text) AS row_hash, ({missing_margin}) AS missing_margin
+    FROM {table}
+    WHERE date BETWEEN %s AND %s
+    """
+    cursor.execute(query, (start_date, end_date))
+    return {(row["date"], row["time"]): (row["row_hash"], row["missing_margin"]) for row in cursor.fetchall()}
+
+
+def keys_to_compare(test_hashes: Dict[RowKey, Tuple[str, bool]], supercell_hashes: Dict[RowKey, Tuple[str, bool]]
+                    ) -> Tuple[List[RowKey], List[RowKey], int]:
+    """
+    Split the row keys of both databases into the keys to fetch for the detailed comparison and the identical rows.
+
+    Parameters:
+        test_hashes (Dict[RowKey, Tuple[str, bool]]): Row hashes of the test database.
+        supercell_hashes (Dict[RowKey, Tuple[str, bool]]): Row hashes of the supercell database.
+
+    Returns:
+        Tuple[List[RowKey], List[RowKey], int]: Keys of the test rows and of the supercell rows to compare in detail,
+        and the number of identical rows.
+    """
+    identical: Set[RowKey] = {
+        key for key, (row_hash, missing_margin) in test_hashes.items()
+        if not missing_margin and supercell_hashes.get(key, (None,))[0] == row_hash
+    }
+    test_keys = [key for key in test_hashes if key not in identical]
+    supercell_keys = [key for key in supercell_hashes if key not in identical]
+    return test_keys, supercell_keys, len(identical)
+
+
+def fetch_records_by_keys(cursor: Any, table: str, keys: List[RowKey], batch_size: int = KEY_BATCH_SIZE) -> List[dict]:
+    """
+    Fetch the rows of a table with the given (date, time) keys.
+
+    Parameters:
+        cursor: Database cursor object to execute queries.
+        table (str): Table name.
+        keys (List[RowKey]): Keys of the rows.
+        batch_size (int, optional): Keys per query. Defaults to KEY_BATCH_SIZE.
+
+    Returns:
+        List[dict]: The rows, ordered by date and time.
+    """
+    query = f"""
+    SELECT t.* FROM {table} t
+    JOIN unnest(%s::date[], %s::time[]) AS k(date, time) ON t.date = k.date AND t.time = k.time
+    ORDER BY t.date, t.time
+    """
+    records = []
+    for start in range(0, len(keys), batch_size):
+        batch = keys[start:start + batch_size]
+        cursor.execute(query, ([key[0] for key in batch], [key[1] for key in batch]))
+        records.extend(dict(record) for record in cursor.fetchall())
+    return records
+
+
+def fetch_differing_records(test_cursor: Any, supercell_cursor: Any, table: str, start_date: str, end_date: str
+                            ) -> Tuple[List[dict], List[dict], int]:
+    """
+    Fetch only the rows of a table that are not identical in both databases, comparing row hashes in SQL.
+
+    Parameters:
+        test_cursor: Cursor of the test database.
+        supercell_cursor: Cursor of the supercell database.
+        table (str): Table name.
+        start_date (str): Start date of the query in YYYY-MM-DD format.
+        end_date (str): End date of the query in YYYY-MM-DD format.
+
+    Returns:
+        Tuple[List[dict], List[dict], int]: Test and supercell rows to compare in detail, and the number of identical rows.
+    """
+    columns = shared_columns(get_table_columns(test_cursor, table), get_table_columns(supercell_cursor, table))
+    test_hashes = fetch_row_hashes(test_cursor, table, columns, start_date, end_date)
+    supercell_hashes = fetch_row_hashes(supercell_cursor, table, columns, start_date, end_date)
+    test_keys, supercell_keys, identical = keys_to_compare(test_hashes, supercell_hashes)
+    my_hashes_logger.info(
+        f"{table}: {identical} identical rows, {len(test_keys)} test and {len(supercell_keys)} supercell rows to compare"
+    )
+    return (fetch_records_by_keys(test_cursor, table, test_keys),
+            fetch_records_by_keys(supercell_cursor, table, supercell_keys), identical)
+
+
+def drop_identical_records(test_records: List[dict], supercell_records: List[dict]) -> Tuple[List[dict], List[dict], int]:
+    """
+    Drop the fetched rows that are identical in both databases, comparing the values of the shared columns.
+
+    Parameters:
+        test_records (List[dict]): Records from the test database.
+        supercell_records (List[dict]): Records from the supercell database.
+
+    Returns:
+        Tuple[List[dict], List[dict], int]: Test and supercell records to compare in detail, in their order,
+        and the number of identical rows.
+    """
+    if not test_records or not supercell_records:
+        return test_records, supercell_records, 0
+    columns = shared_columns(list(test_records[0]), list(supercell_records[0]))
+    margin_columns = [column for column in columns if column in MARGIN_COLUMNS]
+    supercell_rows = {(record["date"], record["time"]): record for record in supercell_records}
+    test_rows = {(record["date"], record["time"]): record for record in test_records}
+
+    identical = set()
+    for key, test_record in test_rows.items():
+        supercell_record = supercell_rows.get(key)
+        if supercell_record is None or any(test_record.get(column) is None for column in margin_columns):
+            continue
+        if all(test_record.get(column) == supercell_record.get(column) for column in columns):
+            identical.add(key)
+    return ([record for record in test_records if (record["date"], record["time"]) not in identical],
+            [record for record in supercell_records if (record["date"], record["time"]) not in identical],
+            len(identical))
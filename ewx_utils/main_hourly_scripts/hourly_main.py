@@ -2,11 +2,16 @@
 import os
 import sys
 import argparse
+import asyncio
 from argparse import Namespace
 import datetime as datetime
 from datetime import datetime, timedelta
 from datetime import date
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from psycopg2 import OperationalError
+from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 load_dotenv()
 ewx_base_path = os.getenv("EWX_BASE_PATH")
@@ -18,20 +23,40 @@ from ewx_utils.db_files.dbs_connection import(
     get_mawn_cursor,
     get_rtma_cursor,
     get_qcwrite_cursor,
-    create_db_connections
+    create_db_connections,
+    release_connection,
+    stream_records
 )
 from ewx_utils.db_files.dbs_configfile import get_db_config
+from ewx_utils.db_files.dbs_pool import get_pool_manager
+from ewx_utils.db_files.dbs_bulk_copy import copy_upsert_records
+from ewx_utils.db_files.dbs_change_detection import diff_existing_records
+from ewx_utils.db_files.dbs_watermark import ensure_watermark_table, read_watermark, write_watermark
 from ewx_utils.hourly_validation_checks.hourly_validation_utils import process_records
+from ewx_utils.hourly_validation_checks.hourly_columnar_engine import process_records_columnar, numpy_available
+from ewx_utils.hourly_validation_checks.hourly_calendar import hour_grid
 from ewx_utils.logs.ewx_utils_logs_config import ewx_unstructured_logger
 from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
-from typing import List, Dict, Any, Tuple, Optional
+from ewx_utils.logs.ewx_utils_timing import StageTimer, run_summary, write_timing_json
+from ewx_utils.logs.ewx_utils_metrics import count_src_outcomes, format_textfile_metrics, write_textfile_metrics
+from datetime import time as time_of_day
+from typing import List, Dict, Any, Tuple, Optional, Iterable, Set
 
-my_logger = EWXStructuredLogger(log_path=EWXStructuredLogger)
+my_logger = EWXStructuredLogger(log_path=ewx_log_file)
+
+# Number of rows sent to the QC database per INSERT ... ON CONFLICT statement
+UPSERT_PAGE_SIZE = 1000
+
+# Number of rows fetched per round trip from a server-side cursor in streaming mode
+STREAM_ITERSIZE = 2000
+
+# Number of fetched work items queued ahead of the one being written by the --async-io runner
+ASYNC_PREFETCH = 1
 
 
 def close_connections(connections: Dict[str, Any]) -> None:
     """
-    Close all provided database connections and cursors.
+    Close all provided cursors and give the database connections back to their pools.
 
     Parameters:
     connections : Dict[str, Any]
@@ -45,29 +70,38 @@ def close_connections(connections: Dict[str, Any]) -> None:
                 conn.close()
                 my_logger.info(f"{name} cursor closed.")
             elif "connection" in name:
-                conn.close()
-                my_logger.info(f"{name} connection closed.")
+                release_connection(conn)
+                my_logger.info(f"{name} connection returned to its pool.")
         except Exception as e:
             my_logger.error(f"Error closing {name}: {e}")
 
 
-def fetch_records(cursor: Any, station: str, begin_date: str, end_date: str) -> List[Dict[str, Any]]:
+def fetch_records(cursor: Any, station: str, begin_date: str, end_date: str,
+                  itersize: Optional[int] = None) -> Iterable[Dict[str, Any]]:
     """
     Fetch records from the specified database table for a given date range.
 
+    With itersize, the records are streamed in date and time order from a named server-side cursor on the
+    cursor's connection instead of being fetched all at once; errors are then raised while iterating.
+    A failed query is rolled back, so that the connection can run the next query, and re-raised.
+
     Parameters:
         cursor: Database cursor object to execute queries.
         station (str): Name of the table (station) to query.
         begin_date (str): Start date of the query in YYYY-MM-DD format.
         end_date (str): End date of the query in YYYY-MM-DD format.
+        itersize (Optional[int]): Rows fetched per round trip in streaming mode.
 
     Returns:
-        list: A list of dictionaries containing the fetched records.
+        list: A list of dictionaries containing the fetched records, or an iterator over them in streaming mode.
 
     Raises:
         Exception: If the query fails or another error occurs.
     """
     query = f"SELECT * FROM {station}_hourly WHERE date BETWEEN %s AND %s"
+    if itersize:
+        my_logger.info("Streaming query: %s with parameters: %s, %s", query, begin_date, end_date)
+        return stream_records(cursor.connection, query + " ORDER BY date, time", (begin_date, end_date), itersize)
     my_logger.error(
         f"Executing query: {query} with parameters: {begin_date}, {end_date}"
     )
@@ -81,7 +115,61 @@ def fetch_records(cursor: Any, station: str, begin_date: str, end_date: str) ->
         return [dict(record) for record in records]
     except Exception as e:
         my_logger.error(f"Error fetching records from {station}: {e}")
-        return []
+        cursor.connection.rollback()
+        raise
+
+
+def end_read_transactions(cursors: Dict[str, Any]) -> None:
+    """
+    Roll back the open read transactions of the mawn and rtma connections, so that each work item reads
+    in a transaction of its own and a failed read does not abort the reads of the next work item.
+
+    Parameters:
+        cursors (Dict[str, Any]): The mawn and rtma cursors.
+    """
+    for source in ("mawn", "rtma"):
+        connection = getattr(cursors[source], "connection", None)
+        if connection is not None and not connection.closed:
+            connection.rollback()
+
+
+def fetch_max_id(cursor: Any, station: str) -> Optional[int]:
+    """
+    Fetch the largest row id of a station table. Row ids grow with every insert, so the largest id marks
+    how far the rows of the table have been seen.
+
+    Parameters:
+        cursor: Database cursor object to execute queries.
+        station (str): Name of the table (station) to query.
+
+    Returns:
+        Optional[int]: The largest id, or None if the table is empty.
+    """
+    cursor.execute(f"SELECT max(id) AS max_id FROM {station}_hourly")
+    return cursor.fetchone()["max_id"]
+
+
+def fetch_changed_hours(cursor: Any, station: str, after_id: Optional[int],
+                        up_to_id: Optional[int]) -> Set[Tuple[date, time_of_day]]:
+    """
+    Fetch the hours of the rows added to a station table since a previous run.
+
+    Parameters:
+        cursor: Database cursor object to execute queries.
+        station (str): Name of the table (station) to query.
+        after_id (Optional[int]): Largest id seen by the previous run; None if the table was empty then.
+        up_to_id (Optional[int]): Largest id seen by this run, so rows added while it runs are left for the next one.
+
+    Returns:
+        Set[Tuple[date, time]]: The (date, time) of each row with an id in (after_id, up_to_id].
+    """
+    if up_to_id is None or (after_id is not None and up_to_id <= after_id):
+        return set()
+    cursor.execute(
+        f"SELECT DISTINCT date, time FROM {station}_hourly WHERE id > %s AND id <= %s",
+        (after_id if after_id is not None else 0, up_to_id),
+    )
+    return {(row["date"], row["time"]) for row in cursor.fetchall()}
 
 
 def get_insert_table_columns(cursor: Any, station: str) -> List[str]:
@@ -124,28 +212,6 @@ def get_insert_table_columns(cursor: Any, station: str) -> List[str]:
         return []
 
 
-def record_exists(cursor: Any, station: str, record: Dict[str, str]) -> bool:
-    """
-    Check if a record exists for the specified weather station.
-
-    Parameters:
-    cursor (object): Database cursor for executing queries.
-    station (str): Specified weather station.
-    record (dict): Record containing 'date' and 'time' to check.
-
-    Returns:
-    bool: True if the record exists, False otherwise.
-    """
-    query = f"SELECT 1 FROM {station}_hourly WHERE date = %s AND time = %s"
-    try:
-        cursor.execute(query, (record["date"], record["time"]))
-
-        return cursor.fetchone() is not None
-    except Exception as e:
-        my_logger.error(f"Error checking existence of record in {station}: {e}")
-        raise
-
-
 def get_all_stations_list(cursor: Any) -> List[str]:
     """
     Fetch and return station names from the database, excluding 'variables_hourly'.
@@ -188,50 +254,31 @@ def get_all_stations_list(cursor: Any) -> List[str]:
         my_logger.error(f"An error occurred when getting the stations list: {e}")
         return []
 
-def update_records(cursor: Any, station: str, records: List[Dict[str, Any]]) -> None:
+def group_records_by_keys(records: List[Dict[str, Any]]) -> Dict[Tuple[str, ...], List[Dict[str, Any]]]:
     """
-    Update existing records in the specified station's table.
+    Group records by their columns, keeping the order of the records within each group.
+    Records built from a MAWN record only carry the columns of that record, so they are written separately
+    from the records that carry every QC column.
 
     Parameters:
-    cursor : Any
-        Database cursor for executing queries.
-    station : str
-        Specified weather station.
     records : List[Dict[str, Any]]
-        List of records to update, where each record is a dictionary with string keys and values of any type.
-    """
-    if not records:
-        my_logger.error(f"No records to update in {station}.")
-        return
+        List of records, where each record is a dictionary with string keys and values of any type.
 
-    try:
-        record_keys = [key for key in records[0].keys() if key not in ["date", "time", "id"]]
-        if not record_keys:
-            my_logger.error(f"No updatable keys found in the records for {station}.")
-            return
-
-        update_query = (
-            f"UPDATE {station}_hourly SET "
-            + ", ".join([f"{col} = %s" for col in record_keys])
-            + " WHERE date = %s AND time = %s"
-        )
-
-        for record in records:
-            update_values = [record[key] for key in record_keys] + [
-                record["date"],
-                record["time"],
-            ]
-            cursor.execute(update_query, update_values)
-
-        my_logger.info(f"Updated {len(records)} records in {station}.")
-    except Exception as e:
-        my_logger.error(f"Error updating records in {station}: {e}")
-        raise
+    Returns:
+    Dict[Tuple[str, ...], List[Dict[str, Any]]]
+        Records keyed by the tuple of their column names.
+    """
+    records_by_keys = {}
+    for record in records:
+        records_by_keys.setdefault(tuple(record.keys()), []).append(record)
+    return records_by_keys
 
 
-def insert_records(cursor: Any, station: str, records: List[Dict[str, Any]]) -> None:
+def upsert_records(cursor: Any, station: str, records: List[Dict[str, Any]], page_size: int = UPSERT_PAGE_SIZE) -> None:
     """
-    Insert records into the specified station's table.
+    Insert or update records in the specified station's table with batched INSERT ... ON CONFLICT statements.
+    Each page of records is sent in a single statement, so the rows of an existing date and time are
+    updated and new rows are inserted without a round trip per record.
 
     Parameters:
     cursor : Any
@@ -239,73 +286,36 @@ def insert_records(cursor: Any, station: str, records: List[Dict[str, Any]]) ->
     station : str
         Specified weather station.
     records : List[Dict[str, Any]]
-        List of records to insert, where each record is a dictionary with string keys and values of any type.
+        List of records to insert or update, where each record is a dictionary with string keys and values of any type.
+    page_size : int
+        Number of records per statement.
     """
     if not records:
-        my_logger.error(f"No records to insert into {station}.")
+        my_logger.error(f"No records to upsert into {station}.")
         return
 
     try:
-        # Use the first record to get column names
-        record_keys = list(records[0].keys())
-        my_logger.info(f"Record Keys: {record_keys}")
-        # Skip the 'id' column if it exists
-        if "id" in record_keys:
-            record_keys.remove("id")
-
-        if not record_keys:
-            my_logger.error(f"No keys found in the records for {station}.")
-            return
-
-    except (IndexError, AttributeError, KeyError) as e:
-        my_logger.error(f"Error accessing record keys: {e}")
-        return
-
-    # Prepare the INSERT query using only the available columns
-    db_columns = ", ".join(record_keys)
-    values_placeholder = ", ".join(["%s"] * len(record_keys))
-    query = f"INSERT INTO {station}_hourly ({db_columns}) VALUES ({values_placeholder})"
-
-    my_logger.info(f"Constructed INSERT query: {query}")
-
-    try:
-        for record in records:
-            record_vals = [record[key] for key in record_keys]
-            cursor.execute(query, record_vals)
-        my_logger.info(f"Inserted {len(records)} records into {station}.")
-    except Exception as e:
-        if query:
-            print(f"query: {query}")
-        if "record_vals" in locals():
-            print(f"record_vals: {record_vals}")
-        my_logger.error(f"Error inserting records into {station}: {e}")
-        raise
-
-
-def insert_or_update_records(cursor: Any, station: str, records: List[Dict[str, Any]]) -> None:
-    """
-    Insert or update records in the specified station's table.
-
-    Parameters:
-    cursor : Any
-        Database cursor for executing queries.
-    station : str
-        Specified weather station.
-    records : List[Dict[str, Any]]
-        List of records to insert or update, where each record is a dictionary with string keys and values of any type.
-    """
-    try:
-        for record in records:
-            if record_exists(cursor, station, record):
-                update_records(cursor, station, [record])
+        for record_keys, grouped_records in group_records_by_keys(records).items():
+            record_keys = [key for key in record_keys if key != "id"]
+            update_cols = [f"{key} = EXCLUDED.{key}" for key in record_keys if key not in ("date", "time")]
+            if update_cols:
+                conflict_action = "DO UPDATE SET " + ", ".join(update_cols)
             else:
-                insert_records(cursor, station, [record])
+                conflict_action = "DO NOTHING"
+            query = (
+                f"INSERT INTO {station}_hourly ({', '.join(record_keys)}) VALUES %s "
+                f"ON CONFLICT (date, time) {conflict_action}"
+            )
+            record_vals = [[record[key] for key in record_keys] for record in grouped_records]
+            execute_values(cursor, query, record_vals, page_size=page_size)
+        my_logger.info(f"Upserted {len(records)} records into {station}.")
     except Exception as e:
-        my_logger.error(f"Error in insert_or_update operation for {station}: {e}")
+        my_logger.error(f"Error upserting records into {station}: {e}")
         raise
-    
 
-def commit_and_rollback(connection: Any, station: str, records: List[Dict[str, Any]]) -> None:
+
+def commit_and_rollback(connection: Any, station: str, records: List[Dict[str, Any]], page_size: int = UPSERT_PAGE_SIZE,
+                        bulk_copy: bool = False) -> None:
     """
     Commit records for a station; rollback on error.
 
@@ -313,18 +323,28 @@ def commit_and_rollback(connection: Any, station: str, records: List[Dict[str, A
     connection (object): Database connection.
     station (str): Specified weather station.
     records (list): Records to insert/update, where each record is a dictionary.
+    page_size (int): Number of records per INSERT ... ON CONFLICT statement.
+    bulk_copy (bool): Load the records with COPY into a temporary table and merge them in one statement.
+
+    Returns:
+    bool: True if the transaction was committed, False if it was rolled back.
     """
     try:
         with connection.cursor() as cursor:
-            insert_or_update_records(cursor, station, records)
+            if bulk_copy:
+                # The hourly ids are assigned by the QC table, as in upsert_records
+                copy_upsert_records(cursor, f"{station}_hourly", records, exclude_keys=("id",))
+            else:
+                upsert_records(cursor, station, records, page_size)
         my_logger.info("Inserted/Updated records successfully")
         connection.commit()
         my_logger.info("Successfully committed transaction")
+        return True
     except Exception as e:
-        print(f"Exception as {e}")
+        my_logger.error(f"Failed to write records of {station}, rolling back the transaction: {e}")
         # Rollback the transaction in case of error
         connection.rollback()
-        my_logger.error(f"Transaction failed and rolled back: {e}")
+        return False
 
 
 def get_station_data(cursor: Any) -> Dict[str, Dict[str, Any]]:
@@ -510,6 +530,648 @@ def get_runtime_end_date(process_end_date: str, station_info: Dict[str, Dict[str
     my_logger.info("Runtime end dates calculation completed.")
     return runtime_end_date
 
+
+def year_chunks(begin_date: str, end_date: str) -> List[Tuple[str, str]]:
+    """
+    Split a date range into calendar years so that only one year of records is held in memory at a time.
+
+    Parameters:
+    begin_date (str): Start date (format: 'YYYY-MM-DD').
+    end_date (str): End date (format: 'YYYY-MM-DD').
+
+    Returns:
+    List[Tuple[str, str]]
+        The begin and end date of each year within the range.
+    """
+    return [
+        (max(begin_date, f"{year}-01-01"), min(end_date, f"{year}-12-31"))
+        for year in range(int(begin_date[:4]), int(end_date[:4]) + 1)
+    ]
+
+
+def read_work_list(work_list_path: str) -> List[Tuple[str, int]]:
+    """
+    Read a station/year work list. Each line holds a station name and a year separated by whitespace
+    or a comma; blank lines and lines starting with '#' are skipped.
+
+    Parameters:
+    work_list_path (str): Path to the work list file.
+
+    Returns:
+    List[Tuple[str, int]]
+        The (station, year) pairs in file order.
+
+    Raises:
+    ValueError: If a line does not hold a station and a year.
+    """
+    work_list = []
+    with open(work_list_path) as work_list_file:
+        for line_number, line in enumerate(work_list_file, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = line.replace(",", " ").split()
+            if len(fields) != 2 or not fields[1].isdigit():
+                raise ValueError(f"Invalid work list line {line_number}: {line!r}")
+            work_list.append((fields[0], int(fields[1])))
+    return work_list
+
+
+def build_work_items(work: List[Tuple[str, str, str]], station_info: Dict[str, Dict[str, Any]]) -> List[Tuple[str, str, str]]:
+    """
+    Clip each (station, begin date, end date) request to the station's runtime dates and split it into years.
+    Stations without station data or without dates in the requested range are skipped.
+
+    Parameters:
+    work : List[Tuple[str, str, str]]
+        Requested station names with their begin and end dates (format: 'YYYY-MM-DD').
+    station_info : Dict[str, Dict[str, Any]]
+        Station data as returned by get_station_data.
+
+    Returns:
+    List[Tuple[str, str, str]]
+        (station, begin date, end date) work items of at most one calendar year each.
+    """
+    work_items = []
+    for station, begin_date, end_date in work:
+        if station not in station_info:
+            my_logger.error(f"No station data for {station}, skipping {begin_date} to {end_date}")
+            continue
+        info = {station: station_info[station]}
+        runtime_begin_date = get_runtime_begin_date(begin_date, info)[station]
+        runtime_end_date = get_runtime_end_date(end_date, info)[station]
+        if runtime_begin_date is None or runtime_end_date is None or runtime_begin_date > runtime_end_date:
+            my_logger.warning(f"No runtime dates for {station} between {begin_date} and {end_date}, skipping")
+            continue
+        work_items.extend((station, chunk_begin, chunk_end) for chunk_begin, chunk_end in year_chunks(runtime_begin_date, runtime_end_date))
+    return work_items
+
+
+def group_work_items_by_station(work_items: List[Tuple[str, str, str]]) -> Dict[str, List[Tuple[str, str, str]]]:
+    """
+    Group work items by station, keeping the station and date order.
+
+    Parameters:
+    work_items : List[Tuple[str, str, str]]
+        (station, begin date, end date) work items as returned by build_work_items.
+
+    Returns:
+    Dict[str, List[Tuple[str, str, str]]]
+        Work items keyed by station name.
+    """
+    work_items_by_station = {}
+    for work_item in work_items:
+        work_items_by_station.setdefault(work_item[0], []).append(work_item)
+    return work_items_by_station
+
+
+def date_runs(dates: Iterable[date]) -> List[Tuple[date, date]]:
+    """
+    Group dates into runs of consecutive days.
+
+    Parameters:
+    dates (Iterable[date]): Dates in any order; duplicates are ignored.
+
+    Returns:
+    List[Tuple[date, date]]
+        The first and last date of each run, in date order.
+    """
+    runs = []
+    for day in sorted(set(dates)):
+        if runs and day - runs[-1][1] == timedelta(days=1):
+            runs[-1][1] = day
+        else:
+            runs.append([day, day])
+    return [(first, last) for first, last in runs]
+
+
+def plan_incremental_work(station: str, work_items: List[Tuple[str, str, str]], watermark: Optional[Dict[str, Any]],
+                          changed_hours: Set[Tuple[date, time_of_day]], now: Optional[datetime] = None
+                          ) -> Tuple[List[Tuple[str, str, str]], Optional[Set[Tuple[date, time_of_day]]], Optional[datetime]]:
+    """
+    Narrow the work items of a station to the hours an incremental run has to revalidate: the hours after
+    the watermark and the hours whose MAWN or RTMA rows were added since the watermark was written.
+
+    Parameters:
+    station (str): Specified weather station.
+    work_items (List[Tuple[str, str, str]]): The station's (station, begin date, end date) work items.
+    watermark (Optional[Dict[str, Any]]): The station's watermark as returned by read_watermark.
+    changed_hours (Set[Tuple[date, time]]): (date, time) of the upstream rows added since the watermark.
+    now (Optional[datetime]): Naive local time after which hours are left out; defaults to the current time.
+
+    Returns:
+    Tuple[List[Tuple[str, str, str]], Optional[Set[Tuple[date, time]]], Optional[datetime]]
+        The work items covering the days of those hours, the (date, time) of the hours to write (None to write
+        every hour, when the station has no watermark yet) and the last hour of the range for the new watermark.
+    """
+    if not work_items:
+        return [], set(), None
+    grid = hour_grid(min(item[1] for item in work_items), max(item[2] for item in work_items), now)
+    if not len(grid):
+        return [], set(), None
+    last_hour = grid.datetimes[-1]
+    if watermark is None:
+        return work_items, None, last_hour
+
+    hours = set()
+    for hour_datetime, hour_date, hour_time in zip(grid.datetimes, grid.dates, grid.times):
+        key = (hour_date, hour_time)
+        if hour_datetime > watermark["last_hour"] or key in changed_hours:
+            hours.add(key)
+    incremental_items = [
+        (station, first.isoformat(), last.isoformat()) for first, last in date_runs(hour_date for hour_date, _ in hours)
+    ]
+    return incremental_items, hours, last_hour
+
+
+def plan_station_increment(station: str, work_items: List[Tuple[str, str, str]], cursors: Dict[str, Any]
+                           ) -> Tuple[List[Tuple[str, str, str]], Optional[Set[Tuple[date, time_of_day]]], Optional[datetime], Dict[str, Optional[int]]]:
+    """
+    Read the watermark and the upstream row ids of a station and plan its incremental run.
+
+    Parameters:
+    station (str): Specified weather station.
+    work_items (List[Tuple[str, str, str]]): The station's (station, begin date, end date) work items.
+    cursors (Dict[str, Any]): The mawn, rtma and qcwrite cursors.
+
+    Returns:
+    Tuple
+        The work items, hours and last hour as returned by plan_incremental_work, and the largest
+        mawn and rtma ids seen, to be stored with the new watermark.
+    """
+    watermark = read_watermark(cursors["qcwrite"], station)
+    max_ids = {source: fetch_max_id(cursors[source], station) for source in ("mawn", "rtma")}
+    changed_hours = set()
+    if watermark is not None:
+        for source in ("mawn", "rtma"):
+            changed_hours |= fetch_changed_hours(cursors[source], station, watermark[f"{source}_max_id"], max_ids[source])
+    work_items, hours, last_hour = plan_incremental_work(station, work_items, watermark, changed_hours)
+    my_logger.info(
+        f"Incremental plan for {station}: {len(work_items)} work items, "
+        f"{'all' if hours is None else len(hours)} hours after watermark {watermark and watermark['last_hour']}"
+    )
+    return work_items, hours, last_hour, max_ids
+
+
+def new_station_result(station: str, timer: StageTimer, args: Namespace) -> Dict[str, Any]:
+    """
+    Create the result of a station, with the counters its options ask for.
+
+    Parameters:
+    station (str): Specified weather station.
+    timer (StageTimer): Timer of the station's stages.
+    args (Namespace): Parsed command-line arguments.
+
+    Returns:
+    Dict[str, Any]
+        Station result as returned by process_station, with nothing processed yet.
+    """
+    result = {"station": station, "work_items": 0, "records": 0, "failures": [], "stages": timer.stages}
+    if getattr(args, "metrics_textfile", None):
+        result["src_counts"] = Counter()
+    if getattr(args, "skip_unchanged", False):
+        result["changes"] = Counter()
+    return result
+
+
+def plan_station(station: str, work_items: List[Tuple[str, str, str]], cursors: Dict[str, Any], args: Namespace,
+                 timer: StageTimer) -> Dict[str, Any]:
+    """
+    Look up the QC columns of a station and, with --incremental, narrow its work items to the hours to revalidate.
+
+    Parameters:
+    station (str): Specified weather station.
+    work_items (List[Tuple[str, str, str]]): The station's (station, begin date, end date) work items.
+    cursors (Dict[str, Any]): The mawn, rtma and qcwrite cursors.
+    args (Namespace): Parsed command-line arguments.
+    timer (StageTimer): Timer of the station's stages.
+
+    Returns:
+    Dict[str, Any]
+        The qc_columns and work_items of the station and, with --incremental, the hour_filter, last_hour and
+        max_ids as returned by plan_station_increment (hour_filter None means every hour is written).
+    """
+    plan = {"work_items": work_items, "hour_filter": None, "last_hour": None, "max_ids": None}
+    if getattr(args, "incremental", False):
+        with timer.time("plan_incremental") as counter:
+            plan["work_items"], plan["hour_filter"], plan["last_hour"], plan["max_ids"] = plan_station_increment(
+                station, work_items, cursors
+            )
+            counter.rows = len(plan["hour_filter"]) if plan["hour_filter"] is not None else 0
+    with timer.time("get_insert_table_columns"):
+        plan["qc_columns"] = get_insert_table_columns(cursors["qcwrite"], station)
+    my_logger.error("Success fetching qc_columns")
+    return plan
+
+
+def fetch_work_item(cursors: Dict[str, Any], station: str, begin_date: str, end_date: str, args: Namespace,
+                    timer: StageTimer) -> Tuple[Iterable[Dict[str, Any]], Iterable[Dict[str, Any]]]:
+    """
+    Fetch the MAWN and then the RTMA records of one work item.
+
+    Parameters:
+    cursors (Dict[str, Any]): The mawn and rtma cursors.
+    station (str): Specified weather station.
+    begin_date (str): Start date of the work item (format: 'YYYY-MM-DD').
+    end_date (str): End date of the work item (format: 'YYYY-MM-DD').
+    args (Namespace): Parsed command-line arguments.
+    timer (StageTimer): Timer of the station's stages.
+
+    Returns:
+    Tuple[Iterable[Dict[str, Any]], Iterable[Dict[str, Any]]]
+        The MAWN and RTMA records, as lists or (with --stream) as iterators.
+    """
+    # Streamed records are only fetched while they are processed, so their fetch time counts as processing;
+    # their rows are added to the fetch stages as they are consumed
+    itersize = args.itersize if args.stream else None
+    with timer.time("fetch_mawn") as counter:
+        mawn_records = fetch_records(cursors["mawn"], station, begin_date, end_date, itersize)
+        if isinstance(mawn_records, list):
+            counter.rows = len(mawn_records)
+        else:
+            mawn_records = timer.count_rows("fetch_mawn", mawn_records)
+    with timer.time("fetch_rtma") as counter:
+        rtma_records = fetch_records(cursors["rtma"], station, begin_date, end_date, itersize)
+        if isinstance(rtma_records, list):
+            counter.rows = len(rtma_records)
+        else:
+            rtma_records = timer.count_rows("fetch_rtma", rtma_records)
+    return mawn_records, rtma_records
+
+
+def write_work_item(station: str, plan: Dict[str, Any], begin_date: str, end_date: str,
+                    mawn_records: Iterable[Dict[str, Any]], rtma_records: Iterable[Dict[str, Any]],
+                    db_connections: Dict[str, Any], cursors: Dict[str, Any], process: Any, args: Namespace,
+                    timer: StageTimer, result: Dict[str, Any]) -> None:
+    """
+    Clean the records of one work item, write them with --execute and add them to the station result.
+
+    Parameters:
+    station (str): Specified weather station.
+    plan (Dict[str, Any]): The station's plan as returned by plan_station.
+    begin_date (str): Start date of the work item (format: 'YYYY-MM-DD').
+    end_date (str): End date of the work item (format: 'YYYY-MM-DD').
+    mawn_records (Iterable[Dict[str, Any]]): MAWN records of the work item.
+    rtma_records (Iterable[Dict[str, Any]]): RTMA records of the work item.
+    db_connections (Dict[str, Any]): Database connections, including qcwrite_connection.
+    cursors (Dict[str, Any]): The qcwrite cursor.
+    process (Any): Validation engine, process_records or process_records_columnar.
+    args (Namespace): Parsed command-line arguments.
+    timer (StageTimer): Timer of the station's stages.
+    result (Dict[str, Any]): Station result as returned by new_station_result.
+
+    Raises:
+    RuntimeError: If the write transaction was rolled back.
+    """
+    my_logger.error("Start process records")
+
+    # Process and clean the records
+    with timer.time("process_records") as counter:
+        cleaned_records = process(plan["qc_columns"], mawn_records, rtma_records, begin_date, end_date)
+        if plan["hour_filter"] is not None:
+            cleaned_records = [
+                record for record in cleaned_records if (record["date"], record["time"]) in plan["hour_filter"]
+            ]
+        counter.rows = len(cleaned_records)
+    my_logger.error("Finish process records")
+
+    # If execution is requested and QC cursor is available, insert or update records in the QC database
+    if args.execute and cursors["qcwrite"]:
+        records_to_write = cleaned_records
+        if "changes" in result:
+            # Runs in the write transaction, so the rows compared are the rows that get updated
+            with timer.time("diff_existing") as counter:
+                changes = diff_existing_records(cursors["qcwrite"], f"{station}_hourly", cleaned_records)
+                counter.rows = len(cleaned_records)
+            records_to_write = changes["inserts"] + changes["updates"]
+        # Call commit_and_rollback with the operations
+        with timer.time("commit_and_rollback") as counter:
+            committed = commit_and_rollback(
+                db_connections["qcwrite_connection"], station, records_to_write, args.page_size, args.bulk_copy
+            )
+            counter.rows = len(records_to_write) if committed else 0
+        if not committed:
+            raise RuntimeError("transaction rolled back")
+        if "changes" in result:
+            result["changes"].update(
+                inserted=len(changes["inserts"]), updated=len(changes["updates"]), unchanged=changes["unchanged"]
+            )
+    result["work_items"] += 1
+    result["records"] += len(cleaned_records)
+    if "src_counts" in result:
+        result["src_counts"].update(count_src_outcomes(cleaned_records))
+
+
+def record_work_item_failure(result: Dict[str, Any], station: str, begin_date: str, end_date: str,
+                             error: Exception) -> None:
+    """
+    Log a failed work item and add it to the station result.
+
+    Parameters:
+    result (Dict[str, Any]): Station result as returned by new_station_result.
+    station (str): Specified weather station.
+    begin_date (str): Start date of the work item (format: 'YYYY-MM-DD').
+    end_date (str): End date of the work item (format: 'YYYY-MM-DD').
+    error (Exception): The error raised by the work item.
+    """
+    my_logger.error(f"An error occurred when processing {station} from {begin_date} to {end_date}: {error}")
+    print(f"An error occurred when processing {station} from {begin_date} to {end_date}")
+    result["failures"].append(f"{begin_date} to {end_date}: {error}")
+
+
+def finish_station(station: str, plan: Dict[str, Any], result: Dict[str, Any], db_connections: Dict[str, Any],
+                   cursors: Dict[str, Any], args: Namespace, timer: StageTimer) -> Dict[str, Any]:
+    """
+    With --incremental and --execute, move the watermark of a station whose work items all succeeded,
+    then log the station_timing event.
+
+    Parameters:
+    station (str): Specified weather station.
+    plan (Dict[str, Any]): The station's plan as returned by plan_station.
+    result (Dict[str, Any]): Station result as returned by new_station_result.
+    db_connections (Dict[str, Any]): Database connections, including qcwrite_connection.
+    cursors (Dict[str, Any]): The qcwrite cursor.
+    args (Namespace): Parsed command-line arguments.
+    timer (StageTimer): Timer of the station's stages.
+
+    Returns:
+    Dict[str, Any]
+        The station result.
+    """
+    if (getattr(args, "incremental", False) and args.execute and cursors["qcwrite"]
+            and plan["last_hour"] is not None and not result["failures"]):
+        connection = db_connections["qcwrite_connection"]
+        try:
+            write_watermark(cursors["qcwrite"], station, plan["last_hour"], plan["max_ids"]["mawn"], plan["max_ids"]["rtma"])
+            connection.commit()
+        except Exception as e:
+            connection.rollback()
+            my_logger.error(f"An error occurred when moving the watermark of {station}: {e}")
+            result["failures"].append(f"watermark: {e}")
+
+    my_logger.info("station_timing", station=station, stages=timer.summary())
+    return result
+
+
+def process_station(station: str, work_items: List[Tuple[str, str, str]], db_connections: Dict[str, Any],
+                    cursors: Dict[str, Any], process: Any, args: Namespace,
+                    timer: Optional[StageTimer] = None) -> Dict[str, Any]:
+    """
+    Fetch, clean and (with --execute) write the work items of one station.
+    A failing work item is recorded and the remaining work items of the station are still processed.
+    The read transactions of the mawn and rtma connections end after each work item.
+    The time and rows of each stage are added to timer and logged as a station_timing event.
+    With --metrics-textfile, the _src outcomes of the cleaned records are counted in the result.
+    With --incremental, only the hours after the station's watermark and the hours with new upstream rows
+    are written, and the watermark is moved once every work item succeeded.
+    With --skip-unchanged, records identical to the stored rows are not written; the numbers of inserted,
+    updated and unchanged records are counted in the result.
+
+    Parameters:
+    station (str): Specified weather station.
+    work_items (List[Tuple[str, str, str]]): The station's (station, begin date, end date) work items.
+    db_connections (Dict[str, Any]): Database connections, including qcwrite_connection.
+    cursors (Dict[str, Any]): The mawn, rtma and qcwrite cursors.
+    process (Any): Validation engine, process_records or process_records_columnar.
+    args (Namespace): Parsed command-line arguments.
+    timer (Optional[StageTimer]): Timer of the station's stages; a new one is used if not given.
+
+    Returns:
+    Dict[str, Any]
+        Station result with the number of work items and records processed, the failed work items,
+        the stage totals, (with --metrics-textfile) the _src outcome counts and (with --skip-unchanged)
+        the inserted, updated and unchanged record counts of the station.
+    """
+    timer = timer or StageTimer()
+    result = new_station_result(station, timer, args)
+    plan = plan_station(station, work_items, cursors, args, timer)
+
+    for _, chunk_begin_date, chunk_end_date in plan["work_items"]:
+        try:
+            mawn_records, rtma_records = fetch_work_item(cursors, station, chunk_begin_date, chunk_end_date, args, timer)
+            write_work_item(station, plan, chunk_begin_date, chunk_end_date, mawn_records, rtma_records,
+                            db_connections, cursors, process, args, timer, result)
+        except Exception as e:
+            record_work_item_failure(result, station, chunk_begin_date, chunk_end_date, e)
+        finally:
+            end_read_transactions(cursors)
+
+    return finish_station(station, plan, result, db_connections, cursors, args, timer)
+
+
+async def fetch_work_item_async(cursors: Dict[str, Any], station: str, begin_date: str, end_date: str,
+                                timer: StageTimer) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Fetch the MAWN and RTMA records of one work item concurrently, each query on a worker thread.
+
+    Parameters:
+    cursors (Dict[str, Any]): The mawn and rtma cursors, on different connections.
+    station (str): Specified weather station.
+    begin_date (str): Start date of the work item (format: 'YYYY-MM-DD').
+    end_date (str): End date of the work item (format: 'YYYY-MM-DD').
+    timer (StageTimer): Timer the fetch stages are added to, from the event loop thread.
+
+    Returns:
+    Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]
+        The MAWN and RTMA records.
+    """
+    async def timed_fetch(source: str) -> List[Dict[str, Any]]:
+        start = time.perf_counter()
+        records = await asyncio.to_thread(fetch_records, cursors[source], station, begin_date, end_date)
+        timer.add(f"fetch_{source}", time.perf_counter() - start, len(records))
+        return records
+
+    mawn_records, rtma_records = await asyncio.gather(timed_fetch("mawn"), timed_fetch("rtma"))
+    return mawn_records, rtma_records
+
+
+async def run_stations_async(work_items_by_station: Dict[str, List[Tuple[str, str, str]]], db_connections: Dict[str, Any],
+                             cursors: Dict[str, Any], process: Any, args: Namespace,
+                             prefetch: int = ASYNC_PREFETCH) -> List[Dict[str, Any]]:
+    """
+    Process stations with an asyncio pipeline: a producer plans each station and fetches the MAWN and RTMA
+    records of its work items concurrently, up to prefetch work items ahead, while the consumer cleans and
+    writes the previous work item on a worker thread. Network waits of the fetches thus overlap with
+    validation and writes, including across stations.
+
+    The producer owns the mawn and rtma cursors and reads the QC database through a connection of its own,
+    taken from the write_to pool and released when the run ends; the consumer writes through the qcwrite
+    connection and cursor. Cursors of one connection share its transaction, so the producer's reads and
+    the consumer's writes and commits never run in the same transaction.
+
+    Parameters:
+    work_items_by_station (Dict[str, List[Tuple[str, str, str]]]): Work items keyed by station name.
+    db_connections (Dict[str, Any]): Database connections, including qcwrite_connection.
+    cursors (Dict[str, Any]): The mawn, rtma and qcwrite cursors.
+    process (Any): Validation engine, process_records or process_records_columnar.
+    args (Namespace): Parsed command-line arguments.
+    prefetch (int): Number of fetched work items queued ahead of the one being written.
+
+    Returns:
+    List[Dict[str, Any]]
+        One result per station, as returned by process_station, in station order.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    # Bounds the fetched work items waiting in the queue; station messages do not count
+    fetch_slots = asyncio.Semaphore(prefetch)
+    producer_cursors = dict(cursors)
+    producer_connection = None
+    if cursors["qcwrite"]:
+        producer_connection = get_pool_manager().getconn(args.write_to)
+        try:
+            producer_cursors["qcwrite"] = get_qcwrite_cursor(producer_connection, "qcwrite")
+        except Exception:
+            release_connection(producer_connection)
+            raise
+
+    async def produce() -> None:
+        try:
+            for station, work_items in work_items_by_station.items():
+                # Fetch stages are timed separately and merged once the station is written
+                fetch_timer = StageTimer()
+                try:
+                    plan = await asyncio.to_thread(plan_station, station, work_items, producer_cursors, args, fetch_timer)
+                except Exception as e:
+                    await queue.put({"kind": "end", "station": station, "plan": None, "timer": fetch_timer, "error": e})
+                    continue
+                await queue.put({"kind": "station", "station": station, "plan": plan})
+                for _, begin_date, end_date in plan["work_items"]:
+                    await fetch_slots.acquire()
+                    try:
+                        records = await fetch_work_item_async(producer_cursors, station, begin_date, end_date, fetch_timer)
+                    except Exception as e:
+                        records = e
+                    finally:
+                        await asyncio.to_thread(end_read_transactions, producer_cursors)
+                    await queue.put({"kind": "work_item", "begin_date": begin_date, "end_date": end_date, "records": records})
+                await queue.put({"kind": "end", "station": station, "plan": plan, "timer": fetch_timer, "error": None})
+        finally:
+            await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    results = []
+    timer = result = None
+    try:
+        while (message := await queue.get()) is not None:
+            if message["kind"] == "station":
+                station, plan = message["station"], message["plan"]
+                timer = StageTimer()
+                result = new_station_result(station, timer, args)
+            elif message["kind"] == "work_item":
+                fetch_slots.release()
+                begin_date, end_date, records = message["begin_date"], message["end_date"], message["records"]
+                try:
+                    if isinstance(records, Exception):
+                        raise records
+                    await asyncio.to_thread(write_work_item, station, plan, begin_date, end_date, *records,
+                                            db_connections, cursors, process, args, timer, result)
+                except Exception as e:
+                    record_work_item_failure(result, station, begin_date, end_date, e)
+            elif message["error"] is not None:
+                station = message["station"]
+                my_logger.error(f"An error occurred when planning {station}: {message['error']}")
+                timer = message["timer"]
+                result = new_station_result(station, timer, args)
+                result["failures"].append(f"plan: {message['error']}")
+                results.append(result)
+            else:
+                timer.merge(message["timer"].stages)
+                results.append(await asyncio.to_thread(finish_station, station, plan, result, db_connections,
+                                                       cursors, args, timer))
+        await producer
+    finally:
+        producer.cancel()
+        if producer_connection is not None:
+            producer_cursors["qcwrite"].close()
+            release_connection(producer_connection)
+    return results
+
+
+def station_worker(args: Namespace, station: str, work_items: List[Tuple[str, str, str]], process: Any) -> Dict[str, Any]:
+    """
+    Process one station in a worker process. The worker opens and closes its own database connections,
+    since connections cannot be shared between processes.
+
+    Parameters:
+    args (Namespace): Parsed command-line arguments, used to create the connections.
+    station (str): Specified weather station.
+    work_items (List[Tuple[str, str, str]]): The station's work items.
+    process (Any): Validation engine, process_records or process_records_columnar.
+
+    Returns:
+    Dict[str, Any]
+        Station result as returned by process_station.
+    """
+    db_connections = {}
+    timer = StageTimer()
+    try:
+        with timer.time("connect"):
+            db_connections = create_db_connections(args)
+            cursors = {
+                "mawn": get_mawn_cursor(db_connections['mawn_connection'], 'mawn'),
+                "rtma": get_rtma_cursor(db_connections['rtma_connection'], 'rtma'),
+                "qcwrite": get_qcwrite_cursor(db_connections['qcwrite_connection'], 'qcwrite'),
+            }
+        return process_station(station, work_items, db_connections, cursors, process, args, timer)
+    except Exception as e:
+        my_logger.error(f"An error occurred in the worker for {station}: {e}")
+        return {"station": station, "work_items": 0, "records": 0, "failures": [f"worker: {e}"], "stages": timer.stages}
+    finally:
+        close_connections(db_connections)
+
+
+def run_station_workers(args: Namespace, work_items_by_station: Dict[str, List[Tuple[str, str, str]]], process: Any) -> List[Dict[str, Any]]:
+    """
+    Fan stations out to a pool of args.workers processes and collect their results as they finish.
+
+    Parameters:
+    args (Namespace): Parsed command-line arguments.
+    work_items_by_station (Dict[str, List[Tuple[str, str, str]]]): Work items keyed by station name.
+    process (Any): Validation engine, process_records or process_records_columnar.
+
+    Returns:
+    List[Dict[str, Any]]
+        One result per station, in order of completion.
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(station_worker, args, station, work_items, process): station
+            for station, work_items in work_items_by_station.items()
+        }
+        for future in as_completed(futures):
+            station = futures[future]
+            try:
+                results.append(future.result())
+            except Exception as e:
+                my_logger.error(f"Worker for {station} failed: {e}")
+                results.append({"station": station, "work_items": 0, "records": 0, "failures": [f"worker: {e}"], "stages": {}})
+    return results
+
+
+def summarize_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarize the station results of a run.
+
+    Parameters:
+    results (List[Dict[str, Any]]): Station results as returned by process_station.
+
+    Returns:
+    Dict[str, Any]
+        Totals of stations, work items, records and (with --skip-unchanged) record changes,
+        and the failures keyed by station.
+    """
+    summary = {
+        "stations": len(results),
+        "work_items": sum(result["work_items"] for result in results),
+        "records": sum(result["records"] for result in results),
+        "failed_stations": {result["station"]: result["failures"] for result in results if result["failures"]},
+    }
+    if any("changes" in result for result in results):
+        summary["changes"] = dict(sum((Counter(result.get("changes", {})) for result in results), Counter()))
+    return summary
+
+
 def main() -> None:
     """
     Main function to check and update data from hourly_main in mawndb_qc.
@@ -527,6 +1189,21 @@ def main() -> None:
     -q, --qcwrite: Modify data in a specific database
     --mawn: Read mawndb data from a specific database
     --rtma: Read rtma data from a specific database
+    --engine: Validation engine, the record by record dict pipeline or the NumPy columnar engine
+    --page-size: Number of records written per INSERT ... ON CONFLICT statement
+    --bulk-copy: Load records with COPY FROM STDIN and merge them with one INSERT ... SELECT per station
+    --years: Run whole calendar years from FIRST to LAST instead of --begin/--end
+    --work-list: File of "station year" lines to run instead of --stations/--years
+    --workers: Number of worker processes; stations are processed in parallel, each worker with its own connections
+    --stream: Stream records from server-side cursors into the validation stage instead of fetching them all at once
+    --itersize: Number of rows fetched per round trip in streaming mode
+    --log-level: Minimum level written to the log file, overriding EWX_LOG_LEVEL
+    --async-log: Write log events from a background thread in batches
+    --timing-json: Write the per-stage timing summary of the run to a JSON file
+    --metrics-textfile: Write run metrics to a node_exporter textfile-collector file
+    --incremental: Only revalidate the hours after each station's watermark and the hours with new upstream rows
+    --skip-unchanged: Compare the records with the stored rows and only write new and changed records
+    --async-io: Fetch MAWN and RTMA records concurrently and prefetch the next work item while the current one is written
     """
     ini_file_path = "path_to_ini_file.ini"
     section_info_help = get_ini_section_info(ini_file_path)
@@ -569,6 +1246,19 @@ def main() -> None:
         default=False, 
         help="Run for all stations"
     )
+    group.add_argument(
+        "--work-list",
+        type=str,
+        help="File of 'station year' lines (whitespace or comma separated) to run in one process",
+    )
+
+    parser.add_argument(
+        "--years",
+        type=int,
+        nargs=2,
+        metavar=("FIRST", "LAST"),
+        help="Run whole calendar years FIRST to LAST (inclusive) instead of --begin/--end",
+    )
 
     parser.add_argument(
         "--read-from",
@@ -584,13 +1274,131 @@ def main() -> None:
         help="Section name in INI file for writing data",
     )
 
+    parser.add_argument(
+        "--engine",
+        choices=["dict", "columnar"],
+        default="dict",
+        help="Validation engine: record by record (dict) or NumPy column arrays (columnar, requires numpy)",
+    )
+
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=UPSERT_PAGE_SIZE,
+        help="Number of records written per INSERT ... ON CONFLICT statement",
+    )
+
+    parser.add_argument(
+        "--bulk-copy",
+        action="store_true",
+        default=False,
+        help="Load records with COPY into a temporary table and merge them with INSERT ... SELECT ... ON CONFLICT (for backfills)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes; each station is processed by one worker with its own database connections",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help="Stream records from named server-side cursors into the validation stage instead of fetching them all at once",
+    )
+
+    parser.add_argument(
+        "--itersize",
+        type=int,
+        default=STREAM_ITERSIZE,
+        help="Number of rows fetched per round trip in streaming mode",
+    )
+
+    parser.add_argument(
+        "--log-level",
+        type=str.upper,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        help="Minimum level written to the log file (default: EWX_LOG_LEVEL, else DEBUG)",
+    )
+
+    parser.add_argument(
+        "--async-log",
+        action="store_true",
+        default=False,
+        help="Write log events from a background thread in batches (same as EWX_LOG_ASYNC=1)",
+    )
+
+    parser.add_argument(
+        "--timing-json",
+        type=str,
+        help="Write the per-stage timing summary of the run (seconds, rows, rows/sec per station) to this JSON file",
+    )
+
+    parser.add_argument(
+        "--metrics-textfile",
+        type=str,
+        help="Write run metrics in Prometheus text format to this file (e.g. the node_exporter textfile-collector directory)",
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=False,
+        help="Only revalidate the hours after each station's watermark and the hours whose MAWN/RTMA rows were "
+             "added since; the watermark is moved after each station with --execute",
+    )
+
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        default=False,
+        help="Fetch the stored rows of each work item in one query and only write new and changed records",
+    )
+
+    parser.add_argument(
+        "--async-io",
+        action="store_true",
+        default=False,
+        help="Fetch MAWN and RTMA records concurrently with asyncio and prefetch the next work item "
+             "while the current one is validated and written",
+    )
+
     args = parser.parse_args()
 
+    if args.log_level:
+        my_logger.set_level(args.log_level)
+    if args.async_log:
+        my_logger.start_async_sink()
+
+    if args.engine == "columnar" and not numpy_available():
+        my_logger.warning("numpy is not installed, using the dict validation engine")
+    process = process_records_columnar if args.engine == "columnar" else process_records
+
+    if args.years and (args.begin or args.end):
+        parser.error("--years cannot be combined with --begin/--end")
+    if args.years and args.years[0] > args.years[1]:
+        parser.error("--years FIRST must not be after LAST")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.async_io and (args.workers > 1 or args.stream):
+        parser.error("--async-io cannot be combined with --workers or --stream")
+    if args.incremental and (args.years or args.work_list):
+        parser.error("--incremental cannot be combined with --years/--work-list")
+
     # Parse and set date ranges
-    begin_date, end_date = time_defaults(args.begin, args.end)
+    if args.years:
+        begin_date, end_date = f"{args.years[0]}-01-01", f"{args.years[1]}-12-31"
+    else:
+        begin_date, end_date = time_defaults(args.begin, args.end)
+
+    run_start = time.perf_counter()
+    run_timer = StageTimer()
 
     # Establish only necessary database connections based on args
-    db_connections = create_db_connections(args)
+    with run_timer.time("connect"):
+        db_connections = create_db_connections(args)
 
     try:
         # Use the necessary connections and cursors based on what is required
@@ -603,51 +1411,62 @@ def main() -> None:
         my_logger.error(f"rtma_cursor: {rtma_cursor}")
         my_logger.error(f"qctest_cursor: {qcwrite_cursor}")
 
-        # Process records for specified stations
-        if args.all:
-            stations = get_all_stations_list(mawn_cursor)
-            #print(f"Stations: {stations}")
+        if args.incremental and args.execute:
+            ensure_watermark_table(qcwrite_cursor)
+            db_connections['qcwrite_connection'].commit()
+
+        # Build the station/year work items; connections and station data are shared by all of them
+        if args.work_list:
+            work = [(station, f"{year}-01-01", f"{year}-12-31") for station, year in read_work_list(args.work_list)]
         else:
-            stations = args.stations
+            if args.all:
+                stations = get_all_stations_list(mawn_cursor)
+                #print(f"Stations: {stations}")
+            else:
+                stations = args.stations
+            work = [(station, begin_date, end_date) for station in stations]
 
         station_info = get_station_data(mawn_cursor)
+        work_items = build_work_items(work, station_info)
+        my_logger.info(f"Processing {len(work_items)} station/year work items")
+
+        work_items_by_station = group_work_items_by_station(work_items)
+        cursors = {"mawn": mawn_cursor, "rtma": rtma_cursor, "qcwrite": qcwrite_cursor}
+        if args.workers > 1:
+            results = run_station_workers(args, work_items_by_station, process)
+        elif args.async_io:
+            results = asyncio.run(run_stations_async(work_items_by_station, db_connections, cursors, process, args))
+        else:
+            results = [
+                process_station(station, station_work_items, db_connections, cursors, process, args)
+                for station, station_work_items in work_items_by_station.items()
+            ]
 
-        runtime_begin_dates = get_runtime_begin_date(begin_date, station_info)
-        runtime_end_dates = get_runtime_end_date(end_date, station_info)
-
-        for station in stations:
-            try: 
-                qc_columns = get_insert_table_columns(qcwrite_cursor, station)
-                my_logger.error("Success fetching qc_columns")
-                mawn_records = fetch_records(
-                    mawn_cursor,
-                    station,
-                    runtime_begin_dates[station],
-                    runtime_end_dates[station],
-                )
-                rtma_records = fetch_records(
-                    rtma_cursor,
-                    station,
-                    runtime_begin_dates[station],
-                    runtime_end_dates[station],
-                )
-                my_logger.error("Start process records")
-
-                # Process and clean the records
-                cleaned_records = process_records(
-                    qc_columns, mawn_records, rtma_records, runtime_begin_dates[station], runtime_end_dates[station]
-                )
-                my_logger.error("Finish process records")
-
-                # If execution is requested and QC cursor is available, insert or update records in the QC database
-                if args.execute and qcwrite_cursor:
-                    # Call commit_and_rollback with the operations
-                    commit_and_rollback(
-                        db_connections["qcwrite_connection"], station, cleaned_records
-                    )
-            except Exception as e:
-                my_logger.error(f"An error occurred when processing {station}")
-                print(f"An error occurred when processing {station}")
+        summary = summarize_results(results)
+        my_logger.info(f"Run summary: {summary}")
+        print(
+            f"Processed {summary['work_items']} work items and {summary['records']} records "
+            f"for {summary['stations']} stations; {len(summary['failed_stations'])} stations with failures"
+        )
+        if "changes" in summary:
+            changes = summary["changes"]
+            print(
+                f"Wrote {changes.get('inserted', 0)} new and {changes.get('updated', 0)} changed records, "
+                f"skipped {changes.get('unchanged', 0)} unchanged records"
+            )
+        for station, failures in summary["failed_stations"].items():
+            print(f"  {station}: {'; '.join(failures)}")
+
+        timing = run_summary(
+            {result["station"]: result["stages"] for result in results}, run_timer, time.perf_counter() - run_start
+        )
+        my_logger.info("run_timing", **timing)
+        write_timing_json(args.timing_json, timing)
+        if args.metrics_textfile:
+            write_textfile_metrics(
+                args.metrics_textfile,
+                format_textfile_metrics("hourly_main", results, run_timer, timing["wall_seconds"]),
+            )
 
     except Exception as e:
         my_logger.error(f"An error occurred in main: {e}")
@@ -661,7 +1480,7 @@ if __name__ == "__main__":
 
 
 """
-usage: hourly_main [-h] [-b BEGIN] [-e END] (-x | -d) [-s [STATIONS ...] | -a] --read-from READ_FROM [READ_FROM ...] --write-to WRITE_TO
+usage: hourly_main [-h] [-b BEGIN] [-e END] (-x | -d) [-s [STATIONS ...] | -a | --work-list WORK_LIST] [--years FIRST LAST] --read-from READ_FROM [READ_FROM ...] --write-to WRITE_TO
 
 python hourly_main.py -x -s aetna --read-from sample_section01 sample_section02 --write-to sample_section03
 
@@ -669,8 +1488,14 @@ python hourly_main.py -x -b 2025-02-08 -e 2025-02-14 -a --read-from sample_secti
 
 python hourly_main.py -x -s aetna --read-from mawn_dbh11 rtma_dbh11 --write-to mawnqc_test
 
+python hourly_main.py -x --years 1996 2005 -s aetna albion --read-from mawn rtma --write-to mawnqc
+
+python hourly_main.py -x --work-list backfill.txt --read-from mawn rtma --write-to mawnqc
+
 python hourly_main.py -x -a --read-from mawn_dbh11 rtma_dbh11 --write-to mawnqc_test
 
 python hourly_main.py -x -b 2025-03-11 -e 2025-03-11 -a --read-from mawn_dbh11 rtma_dbh11 --write-to mawnqc_test
 
+python hourly_main.py -x -b 2015-01-01 -e 2024-12-31 -s aetna --read-from mawn_dbh11 rtma_dbh11 --write-to mawnqc_test --engine columnar
+
 """
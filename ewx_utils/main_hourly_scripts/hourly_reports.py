@@ -0,0 +1,184 @@
+""" This script writes the report files of hourly_utility.
+Each report is opened once per run; its rows are buffered and written in batches, and every file is flushed
+and closed at the end of the run. Reports are written as CSV, gzip compressed CSV or, when pyarrow is
+installed, Parquet files with string columns.
+"""
+import os
+import sys
+import csv
+import gzip
+from dotenv import load_dotenv
+load_dotenv()
+ewx_base_path = os.getenv("EWX_BASE_PATH")
+sys.path.append(ewx_base_path)
+from ewx_utils.ewx_config import ewx_log_file
+from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
+from typing import Any, Dict, IO, List, Optional, Sequence
+try:
+    import pyarrow
+    import pyarrow.parquet as parquet
+except ImportError:  # pyarrow is optional, it is only needed for Parquet reports
+    pyarrow = None
+    parquet = None
+
+my_reports_logger = EWXStructuredLogger(log_path=ewx_log_file)
+
+REPORT_FORMATS = ("csv", "gzip", "parquet")
+REPORT_EXTENSIONS = {"csv": ".csv", "gzip": ".csv.gz", "parquet": ".parquet"}
+BUFFER_ROWS = 10000
+
+# Report names and headers
+MARGIN_VALUES_REPORT = "srad_values"
+MARGIN_VALUES_HEADER = ["Test Value", "Supercell Value"]
+GENERAL_MISMATCHES_REPORT = "general_mismatches"
+GENERAL_MISMATCHES_HEADER = ["Date", "Time", "Column Name", "Test Value", "Supercell Value"]
+COMPARISON_TRACE_REPORT = "comparison_results"
+COMPARISON_TRACE_HEADER = [
+    "Type of Value1",
+    "Value1",
+    "Type of Value2",
+    "Value2",
+    "Type of Value1 Decimal",
+    "Value1 Decimal",
+    "Type of Value2 Decimal",
+    "Value2 Decimal",
+    "Margin",
+    "Result",
+]
+
+SUMMARY_REPORT = "comparison_summary"
+SUMMARY_HEADER = ["Station", "Only In Test", "Only In Supercell", "Mismatches", "Failures"]
+MISMATCHES_BY_COLUMN_REPORT = "comparison_mismatches_by_column"
+MISMATCHES_BY_COLUMN_HEADER = ["Station", "Column Name", "Mismatches"]
+
+
+def parquet_available() -> bool:
+    """
+    Returns:
+        bool: True if pyarrow can be imported and reports can be written as Parquet.
+    """
+    return pyarrow is not None
+
+
+class Report:
+    """
+    One report file: its header is written when the file is opened and rows are written BUFFER_ROWS at a time.
+    """
+
+    def __init__(self, path: str, header: Sequence[str], report_format: str, buffer_rows: int):
+        self.path = path
+        self.header = list(header)
+        self.report_format = report_format
+        self.buffer_rows = buffer_rows
+        self.rows: List[Sequence[Any]] = []
+        self.written = 0
+        self._file: Optional[IO[str]] = None
+        self._writer: Any = None
+
+    def _open(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        if self.report_format == "parquet":
+            schema = pyarrow.schema([(name, pyarrow.string()) for name in self.header])
+            self._writer = parquet.ParquetWriter(self.path, schema)
+            return
+        if self.report_format == "gzip":
+            self._file = gzip.open(self.path, "wt", newline="")
+        else:
+            self._file = open(self.path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.header)
+
+    def add_row(self, row: Sequence[Any]) -> None:
+        self.rows.append(row)
+        if len(self.rows) >= self.buffer_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the buffered rows, opening the file on first use.
+        """
+        if self._writer is None:
+            self._open()
+        if not self.rows:
+            return
+        if self.report_format == "parquet":
+            # Values are written as their CSV text, None as null
+            columns = [[None if value is None else str(value) for value in column] for column in zip(*self.rows)]
+            self._writer.write_table(pyarrow.Table.from_arrays(columns, names=self.header))
+        else:
+            self._writer.writerows(self.rows)
+        self.written += len(self.rows)
+        self.rows = []
+
+    def close(self) -> None:
+        self.flush()
+        if self.report_format == "parquet":
+            self._writer.close()
+        else:
+            self._file.close()
+
+
+class ReportWriter:
+    """
+    The report files of a run, keyed by report name and written to one directory.
+    Use as a context manager, or call close at the end of the run.
+    """
+
+    def __init__(self, directory: str = ".", report_format: str = "csv", buffer_rows: int = BUFFER_ROWS):
+        if report_format not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format {report_format}, expected one of {', '.join(REPORT_FORMATS)}")
+        if report_format == "parquet" and not parquet_available():
+            raise ValueError("Parquet reports need pyarrow, which is not installed")
+        self.directory = directory
+        self.report_format = report_format
+        self.buffer_rows = buffer_rows
+        self.reports: Dict[str, Report] = {}
+
+    def path(self, name: str) -> str:
+        """
+        Returns:
+            str: Path of the report file of a report name.
+        """
+        return os.path.join(self.directory, name + REPORT_EXTENSIONS[self.report_format])
+
+    def report(self, name: str, header: Sequence[str]) -> Report:
+        """
+        Return the report of a name, creating it with the header on first use.
+        """
+        if name not in self.reports:
+            self.reports[name] = Report(self.path(name), header, self.report_format, self.buffer_rows)
+        return self.reports[name]
+
+    def write_row(self, name: str, header: Sequence[str], row: Sequence[Any]) -> None:
+        """
+        Buffer a row of a report.
+
+        Parameters:
+            name (str): Report name, the file name without extension.
+            header (Sequence[str]): Column names, written when the report file is opened.
+            row (Sequence[Any]): Values of the row.
+        """
+        self.report(name, header).add_row(row)
+
+    def write_rows(self, name: str, header: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+        """
+        Buffer rows of a report; the report file is created even without rows.
+        """
+        report = self.report(name, header)
+        for row in rows:
+            report.add_row(row)
+
+    def close(self) -> None:
+        """
+        Flush and close every report file.
+        """
+        for name, report in self.reports.items():
+            report.close()
+            my_reports_logger.info(f"Wrote {report.written} rows to {report.path}")
+        self.reports = {}
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
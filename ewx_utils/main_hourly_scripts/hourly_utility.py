@@ -3,7 +3,8 @@ import os
 import sys
 import decimal
 import argparse
-import csv
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import dotenv
 from datetime import date
 dotenv.load_dotenv()
@@ -20,12 +21,41 @@ from ewx_utils.db_files.dbs_connection import(
     get_mawn_cursor,
     get_rtma_cursor,
     get_qcwrite_cursor,
-    create_db_connections
+    get_mawnqc_cursor,
+    create_db_connections,
+    release_connection
+)
+from ewx_utils.db_files.dbs_pool import get_pool_manager
+from ewx_utils.main_hourly_scripts.hourly_compare_engine import (
+    compare_records_columnar,
+    limit_to_max_digits,
+    numpy_available,
+    write_mismatch_reports
+)
+from ewx_utils.main_hourly_scripts.hourly_compare_hashes import (
+    PRECHECK_MODES,
+    drop_identical_records,
+    fetch_differing_records
+)
+from ewx_utils.main_hourly_scripts.hourly_main import get_all_stations_list
+from ewx_utils.main_hourly_scripts.hourly_reports import (
+    COMPARISON_TRACE_HEADER,
+    COMPARISON_TRACE_REPORT,
+    GENERAL_MISMATCHES_HEADER,
+    GENERAL_MISMATCHES_REPORT,
+    MARGIN_VALUES_HEADER,
+    MARGIN_VALUES_REPORT,
+    MISMATCHES_BY_COLUMN_HEADER,
+    MISMATCHES_BY_COLUMN_REPORT,
+    REPORT_FORMATS,
+    SUMMARY_HEADER,
+    SUMMARY_REPORT,
+    ReportWriter
 )
 from ewx_utils.logs.ewx_utils_logs_config import ewx_unstructured_logger
 from ewx_utils.logs.ewx_utils_logs_config import EWXStructuredLogger
 
-my_logger = EWXStructuredLogger(log_path=EWXStructuredLogger)
+my_logger = EWXStructuredLogger(log_path=ewx_log_file)
 
 
 def fetch_records_by_date(cursor: Any, station: str, start_date: str, end_date: str) -> List[dict]:
@@ -60,77 +90,21 @@ def fetch_records_by_date(cursor: Any, station: str, start_date: str, end_date:
         my_logger.error(f"Error fetching records from {station}: {e}")
         raise
 
-def limit_to_max_digits(num: Optional[float], max_digits: Optional[int] = None) -> Optional[decimal.Decimal]:
-    """
-    Limit the number of digits in a decimal number to a specified maximum.
-
-    Parameters:
-        num (float or None): The input number to be rounded.
-        max_digits (int, optional): Maximum number of digits. Defaults to 6.
-
-    Returns:
-        decimal.Decimal or None: The rounded decimal number, or None if an error occurs.
-
-    Logs:
-        Errors and unexpected conditions are logged.
-    """
-    try:
-        if num is None:
-            my_logger.error("Input num is None.")
-            return None
-
-        if max_digits is None:
-            max_digits = 6
-
-        if num == 0:
-            return decimal.Decimal("0.0")
-
-        num_decimal = decimal.Decimal(str(num))
-        
-        integer_part = num_decimal.to_integral_value()
-        #print(f"Integer part type: {type(integer_part)}")
-        if integer_part == 0:
-            integer_digits = 0
-        else:
-            integer_digits = len(str(integer_part))
-        decimal_places = max_digits - integer_digits
-
-        if decimal_places < 0:
-            decimal_places = 0
-        #print(f"Decimal Places: {decimal_places}")
-
-        quantize_str = decimal.Decimal("1." + "0" * decimal_places)
-
-        rounded_decimal = num_decimal.quantize(
-            quantize_str, rounding=decimal.ROUND_HALF_UP
-        )
-        return rounded_decimal
-
-    except decimal.ConversionSyntax as e:
-        my_logger.error(
-            f"ConversionSyntax error for input num: {num}, max_digits: {max_digits}. Error: {e}"
-        )
-        return None
-    except Exception as e:
-        my_logger.error(
-            f"An unexpected error occurred for input num: {num}, max_digits: {max_digits}. Error: {e}"
-        )
-        return None
-
-
-def is_within_margin(value1: Union[float, str], value2: Union[float, str]) -> bool:
+def is_within_margin(value1: Union[float, str], value2: Union[float, str], trace: Optional[ReportWriter] = None) -> bool:
     """
     Check if the difference between two numbers is within a 0.05% margin of the second number.
 
     Parameters:
         value1 (float or str): First value to compare.
         value2 (float or str): Second value to compare.
+        trace (ReportWriter, optional): Report writer to which the details of the comparison are written
+            (comparison_results report). Defaults to None, no trace.
 
     Returns:
         bool: True if within margin, False otherwise.
 
     Logs:
-        Information about the comparison and writes details to a CSV file.
+        Information about the comparison.
     """
     try:
         if value1 is None or value2 is None:
@@ -159,35 +133,10 @@ def is_within_margin(value1: Union[float, str], value2: Union[float, str]) -> bo
         result = abs(value1_decimal - value2_decimal) <= margin
         my_logger.info(f"Result of comparison: {result}")
 
-        # Append the types and values to a CSV file in the specified directory
-        csv_file_path = (
-            "comparison_results.csv"
-        )
-
-        # Check if the file exists to write headers only once
-        file_exists = os.path.isfile(csv_file_path)
-
-        with open(csv_file_path, mode="a", newline="") as file:
-            writer = csv.writer(file)
-
-            # Write headers if the file does not exist
-            if not file_exists:
-                writer.writerow(
-                    [
-                        "Type of Value1",
-                        "Value1",
-                        "Type of Value2",
-                        "Value2",
-                        "Type of Value1 Decimal",
-                        "Value1 Decimal",
-                        "Type of Value2 Decimal",
-                        "Value2 Decimal",
-                        "Margin",
-                        "Result",
-                    ]
-                )
-
-            writer.writerow(
+        if trace is not None:
+            trace.write_row(
+                COMPARISON_TRACE_REPORT,
+                COMPARISON_TRACE_HEADER,
                 [
                     type(value1).__name__,
                     value1,
@@ -199,7 +148,7 @@ def is_within_margin(value1: Union[float, str], value2: Union[float, str]) -> bo
                     value2_decimal,
                     margin,
                     result,
-                ]
+                ],
             )
 
         return result
@@ -211,19 +160,23 @@ def is_within_margin(value1: Union[float, str], value2: Union[float, str]) -> bo
         return False
 
 
-def compare_records(test_records: List[dict], supercell_records: List[dict]) -> Tuple[List[dict], List[dict], List[Any]]:
+def compare_records(test_records: List[dict], supercell_records: List[dict], reports: Optional[ReportWriter] = None,
+                    trace: bool = False) -> Tuple[List[dict], List[dict], List[Any]]:
     """
     Compare records between test and supercell databases and identify mismatches or missing records.
 
     Parameters:
         test_records (list): Records from the test database.
         supercell_records (list): Records from the supercell database.
+        reports (ReportWriter, optional): Report writer of the run. Defaults to None, the reports are then
+            written as CSV files in the working directory when the comparison ends.
+        trace (bool, optional): Write every margin comparison to the comparison_results report. Defaults to False.
 
     Returns:
         tuple: Lists of records only in test, only in supercell, and mismatched details.
 
     Logs:
-        Mismatched details and writes them to CSV files.
+        Mismatched details and writes them to the srad_values and general_mismatches reports.
     """
     # Function implementation goes here
 
@@ -235,26 +188,14 @@ def compare_records(test_records: List[dict], supercell_records: List[dict]) ->
     only_in_supercell = []
     mismatches_details = []
 
-    # Specify the full path for the CSV files
-    srad_csv_file_path = (
-        "srad_values.csv"
-    )
-    general_mismatch_csv_file_path = (
-        "general_mismatches.csv"
-    )
-
-    # Check if the srad file exists to write headers only once
-    srad_file_exists = os.path.isfile(srad_csv_file_path)
-    general_file_exists = os.path.isfile(general_mismatch_csv_file_path)
-
-    # Open the CSV file for srad values
-    with open(srad_csv_file_path, "w", newline="") as srad_file:
-        writer = csv.writer(srad_file)
-
-        # Write headers if the file does not exist
-        if not srad_file_exists:
-            writer.writerow(["Test Value", "Supercell Value"])
+    own_reports = reports is None
+    if own_reports:
+        reports = ReportWriter()
+    # The srad values report is written even without mismatches
+    reports.report(MARGIN_VALUES_REPORT, MARGIN_VALUES_HEADER)
+    margin_trace = reports if trace else None
 
+    try:
         for key in test_records_dict:
             if key not in supercell_records_dict:
                 only_in_test.append(test_records_dict[key])
@@ -378,13 +319,13 @@ def compare_records(test_records: List[dict], supercell_records: List[dict]) ->
                             )
                             #print(f"Test Value after limtomax: {test_value}")
                             #print(f"Supercell Value after limtomax: {supercell_value}")
-                            if not is_within_margin(test_value, supercell_value):
+                            if not is_within_margin(test_value, supercell_value, margin_trace):
                                 mismatches_details.append(
                                     [test_record, supercell_record, column_name]
                                 )
                                 #print(f"Test Value after withmargn: {test_value}")
                                 #print(f"Supercell Value after withmargn: {supercell_value}")
-                                writer.writerow([test_value, supercell_value])
+                                reports.write_row(MARGIN_VALUES_REPORT, MARGIN_VALUES_HEADER, [test_value, supercell_value])
                             
 
                         # Defining conditions for the relh values
@@ -400,30 +341,17 @@ def compare_records(test_records: List[dict], supercell_records: List[dict]) ->
                                     mismatches_details.append(
                                         [test_record, supercell_record, column_name]
                                     )
-                                    # Write to general mismatches CSV
-                                    with open(
-                                        general_mismatch_csv_file_path, "a", newline=""
-                                    ) as general_file:
-                                        general_writer = csv.writer(general_file)
-                                        if not general_file_exists:
-                                            general_writer.writerow(
-                                                [
-                                                    "Date",
-                                                    "Time",
-                                                    "Column Name",
-                                                    "Test Value",
-                                                    "Supercell Value",
-                                                ]
-                                            )
-                                        general_writer.writerow(
-                                            [
-                                                test_record["date"],
-                                                test_record["time"],
-                                                column_name,
-                                                test_record[column_name],
-                                                supercell_record[column_name],
-                                            ]
-                                        )
+                                    reports.write_row(
+                                        GENERAL_MISMATCHES_REPORT,
+                                        GENERAL_MISMATCHES_HEADER,
+                                        [
+                                            test_record["date"],
+                                            test_record["time"],
+                                            column_name,
+                                            test_record[column_name],
+                                            supercell_record[column_name],
+                                        ],
+                                    )
 
                         elif column_name == "vapr" and record_date < date(2024, 9, 1):
                             if column_name.endswith("_src"):
@@ -448,30 +376,20 @@ def compare_records(test_records: List[dict], supercell_records: List[dict]) ->
                                 mismatches_details.append(
                                     [test_record, supercell_record, column_name]
                                 )
-                                # Write to general mismatches CSV
-                                with open(
-                                    general_mismatch_csv_file_path, "a", newline=""
-                                ) as general_file:
-                                    general_writer = csv.writer(general_file)
-                                    if not general_file_exists:
-                                        general_writer.writerow(
-                                            [
-                                                "Date",
-                                                "Time",
-                                                "Column Name",
-                                                "Test Value",
-                                                "Supercell Value",
-                                            ]
-                                        )
-                                    general_writer.writerow(
-                                        [
-                                            test_record["date"],
-                                            test_record["time"],
-                                            column_name,
-                                            test_record[column_name],
-                                            supercell_record[column_name],
-                                        ]
-                                    )
+                                reports.write_row(
+                                    GENERAL_MISMATCHES_REPORT,
+                                    GENERAL_MISMATCHES_HEADER,
+                                    [
+                                        test_record["date"],
+                                        test_record["time"],
+                                        column_name,
+                                        test_record[column_name],
+                                        supercell_record[column_name],
+                                    ],
+                                )
+    finally:
+        if own_reports:
+            reports.close()
 
     for key in supercell_records_dict:
         if key not in test_records_dict:
@@ -480,6 +398,164 @@ def compare_records(test_records: List[dict], supercell_records: List[dict]) ->
     return only_in_test, only_in_supercell, mismatches_details
 
 
+def compare_station(args: argparse.Namespace, station: str, reports: ReportWriter) -> Dict[str, Any]:
+    """
+    Compare the records of one station table between the test and supercell databases, with pooled connections.
+
+    Parameters:
+        args (argparse.Namespace): Parsed command-line arguments (dates, INI sections, pre-check, engine and trace).
+        station (str): Station table name.
+        reports (ReportWriter): Report writer to which the mismatches are written.
+
+    Returns:
+        Dict[str, Any]: Station, counts of records only in test and only in supercell, mismatches by column
+        and the failures of the comparison.
+    """
+    result = {"station": station, "only_in_test": 0, "only_in_supercell": 0, "mismatches": Counter(), "failures": []}
+    identical = 0
+    pool_manager = get_pool_manager()
+    connections = []
+    try:
+        # Take pooled database connections and create cursors
+        test_conn = pool_manager.getconn(args.test_section)
+        connections.append(test_conn)
+        test_cursor = get_mawnqc_cursor(test_conn, args.test_section)
+
+        supercell_conn = pool_manager.getconn(args.supercell_section)
+        connections.append(supercell_conn)
+        supercell_cursor = get_mawnqc_cursor(supercell_conn, args.supercell_section)
+
+        # Fetch records from both databases; with a pre-check, only the rows that are not identical
+        if args.precheck == "sql":
+            test_records, supercell_records, identical = fetch_differing_records(
+                test_cursor, supercell_cursor, station, args.begin, args.end
+            )
+        else:
+            test_records = fetch_records_by_date(
+                test_cursor, station, args.begin, args.end
+            )
+            supercell_records = fetch_records_by_date(
+                supercell_cursor, station, args.begin, args.end
+            )
+            if args.precheck == "python":
+                test_records, supercell_records, identical = drop_identical_records(test_records, supercell_records)
+
+        # Compare records
+        if args.engine == "columnar":
+            only_in_test, only_in_supercell, mismatches_details, margin_values = compare_records_columnar(
+                test_records, supercell_records
+            )
+            write_mismatch_reports(reports, mismatches_details, margin_values)
+        else:
+            only_in_test, only_in_supercell, mismatches_details = compare_records(
+                test_records, supercell_records, reports, args.trace_comparisons
+            )
+
+        # Report results
+        if args.precheck != "none":
+            my_logger.info(f"Identical records not compared in detail: {identical}")
+        if only_in_test:
+            my_logger.error(f"Records found only in test database: {len(only_in_test)}")
+        if only_in_supercell:
+            my_logger.error(
+                f"Records found only in supercell database: {len(only_in_supercell)}"
+            )
+        if mismatches_details:
+            my_logger.error(f"Mismatched records: {len(mismatches_details)}")
+            my_logger.error(mismatches_details)
+            for mismatch in mismatches_details:
+                my_logger.error(f"Test Record : {mismatch[0]}")
+                my_logger.error(f"Supercell Record: {mismatch[1]}")
+                my_logger.error(f"Details: {mismatch[2]}")
+
+        result["only_in_test"] = len(only_in_test)
+        result["only_in_supercell"] = len(only_in_supercell)
+        result["mismatches"] = Counter(mismatch[2] for mismatch in mismatches_details)
+
+    except Exception as e:
+        my_logger.error(f"An error occurred comparing {station}: {e}")
+        result["failures"].append(str(e))
+    finally:
+        # Give the connections back to their pools
+        for connection in connections:
+            release_connection(connection)
+    return result
+
+
+def station_comparison_worker(args: argparse.Namespace, station: str) -> Dict[str, Any]:
+    """
+    Compare one station in a worker process, with the worker's own connections and the station's own
+    report directory under --report-dir.
+
+    Parameters:
+        args (argparse.Namespace): Parsed command-line arguments.
+        station (str): Station table name.
+
+    Returns:
+        Dict[str, Any]: Station result as returned by compare_station.
+    """
+    with ReportWriter(os.path.join(args.report_dir, station), args.report_format) as reports:
+        return compare_station(args, station, reports)
+
+
+def run_station_comparisons(args: argparse.Namespace, stations: List[str]) -> List[Dict[str, Any]]:
+    """
+    Compare stations in a pool of args.workers processes, or one after the other with a single worker.
+
+    Parameters:
+        args (argparse.Namespace): Parsed command-line arguments.
+        stations (List[str]): Station table names.
+
+    Returns:
+        List[Dict[str, Any]]: One result per station, in the order of stations.
+    """
+    if args.workers == 1:
+        return [station_comparison_worker(args, station) for station in stations]
+    results = {}
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(station_comparison_worker, args, station): station for station in stations}
+        for future in as_completed(futures):
+            station = futures[future]
+            try:
+                results[station] = future.result()
+            except Exception as e:
+                my_logger.error(f"Worker for {station} failed: {e}")
+                results[station] = {"station": station, "only_in_test": 0, "only_in_supercell": 0,
+                                    "mismatches": Counter(), "failures": [f"worker: {e}"]}
+    return [results[station] for station in stations]
+
+
+def write_comparison_summary(reports: ReportWriter, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Write the consolidated summary of a multi-station comparison: the counts of each station to the
+    comparison_summary report and its mismatches by column to the comparison_mismatches_by_column report.
+
+    Parameters:
+        reports (ReportWriter): Report writer of the run.
+        results (List[Dict[str, Any]]): Station results as returned by compare_station.
+
+    Returns:
+        Dict[str, Any]: Totals of stations, records only in test and only in supercell, mismatches by column
+        and the failures keyed by station.
+    """
+    reports.write_rows(SUMMARY_REPORT, SUMMARY_HEADER, [
+        [result["station"], result["only_in_test"], result["only_in_supercell"],
+         sum(result["mismatches"].values()), "; ".join(result["failures"])]
+        for result in results
+    ])
+    reports.write_rows(MISMATCHES_BY_COLUMN_REPORT, MISMATCHES_BY_COLUMN_HEADER, [
+        [result["station"], column, count]
+        for result in results for column, count in sorted(result["mismatches"].items())
+    ])
+    return {
+        "stations": len(results),
+        "only_in_test": sum(result["only_in_test"] for result in results),
+        "only_in_supercell": sum(result["only_in_supercell"] for result in results),
+        "mismatches": dict(sum((result["mismatches"] for result in results), Counter())),
+        "failed_stations": {result["station"]: result["failures"] for result in results if result["failures"]},
+    }
+
+
 def main() -> None:
     """
     Main function to compare records between test and supercell databases.
@@ -492,6 +568,16 @@ def main() -> None:
     -b, --begin: Start date (YYYY-MM-DD)
     -e, --end: End date (YYYY-MM-DD)
     -s, --station: Station name (which is also the table name)
+    --stations: Station table names compared in parallel
+    -a, --all: Compare every station table of the test database in parallel
+    --test-section: Section name in INI file of the test database
+    --supercell-section: Section name in INI file of the supercell database
+    --engine: Comparison engine, dict (compare_records) or columnar (NumPy)
+    --report-dir: Directory of the report files
+    --report-format: Format of the report files, csv, gzip or parquet
+    --trace-comparisons: Write every margin comparison to the comparison_results report
+    --precheck: Compare only the rows whose hashes differ, hashed in SQL or in Python
+    --workers: Number of worker processes for --stations/--all
     """
     parser = argparse.ArgumentParser(
         description="Utility script to compare records between test and supercell databases"
@@ -502,58 +588,119 @@ def main() -> None:
     parser.add_argument(
         "-e", "--end", type=str, required=True, help="End date (YYYY-MM-DD)"
     )
-    parser.add_argument(
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument(
         "-s",
         "--station",
         type=str,
-        required=True,
         help="Station name (which is also the table name)",
     )
+    group.add_argument(
+        "--stations",
+        nargs="+",
+        type=str,
+        help="Compare several station tables in parallel (table names)",
+    )
+    group.add_argument(
+        "-a",
+        "--all",
+        action="store_true",
+        default=False,
+        help="Compare every station table of the test database in parallel",
+    )
+    parser.add_argument(
+        "--test-section",
+        type=str,
+        default="mawnqc_test",
+        help="Section name in INI file for the test database (default: mawnqc_test)",
+    )
+    parser.add_argument(
+        "--supercell-section",
+        type=str,
+        default="mawnqc",
+        help="Section name in INI file for the supercell database (default: mawnqc)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["dict", "columnar"],
+        default="dict",
+        help="Comparison engine: dict compares record by record, columnar compares column arrays with NumPy (default: dict)",
+    )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--report-dir",
+        type=str,
+        default=".",
+        help="Directory of the report files (default: working directory)",
+    )
+    parser.add_argument(
+        "--report-format",
+        choices=REPORT_FORMATS,
+        default="csv",
+        help="Format of the report files: csv, gzip (compressed CSV) or parquet (needs pyarrow) (default: csv)",
+    )
+    parser.add_argument(
+        "--trace-comparisons",
+        action="store_true",
+        help="Write every margin comparison to the comparison_results report (dict engine only)",
+    )
+    parser.add_argument(
+        "--precheck",
+        choices=PRECHECK_MODES,
+        default="none",
+        help="Hash rows first and compare only the rows that differ: sql hashes them in the databases, "
+             "python hashes the fetched rows (default: none)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes comparing stations with --stations/--all, each with its own connections "
+             "(default: number of CPUs)",
+    )
 
+    args = parser.parse_args()
+    if args.engine == "columnar" and not numpy_available():
+        my_logger.warning("NumPy is not installed, comparing with the dict engine")
+        args.engine = "dict"
+    if args.trace_comparisons and args.engine != "dict":
+        parser.error("--trace-comparisons needs --engine dict")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    reports = ReportWriter(args.report_dir, args.report_format)
     try:
-        # Create database connections and cursors
-        test_conn = connect_to_mawnqc_test()
-        test_cursor = mawnqc_test_cursor_connection(test_conn)
-
-        supercell_conn = connect_to_mawnqc_supercell()
-        supercell_cursor = mawn_supercell_cursor_connection(supercell_conn)
-
-        # Fetch records from both databases
-        test_records = fetch_records_by_date(
-            test_cursor, args.station, args.begin, args.end
-        )
-        supercell_records = fetch_records_by_date(
-            supercell_cursor, args.station, args.begin, args.end
-        )
-
-        # Compare records
-        only_in_test, only_in_supercell, mismatches_details = compare_records(
-            test_records, supercell_records
+        if args.station:
+            compare_station(args, args.station, reports)
+            return
+
+        if args.all:
+            # Discover the station tables in the test database
+            connection = get_pool_manager().getconn(args.test_section)
+            try:
+                stations = [f"{station}_hourly" for station in
+                            get_all_stations_list(get_mawnqc_cursor(connection, args.test_section))]
+            finally:
+                release_connection(connection)
+        else:
+            stations = args.stations
+
+        results = run_station_comparisons(args, stations)
+        summary = write_comparison_summary(reports, results)
+        print(
+            f"Compared {summary['stations']} stations: {summary['only_in_test']} records only in test, "
+            f"{summary['only_in_supercell']} only in supercell, {sum(summary['mismatches'].values())} mismatches; "
+            f"{len(summary['failed_stations'])} stations with failures"
         )
-
-        # Report results
-        if only_in_test:
-            my_logger.error(f"Records found only in test database: {len(only_in_test)}")
-        if only_in_supercell:
-            my_logger.error(
-                f"Records found only in supercell database: {len(only_in_supercell)}"
-            )
-        if mismatches_details:
-            my_logger.error(f"Mismatched records: {len(mismatches_details)}")
-            my_logger.error(mismatches_details)
-            for mismatch in mismatches_details:
-                my_logger.error(f"Test Record : {mismatch[0]}")
-                my_logger.error(f"Supercell Record: {mismatch[1]}")
-                my_logger.error(f"Details: {mismatch[2]}")
-
+        for column, count in sorted(summary["mismatches"].items()):
+            print(f"  {column}: {count} mismatches")
+        for station, failures in summary["failed_stations"].items():
+            print(f"  {station}: {'; '.join(failures)}")
     except Exception as e:
         my_logger.error(f"An error occurred: {e}")
     finally:
-        # Close connections
-        test_conn.close()
-        supercell_conn.close()
+        # Write the buffered report rows
+        reports.close()
 
 
 if __name__ == "__main__":
@@ -561,8 +708,12 @@ if __name__ == "__main__":
     
 """
 python hourly_utility.py --begin 2023-01-01 --end 2023-01-02 --station aetna_hourly
+python hourly_utility.py --begin 2023-01-01 --end 2023-12-31 --all --workers 8
 
-usage: hourly_utility.py [-h] -b BEGIN -e END -s STATION
-required: -b/--begin, -e/--end, -s/--station
+usage: hourly_utility.py [-h] -b BEGIN -e END (-s STATION | --stations STATION [STATION ...] | -a)
+                         [--test-section SECTION] [--supercell-section SECTION]
+                         [--engine {dict,columnar}] [--report-dir DIR] [--report-format {csv,gzip,parquet}]
+                         [--trace-comparisons] [--precheck {none,sql,python}] [--workers WORKERS]
+required: -b/--begin, -e/--end, one of -s/--station, --stations, -a/--all
 
 """
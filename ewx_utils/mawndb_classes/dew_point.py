@@ -18,8 +18,46 @@ class DewPoint:
     The DewPoint class calculates the dew point temperature from humidity and temperature measurements.
     It relies on the validity of the Humidity and Temperature classes.
     """
+    __slots__ = ("temp", "relh", "dwptC", "src")
+    logger = EWXStructuredLogger(log_path=ewx_log_file)
+
+    @staticmethod
+    def calculate_dwpt(tempC, relhPCT):
+        """
+        Calculates the dew point temperature in degrees C.
+
+        Parameters:
+        tempC (float): Temperature value in degrees C.
+        relhPCT (float): Relative humidity value in percent.
+
+        Returns:
+        float: Dew point temperature rounded to 3 decimal places.
+        """
+        # Calculating the saturated vapor pressure
+        saturated_vapor = round(0.61078 * math.exp((17.269 * tempC) / (tempC + 237.3)), 6)
+        # Calculating actual vapor pressure
+        dew_point_vapor = round(relhPCT / 100 * saturated_vapor, 6)
+        # Calculating dew point temperature
+        return round((116.9 + 237.3 * math.log(dew_point_vapor)) / (16.78 - math.log(dew_point_vapor)), 3)
+
+    @classmethod
+    def dwpt_value(cls, tempC, relhPCT, month=None):
+        """
+        Calculates the dew point without creating Temperature, Humidity and DewPoint objects.
+
+        Parameters:
+        tempC (float): Temperature value in degrees C.
+        relhPCT (float): Relative humidity value in percent.
+        month (int, optional): Month of the record (1-12), used for the temperature range.
+
+        Returns:
+        float: Dew point temperature, or None if the humidity or temperature is invalid.
+        """
+        if not Humidity.is_valid_value(relhPCT) or not Temperature.is_valid_value(tempC, month):
+            return None
+        return cls.calculate_dwpt(float(tempC), float(relhPCT))
+
     def __init__(self, temp, relh, record_date=None) -> None:
-        self.logger = EWXStructuredLogger(log_path=ewx_log_file)
         self.logger.debug("Initializing DewPoint object with temp: %s and relh: %s", temp, relh)
         if not isinstance(temp, Temperature) or not isinstance(relh, Humidity):
             self.logger.error("Invalid temperature or humidity object passed.")
@@ -33,15 +71,7 @@ class DewPoint:
             self.logger.error("Invalid temperature value temp: %s, on record_date: %s", self.temp.tempC, record_date)
             self.dwptC = None  # Set dwpt to None if temperature is invalid
         else:
-            tempC = self.temp.tempC
-            relhPCT = self.relh.relhPCT
-            # Calculating the saturated vapor pressure
-            saturated_vapor = round(0.61078 * math.exp((17.269 * tempC) / (tempC + 237.3)), 6)
-            # Calculating actual vapor pressure
-            dew_point_vapor = round(relhPCT / 100 * saturated_vapor, 6)
-            # Calculating dew point temperature
-            self.dwptC = round((116.9 + 237.3 * math.log(dew_point_vapor)) / (16.78 - math.log(dew_point_vapor)), 3)
-            
+            self.dwptC = self.calculate_dwpt(self.temp.tempC, self.relh.relhPCT)
 
     def set_src(self, src):
         """
@@ -18,6 +18,32 @@ It also specifies the units of measurement and their respective conversions as s
     valid_rpet_hourly_default = (0, 10)
     valid_rpet_daily_default = (0, 10)
 
+    __slots__ = ("record_date", "src", "tableU", "rpetMM", "rpetIN")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, rpetMM, table="HOURLY"):
+        """
+        Checks an rpet value in MM without creating an Evapotranspiration object.
+
+        Parameters:
+        rpetMM(float): Reference potential evapotranspiration value in MM
+        table(str): The type of table('HOURLY', or 'DAILY')
+
+        Returns:
+        bool: True if the rpet value is within the valid range, False otherwise
+        """
+        tableU = table.upper()
+        if tableU == "HOURLY":
+            validation_range = cls.valid_rpet_hourly_default
+        elif tableU == "DAILY":
+            validation_range = cls.valid_rpet_daily_default
+        else:
+            raise ValueError("Table must be either 'HOURLY or 'DAILY'")
+        if rpetMM is None:
+            return False
+        return validation_range[0] <= float(rpetMM) <= validation_range[1]
+
     def __init__(self, rpet, table: str, units, record_date=None):
         """
         Initializes the Evapotranspiration object.
@@ -28,7 +54,6 @@ It also specifies the units of measurement and their respective conversions as s
         units(str): The unit of measurement ('MM' or 'IN')
         record_date(datetime, optional): The date of the record.
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing Evapotranspiration object with rpet: %s, table: %s, units: %s, record_date: %s",
                           rpet, table, units, record_date)
         self.record_date = record_date
@@ -19,6 +19,24 @@ class Humidity:
     valid_relh_hourly_default = (5, 100)
     RELH_CAP = 105
 
+    __slots__ = ("record_date", "src", "relhPCT", "relhDEC")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, relhPCT):
+        """
+        Checks a relative humidity percentage without creating a Humidity object.
+
+        Parameters:
+        relhPCT (float): Relative humidity value in percent.
+
+        Returns:
+        bool: True if the relative humidity value is within the valid range, False otherwise.
+        """
+        if relhPCT is None:
+            return False
+        return cls.valid_relh_hourly_default[0] <= float(relhPCT) <= cls.valid_relh_hourly_default[1]
+
     def __init__(self, relh, units, record_date=None):
         """
         Initializes the Humidity object.
@@ -28,7 +46,6 @@ class Humidity:
         units (str): The unit of measurement ('PCT' or 'DEC').
         record_date (datetime, optional): The date of the record.
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing Humidity object with relh: %s, units: %s, record_date: %s",
                           relh, units, record_date)
        
@@ -56,7 +73,7 @@ class Humidity:
         """
         self.logger.debug("Validating relhPCT value: %s", self.relhPCT)
 
-        if self.valid_relh_hourly_default[0] <= self.relhPCT <= self.valid_relh_hourly_default[1]:
+        if self.is_valid_value(self.relhPCT):
             self.logger.debug("relhPCT value: %s is within the valid range: %s",
                               self.relhPCT, self.valid_relh_hourly_default)
             return True
@@ -14,6 +14,32 @@ class LeafWetness:
 Below is the precipitation class validation code which defines the valid fivemin, hourly and daily default monthly ranges.
 The units of measurements as stored in mawndb and their respective conversions, sensors and tables are also specified.
     """
+    valid_lw_hourly_default = (0, 1)
+
+    __slots__ = ("record_date", "src", "lw", "tableU", "sensorU", "percent")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, lw, table="HOURLY", sensor="LEAF0"):
+        """
+        Checks a leaf wetness value without creating a LeafWetness object.
+
+        Parameters:
+        lw(float): Leaf wetness value.
+        table(str): The type of table ('FIVEMIN', or 'HOURLY').
+        sensor(str): The type of sensor('LEAF0','LEAF1', 'LWS0', 'LWS1').
+
+        Returns:
+        bool: True if the leaf wetness value is within the valid range, False otherwise
+        """
+        tableU = table.upper()
+        if tableU == "FIVEMIN":
+            if sensor.upper() in ['LEAF0', 'LEAF1']:
+                return lw is not None and -100 <= lw < 9999
+            return True # All valid valid/no valid range for these sensors
+        elif tableU == "HOURLY":
+            return lw is not None and cls.valid_lw_hourly_default[0] <= lw <= cls.valid_lw_hourly_default[1]
+        raise ValueError("Table must be either 'FIVEMIN' or 'HOURLY'")
 
     def __init__(self, lw, table, sensor, record_date=None):
         """
@@ -25,7 +51,6 @@ The units of measurements as stored in mawndb and their respective conversions,
         sensor(str): The type of sensor('LEAF0','LEAF1', 'LWS0', 'LWS1').
         record_date(datetime, optiona): The date of the record.
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing Leafwetness object with lw: %s, table: %s, sensor: %s, record_date: %s",
                           lw, table, sensor, record_date)
         self.record_date = record_date
@@ -72,7 +97,7 @@ The units of measurements as stored in mawndb and their respective conversions,
             else: # lws0 or lws1
                 is_valid = True # All valid valid/no valid range for these sensors
         elif self.tableU == "HOURLY":
-                is_valid = 0 <= self.lw <= 1
+                is_valid = self.is_valid_value(self.lw, self.tableU)
         else:
             self.logger.error("Invalid table type provided: %s", self.tableU)
             raise ValueError("Table must be either 'FIVEMIN' or 'HOURLY'")
@@ -18,6 +18,24 @@ class NetRadiation:
 
     valid_nrad_hourly_default = (-1250, 1250)
 
+    __slots__ = ("record_date", "nrad")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, nrad):
+        """
+        Checks a net radiation value without creating a NetRadiation object.
+
+        Parameters:
+        nrad(float): Net radiation value.
+
+        Returns:
+        bool: True if the net radiation value is within the valid range, False otherwise.
+        """
+        if nrad is None:
+            return False
+        return cls.valid_nrad_hourly_default[0] <= round(nrad, 6) <= cls.valid_nrad_hourly_default[1]
+
     def __init__(self, nrad, record_date=None):
         """
         Initializes the NetRadiation object.
@@ -27,7 +45,6 @@ class NetRadiation:
         record_date(datetime, optional): The date of the record.
         
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing NetRadiation object with nrad: %s, record_date: %s", nrad, record_date)
         self.record_date = record_date
         self.nrad = nrad
@@ -52,6 +69,6 @@ class NetRadiation:
             self.logger.debug("Net radiation value is None, returning False.")
             return False
 
-        is_valid = self.valid_nrad_hourly_default[0] <= self.nrad <= self.valid_nrad_hourly_default[1]
+        is_valid = self.is_valid_value(self.nrad)
         self.logger.debug("Net radiation value: %s is valid: %s", self.nrad, is_valid)
         return is_valid
\ No newline at end of file
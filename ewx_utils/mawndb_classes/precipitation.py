@@ -18,6 +18,34 @@ It also specifies the units of measurement and their respective conversions and
     valid_pcpn_hourly_default = (0, 77)
     valid_pcpn_daily_default = (0, 254)
 
+    __slots__ = ("record_date", "src", "tableU", "pcpnMM", "pcpnIN")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, pcpnMM, table="HOURLY"):
+        """
+        Checks a precipitation value in MM without creating a Precipitation object.
+
+        Parameters:
+        pcpnMM(float): Precipitation value in MM.
+        table(str): The type of table('FIVEMIN','HOURLY','DAILY').
+
+        Returns:
+        bool: True if the precipitation value is within the valid range, False otherwise
+        """
+        tableU = table.upper()
+        if tableU == "FIVEMIN":
+            validation_range = cls.valid_pcpn_fivemin_default
+        elif tableU == "HOURLY":
+            validation_range = cls.valid_pcpn_hourly_default
+        elif tableU == "DAILY":
+            validation_range = cls.valid_pcpn_daily_default
+        else:
+            raise ValueError("Table must be either 'FIVEMIN', 'HOURLY', or 'DAILY'")
+        if pcpnMM is None:
+            return False
+        return validation_range[0] <= float(pcpnMM) <= validation_range[1]
+
     def __init__(self, pcpn, table: str, units, record_date=None):
         """
         Initializes the Precipitation object.
@@ -28,7 +56,6 @@ It also specifies the units of measurement and their respective conversions and
         units(str): The unit of measurement('MM' or 'IN')
 
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing Precipitation object with pcpn: %s, table: %s, units: %s, record_date: %s",
                           pcpn, table, units, record_date)
         self.record_date = record_date
@@ -16,6 +16,24 @@ class SoilHeatFlux:
     """
     valid_sflux_hourly_default = (0, 7000)
 
+    __slots__ = ("record_date", "sflux")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, sflux):
+        """
+        Checks a soil heat flux value without creating a SoilHeatFlux object.
+
+        Parameters:
+        sflux(float): Soil heat flux value.
+
+        Returns:
+        bool: True if the soil heat flux value is within the valid range, False otherwise.
+        """
+        if sflux is None:
+            return False
+        return cls.valid_sflux_hourly_default[0] <= sflux <= cls.valid_sflux_hourly_default[1]
+
     def __init__(self, sflux, record_date=None):
         """
         Initializes the SoilHeatFlux.
@@ -24,7 +42,6 @@ class SoilHeatFlux:
         sflux(float): Soil heat flux value
         record_date(datetime, optional): The date of the record.
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing SoilHeatFlux object with sflux: %s, record_date: %s", sflux, record_date)
         
         self.record_date = record_date
@@ -44,7 +61,7 @@ class SoilHeatFlux:
             self.logger.debug("Soil heat flux value is None, returning False.")
             return False
 
-        is_valid = self.valid_sflux_hourly_default[0] <= self.sflux <= self.valid_sflux_hourly_default[1]
+        is_valid = self.is_valid_value(self.sflux)
         self.logger.debug("Soil moisture value: %s is valid: %s", self.sflux, is_valid)
 
         return is_valid
@@ -15,6 +15,24 @@ class SoilMoisture:
     """
     valid_mstr_hourly_default = (0, 1)
 
+    __slots__ = ("record_date", "mstr")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, mstr):
+        """
+        Checks a soil moisture value without creating a SoilMoisture object.
+
+        Parameters:
+        mstr(float): Soil moisture value.
+
+        Returns:
+        bool: True if the soil moisture value is within the valid range, False otherwise.
+        """
+        if mstr is None:
+            return False
+        return cls.valid_mstr_hourly_default[0] <= mstr <= cls.valid_mstr_hourly_default[1]
+
     def __init__(self, mstr, record_date=None):
         """
         Initializes the SoilMoisture object.
@@ -24,7 +42,6 @@ class SoilMoisture:
         record_date(datetime, optional): The date of the record.
         
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing SoilMoisture object with mstr: %s, record_date: %s", mstr, record_date)
 
         self.record_date = record_date
@@ -50,7 +67,7 @@ class SoilMoisture:
             self.logger.debug("Soil moisture value is None, returning False.")
             return False
 
-        is_valid = self.valid_mstr_hourly_default[0] <= self.mstr <= self.valid_mstr_hourly_default[1]
+        is_valid = self.is_valid_value(self.mstr)
         self.logger.debug("Soil moisture value: %s is valid: %s", self.mstr, is_valid)
 
         return is_valid
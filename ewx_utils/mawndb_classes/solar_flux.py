@@ -17,6 +17,24 @@ class SolarFlux:
     # Valid range for max solar flux (sden_max) in in W/m²
     valid_sden_max_default =(0, 105)
 
+    __slots__ = ("record_date", "src", "sdenWPMS", "sdenKJPMS", "sdenLY")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, sdenWPMS):
+        """
+        Checks a max solar flux value without creating a SolarFlux object.
+
+        Parameters:
+        sdenWPMS(float): Max solar flux value in W/m².
+
+        Returns:
+        bool: True if the max solar flux value is within the valid range, False otherwise.
+        """
+        if sdenWPMS is None:
+            return False
+        return cls.valid_sden_max_default[0] <= float(sdenWPMS) <= cls.valid_sden_max_default[1]
+
     # Conversion factors
     WPMS_TO_KJPMS = 60 / 1000  # 1 W/m² = 0.06 kJ/m²/min
     WPMS_TO_LY = 60 / 1000 * 0.239  # 1 W/m² = 0.01434 ly/min (Langleys per minute)
@@ -35,7 +53,6 @@ class SolarFlux:
 
         record_date (datetime, optional): The date of the record.
         """
-        self.logger = EWXStructuredLogger(log_path=ewx_log_file)
         self.logger.debug("Initializing SolarFlux with sden_max: %s, units: %s, record_date: %s",
                           sden_max, units, record_date)
         
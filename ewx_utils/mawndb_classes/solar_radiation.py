@@ -19,6 +19,32 @@ class SolarRadiation:
     valid_srad_hourly_default = (0, 4500)
     valid_srad_daily_default = (0, 32000)
 
+    __slots__ = ("record_date", "src", "tableU", "srad")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, srad, table="HOURLY"):
+        """
+        Checks a solar radiation value without creating a SolarRadiation object.
+
+        Parameters:
+        srad(float): Solar radiation value.
+        table(str): The type of table('HOURLY', or 'DAILY')
+
+        Returns:
+        bool: True if the solar radiation value is within the valid range, False otherwise.
+        """
+        tableU = table.upper()
+        if tableU == "HOURLY":
+            validation_range = cls.valid_srad_hourly_default
+        elif tableU == "DAILY":
+            validation_range = cls.valid_srad_daily_default
+        else:
+            return False
+        if srad is None:
+            return False
+        return validation_range[0] <= float(srad) <= validation_range[1]
+
     def __init__(self, srad, table: str, record_date=None):
         """
         Initializes the Solar Radiation object.
@@ -28,7 +54,6 @@ class SolarRadiation:
         table(str): The type of table('HOURLY', or 'DAILY')
         record_date(datetime, optional): The date of the record.
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing Solar Radiation object with srad: %s, table: %s, record_date: %s", 
                           srad, table, record_date)
         self.record_date = record_date
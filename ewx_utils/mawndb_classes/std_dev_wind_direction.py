@@ -15,6 +15,24 @@ class StdDevWindDirection:
     """
     valid_wstdv_hourly_default = (0, 99)
 
+    __slots__ = ("record_date", "src", "wstdvM")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, wstdvM):
+        """
+        Checks a standard deviation of wind direction value without creating a StdDevWindDirection object.
+
+        Parameters:
+        wstdvM(float): Standard deviation of wind direction value.
+
+        Returns:
+        bool: True if the standard deviation of wind direction value is within the valid range, False otherwise.
+        """
+        if wstdvM is None:
+            return False
+        return cls.valid_wstdv_hourly_default[0] <= wstdvM <= cls.valid_wstdv_hourly_default[1]
+
     def __init__(self, wstdv, units, record_date=None):
         """
         Initializes the StdWindDirection object.
@@ -25,7 +43,6 @@ class StdDevWindDirection:
         record_date(datetime, optional): The date of the record.
 
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing StdDevWindDirection object with wstdv: %s, units: %s, record_date: %s",
                           wstdv, units, record_date)
         
@@ -59,7 +76,7 @@ class StdDevWindDirection:
             self.logger.debug("Standard Deviation of Wind direction is None, returning False")
             return False
 
-        is_valid = self.valid_wstdv_hourly_default[0] <= self.wstdvM <= self.valid_wstdv_hourly_default[1]
+        is_valid = self.is_valid_value(self.wstdvM)
         self.logger.debug("Standard Deviation of Wind direction value: %s is valid: %s", self.wstdvM, is_valid)
         return is_valid
 
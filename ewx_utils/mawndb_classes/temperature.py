@@ -29,6 +29,32 @@ class Temperature:
         "nov": (-33, 33),
         "dec": (-39, 25),
     }
+    # Range used when no record date is given
+    valid_atmp_hourly_default = (-40, 46)
+    month_abbrvs = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+
+    __slots__ = ("record_date", "src", "tempC", "tempF", "tempK")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, tempC, month=None):
+        """
+        Checks a temperature in degrees C without creating a Temperature object.
+
+        Parameters:
+        tempC (float): Temperature value in degrees C.
+        month (int, optional): Month of the record (1-12); the default range is used when None.
+
+        Returns:
+        bool: True if the temperature value is within the valid range, False otherwise.
+        """
+        if tempC is None:
+            return False
+        if month is not None:
+            low, high = cls.valid_hourly_atmp[cls.month_abbrvs[month - 1]]
+        else:
+            low, high = cls.valid_atmp_hourly_default
+        return low <= float(tempC) <= high
 
     def __init__(self, temp, units, record_date=None):
         """
@@ -39,7 +65,6 @@ class Temperature:
         units (str): The unit of measurement ('C', 'F', 'K').
         record_date (datetime, optional): The date of the record.
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing Temperature object with temp: %s, units: %s, record_date: %s",
                           temp, units, record_date)
         self.record_date = record_date
@@ -97,16 +122,13 @@ class Temperature:
             return False
 
         if self.record_date is not None:
-            month_abbrv = self.record_date.strftime("%b").lower()
-            atmp_valid_range = self.valid_hourly_atmp.get(month_abbrv)
-            if atmp_valid_range:
-                is_valid = atmp_valid_range[0] <= self.tempC <= atmp_valid_range[1]
-                self.logger.debug("Temperature value: %s is valid for month %s: %s",
-                                  self.tempC, month_abbrv, is_valid)
-                return is_valid
-
-        is_valid = -40 <= self.tempC <= 46
+            month = self.record_date.month
+            is_valid = self.is_valid_value(self.tempC, month)
+            self.logger.debug("Temperature value: %s is valid for month %s: %s",
+                              self.tempC, self.month_abbrvs[month - 1], is_valid)
+            return is_valid
+
+        is_valid = self.is_valid_value(self.tempC)
         self.logger.debug("Temperature value: %s is within general valid range (-40 to 46): %s",
                           self.tempC, is_valid)
         return is_valid
-
@@ -16,6 +16,24 @@ class VaporPressure:
     # Valid range for vapor pressure measurements
     valid_vapr_hourly_default = (0, 4)
 
+    __slots__ = ("record_date", "src", "vaprKPA", "vapr")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, vaprKPA):
+        """
+        Checks a vapor pressure value without creating a VaporPressure object.
+
+        Parameters:
+        vaprKPA(float): Vapor pressure value in KPA.
+
+        Returns:
+        bool: True if the vapor pressure value is within the valid range, False otherwise.
+        """
+        if vaprKPA is None:
+            return False
+        return cls.valid_vapr_hourly_default[0] <= vaprKPA <= cls.valid_vapr_hourly_default[1]
+
     def __init__(self, vapr, units, record_date = None):
         """
         Initializes the vapor pressure object
@@ -25,7 +43,6 @@ class VaporPressure:
         units(str): The unit of measurement ('KPA')
         record_date(datetime, optional): The date of the record
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing Vapor Pressure object with vapr: %s, units: %s, record_date: %s", 
                           vapr, record_date)
         
@@ -17,6 +17,24 @@ class Voltage:
     """
     valid_volt_hourly_default = (0, 20)
 
+    __slots__ = ("record_date", "src", "volt")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, volt):
+        """
+        Checks a voltage value without creating a Voltage object.
+
+        Parameters:
+        volt(float): Voltage value.
+
+        Returns:
+        bool: True if the voltage value is within the valid range, False otherwise.
+        """
+        if volt is None:
+            return False
+        return cls.valid_volt_hourly_default[0] <= volt <= cls.valid_volt_hourly_default[1]
+
     def __init__(self, volt, record_date=None):
         """
         Initializes the Voltage class.
@@ -25,7 +43,6 @@ class Voltage:
         volt(float): Voltage value
         record_date(datetime, optional): The date of the record.
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing Voltage object with volt: %s, record_date: %s", volt, record_date)
         
         self.record_date = record_date
@@ -56,6 +73,6 @@ class Voltage:
             self.logger.debug("Voltage value is None, returning False.")
             return False
 
-        is_valid = self.valid_volt_hourly_default[0] <= self.volt <= self.valid_volt_hourly_default[1]
+        is_valid = self.is_valid_value(self.volt)
         self.logger.debug("Voltage value: %s is valid: %s", self.volt, is_valid)
         return is_valid
@@ -16,6 +16,24 @@ class WindDirection:
     """
     valid_wdir_hourly_default = (0, 360)
 
+    __slots__ = ("record_date", "src", "wdirDEGREES", "wdirCOMPASS")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, wdirDEGREES):
+        """
+        Checks a wind direction value without creating a WindDirection object.
+
+        Parameters:
+        wdirDEGREES(float): Wind direction value in degrees.
+
+        Returns:
+        bool: True if the wind direction value is within the valid range, False otherwise.
+        """
+        if wdirDEGREES is None:
+            return False
+        return cls.valid_wdir_hourly_default[0] <= float(wdirDEGREES) <= cls.valid_wdir_hourly_default[1]
+
     def __init__(self, wdir, units, record_date=None):
         """
         Initializes the WindDirection object.
@@ -25,7 +43,6 @@ class WindDirection:
         units (str): The unit of measurement ('DEGREES').
         record_date (datetime, optional): The date of the record.
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing WindDirection object with wdir: %s, units: %s, record_date: %s",
                           wdir, units, record_date)
 
@@ -93,7 +110,7 @@ class WindDirection:
             self.logger.debug("Wind direction is None, returning False")
             return False
 
-        is_valid = self.valid_wdir_hourly_default[0] <= self.wdirDEGREES <= self.valid_wdir_hourly_default[1]
+        is_valid = self.is_valid_value(self.wdirDEGREES)
         self.logger.debug("Wind direction value: %s is valid: %s", self.wdirDEGREES, is_valid)
         return is_valid
 
@@ -16,6 +16,24 @@ class WindSpeed:
 
     valid_wspd_hourly_default = (0, 99)
 
+    __slots__ = ("record_date", "src", "wspdMPS", "wspdMPH")
+    logger = EWXStructuredLogger(log_path = ewx_log_file)
+
+    @classmethod
+    def is_valid_value(cls, wspdMPS):
+        """
+        Checks a wind speed value without creating a WindSpeed object.
+
+        Parameters:
+        wspdMPS(float): Wind speed value in MPS.
+
+        Returns:
+        bool: True if the wind speed value is within the valid range, False otherwise.
+        """
+        if wspdMPS is None:
+            return False
+        return cls.valid_wspd_hourly_default[0] <= float(wspdMPS) <= cls.valid_wspd_hourly_default[1]
+
     def __init__(self, wspd, units, record_date=None):
         """
         Initializes the Windspeed object.
@@ -26,7 +44,6 @@ class WindSpeed:
         record_date(datetime, optional): The date of the record.
     
         """
-        self.logger = EWXStructuredLogger(log_path = ewx_log_file)
         self.logger.debug("Initializing Windspeed object with wspd: %s, units: %s, record_date: %s",
                           wspd, units, record_date)
         self.record_date = record_date
@@ -68,7 +85,7 @@ class WindSpeed:
         if self.wspdMPS is None:
             self.logger.debug("Wind speed is None, returning False")
             return False
-        is_valid = self.valid_wspd_hourly_default[0] <= self.wspdMPS <= self.valid_wspd_hourly_default[1]
+        is_valid = self.is_valid_value(self.wspdMPS)
         self.logger.debug("Wind speed value: %s is valid: %s", self.wspdMPS, is_valid)
         return is_valid
        
@@ -0,0 +1,120 @@
+""" Fake database objects and record factories shared by the tests. """
+from datetime import date, time
+from types import SimpleNamespace
+from psycopg2 import extensions
+
+DAY = date(2023, 6, 1)
+
+
+def make_record(hour, day=DAY, **values):
+    """
+    Returns a record of an hour of day with the given column values.
+    """
+    record = {"date": day, "time": time(hour)}
+    record.update(values)
+    return record
+
+
+class FakeCursor:
+    """
+    Cursor that records the statements it executes, with their whitespace collapsed, and returns canned rows.
+    fetchall returns rows; with results, each fetchone or fetchall call returns the next result instead.
+    With error, every execute raises it.
+    """
+
+    def __init__(self, rows=(), columns=(), connection=None, results=None, error=None):
+        self.rows = list(rows)
+        self.description = [(column,) for column in columns]
+        self.connection = connection if connection is not None else FakeConnection()
+        self.results = list(results) if results is not None else None
+        self.error = error
+        self.executed = []
+        self.copied = []
+        self.name = None
+        self.itersize = None
+        self.closed = False
+
+    @property
+    def statements(self):
+        return [query for query, _ in self.executed]
+
+    def execute(self, query, params=None):
+        if self.error is not None:
+            raise self.error
+        if isinstance(query, bytes):
+            query = query.decode()
+        self.executed.append((" ".join(query.split()), params))
+
+    def copy_expert(self, sql, file):
+        self.executed.append((sql, None))
+        self.copied.append(file.read())
+
+    def mogrify(self, template, args):
+        return b"(" + b",".join(repr(arg).encode() for arg in args) + b")"
+
+    def fetchone(self):
+        return self.results.pop(0) if self.results else None
+
+    def fetchall(self):
+        return self.results.pop(0) if self.results is not None else self.rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeConnection:
+    """
+    Connection that counts commits and rollbacks. cursor returns the given cursor, or a new cursor over rows
+    that raises error when executing.
+    """
+    encoding = "UTF8"
+
+    def __init__(self, cursor=None, rows=()):
+        self.fake_cursor = cursor
+        self.rows = rows
+        self.error = None
+        self.cursors = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.autocommit = False
+        self.closed = 0
+        self.info = SimpleNamespace(transaction_status=extensions.TRANSACTION_STATUS_IDLE)
+
+    def cursor(self, name=None, cursor_factory=None):
+        cursor = self.fake_cursor or FakeCursor(self.rows, connection=self, error=self.error)
+        cursor.name = name
+        self.cursors.append(cursor)
+        return cursor
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = 1
+
+
+class FakePoolManager:
+    """
+    Pool manager that hands out a new FakeConnection, with its section, on every getconn.
+    """
+
+    def __init__(self):
+        self.taken = []
+
+    def getconn(self, section):
+        connection = FakeConnection()
+        connection.section = section
+        self.taken.append(connection)
+        return connection
@@ -0,0 +1,48 @@
+from benchmarks.synthetic_data import HOURLY_VARIABLES, make_daily_records, make_hourly_records, stored_records
+from benchmarks.run_benchmarks import BENCHMARKS, add_cleaned_records, compare_with_baseline, measure
+from datetime import date
+from decimal import Decimal
+
+BEGIN, END = date(2023, 7, 1), date(2023, 7, 2)
+
+def test_synthetic_rows_are_reproducible():
+    first = make_hourly_records("station001", BEGIN, END, seed=3)
+    assert first == make_hourly_records("station001", BEGIN, END, seed=3)
+    assert first != make_hourly_records("station002", BEGIN, END, seed=3)
+
+def test_synthetic_rates():
+    complete = make_hourly_records("station001", BEGIN, END, missing_rate=0.0, out_of_range_rate=0.0)
+    assert len(complete) == 48
+    assert all(isinstance(record[variable], Decimal) for record in complete for variable in HOURLY_VARIABLES)
+
+    gappy = make_hourly_records("station001", date(2023, 1, 1), date(2023, 1, 31), missing_rate=0.2, out_of_range_rate=0.0)
+    assert 0.7 * 744 < len(gappy) < 0.9 * 744
+    rtma = make_hourly_records("station001", BEGIN, END, source="rtma")
+    assert all(isinstance(record["atmp"], float) for record in rtma if record["atmp"] is not None)
+
+def test_stored_records_are_float():
+    stored = stored_records([{"year": 2023, "atmp": Decimal("1.5"), "atmp_src": "MAWN"}])
+    assert stored == [{"year": 2023, "atmp": 1.5, "atmp_src": "MAWN"}]
+
+def test_every_benchmark_runs(tmp_path, monkeypatch):
+    # compare_records writes its CSV files to the working directory
+    monkeypatch.chdir(tmp_path)
+    dataset = add_cleaned_records({
+        "begin": BEGIN.isoformat(),
+        "end": END.isoformat(),
+        "mawn": make_hourly_records("station001", BEGIN, END),
+        "rtma": make_hourly_records("station001", BEGIN, END, source="rtma"),
+        "daily": make_daily_records("station001", BEGIN, END),
+    })
+    data = {"seed": 0, "stations": {"station001": dataset}}
+    for name, bench in BENCHMARKS.items():
+        result = measure(*bench(data), repeat=1)
+        assert result["rows"] > 0, name
+        assert result["peak_memory_bytes"] > 0, name
+    assert measure(*BENCHMARKS["daily_process_records"](data), repeat=1, memory=False)["rows"] == 2
+
+def test_compare_with_baseline():
+    results = {"parameters": {}, "results": {"check_value": {"seconds_best": 1.3}, "compare_records": {"seconds_best": 1.0}}}
+    baseline = {"parameters": {}, "results": {"check_value": {"seconds_best": 1.0}, "compare_records": {"seconds_best": 1.0}}}
+    assert compare_with_baseline(results, baseline, 0.25) == ["check_value"]
+    assert compare_with_baseline(results, baseline, 0.5) == []
@@ -0,0 +1,55 @@
+from ewx_utils.db_files.dbs_bulk_copy import copy_upsert_records, records_to_csv_buffer
+from ewx_utils.main_daily_scripts import daily_main
+from tests.helpers import FakeConnection, FakeCursor, make_record
+from decimal import Decimal
+import datetime
+
+def test_records_to_csv_buffer_writes_nulls_and_quotes():
+    records = [make_record(1, atmp=Decimal("20.5"), atmp_src=None), make_record(2, atmp=None, atmp_src="a,b")]
+    buffer = records_to_csv_buffer(records, ["date", "time", "atmp", "atmp_src", "relh"])
+    assert buffer.read() == '2023-06-01,01:00:00,20.5,\\N,\\N\n2023-06-01,02:00:00,\\N,"a,b",\\N\n'
+
+def test_copy_upsert_records_merges_through_temp_table():
+    cursor = FakeCursor()
+    copy_upsert_records(cursor, "aetna_hourly", [make_record(hour, id=hour, atmp=20) for hour in range(3)],
+                        exclude_keys=("id",))
+    create, copy, merge, drop = cursor.statements
+    assert create == "CREATE TEMP TABLE bulk_aetna_hourly ON COMMIT DROP AS SELECT date, time, atmp FROM aetna_hourly WITH NO DATA"
+    assert copy == "COPY bulk_aetna_hourly (date, time, atmp) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    assert merge == ("INSERT INTO aetna_hourly (date, time, atmp) SELECT date, time, atmp FROM bulk_aetna_hourly "
+                     "ON CONFLICT (date, time) DO UPDATE SET atmp = EXCLUDED.atmp")
+    assert drop == "DROP TABLE bulk_aetna_hourly"
+    assert cursor.copied[0].count("\n") == 3
+
+def test_copy_upsert_records_groups_by_columns():
+    cursor = FakeCursor()
+    records = [make_record(1, atmp=20), make_record(2, atmp=21, relh=50), make_record(3, atmp=22)]
+    copy_upsert_records(cursor, "aetna_hourly", records)
+    assert len(cursor.copied) == 2
+    assert cursor.copied[0] == "2023-06-01,01:00:00,20\n2023-06-01,03:00:00,22\n"
+
+def test_copy_upsert_records_with_record_keys_fills_missing_columns():
+    cursor = FakeCursor()
+    copy_upsert_records(cursor, "aetna_daily", [make_record(0, atmp=20)], ["id", "date", "time", "atmp", "relh"])
+    assert len(cursor.copied) == 1
+    assert cursor.copied[0] == "\\N,2023-06-01,00:00:00,20,\\N\n"
+
+def test_copy_upsert_records_without_records_does_nothing():
+    cursor = FakeCursor()
+    copy_upsert_records(cursor, "aetna_hourly", [])
+    assert cursor.statements == []
+
+def test_daily_bulk_copy_writes_the_ids_of_the_default_path():
+    records = [{"id": 7, "date": datetime.date(2023, 6, 1), "atmp": 20, "atmp_src": "MAWN"}]
+    record_keys = ["id", "date", "atmp", "atmp_src"]
+    default_cursor, bulk_cursor = FakeCursor(), FakeCursor()
+
+    daily_main.commit_and_rollback(FakeConnection(default_cursor), "aetna", records, record_keys, ["date"])
+    bulk_connection = FakeConnection(bulk_cursor)
+    daily_main.commit_and_rollback(bulk_connection, "aetna", records, record_keys, ["date"], bulk_copy=True)
+
+    assert bulk_connection.commits == 1
+    assert [params for _, params in default_cursor.executed] == [[7, datetime.date(2023, 6, 1), 20, "MAWN"]]
+    assert bulk_cursor.copied == ["7,2023-06-01,20,MAWN\n"]
+    assert bulk_cursor.statements[2].endswith("ON CONFLICT (date) DO UPDATE SET id = EXCLUDED.id, atmp = EXCLUDED.atmp, "
+                                              "atmp_src = EXCLUDED.atmp_src")
@@ -0,0 +1,64 @@
+from ewx_utils.db_files.dbs_change_detection import comparable_value, diff_existing_records, row_digest, split_changed_records
+from ewx_utils.logs.ewx_utils_metrics import format_textfile_metrics
+from ewx_utils.logs.ewx_utils_timing import StageTimer
+from ewx_utils.main_hourly_scripts import hourly_main
+from argparse import Namespace
+from tests.helpers import FakeCursor, make_record
+from datetime import date, time
+from decimal import Decimal
+
+def test_comparable_value_matches_stored_numbers():
+    assert comparable_value(Decimal("20.1")) == comparable_value(20.100000381469727)
+    assert comparable_value(20.1) != comparable_value(20.2)
+    assert comparable_value("MAWN") == "MAWN"
+    assert comparable_value(None) is None
+    assert comparable_value(True) is True
+
+def test_row_digest_uses_the_given_columns():
+    stored = {"id": 7, "date": date(2023, 6, 1), "time": time(1), "atmp": 20.1, "relh": 55.0}
+    assert row_digest(make_record(1, atmp=Decimal("20.1")), ["date", "time", "atmp"]) == row_digest(stored, ["date", "time", "atmp"])
+    assert row_digest(make_record(1, atmp=Decimal("20.1")), ["date", "time", "atmp", "relh"]) != row_digest(stored, ["date", "time", "atmp", "relh"])
+
+def test_split_changed_records():
+    existing = {
+        (date(2023, 6, 1), time(1)): {"id": 1, "date": date(2023, 6, 1), "time": time(1), "atmp": 20.0, "atmp_src": "MAWN"},
+        (date(2023, 6, 1), time(2)): {"id": 2, "date": date(2023, 6, 1), "time": time(2), "atmp": 21.0, "atmp_src": "MAWN"},
+    }
+    records = [
+        make_record(1, id=None, atmp=Decimal("20.0"), atmp_src="MAWN"),
+        make_record(2, atmp=None, atmp_src="EMPTY"),
+        make_record(3, atmp=22.0, atmp_src="RTMA"),
+    ]
+    changes = split_changed_records(records, existing)
+    assert changes["unchanged"] == 1
+    assert changes["updates"] == [records[1]]
+    assert changes["inserts"] == [records[2]]
+
+def test_diff_existing_records_fetches_the_range_once():
+    cursor = FakeCursor([{"id": 1, "date": date(2023, 6, 1), "time": time(1), "atmp": 20.0}])
+    changes = diff_existing_records(cursor, "aetna_hourly", [make_record(1, atmp=20.0), make_record(5, atmp=20.0)])
+    assert cursor.executed == [("SELECT * FROM aetna_hourly WHERE date BETWEEN %s AND %s", (date(2023, 6, 1), date(2023, 6, 1)))]
+    assert (len(changes["inserts"]), len(changes["updates"]), changes["unchanged"]) == (1, 0, 1)
+    assert diff_existing_records(FakeCursor([]), "aetna_hourly", []) == {"inserts": [], "updates": [], "unchanged": 0}
+
+def test_process_station_writes_only_changed_records(monkeypatch):
+    monkeypatch.setattr(hourly_main, "get_insert_table_columns", lambda cursor, station: ["date", "time", "atmp"])
+    monkeypatch.setattr(hourly_main, "fetch_records", lambda cursor, station, begin, end, itersize=None: [])
+    written = []
+    monkeypatch.setattr(hourly_main, "commit_and_rollback",
+                        lambda connection, station, records, page_size, bulk_copy: written.append(records) or True)
+    stored = [{"id": 1, "date": date(2023, 6, 1), "time": time(1), "atmp": 20.0},
+              {"id": 2, "date": date(2023, 6, 1), "time": time(2), "atmp": 20.0}]
+    process = lambda *args: [make_record(1, atmp=20.0), make_record(2, atmp=25.0), make_record(3, atmp=20.0)]
+    args = Namespace(execute=True, page_size=10, bulk_copy=False, stream=False, itersize=None, skip_unchanged=True)
+    cursors = {"mawn": object(), "rtma": object(), "qcwrite": FakeCursor(stored)}
+
+    result = hourly_main.process_station("aetna", [("aetna", "2023-06-01", "2023-06-01")], {"qcwrite_connection": None}, cursors, process, args)
+
+    assert written == [[make_record(3, atmp=20.0), make_record(2, atmp=25.0)]]
+    assert result["changes"] == {"inserted": 1, "updated": 1, "unchanged": 1}
+    assert result["stages"]["commit_and_rollback"]["rows"] == 2
+    assert hourly_main.summarize_results([result])["changes"] == {"inserted": 1, "updated": 1, "unchanged": 1}
+
+    metrics = format_textfile_metrics("hourly_main", [result], StageTimer(), 1.0)
+    assert 'ewx_qc_record_changes_total{script="hourly_main",change="unchanged"} 1' in metrics
@@ -0,0 +1,61 @@
+from ewx_utils.daily_validation_checks.daily_validation_utils import (
+    estimate_daily_values,
+    estimate_daily_values_from_aggregate,
+    hourly_aggregate_variables,
+    process_records,
+)
+from ewx_utils.main_daily_scripts.daily_main import fetch_hourly_aggregates
+from tests.helpers import DAY, FakeCursor
+import datetime
+
+QC_COLUMNS = ["date", "year", "day", "atmp_max", "atmp_min", "atmp_src", "pcpn", "pcpn_src", "srad", "srad_src"]
+
+def make_hourly_records(pcpn_missing_hour=None, rtma_hour=None):
+    records = []
+    for hour in range(24):
+        records.append({"date": DAY, "time": datetime.time(hour), "atmp": 10 + hour, "atmp_src": "RTMA" if hour == rtma_hour else "MAWN",
+                        "pcpn": None if hour == pcpn_missing_hour else 0.5, "pcpn_src": "MAWN", "srad": 2.0, "srad_src": "MAWN"})
+    return records
+
+def aggregate(records):
+    return {"date": DAY, "hours": len(records),
+            "has_rtma": any(value == "RTMA" for record in records for key, value in record.items() if key.endswith("_src")),
+            "sum_pcpn": sum(r["pcpn"] for r in records if r["pcpn"] is not None), "count_pcpn": sum(r["pcpn"] is not None for r in records),
+            "sum_srad": sum(r["srad"] for r in records), "count_srad": len(records),
+            "min_atmp": min(r["atmp"] for r in records), "max_atmp": max(r["atmp"] for r in records), "count_atmp": len(records)}
+
+def test_hourly_aggregate_variables():
+    assert hourly_aggregate_variables(QC_COLUMNS) == (["pcpn", "srad"], ["atmp"])
+
+def test_estimates_from_aggregates_match_hourly_estimates():
+    for records in (make_hourly_records(), make_hourly_records(pcpn_missing_hour=3)):
+        assert estimate_daily_values_from_aggregate(aggregate(records), QC_COLUMNS) == estimate_daily_values(records, QC_COLUMNS)
+
+def test_process_records_with_aggregates():
+    mawn_record = {"date": DAY, "year": 2023, "day": 152, "atmp_max": None, "atmp_min": 9, "atmp_src": "MAWN", "pcpn": None, "pcpn_src": "MAWN"}
+    for mawn_records in ([], [mawn_record]):
+        records = make_hourly_records(rtma_hour=7)
+        expected = process_records(QC_COLUMNS, [dict(r) for r in mawn_records], records, "2023-06-01", "2023-06-02")
+        aggregated = process_records(QC_COLUMNS, [dict(r) for r in mawn_records], [aggregate(records)], "2023-06-01", "2023-06-02",
+                                     mawnqc_aggregated=True)
+        assert aggregated == expected
+    assert aggregated[0]["atmp_src"] == "EMPTYQC"
+
+    incomplete = aggregate(make_hourly_records()[:23])
+    assert process_records(QC_COLUMNS, [], [incomplete], "2023-06-01", "2023-06-01", mawnqc_aggregated=True)[0]["atmp_max_src"] == "EMPTY"
+
+def test_fetch_hourly_aggregates_groups_by_date():
+    row = {"date": DAY, "hours": 24, "has_rtma": False, "min_atmp": 10, "max_atmp": 33, "count_atmp": 24}
+    cursor = FakeCursor([row], columns=["id", "date", "time", "atmp", "atmp_src", "srad", "relh_src"])
+
+    assert fetch_hourly_aggregates(cursor, "aetna", QC_COLUMNS, "2023-06-01", "2023-06-30") == [row]
+
+    assert cursor.executed[0] == ("SELECT * FROM aetna_hourly LIMIT 0", None)
+    query, params = cursor.executed[1]
+    assert query == (
+        "SELECT date, count(*) AS hours, "
+        "coalesce(bool_or(upper(atmp_src::text) = 'RTMA' OR upper(relh_src::text) = 'RTMA'), false) AS has_rtma, "
+        "sum(srad) AS sum_srad, min(atmp) AS min_atmp, max(atmp) AS max_atmp, count(srad) AS count_srad, count(atmp) AS count_atmp "
+        "FROM aetna_hourly WHERE date BETWEEN %s and %s GROUP BY date ORDER BY date"
+    )
+    assert params == ("2023-06-01", "2023-06-30")
@@ -0,0 +1,34 @@
+from ewx_utils.daily_validation_checks.daily_validation_utils import (
+    group_records_by_date,
+    process_records,
+)
+import datetime
+
+def make_hourly_record(day, hour, atmp):
+    return {"date": day, "time": datetime.time(hour), "atmp": atmp, "atmp_src": "MAWN"}
+
+def test_group_records_by_date_buckets_in_order():
+    day1 = datetime.date(2023, 6, 1)
+    day2 = datetime.date(2023, 6, 2)
+    records = [make_hourly_record(day1, 1, 10), make_hourly_record(day2, 1, 11), make_hourly_record(day1, 2, 12)]
+    grouped = group_records_by_date(records)
+    assert [rec["atmp"] for rec in grouped[day1]] == [10, 12]
+    assert [rec["atmp"] for rec in grouped[day2]] == [11]
+
+def test_process_records_estimates_from_complete_hourly_day():
+    qc_columns = ["date", "year", "day", "atmp_max", "atmp_min", "atmp_src"]
+    day = datetime.date(2023, 6, 1)
+    mawnqc_records = [make_hourly_record(day, hour, 10 + hour) for hour in range(24)]
+    clean_records = process_records(qc_columns, [], mawnqc_records, "2023-06-01", "2023-06-01")
+    assert len(clean_records) == 1
+    assert clean_records[0]["atmp_max"] == 33
+    assert clean_records[0]["atmp_min"] == 10
+
+def test_process_records_inserts_empty_record_when_no_value_can_be_estimated():
+    qc_columns = ["date", "year", "day", "atmp_max", "atmp_min", "atmp_src"]
+    day = datetime.date(2023, 6, 1)
+    mawnqc_records = [make_hourly_record(day, hour, None if hour == 5 else 10) for hour in range(24)]
+    clean_records = process_records(qc_columns, [], mawnqc_records, "2023-06-01", "2023-06-01")
+    assert len(clean_records) == 1
+    assert clean_records[0]["atmp_max"] is None
+    assert clean_records[0]["atmp_max_src"] == "EMPTY"
@@ -0,0 +1,71 @@
+from ewx_utils.db_files import dbs_pool
+from ewx_utils.db_files.dbs_pool import ConnectionPoolManager, connection_is_healthy, get_pool_manager
+from psycopg2 import OperationalError
+from psycopg2.pool import PoolError
+from tests.helpers import FakeConnection
+import psycopg2
+import pytest
+
+@pytest.fixture
+def opened(monkeypatch):
+    opened = []
+    def connect(**db_config):
+        opened.append(FakeConnection())
+        opened[-1].db_config = db_config
+        return opened[-1]
+    monkeypatch.setattr(psycopg2, "connect", connect)
+    monkeypatch.setattr(dbs_pool, "get_db_config", lambda section: {"dbname": section})
+    return opened
+
+def test_connections_are_reused_per_section(opened):
+    manager = ConnectionPoolManager(maxconn=2)
+    mawn = manager.getconn("mawn")
+    manager.putconn(mawn)
+    assert manager.getconn("mawn") is mawn
+    rtma = manager.getconn("rtma")
+    assert rtma.db_config == {"dbname": "rtma"}
+    assert len(opened) == 2
+
+def test_broken_connections_are_replaced(opened):
+    manager = ConnectionPoolManager(maxconn=1)
+    connection = manager.getconn("mawn")
+    manager.putconn(connection)
+    connection.error = OperationalError("server closed the connection unexpectedly")
+    replacement = manager.getconn("mawn")
+    assert replacement is not connection
+    assert connection.closed
+    assert connection_is_healthy(replacement)
+
+def test_pool_is_bounded(opened):
+    manager = ConnectionPoolManager(maxconn=1, timeout=0.01)
+    connection = manager.getconn("mawn")
+    with pytest.raises(PoolError):
+        manager.getconn("mawn")
+    manager.putconn(connection, close=True)
+    assert connection.closed
+    assert manager.getconn("mawn") is not connection
+
+def test_putconn_resets_autocommit_and_closes_unpooled_connections(opened):
+    manager = ConnectionPoolManager(maxconn=1)
+    connection = manager.getconn("qcwrite")
+    connection.autocommit = True
+    manager.putconn(connection)
+    assert connection.autocommit is False
+
+    stray = FakeConnection()
+    manager.putconn(stray)
+    assert stray.closed
+
+def test_closeall(opened):
+    manager = ConnectionPoolManager()
+    manager.putconn(manager.getconn("mawn"))
+    manager.closeall()
+    assert opened[0].closed
+    manager.closeall()
+
+def test_get_pool_manager_is_per_process(monkeypatch):
+    manager = get_pool_manager()
+    assert get_pool_manager() is manager
+    monkeypatch.setattr(manager, "pid", -1)
+    assert get_pool_manager() is not manager
+    assert manager in dbs_pool._inherited_managers
@@ -0,0 +1,15 @@
+from ewx_utils.mawndb_classes.dew_point import DewPoint
+from ewx_utils.mawndb_classes.humidity import Humidity
+from ewx_utils.mawndb_classes.temperature import Temperature
+import datetime
+
+def test_dwpt_value_matches_object():
+    record_date = datetime.datetime(2023, 6, 1, 12)
+    dwpt_obj = DewPoint(Temperature(25, "C", record_date), Humidity(60, "PCT", record_date), record_date)
+    assert DewPoint.dwpt_value(25, 60, record_date.month) == dwpt_obj.dwptC
+
+def test_dwpt_value_invalid_humidity():
+    assert DewPoint.dwpt_value(25, 2, 6) == None
+
+def test_dwpt_value_invalid_temperature():
+    assert DewPoint.dwpt_value(45, 60, 1) == None
@@ -0,0 +1,104 @@
+from ewx_utils.main_hourly_scripts import hourly_main
+from tests.helpers import FakeCursor, FakePoolManager
+from argparse import Namespace
+import asyncio
+import threading
+
+WORK_ITEMS_BY_STATION = {
+    "aetna": [("aetna", "1997-01-01", "1997-12-31"), ("aetna", "1998-01-01", "1998-06-30")],
+    "albion": [("albion", "1998-01-01", "1998-12-31")],
+}
+
+def fake_process(qc_columns, mawn_records, rtma_records, begin_date, end_date):
+    if begin_date == "1998-01-01":
+        raise ValueError("bad records")
+    return mawn_records + rtma_records
+
+def patch_fetches(monkeypatch, barrier=None):
+    def fetch_records(cursor, station, begin, end, itersize=None):
+        if barrier:
+            # Both sources must be fetching at the same time to pass the barrier
+            barrier.wait()
+        return [{"date": begin, "source": cursor}]
+    monkeypatch.setattr(hourly_main, "get_insert_table_columns", lambda cursor, station: ["date", "time"])
+    monkeypatch.setattr(hourly_main, "fetch_records", fetch_records)
+    producer_cursors, released = [], []
+    def get_qcwrite_cursor(connection, name):
+        producer_cursors.append(FakeCursor(connection=connection))
+        return producer_cursors[-1]
+    manager = FakePoolManager()
+    monkeypatch.setattr(hourly_main, "get_qcwrite_cursor", get_qcwrite_cursor)
+    monkeypatch.setattr(hourly_main, "get_pool_manager", lambda: manager)
+    monkeypatch.setattr(hourly_main, "release_connection", released.append)
+    return producer_cursors, manager, released
+
+def run(args, process=fake_process, db_connections=None):
+    cursors = {"mawn": "mawn", "rtma": "rtma", "qcwrite": FakeCursor()}
+    db_connections = db_connections or {"qcwrite_connection": None}
+    return asyncio.run(hourly_main.run_stations_async(WORK_ITEMS_BY_STATION, db_connections, cursors, process, args))
+
+def test_async_runner_matches_sequential_results(monkeypatch):
+    patch_fetches(monkeypatch)
+    written = []
+    monkeypatch.setattr(hourly_main, "commit_and_rollback",
+                        lambda connection, station, records, page_size, bulk_copy: written.append((station, records)) or True)
+    args = Namespace(execute=True, page_size=10, bulk_copy=False, stream=False, itersize=None, write_to="mawnqc_test")
+    cursors = {"mawn": "mawn", "rtma": "rtma", "qcwrite": FakeCursor()}
+    sequential = [
+        hourly_main.process_station(station, work_items, {"qcwrite_connection": None}, cursors, fake_process, args)
+        for station, work_items in WORK_ITEMS_BY_STATION.items()
+    ]
+    sequential_writes, written[:] = list(written), []
+
+    results = run(args)
+
+    assert written == sequential_writes
+    assert [result["station"] for result in results] == ["aetna", "albion"]
+    for result, expected in zip(results, sequential):
+        assert (result["work_items"], result["records"], result["failures"]) == (expected["work_items"], expected["records"], expected["failures"])
+        assert result["stages"]["fetch_mawn"]["calls"] == expected["stages"]["fetch_mawn"]["calls"]
+        assert result["stages"]["fetch_rtma"]["rows"] == expected["stages"]["fetch_rtma"]["rows"]
+
+def test_async_runner_fetches_mawn_and_rtma_concurrently(monkeypatch):
+    producer_cursors, _, _ = patch_fetches(monkeypatch, threading.Barrier(2, timeout=5))
+    args = Namespace(execute=False, page_size=10, bulk_copy=False, stream=False, itersize=None, write_to="mawnqc_test")
+
+    results = run(args, process=lambda qc_columns, mawn, rtma, begin, end: mawn + rtma)
+
+    assert [result["records"] for result in results] == [4, 2]
+    assert [cursor.closed for cursor in producer_cursors] == [True]
+
+def test_async_runner_records_planning_failures(monkeypatch):
+    patch_fetches(monkeypatch)
+    plan_station = hourly_main.plan_station
+    def failing_plan(station, work_items, cursors, args, timer):
+        if station == "aetna":
+            raise RuntimeError("no columns")
+        return plan_station(station, work_items, cursors, args, timer)
+    monkeypatch.setattr(hourly_main, "plan_station", failing_plan)
+    args = Namespace(execute=False, page_size=10, bulk_copy=False, stream=False, itersize=None, write_to="mawnqc_test")
+
+    results = run(args)
+
+    assert results[0]["failures"] == ["plan: no columns"]
+    assert results[1]["failures"] == ["1998-01-01 to 1998-12-31: bad records"]
+
+def test_async_producer_reads_through_its_own_connection(monkeypatch):
+    producer_cursors, manager, released = patch_fetches(monkeypatch)
+    plan_cursors = []
+    plan_station = hourly_main.plan_station
+    def recording_plan(station, work_items, cursors, args, timer):
+        plan_cursors.append(cursors["qcwrite"])
+        return plan_station(station, work_items, cursors, args, timer)
+    monkeypatch.setattr(hourly_main, "plan_station", recording_plan)
+    write_connection = object()
+    args = Namespace(execute=False, page_size=10, bulk_copy=False, stream=False, itersize=None, write_to="mawnqc_test")
+
+    run(args, db_connections={"qcwrite_connection": write_connection})
+
+    [producer_connection] = manager.taken
+    assert producer_connection.section == "mawnqc_test"
+    assert producer_connection is not write_connection
+    assert plan_cursors == producer_cursors * 2
+    assert producer_cursors[0].connection is producer_connection
+    assert released == [producer_connection]
@@ -0,0 +1,43 @@
+from ewx_utils.hourly_validation_checks.hourly_calendar import hour_grid, hour_id_fields, year_grid
+from ewx_utils.hourly_validation_checks.hourly_time_utils import generate_list_of_hours
+from datetime import date, datetime, time
+import pytest
+
+def test_year_grid_covers_every_hour():
+    assert len(year_grid(2023)) == 8760
+    assert len(year_grid(2024)) == 8784
+    grid = year_grid(2024)
+    assert grid.datetimes[0] == datetime(2024, 1, 1, 0)
+    assert grid.datetimes[-1] == datetime(2024, 12, 31, 23)
+    assert year_grid(2024) is grid
+
+def test_midnight_is_hour_24_of_the_previous_day():
+    assert hour_id_fields(datetime(2024, 1, 1, 0)) == {"year": 2023, "day": 365, "hour": 24, "rpt_time": "2400"}
+    assert hour_id_fields(datetime(2024, 3, 1, 0)) == {"year": 2024, "day": 60, "hour": 24, "rpt_time": "2400"}
+    assert hour_id_fields(datetime(2024, 3, 1, 7)) == {"year": 2024, "day": 61, "hour": 7, "rpt_time": "700"}
+
+def test_id_fields_are_new_dictionaries():
+    fields = hour_id_fields(datetime(2023, 6, 1, 5))
+    fields["hour"] = 99
+    assert hour_id_fields(datetime(2023, 6, 1, 5))["hour"] == 5
+
+def test_hour_grid_spans_years():
+    grid = hour_grid("2023-12-31", "2024-01-01", now=datetime(2030, 1, 1))
+    assert len(grid) == 48
+    assert grid.datetimes[23] == datetime(2023, 12, 31, 23)
+    assert (grid.dates[24], grid.times[24]) == (date(2024, 1, 1), time(0))
+    assert grid.id_fields(24) == {"year": 2023, "day": 365, "hour": 24, "rpt_time": "2400"}
+
+def test_hour_grid_keeps_daylight_saving_days_at_24_hours():
+    assert len(hour_grid("2023-03-12", "2023-03-12", now=datetime(2030, 1, 1))) == 24
+    assert len(hour_grid("2023-11-05", "2023-11-05", now=datetime(2030, 1, 1))) == 24
+
+def test_hour_grid_stops_at_now():
+    grid = hour_grid("2023-06-01", "2023-06-02", now=datetime(2023, 6, 1, 5, 30))
+    assert grid.datetimes[-1] == datetime(2023, 6, 1, 5)
+    assert len(hour_grid("2023-06-02", "2023-06-03", now=datetime(2023, 6, 1, 5))) == 0
+
+def test_hour_grid_rejects_bad_dates():
+    with pytest.raises(ValueError):
+        hour_grid("not a date", "2023-06-01")
+    assert generate_list_of_hours("not a date", "2023-06-01") == []
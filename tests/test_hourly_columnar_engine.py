@@ -0,0 +1,65 @@
+import pytest
+np = pytest.importorskip("numpy")
+
+from ewx_utils.hourly_validation_checks.hourly_validation_utils import process_records
+from ewx_utils.hourly_validation_checks.hourly_columnar_engine import process_records_columnar, validate_column, MAWN, OOR, EMPTY, RELH_CAP
+from decimal import Decimal
+import datetime
+import random
+import copy
+
+VARIABLES = ["atmp", "relh", "pcpn", "rpet", "wspd", "wdir", "dwpt", "srad", "leaf0", "mstr0", "nrad", "volt", "lwin"]
+QC_COLUMNS = ["date", "time", "year", "day", "hour", "rpt_time"] + [c for v in VARIABLES for c in (v, v + "_src")]
+SPECIAL_VALUES = [None, -7999, 3, 100, 103, 105, 110, -5, 1250.0000001, Decimal("4500.0000001"), 1e6]
+
+def make_records(begin, hours, seed, drop):
+    rng = random.Random(seed)
+    records = []
+    for i in range(hours):
+        dt = begin + datetime.timedelta(hours=i)
+        if rng.random() < drop:
+            continue
+        record = {"id": i, "date": dt.date(), "time": dt.time(), "year": dt.year,
+                  "day": dt.timetuple().tm_yday, "hour": dt.hour or 24, "rpt_time": f"{dt.hour or 24}00"}
+        for variable in VARIABLES:
+            if rng.random() < 0.3:
+                record[variable] = rng.choice(SPECIAL_VALUES)
+            else:
+                value = round(rng.uniform(-10, 60), 3)
+                record[variable] = Decimal(str(value)) if rng.random() < 0.5 else value
+        if rng.random() < 0.3:
+            record["dwpt"] = None
+        records.append(record)
+    rng.shuffle(records)
+    return records
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_columnar_engine_matches_dict_pipeline(seed):
+    begin = datetime.datetime(2023, 3, 10, 1)
+    mawn_records = make_records(begin, 24 * 5, seed, drop=0.2)
+    rtma_records = make_records(begin, 24 * 5, seed + 100, drop=0.4)
+    expected = process_records(QC_COLUMNS, copy.deepcopy(mawn_records), copy.deepcopy(rtma_records), "2023-03-10", "2023-03-14")
+    actual = process_records_columnar(QC_COLUMNS, copy.deepcopy(mawn_records), copy.deepcopy(rtma_records), "2023-03-10", "2023-03-14")
+    assert actual == expected
+    assert [list(record) for record in actual] == [list(record) for record in expected]
+
+def test_columnar_engine_without_mawn_records():
+    rtma_records = make_records(datetime.datetime(2023, 6, 1, 1), 24, 7, drop=0.2)
+    expected = process_records(QC_COLUMNS, [], copy.deepcopy(rtma_records), "2023-06-01", "2023-06-01")
+    actual = process_records_columnar(QC_COLUMNS, [], copy.deepcopy(rtma_records), "2023-06-01", "2023-06-01")
+    assert actual == expected
+
+def test_validate_column_relh_codes():
+    values = np.array([None, -7999, 50, 103, 110, -1, 3], dtype=object)
+    hours = np.array([datetime.datetime(2023, 6, 1, 1)] * len(values), dtype=object)
+    months = np.full(len(values), 6)
+    validated, codes = validate_column("relh", values, months, hours, MAWN)
+    assert validated.tolist() == [None, None, 50, 100, None, None, 3]
+    assert codes.tolist() == [EMPTY, OOR, MAWN, RELH_CAP, OOR, EMPTY, OOR]
+
+def test_validate_column_monthly_temperature_bounds():
+    values = np.array([30, 30], dtype=object)
+    hours = np.array([datetime.datetime(2023, 1, 1, 1), datetime.datetime(2023, 7, 1, 1)], dtype=object)
+    validated, codes = validate_column("atmp", values, np.array([1, 7]), hours, MAWN)
+    assert validated.tolist() == [None, 30]
+    assert codes.tolist() == [OOR, MAWN]
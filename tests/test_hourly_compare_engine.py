@@ -0,0 +1,123 @@
+import pytest
+np = pytest.importorskip("numpy")
+
+from ewx_utils.main_hourly_scripts.hourly_utility import compare_records
+from ewx_utils.main_hourly_scripts.hourly_compare_engine import compare_records_columnar, write_mismatch_reports
+from ewx_utils.main_hourly_scripts.hourly_reports import ReportWriter
+from tests.helpers import make_record
+from datetime import date, time, timedelta
+from decimal import Decimal
+import copy
+import csv
+import random
+
+COLUMNS = ["atmp", "relh", "srad", "dwpt", "vapr", "volt", "wspd", "stmp_05cm", "polyatmp"]
+SOURCES = ["MAWN", "RTMA", "EMPTY", "OOR", "RELH_CAP", None]
+SPECIAL_VALUES = [None, -7999, 0, 100, 103, 20.1, Decimal("20.1"), 123456.7]
+
+def make_compared_record(day, hour, **values):
+    # compare_records keys on id and reads year
+    return make_record(hour, day, id=hour, year=day.year, **values)
+
+def make_records(seed, days):
+    rng = random.Random(seed)
+    records = []
+    for i in range(days * 24):
+        day = date(2016, 12, 30) + timedelta(days=i // 24 * 200)
+        values = {}
+        for column in COLUMNS:
+            values[column] = rng.choice(SPECIAL_VALUES) if rng.random() < 0.3 else round(rng.uniform(-10, 500), rng.choice([1, 3, 6]))
+            values[f"{column}_src"] = rng.choice(SOURCES)
+        # compare_records fails on an EMPTY poly*_src test value, see test_poly_src_rule
+        if values["polyatmp_src"] == "EMPTY":
+            values["polyatmp_src"] = "MAWN"
+        records.append(make_compared_record(day, i % 24, **values))
+    return records
+
+def perturb(records, seed):
+    rng = random.Random(seed)
+    perturbed = []
+    for record in records:
+        if rng.random() < 0.05:
+            continue
+        record = dict(record, id=record["id"] + 1000)
+        for column in COLUMNS:
+            if rng.random() < 0.3 and isinstance(record[column], float):
+                record[column] *= 1 + rng.choice([0.0004999, 0.0005, 0.00050001, -0.0005, 0.001])
+            elif rng.random() < 0.1:
+                record[f"{column}_src"] = rng.choice(SOURCES)
+        # compare_records fails on capped humidity compared with a missing value
+        if record["relh"] is None:
+            record["relh"] = 100
+        perturbed.append(record)
+    return perturbed
+
+@pytest.mark.parametrize("seed", range(3))
+def test_columnar_matches_compare_records(seed, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    test_records = make_records(seed, 40)
+    supercell_records = perturb(test_records, seed + 10)
+    supercell_records.append(make_compared_record(date(2030, 1, 1), 1, **{column: 1.0 for column in COLUMNS}))
+
+    expected = compare_records(copy.deepcopy(test_records), copy.deepcopy(supercell_records))
+    only_in_test, only_in_supercell, mismatches, margin_values = compare_records_columnar(test_records, supercell_records)
+
+    assert (only_in_test, only_in_supercell, mismatches) == expected
+    assert mismatches
+    with open("srad_values.csv", newline="") as srad_file:
+        expected_margin_values = list(csv.reader(srad_file))[1:]
+    assert [["" if value is None else str(value) for value in values] for values in margin_values] == expected_margin_values
+
+def test_equivalence_rules():
+    day = date(2023, 6, 1)
+    test_records = [
+        make_compared_record(day, 1, relh=100, relh_src="RELH_CAP", dwpt=5.0, dwpt_src="RTMA", volt_src="EMPTY"),
+        make_compared_record(day, 2, polyatmp_src="EMPTY", stmp_05cm_src="EMPTY", wspd=-7999, wspd_src="OOR", vapr=1.0),
+    ]
+    supercell_records = [
+        make_compared_record(day, 1, relh=104.0, relh_src="MAWN", dwpt=None, dwpt_src=None, volt_src="OOR"),
+        make_compared_record(day, 2, polyatmp_src="OOR", stmp_05cm_src=None, wspd=None, wspd_src="OOR", vapr=2.0),
+    ]
+    assert compare_records_columnar(test_records, supercell_records)[2] == []
+
+    # vapr is compared from September 2024 on, and _src columns from 2017 on
+    later = [dict(record, date=date(2024, 9, 1)) for record in test_records]
+    later_supercell = [dict(record, date=date(2024, 9, 1)) for record in supercell_records]
+    assert [m[2] for m in compare_records_columnar(later, later_supercell)[2]] == ["vapr"]
+    older = [dict(record, year=2016) for record in test_records]
+    older[0]["volt_src"] = "MAWN"
+    assert compare_records_columnar(older, [dict(record, year=2016) for record in supercell_records])[2] == []
+
+def test_poly_src_rule():
+    day = date(2023, 6, 1)
+    test_records = [make_compared_record(day, 1, polyatmp_src="EMPTY"), make_compared_record(day, 2, polyatmp_src="EMPTY"),
+                    make_compared_record(day, 3, polystmp1_src="MAWN")]
+    supercell_records = [make_compared_record(day, 1, polyatmp_src="OOR"), make_compared_record(day, 2, polyatmp_src="MAWN"),
+                         make_compared_record(day, 3, polystmp1_src="OOR")]
+    mismatches = compare_records_columnar(test_records, supercell_records)[2]
+    assert [(m[0]["time"], m[2]) for m in mismatches] == [(time(2), "polyatmp_src"), (time(3), "polystmp1_src")]
+    # compare_records only agrees on rows without an EMPTY test value
+    assert compare_records(test_records[2:], supercell_records[2:])[2] == compare_records_columnar(test_records[2:], supercell_records[2:])[2]
+    with pytest.raises(TypeError):
+        compare_records(test_records[:1], supercell_records[:1])
+
+def test_margin_boundary():
+    day = date(2023, 6, 1)
+    test_records = [make_compared_record(day, 1, srad=100.05, srad_src="MAWN"), make_compared_record(day, 2, srad=100.051, srad_src="MAWN"),
+                    make_compared_record(day, 3, srad=None, srad_src="MAWN")]
+    supercell_records = [make_compared_record(day, 1, srad=100.0, srad_src="MAWN"), make_compared_record(day, 2, srad=100.0, srad_src="MAWN"),
+                         make_compared_record(day, 3, srad=1.0, srad_src="MAWN")]
+    _, _, mismatches, margin_values = compare_records_columnar(test_records, supercell_records)
+    assert [(m[0]["time"], m[2]) for m in mismatches] == [(time(2), "srad"), (time(3), "srad")]
+    assert "id" not in mismatches[0][0]
+    assert margin_values == [(Decimal("100.051"), Decimal("100.000")), (None, Decimal("1.00000"))]
+
+def test_write_mismatch_reports(tmp_path):
+    day = date(2023, 6, 1)
+    mismatches = [[{"date": day, "time": time(1), "wspd": 1}, {"date": day, "time": time(1), "wspd": 0}, "wspd"],
+                  [{"date": day, "time": time(2), "srad": 5.0}, {"date": day, "time": time(2), "srad": 6.0}, "srad"]]
+    with ReportWriter(str(tmp_path)) as reports:
+        write_mismatch_reports(reports, mismatches, [(Decimal("5.00000"), Decimal("6.00000"))])
+    assert list(csv.reader((tmp_path / "general_mismatches.csv").open())) == [
+        ["Date", "Time", "Column Name", "Test Value", "Supercell Value"], ["2023-06-01", "01:00:00", "wspd", "1", "0"]]
+    assert list(csv.reader((tmp_path / "srad_values.csv").open())) == [["Test Value", "Supercell Value"], ["5.00000", "6.00000"]]
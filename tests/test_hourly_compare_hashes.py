@@ -0,0 +1,80 @@
+from ewx_utils.main_hourly_scripts import hourly_compare_hashes
+from ewx_utils.main_hourly_scripts.hourly_compare_hashes import (
+    drop_identical_records,
+    fetch_differing_records,
+    fetch_records_by_keys,
+    fetch_row_hashes,
+    keys_to_compare,
+    shared_columns,
+)
+from ewx_utils.main_hourly_scripts.hourly_utility import compare_records
+from tests.helpers import DAY, FakeCursor
+from datetime import time
+import random
+
+def make_records(seed):
+    rng = random.Random(seed)
+    records = []
+    for hour in range(24):
+        records.append({"id": hour, "date": DAY, "time": time(hour), "year": 2023, "wspd": rng.choice([1.0, 2.0]),
+                        "srad": rng.choice([None, 100.0, 100.04]), "srad_src": rng.choice(["MAWN", "EMPTY"])})
+    return records
+
+def test_shared_columns():
+    assert shared_columns(["id", "date", "time", "wspd", "volt"], ["id", "date", "time", "volt", "lwin"]) == ["date", "time", "volt"]
+
+def test_drop_identical_records_keeps_compare_records_results(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    test_records = make_records(1)
+    supercell_records = [dict(record, id=record["id"] + 100) for record in make_records(1)]
+    for record in supercell_records[::3]:
+        record["wspd"] += 1
+    supercell_records[5]["srad"] = 100.0 if supercell_records[5]["srad"] != 100.0 else 100.04
+    del supercell_records[7]
+
+    kept_test, kept_supercell, identical = drop_identical_records(test_records, supercell_records)
+
+    assert 0 < identical < 23
+    assert all(record["srad"] is not None for record in test_records if record not in kept_test)
+    assert compare_records(kept_test, kept_supercell) == compare_records(test_records, supercell_records)
+
+def test_keys_to_compare():
+    keys = [(DAY, time(hour)) for hour in range(4)]
+    test_hashes = {keys[0]: ("a", False), keys[1]: ("b", False), keys[2]: ("c", True), keys[3]: ("d", False)}
+    supercell_hashes = {keys[0]: ("a", False), keys[1]: ("x", False), keys[2]: ("c", True)}
+    assert keys_to_compare(test_hashes, supercell_hashes) == (keys[1:], keys[1:3], 1)
+
+def test_fetch_row_hashes_hashes_the_shared_columns():
+    cursor = FakeCursor([{"date": DAY, "time": time(1), "row_hash": "abc", "missing_margin": False}])
+    hashes = fetch_row_hashes(cursor, "aetna_hourly", ["date", "time", "srad", "relh", "wspd"], "2023-06-01", "2023-06-02")
+    assert hashes == {(DAY, time(1)): ("abc", False)}
+    query, params = cursor.executed[0]
+    assert "md5(row(date, time, srad, relh, wspd)::text) AS row_hash, (srad IS NULL OR relh IS NULL) AS missing_margin" in query
+    assert params == ("2023-06-01", "2023-06-02")
+
+def test_fetch_records_by_keys_in_batches():
+    cursor = FakeCursor([{"date": DAY, "time": time(1)}])
+    keys = [(DAY, time(hour)) for hour in range(5)]
+    records = fetch_records_by_keys(cursor, "aetna_hourly", keys, batch_size=2)
+    assert len(records) == 3
+    assert [params for _, params in cursor.executed] == [
+        ([DAY, DAY], [time(0), time(1)]), ([DAY, DAY], [time(2), time(3)]), ([DAY], [time(4)])]
+    assert fetch_records_by_keys(cursor, "aetna_hourly", []) == []
+
+def test_fetch_differing_records(monkeypatch):
+    hashes = {
+        "test": {(DAY, time(1)): ("a", False), (DAY, time(2)): ("b", False)},
+        "supercell": {(DAY, time(1)): ("a", False), (DAY, time(2)): ("c", False), (DAY, time(3)): ("d", False)},
+    }
+    monkeypatch.setattr(hourly_compare_hashes, "fetch_row_hashes", lambda cursor, table, columns, begin, end: hashes[cursor.name])
+    fetched = []
+    monkeypatch.setattr(hourly_compare_hashes, "fetch_records_by_keys",
+                        lambda cursor, table, keys: fetched.append((cursor.name, keys)) or [{"time": key[1]} for key in keys])
+    test_cursor, supercell_cursor = FakeCursor(columns=["id", "date", "time", "wspd"]), FakeCursor(columns=["id", "date", "time"])
+    test_cursor.name, supercell_cursor.name = "test", "supercell"
+
+    test_records, supercell_records, identical = fetch_differing_records(test_cursor, supercell_cursor, "aetna_hourly", "2023-06-01", "2023-06-01")
+
+    assert identical == 1
+    assert fetched == [("test", [(DAY, time(2))]), ("supercell", [(DAY, time(2)), (DAY, time(3))])]
+    assert [record["time"] for record in supercell_records] == [time(2), time(3)]
@@ -0,0 +1,76 @@
+from ewx_utils.main_hourly_scripts import hourly_utility
+from tests.helpers import FakePoolManager
+from argparse import Namespace
+from collections import Counter
+from datetime import date, time
+import csv
+
+RECORD = {"id": 1, "date": date(2023, 6, 1), "time": time(1), "year": 2023, "wspd": 1.0, "atmp": 20.0, "atmp_src": "MAWN"}
+TEST_RECORDS = [RECORD, dict(RECORD, time=time(2))]
+SUPERCELL_RECORDS = [dict(RECORD, wspd=2.0, atmp=25.0), dict(RECORD, time=time(3))]
+
+def make_args(tmp_path, **overrides):
+    args = Namespace(begin="2023-06-01", end="2023-06-01", test_section="mawnqc_test", supercell_section="mawnqc",
+                     engine="dict", trace_comparisons=False, report_dir=str(tmp_path), report_format="csv", workers=1,
+                     precheck="none")
+    for name, value in overrides.items():
+        setattr(args, name, value)
+    return args
+
+def patch_databases(monkeypatch, failing=()):
+    released = []
+    manager = FakePoolManager()
+    monkeypatch.setattr(hourly_utility, "get_pool_manager", lambda: manager)
+    monkeypatch.setattr(hourly_utility, "get_mawnqc_cursor", lambda connection, section: connection.section)
+    monkeypatch.setattr(hourly_utility, "release_connection", released.append)
+    def fetch_records_by_date(cursor, station, begin, end):
+        if station in failing:
+            raise RuntimeError(f"relation {station} does not exist")
+        return [dict(record) for record in (TEST_RECORDS if cursor == "mawnqc_test" else SUPERCELL_RECORDS)]
+    monkeypatch.setattr(hourly_utility, "fetch_records_by_date", fetch_records_by_date)
+    return manager, released
+
+def test_compare_station_counts_and_releases_connections(tmp_path, monkeypatch):
+    manager, released = patch_databases(monkeypatch)
+    with hourly_utility.ReportWriter(str(tmp_path)) as reports:
+        result = hourly_utility.compare_station(make_args(tmp_path), "aetna_hourly", reports)
+    assert result == {"station": "aetna_hourly", "only_in_test": 1, "only_in_supercell": 1,
+                      "mismatches": Counter({"wspd": 1, "atmp": 1}), "failures": []}
+    assert released == manager.taken
+    assert [connection.section for connection in released] == ["mawnqc_test", "mawnqc"]
+
+def test_run_station_comparisons_writes_reports_per_station(tmp_path, monkeypatch):
+    patch_databases(monkeypatch, failing=("albion_hourly",))
+    args = make_args(tmp_path)
+
+    results = hourly_utility.run_station_comparisons(args, ["aetna_hourly", "albion_hourly"])
+
+    assert [result["station"] for result in results] == ["aetna_hourly", "albion_hourly"]
+    assert results[1]["failures"] == ["relation albion_hourly does not exist"]
+    rows = list(csv.reader((tmp_path / "aetna_hourly" / "general_mismatches.csv").open()))
+    assert [row[2] for row in rows[1:]] == ["wspd"]
+
+def test_write_comparison_summary(tmp_path):
+    results = [
+        {"station": "aetna_hourly", "only_in_test": 1, "only_in_supercell": 2, "mismatches": Counter({"wspd": 3, "atmp": 1}), "failures": []},
+        {"station": "albion_hourly", "only_in_test": 0, "only_in_supercell": 0, "mismatches": Counter({"wspd": 1}), "failures": ["worker: lost"]},
+    ]
+    with hourly_utility.ReportWriter(str(tmp_path)) as reports:
+        summary = hourly_utility.write_comparison_summary(reports, results)
+
+    assert summary == {"stations": 2, "only_in_test": 1, "only_in_supercell": 2, "mismatches": {"wspd": 4, "atmp": 1},
+                       "failed_stations": {"albion_hourly": ["worker: lost"]}}
+    assert list(csv.reader((tmp_path / "comparison_summary.csv").open())) == [
+        ["Station", "Only In Test", "Only In Supercell", "Mismatches", "Failures"],
+        ["aetna_hourly", "1", "2", "4", ""],
+        ["albion_hourly", "0", "0", "1", "worker: lost"],
+    ]
+    assert list(csv.reader((tmp_path / "comparison_mismatches_by_column.csv").open()))[1:] == [
+        ["aetna_hourly", "atmp", "1"], ["aetna_hourly", "wspd", "3"], ["albion_hourly", "wspd", "1"]]
+
+def test_compare_station_python_precheck_gives_the_same_result(tmp_path, monkeypatch):
+    patch_databases(monkeypatch)
+    with hourly_utility.ReportWriter(str(tmp_path)) as reports:
+        full = hourly_utility.compare_station(make_args(tmp_path), "aetna_hourly", reports)
+        prechecked = hourly_utility.compare_station(make_args(tmp_path, precheck="python"), "aetna_hourly", reports)
+    assert prechecked == full
@@ -0,0 +1,82 @@
+from ewx_utils.db_files.dbs_watermark import read_watermark, write_watermark
+from ewx_utils.main_hourly_scripts import hourly_main
+from tests.helpers import FakeConnection, FakeCursor
+from argparse import Namespace
+from datetime import date, datetime, time
+
+NOW = datetime(2024, 6, 10, 5, 30)
+WORK_ITEMS = [("aetna", "2024-06-01", "2024-06-10")]
+
+def test_date_runs():
+    days = [date(2024, 6, 3), date(2024, 6, 1), date(2024, 6, 2), date(2024, 6, 2), date(2024, 6, 7)]
+    assert hourly_main.date_runs(days) == [(date(2024, 6, 1), date(2024, 6, 3)), (date(2024, 6, 7), date(2024, 6, 7))]
+    assert hourly_main.date_runs([]) == []
+
+def test_plan_without_watermark_keeps_every_hour():
+    work_items, hours, last_hour = hourly_main.plan_incremental_work("aetna", WORK_ITEMS, None, set(), now=NOW)
+    assert work_items == WORK_ITEMS
+    assert hours is None
+    assert last_hour == datetime(2024, 6, 10, 5)
+
+def test_plan_keeps_new_and_changed_hours():
+    watermark = {"last_hour": datetime(2024, 6, 9, 22), "mawn_max_id": 10, "rtma_max_id": 20}
+    changed = {(date(2024, 6, 3), time(7)), (date(2024, 5, 1), time(7))}
+
+    work_items, hours, last_hour = hourly_main.plan_incremental_work("aetna", WORK_ITEMS, watermark, changed, now=NOW)
+
+    assert work_items == [("aetna", "2024-06-03", "2024-06-03"), ("aetna", "2024-06-09", "2024-06-10")]
+    # 23:00 on June 9 and 00:00 through 05:00 on June 10; changed hours outside the range are left out
+    assert len(hours) == 1 + 1 + 6
+    assert (date(2024, 6, 3), time(7)) in hours
+    assert (date(2024, 5, 1), time(7)) not in hours
+    assert last_hour == datetime(2024, 6, 10, 5)
+
+def test_plan_without_changes_has_no_work():
+    watermark = {"last_hour": datetime(2024, 6, 10, 5), "mawn_max_id": 10, "rtma_max_id": 20}
+    assert hourly_main.plan_incremental_work("aetna", WORK_ITEMS, watermark, set(), now=NOW) == ([], set(), datetime(2024, 6, 10, 5))
+
+def test_fetch_changed_hours_is_bounded_by_ids():
+    cursor = FakeCursor(results=[[{"date": date(2024, 6, 3), "time": time(7)}]])
+    assert hourly_main.fetch_changed_hours(cursor, "aetna", 10, 12) == {(date(2024, 6, 3), time(7))}
+    assert cursor.executed[0][1] == (10, 12)
+    assert hourly_main.fetch_changed_hours(cursor, "aetna", 12, 12) == set()
+    assert hourly_main.fetch_changed_hours(cursor, "aetna", 12, None) == set()
+    assert len(cursor.executed) == 1
+
+def test_read_watermark():
+    assert read_watermark(FakeCursor(results=[{"table_exists": False}]), "aetna") is None
+    row = {"last_hour": datetime(2024, 6, 9, 22), "mawn_max_id": 10, "rtma_max_id": 20}
+    assert read_watermark(FakeCursor(results=[{"table_exists": True}, row]), "aetna") == row
+    assert read_watermark(FakeCursor(results=[{"table_exists": True}, None]), "aetna") is None
+
+def test_write_watermark_only_moves_forward():
+    cursor = FakeCursor(results=[])
+    write_watermark(cursor, "aetna", datetime(2024, 6, 10, 5), 11, 21)
+    query, params = cursor.executed[0]
+    assert "ON CONFLICT (station)" in query
+    assert "GREATEST(hourly_qc_watermarks.last_hour, EXCLUDED.last_hour)" in query
+    assert params == ("aetna", datetime(2024, 6, 10, 5), 11, 21)
+
+def test_process_station_writes_new_hours_and_moves_watermark(monkeypatch):
+    monkeypatch.setattr(hourly_main, "get_insert_table_columns", lambda cursor, station: ["date", "time"])
+    monkeypatch.setattr(hourly_main, "fetch_records", lambda cursor, station, begin, end, itersize=None: [])
+    hours = {(date(2024, 6, 10), time(5))}
+    monkeypatch.setattr(hourly_main, "plan_station_increment", lambda station, work_items, cursors: (
+        [("aetna", "2024-06-10", "2024-06-10")], hours, datetime(2024, 6, 10, 5), {"mawn": 11, "rtma": 21}))
+    written = []
+    monkeypatch.setattr(hourly_main, "commit_and_rollback",
+                        lambda connection, station, records, page_size, bulk_copy: written.extend(records) or True)
+    moved = []
+    monkeypatch.setattr(hourly_main, "write_watermark", lambda *args: moved.append(args))
+    process = lambda qc_columns, mawn, rtma, begin, end: [
+        {"date": date(2024, 6, 10), "time": time(4)}, {"date": date(2024, 6, 10), "time": time(5)}]
+    args = Namespace(execute=True, page_size=10, bulk_copy=False, stream=False, itersize=None, incremental=True)
+    connection = FakeConnection()
+    cursors = {"mawn": object(), "rtma": object(), "qcwrite": object()}
+
+    result = hourly_main.process_station("aetna", WORK_ITEMS, {"qcwrite_connection": connection}, cursors, process, args)
+
+    assert written == [{"date": date(2024, 6, 10), "time": time(5)}]
+    assert result["records"] == 1
+    assert moved == [(cursors["qcwrite"], "aetna", datetime(2024, 6, 10, 5), 11, 21)]
+    assert connection.commits == 1
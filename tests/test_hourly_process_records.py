@@ -0,0 +1,42 @@
+from ewx_utils.hourly_validation_checks.hourly_validation_utils import (
+    index_records_by_hour,
+    process_records,
+)
+from tests.helpers import DAY, make_record
+import datetime
+
+QC_COLUMNS = ["date", "time", "year", "day", "hour", "rpt_time", "atmp", "atmp_src", "relh", "relh_src"]
+
+def make_qc_record(hour, atmp, relh, day=DAY):
+    record = make_record(hour, day, year=day.year, rpt_time=f"{hour}00", atmp=atmp, relh=relh)
+    record.update({"day": day.timetuple().tm_yday, "hour": hour})
+    return record
+
+def test_index_records_by_hour_keys():
+    records = [make_qc_record(1, 20, 50), make_qc_record(2, 21, 55)]
+    index = index_records_by_hour(records)
+    assert set(index.keys()) == {
+        (datetime.date(2023, 6, 1), datetime.time(1)),
+        (datetime.date(2023, 6, 1), datetime.time(2)),
+    }
+
+def test_index_records_by_hour_keeps_first_duplicate():
+    first = make_qc_record(1, 20, 50)
+    second = make_qc_record(1, 25, 60)
+    index = index_records_by_hour([first, second])
+    assert index[(datetime.date(2023, 6, 1), datetime.time(1))] is first
+
+def test_process_records_joins_mawn_and_rtma():
+    mawn_records = [make_qc_record(1, 20, None), make_qc_record(3, 22, 60)]
+    rtma_records = [make_qc_record(1, 19, 70), make_qc_record(2, 18, 75)]
+    clean_records = process_records(QC_COLUMNS, mawn_records, rtma_records, "2023-06-01", "2023-06-01")
+    by_hour = {record["time"]: record for record in clean_records}
+
+    assert len(clean_records) == 24
+    assert by_hour[datetime.time(1)]["atmp_src"] == "MAWN"
+    assert by_hour[datetime.time(1)]["relh"] == 70
+    assert by_hour[datetime.time(1)]["relh_src"] == "RTMA"
+    assert by_hour[datetime.time(2)]["atmp"] == 18
+    assert by_hour[datetime.time(2)]["atmp_src"] == "RTMA"
+    assert by_hour[datetime.time(3)]["relh_src"] == "MAWN"
+    assert by_hour[datetime.time(4)]["atmp_src"] == "EMPTY"
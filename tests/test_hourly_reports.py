@@ -0,0 +1,60 @@
+from ewx_utils.main_hourly_scripts import hourly_reports
+from ewx_utils.main_hourly_scripts.hourly_reports import ReportWriter
+from ewx_utils.main_hourly_scripts.hourly_utility import compare_records
+from datetime import date, time
+from decimal import Decimal
+import builtins
+import csv
+import gzip
+import pytest
+
+HEADER = ["Date", "Value"]
+
+def test_reports_are_opened_once_and_buffered(tmp_path, monkeypatch):
+    opened = []
+    real_open = builtins.open
+    monkeypatch.setattr(builtins, "open", lambda path, *args, **kwargs: opened.append(path) or real_open(path, *args, **kwargs))
+    reports = ReportWriter(str(tmp_path), buffer_rows=2)
+    for value in range(5):
+        reports.write_row("values", HEADER, [date(2023, 6, 1), value])
+    report = reports.reports["values"]
+    assert (report.written, len(report.rows)) == (4, 1)
+    reports.close()
+    assert opened == [str(tmp_path / "values.csv")]
+    rows = list(csv.reader((tmp_path / "values.csv").open()))
+    assert rows == [HEADER] + [["2023-06-01", str(value)] for value in range(5)]
+
+def test_gzip_reports(tmp_path):
+    with ReportWriter(str(tmp_path), "gzip") as reports:
+        reports.write_rows("values", HEADER, [["2023-06-01", None], ["2023-06-02", Decimal("1.5")]])
+        reports.report("empty", HEADER)
+    with gzip.open(tmp_path / "values.csv.gz", "rt", newline="") as report_file:
+        assert list(csv.reader(report_file)) == [HEADER, ["2023-06-01", ""], ["2023-06-02", "1.5"]]
+    with gzip.open(tmp_path / "empty.csv.gz", "rt", newline="") as report_file:
+        assert list(csv.reader(report_file)) == [HEADER]
+
+def test_parquet_reports(tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    with ReportWriter(str(tmp_path), "parquet", buffer_rows=1) as reports:
+        reports.write_rows("values", HEADER, [[date(2023, 6, 1), None], [date(2023, 6, 2), Decimal("1.5")]])
+    assert parquet.read_table(tmp_path / "values.parquet").to_pydict() == {"Date": ["2023-06-01", "2023-06-02"], "Value": [None, "1.5"]}
+
+def test_unknown_or_unavailable_formats(monkeypatch):
+    with pytest.raises(ValueError):
+        ReportWriter(report_format="xlsx")
+    monkeypatch.setattr(hourly_reports, "pyarrow", None)
+    with pytest.raises(ValueError):
+        ReportWriter(report_format="parquet")
+
+def test_comparison_trace_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    record = {"id": 1, "date": date(2023, 6, 1), "time": time(1), "year": 2023, "srad": 100.0, "srad_src": "MAWN", "wspd": 1.0}
+    compare_records([record], [dict(record, srad=101.0, wspd=2.0)])
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["general_mismatches.csv", "srad_values.csv"]
+    assert list(csv.reader(open("srad_values.csv"))) == [["Test Value", "Supercell Value"], ["100.000", "101.000"]]
+
+    with ReportWriter(str(tmp_path / "traced")) as reports:
+        compare_records([record], [dict(record, srad=101.0)], reports, trace=True)
+    rows = list(csv.reader((tmp_path / "traced" / "comparison_results.csv").open()))
+    assert rows[0] == hourly_reports.COMPARISON_TRACE_HEADER
+    assert rows[1][-1] == "False"
@@ -0,0 +1,25 @@
+from ewx_utils.main_hourly_scripts.hourly_main import group_records_by_keys, upsert_records
+from tests.helpers import FakeCursor, make_record
+
+def test_upsert_records_batches_pages():
+    cursor = FakeCursor()
+    records = [make_record(hour, atmp=20, atmp_src="MAWN") for hour in range(24)]
+    upsert_records(cursor, "aetna", records, page_size=10)
+    assert len(cursor.statements) == 3
+    assert cursor.statements[0].startswith("INSERT INTO aetna_hourly (date, time, atmp, atmp_src) VALUES (")
+    assert cursor.statements[0].endswith(
+        "ON CONFLICT (date, time) DO UPDATE SET atmp = EXCLUDED.atmp, atmp_src = EXCLUDED.atmp_src"
+    )
+
+def test_upsert_records_skips_id_column():
+    cursor = FakeCursor()
+    upsert_records(cursor, "aetna", [make_record(1, id=5, atmp=20)])
+    assert cursor.statements[0].startswith("INSERT INTO aetna_hourly (date, time, atmp) VALUES (")
+
+def test_upsert_records_groups_by_columns():
+    cursor = FakeCursor()
+    records = [make_record(1, atmp=20), make_record(2, atmp=21, relh=50), make_record(3, atmp=22)]
+    assert list(group_records_by_keys(records).keys()) == [("date", "time", "atmp"), ("date", "time", "atmp", "relh")]
+    upsert_records(cursor, "aetna", records)
+    assert len(cursor.statements) == 2
+    assert "relh" not in cursor.statements[0]
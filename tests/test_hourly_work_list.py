@@ -0,0 +1,42 @@
+from ewx_utils.main_hourly_scripts.hourly_main import year_chunks, read_work_list, build_work_items
+import pytest
+
+STATION_INFO = {
+    "aetna": {"active": True, "bg_date": ["1997-05-10"], "ed_date": ["2024-10-01"]},
+    "albion": {"active": False, "bg_date": ["1996-01-01"], "ed_date": ["1998-03-31"]},
+    "casco": {"active": False, "bg_date": [], "ed_date": []},
+}
+
+def test_year_chunks_split_on_calendar_years():
+    assert year_chunks("1996-06-01", "1998-02-15") == [
+        ("1996-06-01", "1996-12-31"),
+        ("1997-01-01", "1997-12-31"),
+        ("1998-01-01", "1998-02-15"),
+    ]
+    assert year_chunks("2023-03-01", "2023-03-02") == [("2023-03-01", "2023-03-02")]
+
+def test_read_work_list(tmp_path):
+    work_list = tmp_path / "work.txt"
+    work_list.write_text("# station year\naetna 1997\n\nalbion,1998\n")
+    assert read_work_list(str(work_list)) == [("aetna", 1997), ("albion", 1998)]
+
+def test_read_work_list_rejects_invalid_lines(tmp_path):
+    work_list = tmp_path / "work.txt"
+    work_list.write_text("aetna\n")
+    with pytest.raises(ValueError):
+        read_work_list(str(work_list))
+
+def test_build_work_items_clips_to_station_dates():
+    work = [
+        ("aetna", "1996-01-01", "1998-12-31"),
+        ("albion", "1996-01-01", "1998-12-31"),
+        ("casco", "1996-01-01", "1998-12-31"),
+        ("unknown", "1996-01-01", "1998-12-31"),
+    ]
+    assert build_work_items(work, STATION_INFO) == [
+        ("aetna", "1997-05-10", "1997-12-31"),
+        ("aetna", "1998-01-01", "1998-12-31"),
+        ("albion", "1996-01-01", "1996-12-31"),
+        ("albion", "1997-01-01", "1997-12-31"),
+        ("albion", "1998-01-01", "1998-03-31"),
+    ]
@@ -0,0 +1,79 @@
+from ewx_utils.main_hourly_scripts import hourly_main
+from tests.helpers import FakeCursor
+from argparse import Namespace
+import pytest
+
+WORK_ITEMS = [("aetna", "1997-01-01", "1997-12-31"), ("aetna", "1998-01-01", "1998-06-30"), ("albion", "1998-01-01", "1998-12-31")]
+
+def fake_process(qc_columns, mawn_records, rtma_records, begin_date, end_date):
+    if begin_date == "1998-01-01":
+        raise ValueError("bad records")
+    return [{"date": begin_date}, {"date": end_date}]
+
+def test_group_work_items_by_station():
+    grouped = hourly_main.group_work_items_by_station(WORK_ITEMS)
+    assert list(grouped) == ["aetna", "albion"]
+    assert grouped["aetna"] == WORK_ITEMS[:2]
+
+def test_process_station_collects_failures(monkeypatch):
+    monkeypatch.setattr(hourly_main, "get_insert_table_columns", lambda cursor, station: ["date", "time"])
+    monkeypatch.setattr(hourly_main, "fetch_records", lambda cursor, station, begin, end, itersize=None: [])
+    written = []
+    monkeypatch.setattr(hourly_main, "commit_and_rollback",
+                        lambda connection, station, records, page_size, bulk_copy: written.append(records) or True)
+    args = Namespace(execute=True, page_size=10, bulk_copy=False, stream=False, itersize=None)
+    cursors = {"mawn": object(), "rtma": object(), "qcwrite": object()}
+
+    result = hourly_main.process_station("aetna", WORK_ITEMS[:2], {"qcwrite_connection": None}, cursors, fake_process, args)
+
+    assert result["work_items"] == 1
+    assert result["records"] == 2
+    assert len(written) == 1
+    assert result["failures"] == ["1998-01-01 to 1998-06-30: bad records"]
+    assert result["stages"]["process_records"]["calls"] == 2
+    assert result["stages"]["commit_and_rollback"]["rows"] == 2
+
+def test_process_station_counts_rolled_back_writes_as_failures(monkeypatch):
+    monkeypatch.setattr(hourly_main, "get_insert_table_columns", lambda cursor, station: ["date", "time"])
+    monkeypatch.setattr(hourly_main, "fetch_records", lambda cursor, station, begin, end, itersize=None: [])
+    monkeypatch.setattr(hourly_main, "commit_and_rollback", lambda *args: False)
+    args = Namespace(execute=True, page_size=10, bulk_copy=False, stream=False, itersize=None)
+    cursors = {"mawn": object(), "rtma": object(), "qcwrite": object()}
+
+    result = hourly_main.process_station("aetna", WORK_ITEMS[:1], {"qcwrite_connection": None}, cursors, fake_process, args)
+
+    assert result["work_items"] == 0
+    assert result["failures"] == ["1997-01-01 to 1997-12-31: transaction rolled back"]
+
+def test_summarize_results():
+    summary = hourly_main.summarize_results([
+        {"station": "aetna", "work_items": 2, "records": 48, "failures": []},
+        {"station": "albion", "work_items": 0, "records": 0, "failures": ["worker: no connection"]},
+    ])
+    assert summary == {"stations": 2, "work_items": 2, "records": 48, "failed_stations": {"albion": ["worker: no connection"]}}
+
+def failing_cursor():
+    return FakeCursor(error=RuntimeError("current transaction is aborted"))
+
+def test_fetch_records_rolls_back_and_raises():
+    cursor = failing_cursor()
+    with pytest.raises(RuntimeError, match="aborted"):
+        hourly_main.fetch_records(cursor, "aetna", "1997-01-01", "1997-12-31")
+    assert cursor.connection.rollbacks == 1
+
+def test_process_station_does_not_write_failed_fetches(monkeypatch):
+    monkeypatch.setattr(hourly_main, "get_insert_table_columns", lambda cursor, station: ["date", "time"])
+    written = []
+    monkeypatch.setattr(hourly_main, "commit_and_rollback",
+                        lambda connection, station, records, page_size, bulk_copy: written.append(records) or True)
+    args = Namespace(execute=True, page_size=10, bulk_copy=False, stream=False, itersize=None)
+    cursors = {"mawn": failing_cursor(), "rtma": failing_cursor(), "qcwrite": object()}
+
+    result = hourly_main.process_station("aetna", WORK_ITEMS[:2], {"qcwrite_connection": None}, cursors, fake_process, args)
+
+    assert written == []
+    assert result["failures"] == ["1997-01-01 to 1997-12-31: current transaction is aborted",
+                                  "1998-01-01 to 1998-06-30: current transaction is aborted"]
+    # One rollback by the failed query and one at the end of each work item
+    assert cursors["mawn"].connection.rollbacks == 4
+    assert cursors["rtma"].connection.rollbacks == 2
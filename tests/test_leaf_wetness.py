@@ -60,3 +60,7 @@ def test_leafwt_fivemin_leaf0_dry():
 
 
 
+
+def test_leafwt_is_valid_value_hourly():
+    assert LeafWetness.is_valid_value(0.5, "HOURLY") == True
+    assert LeafWetness.is_valid_value(1.5, "HOURLY") == False
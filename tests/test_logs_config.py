@@ -0,0 +1,125 @@
+from ewx_utils.ewx_config import ewx_log_file
+from ewx_utils.logs.ewx_utils_logs_config import (
+    EWXStructuredLogger,
+    BatchingQueueListener,
+    BlockingQueueHandler,
+    resolve_log_level,
+)
+import os
+import queue
+import logging
+import threading
+import pytest
+
+class CountingValue:
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "value"
+
+@pytest.fixture
+def logger():
+    logger = EWXStructuredLogger(log_path=ewx_log_file)
+    level = logger.level
+    yield logger
+    logger.set_level(level)
+
+def test_resolve_log_level():
+    assert resolve_log_level("info") == logging.INFO
+    assert resolve_log_level(logging.WARNING) == logging.WARNING
+    with pytest.raises(ValueError):
+        resolve_log_level("verbose")
+
+def test_disabled_level_skips_formatting(logger):
+    logger.set_level("INFO")
+    value = CountingValue()
+    logger.debug("value: %s", value)
+    assert value.formatted == 0
+    assert not logger.debug_enabled
+    assert not logger.is_enabled_for("DEBUG")
+    assert logger.is_enabled_for(logging.ERROR)
+
+def test_enabled_level_formats_message(logger):
+    logger.set_level("DEBUG")
+    value = CountingValue()
+    logger.debug("value: %s", value)
+    assert value.formatted == 1
+    assert logger.debug_enabled
+
+def test_level_applies_to_class_loggers(logger):
+    from ewx_utils.mawndb_classes.wind_speed import WindSpeed
+    logger.set_level("WARNING")
+    assert WindSpeed.logger.debug == logger.debug
+    assert WindSpeed.logger.level == logging.WARNING
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        self.flushes = 0
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+    def flush(self):
+        self.flushes += 1
+
+def test_batching_queue_listener_flushes_once_per_batch():
+    log_queue = queue.Queue()
+    handler = RecordingHandler()
+    listener = BatchingQueueListener(log_queue, handler, batch_size=4)
+    for i in range(10):
+        log_queue.put(logging.makeLogRecord({"msg": f"event {i}", "levelno": logging.INFO}))
+    listener.start()
+    listener.stop()
+    assert handler.messages == [f"event {i}" for i in range(10)]
+    assert handler.flushes <= 4
+
+def test_blocking_queue_handler_waits_when_full():
+    log_queue = queue.Queue(maxsize=1)
+    handler = BlockingQueueHandler(log_queue)
+    handler.handle(logging.makeLogRecord({"msg": "first"}))
+    threading.Timer(0.05, log_queue.get).start()
+    handler.handle(logging.makeLogRecord({"msg": "second"}))
+    assert log_queue.get().getMessage() == "second"
+
+def test_async_sink_writes_queued_events(logger):
+    logger.set_level("INFO")
+    logger.start_async_sink(queue_size=10, batch_size=3)
+    assert logger.listener is not None
+    # The writer thread starts with the first event of the process
+    assert logger.listener_pid is None
+    for i in range(25):
+        logger.warning("async sink event %s", i)
+    logger.stop_async_sink()
+    assert logger.listener is None
+    with open(os.path.join(logger.log_path, "ewx_logs.log"), encoding="utf-8") as log_file:
+        events = [line for line in log_file if "async sink event" in line]
+    assert len(events) >= 25
+    assert '"async sink event 24"' in events[-1]
+
+def test_async_sink_inherited_from_another_process_gets_its_own_writer(logger):
+    logger.set_level("INFO")
+    logger.start_async_sink(queue_size=10, batch_size=3)
+    inherited_listener = logger.listener
+    logger.listener_pid = -1
+    logger.warning("async sink event in child")
+    assert logger.listener is not inherited_listener
+    assert logger.listener_pid == os.getpid()
+    logger.stop_async_sink()
+    assert logger.listener is None
+
+def test_logger_without_fork_support(tmp_path, monkeypatch):
+    monkeypatch.delattr(os, "register_at_fork")
+    monkeypatch.setattr(EWXStructuredLogger, "_instance", None)
+    windows_logger = EWXStructuredLogger(log_path=str(tmp_path), level="INFO")
+    assert windows_logger.level == logging.INFO
+
+def test_invalid_log_level_warns_and_logs_at_debug(tmp_path, monkeypatch):
+    monkeypatch.setattr(EWXStructuredLogger, "_instance", None)
+    monkeypatch.setenv("EWX_LOG_LEVEL", "verbose")
+    with pytest.warns(UserWarning, match="Unknown log level: verbose, logging at DEBUG level"):
+        fallback_logger = EWXStructuredLogger(log_path=str(tmp_path))
+    assert fallback_logger.level == logging.DEBUG
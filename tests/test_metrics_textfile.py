@@ -0,0 +1,95 @@
+from ewx_utils.logs.ewx_utils_metrics import count_src_outcomes, format_textfile_metrics, write_textfile_metrics
+from ewx_utils.logs.ewx_utils_timing import StageTimer
+from ewx_utils.main_hourly_scripts import hourly_main
+from argparse import Namespace
+import os
+import re
+
+SAMPLE = re.compile(r'^(?P<name>[a-z_]+)(\{(?P<labels>.*)\})? (?P<value>\S+)$')
+LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+def parse_textfile(text):
+    """Parse Prometheus text format into {name: [(labels, value)]} and {name: type}."""
+    samples, types = {}, {}
+    for line in text.splitlines():
+        if line.startswith("# TYPE"):
+            _, _, name, metric_type = line.split()
+            types[name] = metric_type
+        elif line and not line.startswith("#"):
+            match = SAMPLE.match(line)
+            assert match, line
+            labels = dict(LABEL.findall(match["labels"] or ""))
+            samples.setdefault(match["name"], []).append((labels, float(match["value"])))
+    return samples, types
+
+def value(samples, name, **labels):
+    return next(v for sample_labels, v in samples[name] if labels.items() <= sample_labels.items())
+
+def run_results():
+    aetna = StageTimer()
+    aetna.add("fetch_mawn", 0.2, 48)
+    aetna.add("fetch_rtma", 0.3, 48)
+    aetna.add("process_records", 2.0, 48)
+    aetna.add("commit_and_rollback", 0.04, 48)
+    albion = StageTimer()
+    albion.add("fetch_mawn", 7.0, 24)
+    return [
+        {"station": "aetna", "work_items": 1, "records": 48, "failures": [], "stages": aetna.stages,
+         "src_counts": {"MAWN": 40, "RTMA": 6, "RELH_CAP": 2}},
+        {"station": "albion", "work_items": 0, "records": 0, "failures": ["1998-01-01 to 1998-12-31: timeout"],
+         "stages": albion.stages, "src_counts": {}},
+    ]
+
+def test_count_src_outcomes():
+    records = [
+        {"date": "2024-01-01", "atmp_src": "MAWN", "relh_src": "RELH_CAP"},
+        {"date": "2024-01-01", "atmp_src": "OOR", "relh_src": None},
+    ]
+    assert count_src_outcomes(records) == {"MAWN": 1, "RELH_CAP": 1, "OOR": 1}
+
+def test_format_textfile_metrics():
+    run_timer = StageTimer()
+    run_timer.add("connect", 0.5)
+    samples, types = parse_textfile(format_textfile_metrics("hourly_main", run_results(), run_timer, 12.5, timestamp=1700000000))
+
+    assert types["ewx_qc_stage_duration_seconds"] == "histogram"
+    assert types["ewx_qc_rows_fetched_total"] == "counter"
+    assert value(samples, "ewx_qc_stations_processed_total", script="hourly_main") == 2
+    assert value(samples, "ewx_qc_rows_fetched_total", source="MAWN") == 72
+    assert value(samples, "ewx_qc_rows_fetched_total", source="RTMA") == 48
+    assert value(samples, "ewx_qc_rows_written_total") == 48
+    assert value(samples, "ewx_qc_src_outcomes_total", outcome="RELH_CAP") == 2
+    assert value(samples, "ewx_qc_failures_total") == 1
+    assert value(samples, "ewx_qc_failed_stations") == 1
+    assert value(samples, "ewx_qc_run_duration_seconds") == 12.5
+    assert value(samples, "ewx_qc_last_run_timestamp_seconds") == 1700000000
+
+    fetch_mawn = {"stage": "fetch_mawn"}
+    assert value(samples, "ewx_qc_stage_duration_seconds_bucket", le="0.5", **fetch_mawn) == 1
+    assert value(samples, "ewx_qc_stage_duration_seconds_bucket", le="10.0", **fetch_mawn) == 2
+    assert value(samples, "ewx_qc_stage_duration_seconds_bucket", le="+Inf", **fetch_mawn) == 2
+    assert value(samples, "ewx_qc_stage_duration_seconds_count", **fetch_mawn) == 2
+    assert value(samples, "ewx_qc_stage_duration_seconds_sum", **fetch_mawn) == 7.2
+    assert value(samples, "ewx_qc_stage_duration_seconds_count", stage="connect") == 1
+
+def test_label_values_are_escaped():
+    samples, _ = parse_textfile(format_textfile_metrics('odd "name"\\', [], StageTimer(), 1.0))
+    assert samples["ewx_qc_stations_processed_total"][0][0]["script"] == 'odd \\"name\\"\\\\'
+
+def test_write_textfile_metrics_replaces_file(tmp_path):
+    path = tmp_path / "ewx_qc.prom"
+    path.write_text("old\n")
+    write_textfile_metrics(str(path), "ewx_qc_failures_total 0\n")
+    assert path.read_text() == "ewx_qc_failures_total 0\n"
+    assert os.listdir(tmp_path) == ["ewx_qc.prom"]
+    write_textfile_metrics(None, "ignored\n")
+
+def test_process_station_counts_src_outcomes(monkeypatch):
+    monkeypatch.setattr(hourly_main, "get_insert_table_columns", lambda cursor, station: ["date", "time"])
+    monkeypatch.setattr(hourly_main, "fetch_records", lambda cursor, station, begin, end, itersize=None: [])
+    args = Namespace(execute=False, page_size=10, bulk_copy=False, stream=False, itersize=None, metrics_textfile="run.prom")
+    process = lambda *args: [{"atmp_src": "MAWN", "relh_src": "EMPTY"}, {"atmp_src": "RTMA", "relh_src": "EMPTY"}]
+
+    result = hourly_main.process_station("aetna", [("aetna", "2024-01-01", "2024-12-31")], {}, {"mawn": None, "rtma": None, "qcwrite": None}, process, args)
+
+    assert result["src_counts"] == {"MAWN": 1, "RTMA": 1, "EMPTY": 2}
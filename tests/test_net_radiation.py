@@ -31,3 +31,7 @@ def test_nrad_edge_case_above_max():
 def test_nrad_with_none_value():
     nrad_obj = NetRadiation(None)
     assert nrad_obj.is_valid() is False
+
+def test_nrad_is_valid_value_matches_object():
+    for value in (-1250.0000001, -1250, 0, 1250, 1250.1):
+        assert NetRadiation.is_valid_value(value) == NetRadiation(value).is_valid()
@@ -60,3 +60,9 @@ def test_precip_outside_valid_range_daily():
     
 
 
+
+def test_pcpn_is_valid_value_tables():
+    assert Precipitation.is_valid_value(50, "hourly") == True
+    assert Precipitation.is_valid_value(100, "hourly") == False
+    assert Precipitation.is_valid_value(100, "daily") == True
+    assert Precipitation.is_valid_value(None, "daily") == False
@@ -0,0 +1,53 @@
+from ewx_utils.db_files.dbs_connection import stream_records
+from ewx_utils.main_hourly_scripts import hourly_main
+from ewx_utils.hourly_validation_checks.hourly_validation_utils import process_records
+from ewx_utils.hourly_validation_checks.hourly_columnar_engine import process_records_columnar
+from ewx_utils.logs.ewx_utils_timing import StageTimer
+from tests.helpers import FakeConnection, FakeCursor, make_record
+from argparse import Namespace
+
+def make_rows(hours):
+    return [make_record(hour, atmp=20 + hour) for hour in hours]
+
+def test_stream_records_uses_named_cursor():
+    connection = FakeConnection(rows=make_rows(range(3)))
+    rows = stream_records(connection, "SELECT 1", ("a",), itersize=50)
+    assert connection.cursors == []
+    assert list(rows) == make_rows(range(3))
+    cursor = connection.cursors[0]
+    assert cursor.name.startswith("stream_")
+    assert cursor.itersize == 50
+    assert cursor.executed == [("SELECT 1", ("a",))]
+    assert cursor.closed
+
+def test_stream_records_closes_cursor_when_not_exhausted():
+    connection = FakeConnection(rows=make_rows(range(3)))
+    rows = stream_records(connection, "SELECT 1")
+    next(rows)
+    rows.close()
+    assert connection.cursors[0].closed
+
+def test_fetch_records_streams_in_timestamp_order():
+    connection = FakeConnection(rows=make_rows(range(2)))
+    records = hourly_main.fetch_records(FakeCursor(connection=connection), "aetna", "2023-06-01", "2023-06-01", itersize=10)
+    assert list(records) == make_rows(range(2))
+    assert connection.cursors[0].executed == [
+        ("SELECT * FROM aetna_hourly WHERE date BETWEEN %s AND %s ORDER BY date, time", ("2023-06-01", "2023-06-01"))
+    ]
+
+def test_process_records_accepts_streamed_records():
+    qc_columns = ["date", "time", "atmp", "atmp_src"]
+    mawn_rows = make_rows(range(1, 24, 2))
+    rtma_rows = make_rows(range(0, 24))
+    expected = process_records(qc_columns, mawn_rows, rtma_rows, "2023-06-01", "2023-06-01")
+    assert process_records(qc_columns, iter(mawn_rows), iter(rtma_rows), "2023-06-01", "2023-06-01") == expected
+    assert process_records_columnar(qc_columns, iter(mawn_rows), iter(rtma_rows), "2023-06-01", "2023-06-01") == expected
+
+def test_fetch_work_item_counts_streamed_rows(monkeypatch):
+    cursors = {"mawn": FakeCursor(connection=FakeConnection(rows=make_rows(range(3)))), "rtma": FakeCursor(connection=FakeConnection(rows=make_rows(range(24))))}
+    timer = StageTimer()
+    mawn_records, rtma_records = hourly_main.fetch_work_item(
+        cursors, "aetna", "2023-06-01", "2023-06-01", Namespace(stream=True, itersize=10), timer)
+    process_records(["date", "time", "atmp", "atmp_src"], mawn_records, rtma_records, "2023-06-01", "2023-06-01")
+    assert timer.stages["fetch_mawn"]["rows"] == 3
+    assert timer.stages["fetch_rtma"]["rows"] == 24
@@ -42,3 +42,16 @@ def test_for_invalid_temp():
     assert temp_obj.is_valid() == False
     
     
+
+def test_temp_is_valid_value_matches_object():
+    for value in (-45, -39, 0, 38, 46, 47):
+        for record_date in (datetime.datetime(2023, 1, 10), datetime.datetime(2023, 7, 10), None):
+            month = record_date.month if record_date else None
+            assert Temperature.is_valid_value(value, month) == Temperature(value, "C", record_date).is_valid()
+
+def test_temp_is_valid_value_none():
+    assert Temperature.is_valid_value(None, 7) == False
+
+def test_temp_has_no_instance_dict():
+    temp_obj = Temperature(25, "C")
+    assert not hasattr(temp_obj, "__dict__")
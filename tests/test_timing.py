@@ -0,0 +1,55 @@
+from ewx_utils.logs.ewx_utils_timing import StageTimer, run_summary, write_timing_json
+import json
+
+def test_stage_timer_counts_calls_and_rows():
+    timer = StageTimer()
+    for rows in (10, 20):
+        with timer.time("process_records") as counter:
+            counter.rows = rows
+    with timer.time("connect"):
+        pass
+    assert timer.stages["process_records"]["calls"] == 2
+    assert timer.stages["process_records"]["rows"] == 30
+    assert timer.stages["connect"]["rows"] == 0
+    assert timer.summary()["connect"]["rows_per_sec"] is None
+
+def test_stage_timer_records_time_when_stage_fails():
+    timer = StageTimer()
+    try:
+        with timer.time("fetch_mawn"):
+            raise ValueError("query failed")
+    except ValueError:
+        pass
+    assert timer.stages["fetch_mawn"]["calls"] == 1
+
+def test_stage_timer_counts_rows_as_they_are_consumed():
+    timer = StageTimer()
+    with timer.time("fetch_mawn"):
+        records = timer.count_rows("fetch_mawn", iter(range(5)))
+    assert timer.stages["fetch_mawn"]["rows"] == 0
+    assert list(records) == [0, 1, 2, 3, 4]
+    assert timer.stages["fetch_mawn"]["rows"] == 5
+    assert timer.stages["fetch_mawn"]["calls"] == 1
+
+def test_run_summary_totals_stations():
+    aetna = StageTimer()
+    aetna.add("process_records", 2.0, 100)
+    albion = StageTimer()
+    albion.add("process_records", 1.0, 50)
+    albion.add("commit_and_rollback", 0.5, 50)
+    run_timer = StageTimer()
+    run_timer.add("connect", 0.25)
+
+    summary = run_summary({"aetna": aetna.stages, "albion": albion.stages}, run_timer, 4.0)
+
+    assert summary["stations_processed"] == 2
+    assert summary["stages"]["process_records"] == {"seconds": 3.0, "calls": 2, "rows": 150, "rows_per_sec": 50.0}
+    assert summary["stages"]["connect"]["seconds"] == 0.25
+    assert summary["stations"]["albion"]["commit_and_rollback"]["rows_per_sec"] == 100.0
+
+def test_write_timing_json(tmp_path):
+    path = tmp_path / "timing.json"
+    summary = run_summary({}, StageTimer(), 1.5)
+    write_timing_json(str(path), summary)
+    assert json.loads(path.read_text()) == summary
+    write_timing_json(None, summary)
@@ -0,0 +1,66 @@
+from ewx_utils.hourly_validation_checks.hourly_validator_registry import (
+    HOURLY_VALIDATORS,
+    resolve_validators,
+)
+from ewx_utils.daily_validation_checks.daily_validator_registry import DAILY_VALIDATORS
+from ewx_utils.hourly_validation_checks import hourly_validation_utils
+from ewx_utils.daily_validation_checks import daily_validation_utils
+from ewx_utils.mawndb_classes.temperature import Temperature
+from ewx_utils.mawndb_classes.precipitation import Precipitation
+from ewx_utils.mawndb_classes.wind_speed import WindSpeed
+import datetime
+import pytest
+
+JULY = datetime.date(2023, 7, 15)
+JANUARY = datetime.date(2023, 1, 15)
+
+@pytest.mark.parametrize("value", [-45, -40, 0, 10.5, 38, 39, 46, 47])
+def test_hourly_temperature_matches_class(value):
+    for d in (JULY, JANUARY, None):
+        assert HOURLY_VALIDATORS["atmp"].check(value, d) == Temperature(value, "C", d).is_valid()
+
+@pytest.mark.parametrize("value", [-1, 0, 50, 77, 78])
+def test_hourly_precipitation_matches_class(value):
+    expected = Precipitation(value, "hourly", "MM", JULY).is_valid()
+    assert HOURLY_VALIDATORS["pcpn"].check(value, JULY) == expected
+
+@pytest.mark.parametrize("value", [-1, 0, 200, 254, 255])
+def test_daily_precipitation_matches_class(value):
+    expected = Precipitation(value, "daily", "MM", JULY).is_valid()
+    assert DAILY_VALIDATORS["pcpn"].check(value, JULY) == expected
+
+@pytest.mark.parametrize("value", [-1, 0, 20, 200])
+def test_wind_speed_matches_class(value):
+    assert HOURLY_VALIDATORS["wspd"].check(value, JULY) == WindSpeed(value, "MPS", JULY).is_valid()
+
+def test_check_value_unknown_column_is_invalid():
+    assert hourly_validation_utils.check_value("not_a_column", 1, JULY) is False
+    assert daily_validation_utils.check_value("not_a_column", 1, JULY) is False
+
+def test_check_value_uses_registry():
+    assert hourly_validation_utils.check_value("atmp", 20, JULY) is True
+    assert hourly_validation_utils.check_value("relh", 101, JULY) is False
+    assert daily_validation_utils.check_value("rpet", 5, JULY) is True
+
+def test_resolve_validators_skips_unknown_columns():
+    validators = resolve_validators(("date", "atmp", "relh"))
+    assert set(validators) == {"atmp", "relh"}
+    assert validators["atmp"].kind == "temp_vars"
+
+def test_process_records_resolves_validators_once(monkeypatch):
+    resolved = []
+    def spy(resolve):
+        def resolve_once(columns):
+            resolved.append(columns)
+            return resolve(columns)
+        return resolve_once
+    monkeypatch.setattr(hourly_validation_utils, "resolve_validators", spy(hourly_validation_utils.resolve_validators))
+    monkeypatch.setattr(daily_validation_utils, "resolve_validators", spy(daily_validation_utils.resolve_validators))
+    hourly_record = {"date": JULY, "time": datetime.time(1), "atmp": 20.0, "relh": 50.0}
+    hourly_validation_utils.process_records(["date", "time", "atmp", "atmp_src"], [hourly_record, dict(hourly_record, time=datetime.time(2))],
+                                            [], "2023-07-15", "2023-07-15")
+    daily_record = {"date": JULY, "pcpn": 5.0}
+    clean_records = daily_validation_utils.process_records(["date", "pcpn", "pcpn_src"], [daily_record], [], "2023-07-15", "2023-07-15")
+
+    assert resolved == [("date", "time", "atmp", "atmp_src", "relh"), ("date", "pcpn", "pcpn_src")]
+    assert clean_records[0]["pcpn_src"] == "MAWN"